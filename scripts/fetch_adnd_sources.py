@@ -8,21 +8,28 @@ FETCH-3: Script MUST prioritize PDF format, then EPUB, then ZIP.
 FETCH-4: Script MUST group files by unique title to avoid duplicates.
 FETCH-5: Script MUST only download files that don't already exist in sources/.
 FETCH-6: Script MUST log all operations at appropriate levels.
+FETCH-7: Script MUST resume interrupted downloads from .part files.
+FETCH-8: Script MUST verify downloads against archive.org file metadata.
 """
 
+import hashlib
+import json
 import logging
 import os
+import queue
 import re
 import sys
 import threading
 import zipfile
+import zlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import unquote, urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from tqdm import tqdm
 
@@ -86,6 +93,8 @@ class SourceFile(BaseModel):
     format: str = Field(..., description="File format (pdf, epub, zip)")
     local_path: Path = Field(..., description="Local filesystem path for storage")
     priority: int = Field(..., description="Priority for format selection (lower is better)")
+    size: Optional[int] = Field(None, description="Expected size in bytes from archive.org metadata")
+    md5: Optional[str] = Field(None, description="Expected MD5 digest from archive.org metadata")
 
 
 class ArchiveOrgFetcher:
@@ -96,19 +105,79 @@ class ArchiveOrgFetcher:
 
     COLLECTION_URL = "https://archive.org/download/advanced-dungeons-dragons-2nd-edition"
     COLLECTION_BASE_URL = "https://archive.org/download/advanced-dungeons-dragons-2nd-edition"
+    METADATA_URL = "https://archive.org/metadata/advanced-dungeons-dragons-2nd-edition"
     FORMAT_PRIORITY = {"pdf": 1, "epub": 2, "zip": 3}
+    MANIFEST_FILENAME = ".fetch_manifest.json"
+    PARTIAL_SUFFIX = ".part"
+    CHUNK_SIZE = 1024 * 1024
+    DEFAULT_EXTRACT_WORKERS = 2
 
-    def __init__(self, sources_dir: Path):
+    def __init__(self, sources_dir: Path, pool_size: int = 32):
         """
         INIT-1: Initialize fetcher with target directory.
+        INIT-2: MUST share one connection pool across download threads.
         
         Args:
             sources_dir: Directory where source files will be stored
+            pool_size: Maximum pooled connections (one per download thread)
         """
         self.sources_dir = sources_dir
         self.sources_dir.mkdir(parents=True, exist_ok=True)
+        
+        # requests.Session is safe to share for plain GETs; the adapter pool
+        # keeps one keep-alive connection per worker thread
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self.manifest_path = self.sources_dir / self.MANIFEST_FILENAME
+        self._manifest_lock = threading.Lock()
+        self.manifest = self._load_manifest()
         logger.info(f"Initialized fetcher with sources directory: {sources_dir}")
 
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """
+        MANIFEST-1: Load the record of completed downloads.
+        
+        Returns:
+            Mapping of file name to its recorded size, MD5 and URL
+        """
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            return data.get("files", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable fetch manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _record_completed(self, source_file: SourceFile, size: int, md5: str) -> None:
+        """
+        MANIFEST-2: Record a verified download and persist the manifest.
+        
+        Args:
+            source_file: Downloaded file
+            size: Size in bytes on disk
+            md5: MD5 digest of the downloaded bytes
+        """
+        with self._manifest_lock:
+            self.manifest[source_file.local_path.name] = {
+                "url": str(source_file.url),
+                "size": size,
+                "md5": md5,
+            }
+            tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": 1, "files": self.manifest}, indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.manifest_path)
+
     def fetch_collection_page(self) -> str:
         """
         FETCH-1: Fetch the HTML content of the collection page.
@@ -121,7 +190,7 @@ class ArchiveOrgFetcher:
         """
         logger.info(f"Fetching collection page: {self.COLLECTION_URL}")
         try:
-            response = requests.get(self.COLLECTION_URL, timeout=30)
+            response = self.session.get(self.COLLECTION_URL, timeout=30)
             response.raise_for_status()
             logger.debug(f"Successfully fetched page, size: {len(response.text)} bytes")
             return response.text
@@ -129,6 +198,54 @@ class ArchiveOrgFetcher:
             logger.error(f"Failed to fetch collection page: {e}")
             raise
 
+    def fetch_file_metadata(self) -> Dict[str, Dict]:
+        """
+        METADATA-1: Fetch expected file sizes and checksums from archive.org.
+        METADATA-2: MUST NOT fail the fetch when metadata is unavailable.
+        
+        Returns:
+            Mapping of file name to {"size": int, "md5": str}; empty on failure
+        """
+        logger.info(f"Fetching file metadata: {self.METADATA_URL}")
+        try:
+            response = self.session.get(self.METADATA_URL, timeout=30)
+            response.raise_for_status()
+            files = response.json().get("files", [])
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not fetch file metadata, downloads will not be verified: {e}")
+            return {}
+
+        metadata = {}
+        for entry in files:
+            name = Path(entry.get("name", "")).name
+            if not name:
+                continue
+            size = entry.get("size")
+            metadata[name] = {
+                "size": int(size) if size is not None else None,
+                "md5": entry.get("md5"),
+            }
+        logger.debug(f"Loaded metadata for {len(metadata)} files")
+        return metadata
+
+    def apply_file_metadata(
+        self, source_files: List[SourceFile], metadata: Dict[str, Dict]
+    ) -> None:
+        """
+        METADATA-3: Attach expected size and MD5 to source files by file name.
+        METADATA-4: MUST match percent-encoded local names (taken from the
+            listing hrefs) against the decoded names in the metadata.
+        
+        Args:
+            source_files: Files to annotate in place
+            metadata: Mapping returned by fetch_file_metadata
+        """
+        for source_file in source_files:
+            entry = metadata.get(unquote(source_file.local_path.name))
+            if entry:
+                source_file.size = entry.get("size")
+                source_file.md5 = entry.get("md5")
+
     def parse_download_links(self, html_content: str) -> List[SourceFile]:
         """
         PARSE-1: Parse HTML to extract download links.
@@ -335,11 +452,59 @@ class ArchiveOrgFetcher:
         """
         return zip_path.parent / f"{zip_path.name}.extracted"
 
+    def get_partial_path(self, local_path: Path) -> Path:
+        """
+        PARTIAL-1: Get path of the in-progress download for a file.
+        
+        Args:
+            local_path: Final file path
+            
+        Returns:
+            Path with .part suffix
+        """
+        return local_path.parent / f"{local_path.name}{self.PARTIAL_SUFFIX}"
+
+    def is_complete(self, source_file: SourceFile) -> bool:
+        """
+        COMPLETE-1: Check whether an existing file is a finished download.
+        COMPLETE-2: MUST reject files whose size disagrees with the manifest or metadata.
+        
+        Files without a manifest record or metadata (e.g. placed by hand) are
+        trusted as complete.
+        
+        Args:
+            source_file: File to check
+            
+        Returns:
+            True if the local file exists and matches the recorded size
+        """
+        local_path = source_file.local_path
+        if not local_path.exists():
+            return False
+
+        size = local_path.stat().st_size
+        record = self.manifest.get(local_path.name)
+        if record and record.get("size") != size:
+            return False
+        if source_file.size is not None and source_file.size != size:
+            return False
+        return True
+
+    @staticmethod
+    def _md5_file(path: Path) -> str:
+        """Compute the MD5 digest of a file."""
+        digest = hashlib.md5()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
     def filter_existing_files(self, source_files: List[SourceFile]) -> List[SourceFile]:
         """
         FILTER-1: Filter out files that already exist in sources directory.
         FILTER-2: MUST check actual filesystem presence.
         FILTER-3: MUST check for extraction markers for ZIP files.
+        FILTER-4: MUST re-queue files whose size does not match the manifest or metadata.
         
         Args:
             source_files: List of source files to filter
@@ -351,10 +516,15 @@ class ArchiveOrgFetcher:
         
         missing_files = []
         for source_file in source_files:
-            # Check if file exists
-            if source_file.local_path.exists():
+            # Check if file exists and is a finished download
+            if self.is_complete(source_file):
                 logger.debug(f"File already exists: {source_file.local_path.name}")
                 continue
+            if source_file.local_path.exists():
+                logger.warning(
+                    f"Existing file does not match expected size, re-fetching: "
+                    f"{source_file.local_path.name}"
+                )
             
             # For ZIP files, also check if extraction marker exists
             if source_file.format == "zip":
@@ -374,54 +544,51 @@ class ArchiveOrgFetcher:
         )
         return missing_files
 
-    def download_file(self, source_file: SourceFile, show_progress: bool = True) -> bool:
+    def download_file(
+        self, source_file: SourceFile, show_progress: bool = True, extract: bool = True
+    ) -> bool:
         """
         DOWNLOAD-1: Download a single file to the sources directory.
-        DOWNLOAD-2: MUST skip if file already exists.
+        DOWNLOAD-2: MUST resume from an existing .part file with an HTTP Range request.
         DOWNLOAD-3: MUST show progress bar during download.
-        DOWNLOAD-4: MUST extract ZIP files after download.
+        DOWNLOAD-4: MUST extract ZIP files after download unless extract is False.
+        DOWNLOAD-5: MUST verify size and MD5 before moving the file into place.
+        DOWNLOAD-6: MUST keep the .part file on network errors so a rerun resumes.
         
         Args:
             source_file: File to download
             show_progress: Whether to show progress bar (default: True)
+            extract: Whether to extract ZIP files inline (the parallel path
+                hands them to the extraction workers instead)
             
         Returns:
             True if download succeeded, False otherwise
         """
         logger.info(f"Downloading {source_file.title} from {source_file.url}")
+        part_path = self.get_partial_path(source_file.local_path)
         
         try:
-            # Make request with streaming
-            response = requests.get(str(source_file.url), stream=True, timeout=60)
-            response.raise_for_status()
-            
-            # Get total file size
-            total_size = int(response.headers.get("content-length", 0))
-            
-            # Download with progress bar
-            with open(source_file.local_path, "wb") as f:
-                if show_progress and total_size > 0:
-                    with tqdm(
-                        total=total_size,
-                        unit="B",
-                        unit_scale=True,
-                        unit_divisor=1024,
-                        desc=source_file.local_path.name,
-                    ) as pbar:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                pbar.update(len(chunk))
-                else:
-                    # No progress bar
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-            
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if source_file.size is not None and offset > source_file.size:
+                logger.warning(f"Discarding oversized partial download: {part_path.name}")
+                part_path.unlink()
+                offset = 0
+
+            if source_file.size is None or offset < source_file.size:
+                self._fetch_into(source_file, part_path, offset, show_progress)
+
+            if not self._verify_download(source_file, part_path):
+                part_path.unlink()
+                return False
+
+            size = part_path.stat().st_size
+            md5 = source_file.md5 or self._md5_file(part_path)
+            part_path.replace(source_file.local_path)
+            self._record_completed(source_file, size, md5)
             logger.info(f"Successfully downloaded to {source_file.local_path}")
             
             # If it's a ZIP file, extract it
-            if source_file.format == "zip":
+            if extract and source_file.format == "zip":
                 logger.info(f"Extracting ZIP file: {source_file.local_path}")
                 if self.extract_zip_file(source_file.local_path):
                     logger.info(f"Successfully extracted and removed ZIP: {source_file.local_path}")
@@ -432,24 +599,108 @@ class ArchiveOrgFetcher:
             
         except requests.HTTPError as e:
             logger.error(f"HTTP error downloading {source_file.url}: {e}")
-            # Clean up partial download
-            if source_file.local_path.exists():
-                source_file.local_path.unlink()
             return False
             
         except requests.RequestException as e:
-            logger.error(f"Network error downloading {source_file.url}: {e}")
-            # Clean up partial download
-            if source_file.local_path.exists():
-                source_file.local_path.unlink()
+            logger.error(
+                f"Network error downloading {source_file.url}: {e} "
+                f"(partial download kept for resume)"
+            )
             return False
             
         except Exception as e:
             logger.error(f"Unexpected error downloading {source_file.url}: {e}", exc_info=True)
             # Clean up partial download
-            if source_file.local_path.exists():
-                source_file.local_path.unlink()
+            if part_path.exists():
+                part_path.unlink()
+            return False
+
+    def _fetch_into(
+        self, source_file: SourceFile, part_path: Path, offset: int, show_progress: bool
+    ) -> None:
+        """
+        RANGE-1: Stream the remaining bytes of a file into its .part file.
+        RANGE-2: MUST restart from zero when the server ignores the Range header.
+        
+        Args:
+            source_file: File to download
+            part_path: Partial download path
+            offset: Bytes already present in part_path
+            show_progress: Whether to show progress bar
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = self.session.get(
+            str(source_file.url), stream=True, timeout=60, headers=headers
+        )
+        try:
+            if offset and response.status_code == 416:
+                # Nothing left to fetch; the .part file is verified by the caller
+                return
+            response.raise_for_status()
+            
+            if offset and response.status_code != 206:
+                logger.info(f"Server ignored Range request, restarting: {part_path.name}")
+                offset = 0
+            elif offset:
+                logger.info(f"Resuming {part_path.name} at {offset} bytes")
+            
+            total_size = offset + int(response.headers.get("content-length", 0))
+            
+            with open(part_path, "ab" if offset else "wb") as f:
+                if show_progress and total_size > 0:
+                    with tqdm(
+                        total=total_size,
+                        initial=offset,
+                        unit="B",
+                        unit_scale=True,
+                        unit_divisor=1024,
+                        desc=source_file.local_path.name,
+                    ) as pbar:
+                        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                                pbar.update(len(chunk))
+                else:
+                    # No progress bar
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+        finally:
+            response.close()
+
+    def _verify_download(self, source_file: SourceFile, part_path: Path) -> bool:
+        """
+        VERIFY-1: Check a finished download against archive.org metadata.
+        VERIFY-2: MUST skip checks for which no metadata is known.
+        
+        Args:
+            source_file: File with expected size/MD5
+            part_path: Downloaded bytes
+            
+        Returns:
+            True if the download matches the metadata
+        """
+        size = part_path.stat().st_size
+        if source_file.size is not None and size != source_file.size:
+            logger.error(
+                f"Size mismatch for {source_file.local_path.name}: "
+                f"expected {source_file.size}, got {size}"
+            )
             return False
+        
+        if source_file.md5:
+            md5 = self._md5_file(part_path)
+            if md5 != source_file.md5:
+                logger.error(
+                    f"Checksum mismatch for {source_file.local_path.name}: "
+                    f"expected {source_file.md5}, got {md5}"
+                )
+                return False
+        
+        return True
 
     def extract_zip_file(self, zip_path: Path) -> bool:
         """
@@ -457,6 +708,7 @@ class ArchiveOrgFetcher:
         EXTRACT-2: MUST delete ZIP file after successful extraction.
         EXTRACT-3: MUST handle corrupt ZIP files gracefully.
         EXTRACT-4: MUST create marker file to prevent re-downloading.
+        EXTRACT-5: MUST skip members already present with a matching size and CRC-32.
         
         Args:
             zip_path: Path to ZIP file to extract
@@ -473,15 +725,19 @@ class ArchiveOrgFetcher:
             extract_dir = zip_path.parent
             
             with zipfile.ZipFile(zip_path, "r") as zf:
-                # Validate ZIP file
-                bad_file = zf.testzip()
-                if bad_file:
-                    logger.error(f"Corrupt file in ZIP: {bad_file}")
-                    return False
-                
-                # Extract all files
-                zf.extractall(extract_dir)
-                logger.debug(f"Extracted {len(zf.namelist())} files from {zip_path.name}")
+                # Extract only missing or changed members; reading a member
+                # checks its CRC, so a corrupt member raises BadZipFile here
+                extracted = skipped = 0
+                for info in zf.infolist():
+                    if not info.is_dir() and self._member_is_current(extract_dir, info):
+                        skipped += 1
+                        continue
+                    zf.extract(info, extract_dir)
+                    extracted += 1
+                logger.debug(
+                    f"Extracted {extracted} files from {zip_path.name} "
+                    f"({skipped} already present)"
+                )
             
             # Create marker file to indicate extraction completed
             marker_path = self.get_extraction_marker_path(zip_path)
@@ -502,69 +758,134 @@ class ArchiveOrgFetcher:
             logger.error(f"Error extracting {zip_path}: {e}", exc_info=True)
             return False
 
+    def _member_is_current(self, extract_dir: Path, info: zipfile.ZipInfo) -> bool:
+        """
+        EXTRACT-6: Check whether a ZIP member is already extracted unchanged.
+        
+        Args:
+            extract_dir: Extraction directory
+            info: ZIP member
+            
+        Returns:
+            True if the target exists with the member's size and CRC-32
+        """
+        target = (extract_dir / info.filename).resolve()
+        if extract_dir.resolve() not in target.parents or not target.is_file():
+            return False
+        if target.stat().st_size != info.file_size:
+            return False
+        
+        crc = 0
+        with open(target, "rb") as f:
+            for block in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                crc = zlib.crc32(block, crc)
+        return crc == info.CRC
+
     def download_files_parallel(
         self,
         source_files: List[SourceFile],
         stats: Dict[str, int],
         max_workers: int = 8,
+        extract_workers: Optional[int] = None,
     ) -> None:
         """
         PARALLEL-1: Download files in parallel using ThreadPoolExecutor.
         PARALLEL-2: MUST use thread-safe statistics tracking.
         PARALLEL-3: MUST handle progress bars for concurrent downloads.
         PARALLEL-4: MUST respect max_workers limit.
+        PARALLEL-5: MUST extract ZIP files in separate workers fed by a queue,
+            so extraction overlaps with the remaining downloads.
+        PARALLEL-6: MUST count extraction failures as ``extract_failed``, not
+            as failed downloads.
         
         Args:
             source_files: List of files to download
             stats: Statistics dictionary (will be updated thread-safely)
             max_workers: Maximum number of concurrent downloads
+            extract_workers: Number of extraction workers (default: DEFAULT_EXTRACT_WORKERS)
         """
         # Thread-safe lock for updating statistics
         stats_lock = threading.Lock()
+        extract_queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        extract_workers = extract_workers or self.DEFAULT_EXTRACT_WORKERS
+        
+        def extract_from_queue() -> None:
+            """Extract downloaded ZIP files until a None sentinel arrives."""
+            while True:
+                zip_path = extract_queue.get()
+                if zip_path is None:
+                    return
+                logger.info(f"Extracting ZIP file: {zip_path}")
+                success = self.extract_zip_file(zip_path)
+                with stats_lock:
+                    if success:
+                        stats["extracted"] += 1
+                    else:
+                        stats["extract_failed"] = stats.get("extract_failed", 0) + 1
+                if not success:
+                    logger.warning(f"Failed to extract ZIP: {zip_path}")
         
         def download_with_stats(source_file: SourceFile, position: int) -> bool:
-            """Download a single file and update stats."""
+            """Download a single file, update stats and queue ZIPs for extraction."""
             logger.info(f"Starting download: {source_file.title}")
             
-            success = self.download_file(source_file, show_progress=True)
+            success = self.download_file(source_file, show_progress=True, extract=False)
             
             # Thread-safe statistics update
             with stats_lock:
                 if success:
                     stats["succeeded"] += 1
-                    if source_file.format == "zip":
-                        stats["extracted"] += 1
                 else:
                     stats["failed"] += 1
             
+            if success and source_file.format == "zip":
+                extract_queue.put(source_file.local_path)
+            
             return success
         
-        logger.info(f"Starting parallel downloads with {max_workers} workers...")
+        logger.info(
+            f"Starting parallel downloads with {max_workers} workers "
+            f"and {extract_workers} extraction workers..."
+        )
         
-        # Use ThreadPoolExecutor for parallel downloads
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all download tasks
-            future_to_file = {
-                executor.submit(download_with_stats, source_file, i): source_file
-                for i, source_file in enumerate(source_files)
-            }
+        extractors = [
+            threading.Thread(target=extract_from_queue, name=f"extract-{i}", daemon=True)
+            for i in range(extract_workers)
+        ]
+        for extractor in extractors:
+            extractor.start()
+        
+        try:
+            # Use ThreadPoolExecutor for parallel downloads
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all download tasks
+                future_to_file = {
+                    executor.submit(download_with_stats, source_file, i): source_file
+                    for i, source_file in enumerate(source_files)
+                }
             
-            # Process completed downloads
-            completed = 0
-            for future in as_completed(future_to_file):
-                completed += 1
-                source_file = future_to_file[future]
+                # Process completed downloads
+                completed = 0
+                for future in as_completed(future_to_file):
+                    completed += 1
+                    source_file = future_to_file[future]
                 
-                try:
-                    success = future.result()
-                    status = "✅" if success else "❌"
-                    logger.info(
-                        f"[{completed}/{len(source_files)}] {status} {source_file.title}"
-                    )
-                except Exception as e:
-                    logger.error(f"Exception downloading {source_file.title}: {e}")
-                    with stats_lock:
-                        stats["failed"] += 1
+                    try:
+                        success = future.result()
+                        status = "✅" if success else "❌"
+                        logger.info(
+                            f"[{completed}/{len(source_files)}] {status} {source_file.title}"
+                        )
+                    except Exception as e:
+                        logger.error(f"Exception downloading {source_file.title}: {e}")
+                        with stats_lock:
+                            stats["failed"] += 1
+        finally:
+            # Let the extractors drain the queue, then stop them
+            for _ in extractors:
+                extract_queue.put(None)
+            for extractor in extractors:
+                extractor.join()
 
     def format_statistics(self, stats: Dict[str, int]) -> str:
         """
@@ -585,12 +906,13 @@ class ArchiveOrgFetcher:
             f"❌ Failed: {stats.get('failed', 0)}",
             f"⏭️  Skipped: {stats.get('skipped', 0)}",
             f"📦 ZIP files extracted: {stats.get('extracted', 0)}",
+            f"⚠️  ZIP extractions failed: {stats.get('extract_failed', 0)}",
             "=" * 80,
         ]
         return "\n".join(lines)
 
 
-def main(dry_run: bool = False, max_workers: int = None):
+def main(dry_run: bool = False, max_workers: int = None, extract_workers: int = None):
     """
     MAIN-1: Main entry point for the script.
     MAIN-2: MUST fetch, parse, deduplicate, and download files.
@@ -601,6 +923,7 @@ def main(dry_run: bool = False, max_workers: int = None):
     Args:
         dry_run: If True, only show what would be downloaded without downloading
         max_workers: Maximum number of concurrent downloads (default: auto-detect based on CPU cores)
+        extract_workers: Number of ZIP extraction workers running alongside downloads
     """
     # Auto-detect optimal threads if not specified
     if max_workers is None:
@@ -611,7 +934,7 @@ def main(dry_run: bool = False, max_workers: int = None):
     
     # Initialize fetcher
     sources_dir = Path(__file__).parent.parent / "sources"
-    fetcher = ArchiveOrgFetcher(sources_dir)
+    fetcher = ArchiveOrgFetcher(sources_dir, pool_size=max_workers)
     
     # Initialize statistics
     stats = {
@@ -620,6 +943,7 @@ def main(dry_run: bool = False, max_workers: int = None):
         "failed": 0,
         "skipped": 0,
         "extracted": 0,
+        "extract_failed": 0,
     }
     
     try:
@@ -637,6 +961,7 @@ def main(dry_run: bool = False, max_workers: int = None):
         
         # Step 4: Filter existing files
         logger.info("\n✅ Step 4: Filtering for missing files...")
+        fetcher.apply_file_metadata(unique_files, fetcher.fetch_file_metadata())
         missing_files = fetcher.filter_existing_files(unique_files)
         
         stats["total"] = len(missing_files)
@@ -671,14 +996,19 @@ def main(dry_run: bool = False, max_workers: int = None):
         logger.info(f"\n📥 Step 5: Downloading missing files (using {max_workers} threads)...")
         logger.info("-" * 80)
         
-        fetcher.download_files_parallel(missing_files, stats, max_workers=max_workers)
+        fetcher.download_files_parallel(
+            missing_files, stats, max_workers=max_workers, extract_workers=extract_workers
+        )
         
         # Step 7: Display final statistics
         logger.info("\n" + fetcher.format_statistics(stats))
         
-        # Exit with error if any downloads failed
-        if stats["failed"] > 0:
-            logger.warning(f"\n⚠️  {stats['failed']} file(s) failed to download")
+        # Exit with error if any downloads or extractions failed
+        if stats["failed"] > 0 or stats["extract_failed"] > 0:
+            if stats["failed"] > 0:
+                logger.warning(f"\n⚠️  {stats['failed']} file(s) failed to download")
+            if stats["extract_failed"] > 0:
+                logger.warning(f"\n⚠️  {stats['extract_failed']} ZIP file(s) failed to extract")
             sys.exit(1)
         else:
             logger.info("\n✅ All downloads completed successfully!")
@@ -692,6 +1022,9 @@ def main(dry_run: bool = False, max_workers: int = None):
         logger.error(f"\n❌ Fatal error: {e}", exc_info=True)
         logger.info("\n" + fetcher.format_statistics(stats))
         sys.exit(1)
+        
+    finally:
+        fetcher.close()
 
 
 if __name__ == "__main__":
@@ -715,6 +1048,16 @@ if __name__ == "__main__":
         help=f"Number of parallel download threads (default: {default_threads}, auto-detected based on CPU cores)",
     )
     
+    parser.add_argument(
+        "--extract-threads",
+        type=int,
+        default=None,
+        help=(
+            "Number of ZIP extraction threads running alongside downloads "
+            f"(default: {ArchiveOrgFetcher.DEFAULT_EXTRACT_WORKERS})"
+        ),
+    )
+    
     args = parser.parse_args()
-    main(dry_run=args.dry_run, max_workers=args.threads)
+    main(dry_run=args.dry_run, max_workers=args.threads, extract_workers=args.extract_threads)
 
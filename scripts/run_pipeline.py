@@ -9,6 +9,7 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 def _add_repo_path() -> None:
@@ -40,6 +41,13 @@ Examples:
   
   # Dry run to validate configuration
   python scripts/run_pipeline.py --dry-run
+  
+  # Profile regex calls per pattern and chapter
+  python scripts/run_pipeline.py --profile-regex
+  
+  # Profile stages, sections, chapter hooks and worker tasks, and compare
+  # with an earlier profile
+  python scripts/run_pipeline.py --profile --profile-baseline old_profile.json
         """
     )
     
@@ -94,6 +102,35 @@ Examples:
         help="Save checkpoint with given ID after execution",
     )
     
+    parser.add_argument(
+        "--profile-regex",
+        nargs="?",
+        const="data/profiles/regex_profile.json",
+        default=None,
+        metavar="PATH",
+        help="Record regex call counts and timings per pattern and chapter, and write a "
+             "JSON report (default: data/profiles/regex_profile.json)",
+    )
+    
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="data/profiles/profile.json",
+        default=None,
+        metavar="PATH",
+        help="Record wall time, CPU time and peak RSS per transformer, stage, section, "
+             "chapter hook and worker task, and write a Chrome trace with a summary "
+             "(default: data/profiles/profile.json)",
+    )
+    
+    parser.add_argument(
+        "--profile-baseline",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Earlier --profile report to compare the summary against",
+    )
+    
     parser.add_argument(
         "--verbose",
         "-v",
@@ -176,6 +213,43 @@ def run_stage_only(config_path: Path, stage_name: str, verbose: bool = False) ->
         return 1
 
 
+def write_regex_report(path: str) -> None:
+    """Write the regex profile and print its slowest patterns.
+    
+    Args:
+        path: Output JSON path
+    """
+    from tools.pdf_pipeline.utils.regex_registry import PROFILER
+    
+    report_path = PROFILER.write_report(path)
+    print("\nREGEX PROFILE (slowest patterns)")
+    print(PROFILER.format_summary())
+    print(f"Full report: {report_path}")
+
+
+def write_profile_report(path: str, baseline_path: Optional[Path] = None) -> None:
+    """Write the pipeline profile and print the spans with the most self time.
+    
+    Args:
+        path: Output JSON path
+        baseline_path: Optional earlier report to compare against
+    """
+    import json
+    from tools.pdf_pipeline.utils.profiling import PROFILER
+    
+    baseline = None
+    if baseline_path:
+        try:
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Ignoring profile baseline {baseline_path}: {e}")
+    
+    report_path = PROFILER.write_report(path)
+    print("\nPIPELINE PROFILE (most self time)")
+    print(PROFILER.format_summary(baseline=baseline))
+    print(f"Chrome trace and full summary: {report_path}")
+
+
 def main() -> int:
     """Main entry point.
     
@@ -192,9 +266,22 @@ def main() -> int:
         print(f"Error: Configuration file not found: {args.config}")
         return 1
     
+    if args.profile_regex:
+        from tools.pdf_pipeline.utils.regex_registry import enable_regex_profiling
+        enable_regex_profiling()
+    
+    if args.profile:
+        from tools.pdf_pipeline.utils.profiling import enable_profiling
+        enable_profiling()
+    
     # Handle stage-only execution
     if args.stage:
-        return run_stage_only(args.config, args.stage, args.verbose)
+        exit_code = run_stage_only(args.config, args.stage, args.verbose)
+        if args.profile_regex:
+            write_regex_report(args.profile_regex)
+        if args.profile:
+            write_profile_report(args.profile, args.profile_baseline)
+        return exit_code
     
     # Run full pipeline
     try:
@@ -264,6 +351,11 @@ def main() -> int:
         
         print("=" * 60)
         
+        if args.profile_regex:
+            write_regex_report(args.profile_regex)
+        if args.profile:
+            write_profile_report(args.profile, args.profile_baseline)
+        
         return 0 if result.success else 1
         
     except Exception as e:
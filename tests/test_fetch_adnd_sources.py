@@ -8,10 +8,15 @@ TEST-3: Tests MUST verify file existence checking.
 TEST-4: Tests MUST verify download functionality.
 TEST-5: Tests MUST verify ZIP extraction functionality.
 TEST-6: Tests MUST verify error handling for failed downloads.
+TEST-7: Tests MUST verify Range resume and checksum verification over HTTP.
 """
 
+import hashlib
+import json
 import tempfile
+import threading
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from io import BytesIO
@@ -335,7 +340,7 @@ class TestArchiveOrgFetcher:
         assert len(filtered) == 1
         assert filtered[0].title == "Missing"
 
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_download_file_success(self, mock_get, fetcher, temp_sources_dir):
         """TEST: File download succeeds with valid response."""
         # Mock successful download
@@ -359,7 +364,7 @@ class TestArchiveOrgFetcher:
         assert source_file.local_path.exists()
         assert source_file.local_path.read_bytes() == b"chunk1chunk2"
 
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_download_file_handles_network_error(self, mock_get, fetcher, temp_sources_dir):
         """TEST: Download handles network errors gracefully."""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -377,7 +382,7 @@ class TestArchiveOrgFetcher:
         assert result is False
         assert not source_file.local_path.exists()
 
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_download_file_handles_http_error(self, mock_get, fetcher, temp_sources_dir):
         """TEST: Download handles HTTP errors (404, 500, etc.)."""
         mock_response = Mock()
@@ -436,7 +441,25 @@ class TestArchiveOrgFetcher:
         
         assert result is False
 
-    @patch("fetch_adnd_sources.requests.get")
+    def test_extract_zip_file_skips_current_members(self, fetcher, temp_sources_dir):
+        """TEST: Members already present with a matching CRC are not rewritten."""
+        zip_path = temp_sources_dir / "test.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("same.txt", "unchanged")
+            zf.writestr("stale.txt", "new content")
+        (temp_sources_dir / "same.txt").write_text("unchanged")
+        (temp_sources_dir / "stale.txt").write_text("old content")
+        
+        with patch.object(
+            zipfile.ZipFile, "extract", autospec=True, side_effect=zipfile.ZipFile.extract
+        ) as mock_extract:
+            result = fetcher.extract_zip_file(zip_path)
+        
+        assert result is True
+        assert [call.args[1].filename for call in mock_extract.call_args_list] == ["stale.txt"]
+        assert (temp_sources_dir / "stale.txt").read_text() == "new content"
+
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_download_and_extract_zip(self, mock_get, fetcher, temp_sources_dir):
         """TEST: ZIP files are automatically extracted after download."""
         # Create a mock ZIP file in memory
@@ -495,7 +518,7 @@ class TestIntegration:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
 
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_full_workflow_with_mixed_formats(self, mock_get, temp_sources_dir):
         """TEST: Complete workflow with PDF, EPUB, and ZIP files."""
         fetcher = ArchiveOrgFetcher(temp_sources_dir)
@@ -563,7 +586,7 @@ class TestParallelDownloads:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
     
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_parallel_download_success(self, mock_get, temp_sources_dir):
         """TEST: Parallel downloads complete successfully."""
         fetcher = ArchiveOrgFetcher(temp_sources_dir)
@@ -601,7 +624,7 @@ class TestParallelDownloads:
         assert stats["failed"] == 0
         assert all((temp_sources_dir / f"book{i}.pdf").exists() for i in range(5))
     
-    @patch("fetch_adnd_sources.requests.get")
+    @patch("fetch_adnd_sources.requests.Session.get")
     def test_parallel_download_with_failures(self, mock_get, temp_sources_dir):
         """TEST: Parallel downloads handle mixed success and failure."""
         fetcher = ArchiveOrgFetcher(temp_sources_dir)
@@ -651,6 +674,263 @@ class TestParallelDownloads:
         assert stats["failed"] == 2
 
 
+    @patch("fetch_adnd_sources.requests.Session.get")
+    def test_parallel_download_queues_zip_extraction(self, mock_get, temp_sources_dir):
+        """TEST: ZIP files are extracted by the extraction workers, not the downloaders."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        
+        def mock_download(url, **kwargs):
+            zip_buffer = BytesIO()
+            with zipfile.ZipFile(zip_buffer, "w") as zf:
+                zf.writestr(f"{Path(url).stem}.txt", "extracted content")
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.iter_content = Mock(return_value=[zip_buffer.getvalue()])
+            response.headers = {"content-length": str(len(zip_buffer.getvalue()))}
+            return response
+        
+        mock_get.side_effect = mock_download
+        
+        files = [
+            SourceFile(
+                title=f"Archive {i}",
+                url=f"https://example.com/archive{i}.zip",
+                format="zip",
+                local_path=temp_sources_dir / f"archive{i}.zip",
+                priority=3,
+            )
+            for i in range(3)
+        ]
+        stats = {"total": 3, "succeeded": 0, "failed": 0, "skipped": 0, "extracted": 0}
+        extracting_threads = []
+        original_extract = fetcher.extract_zip_file
+        
+        def record_thread(zip_path):
+            extracting_threads.append(threading.current_thread().name)
+            return original_extract(zip_path)
+        
+        with patch.object(fetcher, "extract_zip_file", side_effect=record_thread):
+            fetcher.download_files_parallel(files, stats, max_workers=2, extract_workers=2)
+        
+        assert stats["succeeded"] == 3
+        assert stats["extracted"] == 3
+        assert all(name.startswith("extract-") for name in extracting_threads)
+        assert all((temp_sources_dir / f"archive{i}.txt").exists() for i in range(3))
+
+    @patch("fetch_adnd_sources.requests.Session.get")
+    def test_failed_extraction_is_not_a_failed_download(self, mock_get, temp_sources_dir):
+        """TEST: A ZIP that downloads but fails to extract is counted once, as an extraction failure."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.iter_content = Mock(return_value=[b"not a zip"])
+        response.headers = {"content-length": "9"}
+        mock_get.return_value = response
+        
+        files = [
+            SourceFile(
+                title="Broken Archive",
+                url="https://example.com/broken.zip",
+                format="zip",
+                local_path=temp_sources_dir / "broken.zip",
+                priority=3,
+            )
+        ]
+        stats = {"total": 1, "succeeded": 0, "failed": 0, "skipped": 0, "extracted": 0}
+        
+        fetcher.download_files_parallel(files, stats, max_workers=1, extract_workers=1)
+        
+        assert stats["succeeded"] == 1
+        assert stats["failed"] == 0
+        assert stats["extract_failed"] == 1
+        assert "ZIP extractions failed: 1" in fetcher.format_statistics(stats)
+
+    def test_fetch_stage_reports_failed_extractions(self, temp_sources_dir):
+        """TEST: The source fetch stage warns about and reports failed extractions."""
+        from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput, ProcessorSpec
+        from tools.pdf_pipeline.stages.source_fetch import SourceFetchProcessor
+
+        missing = SourceFile(
+            title="Broken Archive",
+            url="https://example.com/broken.zip",
+            format="zip",
+            local_path=temp_sources_dir / "broken.zip",
+            priority=3,
+        )
+
+        def download(files, stats, **kwargs):
+            stats["succeeded"] += 1
+            stats["extract_failed"] += 1
+
+        fetcher = MagicMock()
+        fetcher.filter_existing_files.return_value = [missing]
+        fetcher.download_files_parallel.side_effect = download
+        fetcher.format_statistics.return_value = ""
+        processor = SourceFetchProcessor(ProcessorSpec(
+            name="SourceFetchProcessor",
+            config={"sources_dir": str(temp_sources_dir), "max_workers": 1},
+        ))
+        context = ExecutionContext(pipeline_name="fetch")
+
+        with patch("tools.pdf_pipeline.stages.source_fetch.ArchiveOrgFetcher", return_value=fetcher):
+            result = processor.process(ProcessorInput(data={}), context)
+
+        assert result.metadata["extract_failed"] == 1
+        assert result.metadata["failed"] == 0
+        assert context.warnings == ["1 source ZIP files failed to extract"]
+
+
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serve in-memory files with Range support and record each request."""
+
+    files = {}
+    requests_seen = []
+
+    def do_GET(self):
+        body = self.files.get(self.path)
+        range_header = self.headers.get("Range")
+        self.requests_seen.append((self.path, range_header))
+        if body is None:
+            self.send_error(404)
+            return
+        if self.path.startswith("/metadata"):
+            self.send_response(200)
+        elif range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(body):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResumableDownloads:
+    """Tests for Range resume and verification against a local HTTP server."""
+
+    CONTENT = bytes(range(256)) * 64
+
+    @pytest.fixture
+    def server(self):
+        """Start a local HTTP stand-in for archive.org."""
+        _RangeHandler.files = {
+            "/book.pdf": self.CONTENT,
+            "/metadata": json.dumps(
+                {
+                    "files": [
+                        {
+                            "name": "sub/book.pdf",
+                            "size": str(len(self.CONTENT)),
+                            "md5": hashlib.md5(self.CONTENT).hexdigest(),
+                        }
+                    ]
+                }
+            ).encode(),
+        }
+        _RangeHandler.requests_seen = []
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+        httpd.shutdown()
+        httpd.server_close()
+
+    @pytest.fixture
+    def temp_sources_dir(self):
+        """Create a temporary sources directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def _source_file(self, server, temp_sources_dir, fetcher):
+        source_file = SourceFile(
+            title="Book",
+            url=f"{server}/book.pdf",
+            format="pdf",
+            local_path=temp_sources_dir / "book.pdf",
+            priority=1,
+        )
+        fetcher.METADATA_URL = f"{server}/metadata"
+        fetcher.apply_file_metadata([source_file], fetcher.fetch_file_metadata())
+        return source_file
+
+    def test_metadata_annotates_size_and_md5(self, server, temp_sources_dir):
+        """TEST: Expected size and MD5 come from the metadata endpoint."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        source_file = self._source_file(server, temp_sources_dir, fetcher)
+
+        assert source_file.size == len(self.CONTENT)
+        assert source_file.md5 == hashlib.md5(self.CONTENT).hexdigest()
+
+    def test_metadata_matches_percent_encoded_href(self, temp_sources_dir):
+        """TEST: A listing href with %20 matches the decoded metadata name."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        (source_file,) = fetcher.parse_download_links(
+            '<a href="Dark%20Sun%20Boxed%20Set.pdf">Dark Sun</a>'
+        )
+
+        fetcher.apply_file_metadata(
+            [source_file], {"Dark Sun Boxed Set.pdf": {"size": 42, "md5": "abc"}}
+        )
+
+        assert (source_file.size, source_file.md5) == (42, "abc")
+
+    def test_resume_fetches_only_missing_bytes(self, server, temp_sources_dir):
+        """TEST: A .part file is resumed with a Range request and recorded in the manifest."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        source_file = self._source_file(server, temp_sources_dir, fetcher)
+        fetcher.get_partial_path(source_file.local_path).write_bytes(self.CONTENT[:1000])
+
+        assert fetcher.download_file(source_file, show_progress=False) is True
+
+        assert source_file.local_path.read_bytes() == self.CONTENT
+        assert not fetcher.get_partial_path(source_file.local_path).exists()
+        assert ("/book.pdf", "bytes=1000-") in _RangeHandler.requests_seen
+        manifest = json.loads(fetcher.manifest_path.read_text())
+        assert manifest["files"]["book.pdf"]["size"] == len(self.CONTENT)
+
+    def test_complete_part_file_is_not_refetched(self, server, temp_sources_dir):
+        """TEST: A .part file that already holds every byte is verified without a request."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        source_file = self._source_file(server, temp_sources_dir, fetcher)
+        fetcher.get_partial_path(source_file.local_path).write_bytes(self.CONTENT)
+
+        assert fetcher.download_file(source_file, show_progress=False) is True
+
+        assert [path for path, _ in _RangeHandler.requests_seen] == ["/metadata"]
+
+    def test_checksum_mismatch_discards_download(self, server, temp_sources_dir):
+        """TEST: A corrupt .part file fails verification and is removed."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        source_file = self._source_file(server, temp_sources_dir, fetcher)
+        fetcher.get_partial_path(source_file.local_path).write_bytes(b"x" * 1000)
+
+        assert fetcher.download_file(source_file, show_progress=False) is False
+
+        assert not source_file.local_path.exists()
+        assert not fetcher.get_partial_path(source_file.local_path).exists()
+        assert "book.pdf" not in fetcher.manifest
+
+    def test_truncated_file_is_requeued(self, server, temp_sources_dir):
+        """TEST: An existing file whose size disagrees with metadata is fetched again."""
+        fetcher = ArchiveOrgFetcher(temp_sources_dir)
+        source_file = self._source_file(server, temp_sources_dir, fetcher)
+        source_file.local_path.write_bytes(self.CONTENT[:10])
+
+        assert fetcher.filter_existing_files([source_file]) == [source_file]
+
+        fetcher.download_file(source_file, show_progress=False)
+        assert fetcher.filter_existing_files([source_file]) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
-
@@ -79,14 +79,67 @@ class TestADnDExtractor(unittest.TestCase):
         spec.config = {}
         extractor = ADnDRuleExtractor(spec)
 
-        # Mock PDF extraction
-        with patch("pdfplumber.open"):
-            results = extractor._extract_ability_scores(
-                Path("dummy.pdf"), ADnDSourcebook.DMG_REVISED
-            )
+        pages = {13: {"text": "STR 18 DEX 12", "tables": []}}
+        results = extractor._extract_ability_scores(pages, ADnDSourcebook.DMG_REVISED)
 
         # Should return a list
         self.assertIsInstance(results, list)
+        self.assertEqual([r.ability for r in results], ["STR", "DEX"])
+        self.assertEqual(results[0].page_reference, "13")
+
+    def test_sourcebook_opened_once_for_all_rule_types(self):
+        """Test a sourcebook is scanned once and shared across extractors."""
+        pdf_file = Path(self.temp_dir) / "test_dmg.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4")
+        registry_data = {
+            "sourcebooks": [
+                {
+                    "id": "dmg_revised",
+                    "filename": str(pdf_file),
+                    "extract_rules": ["ability_scores", "saves", "thac0"],
+                    "page_map": {
+                        "ability_scores": {"pages": [1, 2], "tables": False},
+                        "saves": {"pages": [2, 3], "tables": True},
+                        "thac0": [3, 3],
+                    },
+                }
+            ],
+            "extraction_order": ["dmg_revised"],
+        }
+        self.registry_file.write_text(json.dumps(registry_data), encoding="utf-8")
+
+        pages = []
+        for text in ["STR 18", "CON 16", "THAC0 20"]:
+            page = MagicMock()
+            page.extract_text.return_value = text
+            page.extract_tables.return_value = []
+            pages.append(page)
+        pdf = MagicMock()
+        pdf.pages = pages
+        pdf.__enter__.return_value = pdf
+
+        spec = MagicMock()
+        spec.config = {
+            "sourcebook_registry": str(self.registry_file),
+            "knowledge_base_dir": str(self.kb_dir),
+            "parallel": False,
+        }
+        extractor = ADnDRuleExtractor(spec)
+
+        with patch(
+            "tools.pdf_pipeline.knowledge_base.adnd_extractor.pdfplumber.open",
+            return_value=pdf,
+        ) as pdf_open:
+            result = extractor.process(
+                ProcessorInput(data={}), ExecutionContext(pipeline_name="test")
+            )
+
+        pdf_open.assert_called_once()
+        self.assertEqual(result.data["extracted_rules"], 2)
+        pages[0].extract_tables.assert_not_called()
+        pages[1].extract_tables.assert_called_once()
+        for page in pages:
+            page.extract_text.assert_called_once()
 
 
 class TestKnowledgeRepository(unittest.TestCase):
@@ -0,0 +1,85 @@
+"""Unit tests for worker side artifacts.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.pdf_pipeline.postprocessors.html_export import _export_html_task
+from tools.pdf_pipeline.utils.artifacts import (
+    collect_artifacts,
+    emit_artifact,
+    merge_artifacts,
+    register_merger,
+)
+
+
+class TestArtifacts(unittest.TestCase):
+    """Test collecting and merging side artifacts."""
+
+    def setUp(self):
+        """Register a recording merger."""
+        self.merged = []
+        register_merger("test-artifact", self.merged.append)
+
+    def test_collected_artifacts_are_not_merged(self):
+        """Test artifacts emitted inside a collector are returned, not applied."""
+        with collect_artifacts() as artifacts:
+            emit_artifact("test-artifact", [1])
+            with collect_artifacts() as inner:
+                emit_artifact("test-artifact", [2])
+        self.assertEqual(artifacts, [("test-artifact", [1])])
+        self.assertEqual(inner, [("test-artifact", [2])])
+        self.assertEqual(self.merged, [])
+
+    def test_emit_without_collector_merges_now(self):
+        """Test direct callers keep their immediate side effect."""
+        emit_artifact("test-artifact", {"a": 1})
+        self.assertEqual(self.merged, [[{"a": 1}]])
+
+    def test_merge_groups_payloads_in_order(self):
+        """Test each merger runs once with its payloads in the given order."""
+        errors = merge_artifacts([
+            ("test-artifact", "first"), ("unknown-artifact", None), ("test-artifact", "second"),
+        ])
+        self.assertEqual(self.merged, [["first", "second"]])
+        self.assertEqual(errors, ["No merger registered for artifact 'unknown-artifact'"])
+
+    def test_failed_merger_reports_error(self):
+        """Test a merger exception becomes an error message."""
+        register_merger("test-broken", lambda payloads: 1 / 0)
+        errors = merge_artifacts([("test-broken", None)])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("test-broken", errors[0])
+
+
+class TestExportTaskArtifacts(unittest.TestCase):
+    """Test the HTML export worker returns artifacts instead of writing them."""
+
+    def setUp(self):
+        """Create temporary directories."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_export_task_collects_artifacts(self):
+        """Test fixers' artifacts land in the task result."""
+        journal = {"slug": "plain", "data": {"title": "Plain", "content": "<p>Text</p>"}}
+        json_file = self.temp_dir / "plain.json"
+        json_file.write_text(json.dumps(journal), encoding="utf-8")
+
+        result = _export_html_task({"json_file": str(json_file), "output_dir": str(self.temp_dir)})
+        self.assertEqual(result["items"], 1)
+        self.assertEqual(result["artifacts"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,8 @@ import logging
 import json
 from tools.pdf_pipeline.transformers.chapter_10.tables import (
     extract_individual_treasures_table,
-    _extract_individual_table_cells_from_blocks,
-    _organize_individual_cells_into_table,
 )
-from tools.pdf_pipeline.transformers.chapter_10.common import normalize_plain_text
+from tools.pdf_pipeline.transformers.chapter_10.common import clean_whitespace, normalize_plain_text
 
 logger = logging.getLogger(__name__)
 
@@ -198,6 +196,11 @@ class TestIndividualTreasuresTableExtraction(unittest.TestCase):
                     self.assertNotRegex(line, r'\d\s+\d', 
                                       f"Cell has space within number on same line: '{line}' in '{cell_text}'")
 
+    def test_clean_whitespace_joins_whole_words(self):
+        """Test a spaced-out word is joined in one call and cleaning is idempotent."""
+        self.assertEqual(clean_whitespace("A n y 1 - 1 0 0"), "Any 1-100")
+        self.assertEqual(clean_whitespace(clean_whitespace("A n y")), clean_whitespace("A n y"))
+
     def test_header_marked_as_h2(self):
         """Test that the header is marked as H2."""
         # Make a copy to avoid modifying the original
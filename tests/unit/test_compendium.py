@@ -0,0 +1,240 @@
+"""Unit tests for the deterministic, incremental compendium builder.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tools.pdf_pipeline.compendium import (
+    build_ancestry_pack,
+    build_journal_pack,
+    read_pack,
+    split_journal_pages,
+    stable_id,
+    write_pack,
+)
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput
+from tools.pdf_pipeline.stages.foundry_build import CompendiumBuildProcessor
+from tools.pdf_pipeline.utils.artifacts import collect_artifacts, merge_artifacts
+from tools.pdf_pipeline.utils.entities import emit_entities
+
+
+def _write_journal(journals_dir: Path, slug: str, content: str) -> None:
+    (journals_dir / f"{slug}.json").write_text(
+        json.dumps(
+            {
+                "slug": slug,
+                "data": {"title": slug.title(), "content": content, "source_pages": [1, 2]},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+class TestCompendiumPacks(unittest.TestCase):
+    """Test stable IDs and incremental pack writes."""
+
+    def setUp(self):
+        """Set up a processed data directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.journals_dir = self.temp_dir / "journals"
+        self.journals_dir.mkdir()
+        _write_journal(self.journals_dir, "chapter-one", "<p>One</p>")
+        _write_journal(self.journals_dir, "chapter-two", "<p>Two</p>")
+        self.ancestry_file = self.temp_dir / "ancestries.json"
+        self.ancestry_file.write_text(
+            json.dumps(
+                {"data": {"entities": [{"name": "Mul", "slug": "mul", "pf2e": {}}]}}
+            ),
+            encoding="utf-8",
+        )
+        self.pack = self.temp_dir / "rules.db"
+
+    def test_rebuild_produces_identical_pack(self):
+        """Test two builds from the same inputs write byte-identical packs."""
+        build_journal_pack(self.journals_dir, self.pack)
+        first = self.pack.read_bytes()
+        build_journal_pack(self.journals_dir, self.pack)
+
+        self.assertEqual(self.pack.read_bytes(), first)
+        docs = read_pack(self.pack)
+        self.assertIn(stable_id("journal", "chapter-one"), docs)
+        self.assertTrue(all(len(doc_id) == 16 for doc_id in docs))
+
+    def test_ancestry_ids_derive_from_slug(self):
+        """Test ancestry document IDs come from the entity slug."""
+        pack = build_ancestry_pack(self.ancestry_file, self.temp_dir / "anc.db")
+        self.assertEqual(list(read_pack(pack)), [stable_id("ancestry", "mul")])
+
+    def test_changed_entry_is_appended_as_update(self):
+        """Test only the changed document is written as an update record."""
+        build_journal_pack(self.journals_dir, self.pack)
+        lines_before = self.pack.read_text(encoding="utf-8").splitlines()
+        _write_journal(self.journals_dir, "chapter-two", "<p>Two, revised</p>")
+
+        build_journal_pack(self.journals_dir, self.pack)
+
+        lines_after = self.pack.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines_after[: len(lines_before)], lines_before)
+        self.assertEqual(len(lines_after), len(lines_before) + 1)
+        docs = read_pack(self.pack)
+        updated = docs[stable_id("journal", "chapter-two")]
+        self.assertEqual(updated["pages"][0]["text"]["content"], "<p>Two, revised</p>")
+
+    def test_removed_entry_and_compaction(self):
+        """Test removals are recorded and heavy churn compacts the pack."""
+        entries = [{"_id": stable_id("doc", n), "name": str(n)} for n in range(4)]
+        write_pack(entries, self.pack)
+
+        stats = write_pack(entries[:3], self.pack)
+        self.assertEqual(stats["removed"], 1)
+        self.assertFalse(stats["rewritten"])
+        self.assertEqual(len(read_pack(self.pack)), 3)
+
+        changed = [dict(entry, name="x") for entry in entries[:3]]
+        stats = write_pack(changed, self.pack)
+        self.assertTrue(stats["rewritten"])
+        self.assertEqual(len(self.pack.read_text(encoding="utf-8").splitlines()), 3)
+
+
+CHAPTER_HTML = (
+    '<nav id="table-of-contents">\n<h2>Table of Contents</h2>\n<ul>'
+    '<li><a href="#header-0-water">Water</a></li>'
+    '<li><a href="#header-2-metal">Metal</a></li></ul>\n</nav>\n'
+    '<a id="top"></a><p>Intro text.</p>'
+    '<p id="header-0-water" class="h1-header">I.  <a href="#top" style="font-size: 0.8em;">[^]</a> '
+    '<span style="color: #ca5804">Water</span></p><p>See <a href="#header-3-iron">Iron</a>.</p>'
+    '<p id="header-1-wells" class="h2-header"> <a href="#top">[^]</a> '
+    '<span class="header-h2">Wells</span></p><p>Back to <a href="#header-0-water">Water</a>.</p>'
+    '<p id="header-2-metal" class="h1-header">II.  <a href="#top">[^]</a> '
+    '<span style="color: #ca5804">Metal</span></p>'
+    '<p id="header-3-iron" class="h2-header"> <a href="#top">[^]</a> '
+    '<span class="header-h2">Iron</span></p><p>See <a href="#header-1-wells">Wells</a>.</p>'
+)
+
+
+class TestJournalPageSplit(unittest.TestCase):
+    """Test chapters are split into pages at H1 anchors."""
+
+    UUID = "Compendium.darksun-pf2e.dark-sun-rules.JournalEntry.abc"
+
+    def setUp(self):
+        """Split the sample chapter."""
+        self.pages = split_journal_pages("chapter", "Chapter", CHAPTER_HTML, self.UUID)
+        self.by_name = {page["name"]: page for page in self.pages}
+
+    def _link(self, key: str, label: str) -> str:
+        page_id = stable_id("journal", "chapter", "page", key)
+        return f"@UUID[{self.UUID}.JournalEntryPage.{page_id}]{{{label}}}"
+
+    def test_pages_follow_h1_sections(self):
+        """Test an index, an introduction and one page per H1 are produced."""
+        self.assertEqual(
+            [page["name"] for page in self.pages], ["Contents", "Chapter", "Water", "Metal"]
+        )
+        self.assertEqual([page["sort"] for page in self.pages], [1000, 2000, 3000, 4000])
+        self.assertIn("Wells", self.by_name["Water"]["text"]["content"])
+        self.assertNotIn("table-of-contents", "".join(p["text"]["content"] for p in self.pages))
+
+    def test_index_links_every_page(self):
+        """Test the navigation index links each section page by UUID."""
+        index = self.by_name["Contents"]["text"]["content"]
+        self.assertIn(self._link("header-0-water", "Water"), index)
+        self.assertIn(self._link("header-2-metal", "Metal"), index)
+
+    def test_internal_links_rewritten_across_pages(self):
+        """Test cross-page anchors become UUID links and same-page ones stay."""
+        water = self.by_name["Water"]["text"]["content"]
+        metal = self.by_name["Metal"]["text"]["content"]
+
+        self.assertIn(self._link("header-2-metal", "Iron"), water)
+        self.assertIn('<a href="#header-0-water">Water</a>', water)
+        self.assertIn(self._link("header-0-water", "Wells"), metal)
+        self.assertIn(self._link("index", "[^]"), metal)
+        self.assertNotIn('href="#top"', water + metal)
+
+    def test_content_without_anchors_stays_single_page(self):
+        """Test unanchored content keeps the single-page layout."""
+        pages = split_journal_pages("kluzd", "Kluzd", "<p>Kluzd</p>", self.UUID)
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0]["text"]["content"], "<p>Kluzd</p>")
+
+
+class TestCompendiumBuildProcessor(unittest.TestCase):
+    """Test the content manifest skips unchanged packs."""
+
+    def setUp(self):
+        """Set up processed inputs and the processor."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.converted_dir = self.temp_dir / "processed"
+        self.journals_dir = self.converted_dir / "journals"
+        self.journals_dir.mkdir(parents=True)
+        _write_journal(self.journals_dir, "chapter-one", "<p>One</p>")
+        (self.converted_dir / "ancestries.json").write_text(
+            json.dumps({"data": {"entities": []}}), encoding="utf-8"
+        )
+
+        spec = MagicMock()
+        spec.config = {
+            "converted_dir": str(self.converted_dir),
+            "output_dir": str(self.temp_dir / "packs"),
+        }
+        self.processor = CompendiumBuildProcessor(spec)
+
+    def _run(self):
+        context = ExecutionContext(pipeline_name="test")
+        result = self.processor.process(ProcessorInput(data={}), context)
+        return result, context
+
+    def test_unchanged_inputs_skip_build(self):
+        """Test a rerun with unchanged inputs builds nothing."""
+        first, context = self._run()
+        self.assertEqual(context.items_processed, 2)
+
+        with patch(
+            "tools.pdf_pipeline.stages.foundry_build.build_journal_pack"
+        ) as build:
+            second, context = self._run()
+
+        build.assert_not_called()
+        self.assertEqual(context.items_processed, 0)
+        self.assertEqual(
+            sorted(second.metadata["skipped_packs"]),
+            ["dark-sun-ancestries", "dark-sun-rules"],
+        )
+        self.assertEqual(second.data["compendia"], first.data["compendia"])
+
+    def test_changed_input_rebuilds_only_that_pack(self):
+        """Test editing a journal rebuilds the rules pack only."""
+        self._run()
+        _write_journal(self.journals_dir, "chapter-one", "<p>Changed</p>")
+
+        result, context = self._run()
+
+        self.assertEqual(context.items_processed, 1)
+        self.assertEqual(result.metadata["skipped_packs"], ["dark-sun-ancestries"])
+
+    def test_held_back_entity_packs_are_not_built(self):
+        """Test entity packs without PF2E system data stay out of the build."""
+        with collect_artifacts() as artifacts:
+            emit_entities("equipment", "chapter-six", [{"name": "Rope", "source": "chapter-six", "category": "General"}],
+                          self.converted_dir / "entities")
+            emit_entities("spell", "chapter-seven", [{"name": "Bless", "source": "chapter-seven"}],
+                          self.converted_dir / "entities")
+        merge_artifacts(artifacts)
+
+        result, _ = self._run()
+
+        names = [pack["name"] for pack in result.data["compendia"]]
+        self.assertIn("dark-sun-equipment", names)
+        self.assertNotIn("dark-sun-spells", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Unit tests for typed entity extraction and entity packs.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.pdf_pipeline.compendium import build_entity_pack, read_pack
+from tools.pdf_pipeline.transformers.chapter_6.entities import equipment_entities
+from tools.pdf_pipeline.utils.artifacts import collect_artifacts, merge_artifacts
+from tools.pdf_pipeline.utils.entities import (
+    ENTITIES_ARTIFACT,
+    SpellEntity,
+    emit_entities,
+    entity_file,
+    parse_level,
+    read_entities,
+)
+
+
+def _table(rows):
+    return {
+        "header_rows": 1,
+        "rows": [{"cells": [{"text": text} for text in row]} for row in [["Item", "Price", "Weight"]] + rows],
+    }
+
+
+class TestEntityFiles(unittest.TestCase):
+    """Test emitting entities and merging them into per-type files."""
+
+    def setUp(self):
+        """Create a temporary entities directory."""
+        self.entities_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.entities_dir, ignore_errors=True)
+
+    def _emit(self, source, records, entity_type="spell"):
+        with collect_artifacts() as artifacts:
+            emit_entities(entity_type, source, records, self.entities_dir)
+        self.assertEqual(artifacts[0][0], ENTITIES_ARTIFACT)
+        self.assertEqual(merge_artifacts(artifacts), [])
+
+    def test_columnar_file(self):
+        """Test records are written as a header line and one array per record."""
+        self._emit("chapter-a", [SpellEntity(name="Bless", source="chapter-a", level=1, sphere="Sun")])
+        lines = entity_file("spell", self.entities_dir).read_text(encoding="utf-8").splitlines()
+        header = json.loads(lines[0])
+        self.assertEqual(header["columns"], ["name", "source", "level", "sphere"])
+        self.assertEqual(header["count"], 1)
+        self.assertEqual(json.loads(lines[1]), ["Bless", "chapter-a", 1, "Sun"])
+
+    def test_reemitting_replaces_only_that_source(self):
+        """Test a chapter's rows are replaced while other chapters' rows stay."""
+        self._emit("chapter-b", [{"name": "Fireball", "source": "chapter-b", "level": 3}])
+        self._emit("chapter-a", [{"name": "Bless", "source": "chapter-a"}])
+        self._emit("chapter-b", [{"name": "Sleep", "source": "chapter-b", "level": 1}])
+
+        names = [record["name"] for record in read_entities("spell", self.entities_dir)]
+        self.assertEqual(names, ["Bless", "Sleep"])
+
+    def test_changed_columns_rebuild_file(self):
+        """Test a file written with other columns is discarded, not mixed."""
+        path = entity_file("spell", self.entities_dir)
+        path.write_text(
+            json.dumps({"entity": "spell", "version": 1, "columns": ["name", "source"]})
+            + "\n" + json.dumps(["Old", "chapter-c"]) + "\n",
+            encoding="utf-8",
+        )
+        self._emit("chapter-a", [{"name": "Bless", "source": "chapter-a"}])
+        self.assertEqual([r["name"] for r in read_entities("spell", self.entities_dir)], ["Bless"])
+
+    def test_validation(self):
+        """Test unknown types and fields are rejected and levels are parsed."""
+        with self.assertRaises(ValueError):
+            emit_entities("relic", "chapter-a", [])
+        with self.assertRaises(ValueError):
+            emit_entities("spell", "chapter-a", [{"name": "Bless", "source": "chapter-a", "range": "0"}])
+        self.assertEqual(parse_level("3rd-Level Spells"), 3)
+        self.assertEqual(parse_level("Seventh level"), 7)
+        self.assertIsNone(parse_level("Cantrips"))
+
+
+class TestChapter6Entities(unittest.TestCase):
+    """Test equipment records from the chapter 6 price lists."""
+
+    def test_group_rows_name_their_variants(self):
+        """Test a row without a price labels the indented rows below it."""
+        table = _table([
+            ["Chariot", "", ""],
+            ["  two-wheeled", "200 cp", "-"],
+            ["Kank", "", ""],
+            ["  Trained", "12 cp", "-"],
+            ["Inix", "50 cp", "-"],
+        ])
+        section = {"slug": "chapter-six", "pages": [{"blocks": [{"__transport_table": table}]}]}
+        items = equipment_entities(section)
+        self.assertEqual(
+            [(item.name, item.cost) for item in items],
+            [("Chariot (two-wheeled)", "200 cp"), ("Kank (Trained)", "12 cp"), ("Inix", "50 cp")],
+        )
+        self.assertEqual({item.category for item in items}, {"Transport"})
+        self.assertEqual({item.source for item in items}, {"chapter-six"})
+
+
+class TestEntityPacks(unittest.TestCase):
+    """Test building compendium documents from entity files."""
+
+    def setUp(self):
+        """Write a monster entity file."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.entities_dir = self.temp_dir / "entities"
+        with collect_artifacts() as artifacts:
+            emit_entities("monster", "chapter-five", [
+                {"name": "Kank", "source": "chapter-five", "stats": {"Armor Class": "5"}, "combat": "Bites."},
+                {"name": "Kank", "source": "chapter-five"},
+            ], self.entities_dir)
+        merge_artifacts(artifacts)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_bestiary_actors(self):
+        """Test monsters become npc Actors with stable, distinct IDs and AD&D flags."""
+        pack = self.temp_dir / "dark-sun-bestiary.db"
+        build_entity_pack(self.entities_dir, pack, "dark-sun-bestiary", foundry_version=10)
+        documents = list(read_pack(pack).values())
+
+        self.assertEqual([doc["type"] for doc in documents], ["npc", "npc"])
+        self.assertEqual(len({doc["_id"] for doc in documents}), 2)
+        self.assertEqual(documents[0]["flags"]["darksun-pf2e"]["adnd"]["stats"], {"Armor Class": "5"})
+        self.assertIn("Bites.", documents[0]["system"]["details"]["publicNotes"])
+
+        build_entity_pack(self.entities_dir, pack, "dark-sun-bestiary", foundry_version=10)
+        self.assertEqual([doc["_id"] for doc in read_pack(pack).values()], [doc["_id"] for doc in documents])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,10 @@ from tools.pdf_pipeline.postprocessors.html_export import (
     _fix_letter_spacing,
     _reposition_chapter2_tables,
     _generate_html_template,
+    _on_body,
+    _on_content,
+    _render_parts,
+    _split_toc,
 )
 
 
@@ -162,6 +166,44 @@ class TestGenerateHtmlTemplate(unittest.TestCase):
         self.assertIn("<title>Custom: My Chapter</title>", result)
 
 
+class TestPageParts(unittest.TestCase):
+    """Test page assembly from separate TOC and content buffers."""
+
+    TOC = '<nav id="table-of-contents"><ul><li>A</li></ul></nav>'
+
+    def test_split_toc(self):
+        """Test the TOC nav is separated from the content."""
+        toc, content = _split_toc(f"{self.TOC}\n<p>Body</p>")
+        self.assertEqual(toc, self.TOC)
+        self.assertEqual(content, "\n<p>Body</p>")
+        self.assertEqual(_split_toc("<p>Body</p>"), ("", "<p>Body</p>"))
+
+    def test_content_fixer_never_sees_chrome(self):
+        """Test content fixers only receive the content buffer."""
+        seen = []
+        fixer = _on_content(lambda html: seen.append(html) or html.upper())
+        toc, content = fixer(self.TOC, "<p>body</p>")
+        self.assertEqual(seen, ["<p>body</p>"])
+        self.assertEqual((toc, content), (self.TOC, "<P>BODY</P>"))
+
+    def test_body_fixer_edits_toc_and_content(self):
+        """Test body fixers see the TOC and content section and round-trip them."""
+        def fixer(html):
+            self.assertNotIn("<head>", html)
+            self.assertIn('<section class="content">', html)
+            return html.replace("<li>A</li>", "").replace("old", "new")
+
+        toc, content = _on_body(fixer)(self.TOC, "<p>old</p>")
+        self.assertEqual(toc, '<nav id="table-of-contents"><ul></ul></nav>')
+        self.assertEqual(content, "<p>new</p>")
+
+    def test_render_matches_template(self):
+        """Test an unfixed page renders exactly as the template."""
+        expected = _generate_html_template("T", self.TOC, "<p>x</p>", "slug", "DS - ")
+        self.assertEqual(_render_parts("T", "slug", "DS - ", self.TOC, "<p>x</p>"), expected)
+        self.assertEqual(expected.count('<section class="content">'), 1)
+
+
 class TestExportHtmlTask(unittest.TestCase):
     """Test the _export_html_task worker function."""
     
@@ -0,0 +1,95 @@
+"""Unit tests for the knowledge base snapshot.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.pdf_pipeline.knowledge_base.adnd_schema import (
+    ADnDAbilityScore,
+    ADnDSourcebook,
+)
+from tools.pdf_pipeline.knowledge_base.knowledge_repository import (
+    KnowledgeRepository,
+    RuleCategory,
+)
+from tools.pdf_pipeline.knowledge_base.pf2e_client import PF2EMCPClient
+from tools.pdf_pipeline.knowledge_base.snapshot import build_snapshot, open_snapshot
+
+
+class TestKnowledgeSnapshot(unittest.TestCase):
+    """Test snapshot build, lazy reads and staleness fallback."""
+
+    def setUp(self):
+        """Set up a knowledge base with one rule and a PF2E cache entry."""
+        self.kb_dir = Path(tempfile.mkdtemp()) / "knowledge_base"
+        repo = KnowledgeRepository(self.kb_dir)
+        self.rule_id = repo.store_adnd_rule(
+            ADnDAbilityScore(
+                ability="STR", score=18, modifiers={}, source=ADnDSourcebook.DMG_REVISED
+            ),
+            RuleCategory.ABILITY_SCORES,
+            ADnDSourcebook.DMG_REVISED,
+            rule_id="str_18",
+        )
+        PF2EMCPClient(self.kb_dir / "pf2e_cache").query_saves()
+        build_snapshot(self.kb_dir)
+
+    def test_repository_reads_from_snapshot(self):
+        """Test a current snapshot serves the index and rules without disk reads."""
+        repo = KnowledgeRepository(self.kb_dir)
+        self.assertIsNotNone(repo.snapshot)
+        self.assertEqual(repo.list_adnd_rules(), [self.rule_id])
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("disk read")):
+            rule = repo.get_adnd_rule(
+                self.rule_id, RuleCategory.ABILITY_SCORES, ADnDSourcebook.DMG_REVISED
+            )
+            saves = PF2EMCPClient(
+                self.kb_dir / "pf2e_cache", repo=repo
+            ).query_saves()
+
+        self.assertEqual(rule.score, 18)
+        self.assertEqual(len(saves), 3)
+
+    def test_stale_snapshot_falls_back_to_directory(self):
+        """Test storing a rule makes the snapshot stale for new repositories."""
+        repo = KnowledgeRepository(self.kb_dir)
+        repo.store_adnd_rule(
+            ADnDAbilityScore(
+                ability="DEX", score=12, modifiers={}, source=ADnDSourcebook.DMG_REVISED
+            ),
+            RuleCategory.ABILITY_SCORES,
+            ADnDSourcebook.DMG_REVISED,
+            rule_id="dex_12",
+        )
+
+        self.assertIsNone(repo.snapshot)
+        self.assertIsNone(open_snapshot(self.kb_dir))
+        fresh = KnowledgeRepository(self.kb_dir)
+        self.assertIsNone(fresh.snapshot)
+        self.assertEqual(sorted(fresh.list_adnd_rules()), ["dex_12", "str_18"])
+
+    def test_snapshot_index_not_mutated_by_store(self):
+        """Test storing through one repository leaves the shared snapshot intact."""
+        snapshot = open_snapshot(self.kb_dir)
+        repo = KnowledgeRepository(self.kb_dir)
+        repo.store_adnd_rule(
+            ADnDAbilityScore(
+                ability="CON", score=9, modifiers={}, source=ADnDSourcebook.DMG_REVISED
+            ),
+            RuleCategory.ABILITY_SCORES,
+            ADnDSourcebook.DMG_REVISED,
+            rule_id="con_9",
+        )
+
+        self.assertEqual(snapshot.index["metadata"]["total_adnd_rules"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
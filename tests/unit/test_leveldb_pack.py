@@ -0,0 +1,183 @@
+"""Unit tests for the LevelDB compendium pack writer.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput
+from tools.pdf_pipeline.leveldb_pack import (
+    crc32c,
+    read_leveldb_pack,
+    uses_leveldb,
+    write_leveldb_pack,
+)
+from tools.pdf_pipeline.stages.foundry_build import (
+    CompendiumBuildProcessor,
+    ModuleMetadataProcessor,
+)
+
+
+def _journal(doc_id: str, content: str) -> dict:
+    return {
+        "_id": doc_id,
+        "name": doc_id,
+        "pages": [{"_id": f"{doc_id}p", "name": doc_id, "text": {"content": content}}],
+    }
+
+
+class TestLevelDBPack(unittest.TestCase):
+    """Test the LevelDB log layout and read-back verification."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pack = self.temp_dir / "rules"
+
+    def test_crc32c_known_value(self):
+        """Test the checksum matches the CRC-32C check value."""
+        self.assertEqual(crc32c(b"123456789"), 0xE3069283)
+
+    def test_round_trip_splits_embedded_pages(self):
+        """Test journal pages are stored under their own keys."""
+        stats = write_leveldb_pack(
+            iter([_journal("a", "<p>A</p>"), _journal("b", "<p>B</p>")]),
+            self.pack,
+            "JournalEntry",
+            batch_size=1,
+        )
+
+        self.assertEqual(stats["documents"], 2)
+        self.assertEqual(stats["embedded"], 2)
+        self.assertEqual(stats["batches"], 2)
+        self.assertEqual(
+            sorted(p.name for p in self.pack.iterdir()),
+            ["000003.log", "CURRENT", "MANIFEST-000002"],
+        )
+        values = read_leveldb_pack(self.pack)
+        self.assertEqual(values["!journal!a"]["pages"], ["ap"])
+        self.assertEqual(values["!journal.pages!a.ap"]["text"]["content"], "<p>A</p>")
+
+    def test_large_documents_span_log_blocks(self):
+        """Test records larger than a 32 KiB block are fragmented and rejoined."""
+        content = "x" * 100_000
+        write_leveldb_pack([_journal("big", content)], self.pack, "JournalEntry")
+
+        values = read_leveldb_pack(self.pack)
+        self.assertEqual(values["!journal.pages!big.bigp"]["text"]["content"], content)
+
+    def test_corruption_is_detected(self):
+        """Test a flipped byte in the log fails verification."""
+        write_leveldb_pack([_journal("a", "<p>A</p>")], self.pack, "JournalEntry")
+        log = self.pack / "000003.log"
+        data = bytearray(log.read_bytes())
+        data[20] ^= 0xFF
+        log.write_bytes(bytes(data))
+
+        with self.assertRaises(ValueError):
+            read_leveldb_pack(self.pack)
+
+    def test_rebuild_appends_only_changes(self):
+        """Test unchanged documents are skipped and changes are appended to the log."""
+        docs = [_journal("a", "<p>A</p>"), _journal("b", "<p>B</p>"), _journal("c", "<p>C</p>")]
+        write_leveldb_pack(docs, self.pack, "JournalEntry")
+        log = self.pack / "000003.log"
+        size = log.stat().st_size
+
+        stats = write_leveldb_pack(docs, self.pack, "JournalEntry")
+        self.assertEqual((stats["unchanged"], stats["batches"], stats["rewritten"]), (3, 0, False))
+        self.assertEqual(log.stat().st_size, size)
+
+        docs = [_journal("a", "<p>A2</p>"), _journal("b", "<p>B</p>"), _journal("d", "<p>D</p>")]
+        stats = write_leveldb_pack(docs, self.pack, "JournalEntry")
+        self.assertEqual((stats["unchanged"], stats["rewritten"]), (1, False))
+        self.assertGreater(log.stat().st_size, size)
+        values = read_leveldb_pack(self.pack)
+        self.assertEqual(values["!journal.pages!a.ap"]["text"]["content"], "<p>A2</p>")
+        self.assertEqual(sorted(values), [
+            "!journal!a", "!journal!b", "!journal!d",
+            "!journal.pages!a.ap", "!journal.pages!b.bp", "!journal.pages!d.dp",
+        ])
+
+    def test_rebuild_compacts_superseded_records(self):
+        """Test the pack is rewritten once superseded records outnumber live ones."""
+        write_leveldb_pack([_journal("a", "<p>A</p>")], self.pack, "JournalEntry")
+        stats = write_leveldb_pack([_journal("a", "<p>A2</p>")], self.pack, "JournalEntry")
+        self.assertFalse(stats["rewritten"])
+        stats = write_leveldb_pack([_journal("a", "<p>A3</p>")], self.pack, "JournalEntry")
+        self.assertTrue(stats["rewritten"])
+        self.assertEqual(read_leveldb_pack(self.pack)["!journal.pages!a.ap"]["text"]["content"], "<p>A3</p>")
+
+    def test_failed_build_keeps_previous_pack(self):
+        """Test an exception mid-stream leaves the existing pack untouched."""
+        write_leveldb_pack([_journal("a", "<p>A</p>")], self.pack, "JournalEntry")
+
+        def entries():
+            yield _journal("b", "<p>B</p>")
+            raise RuntimeError("source failed")
+
+        with self.assertRaises(RuntimeError):
+            write_leveldb_pack(entries(), self.pack, "JournalEntry")
+
+        self.assertIn("!journal!a", read_leveldb_pack(self.pack))
+        self.assertFalse((self.temp_dir / "rules.tmp").exists())
+
+
+class TestFoundryVersionSelection(unittest.TestCase):
+    """Test foundry_version selects the pack backend."""
+
+    def setUp(self):
+        """Set up processed journals."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        journals = self.temp_dir / "processed" / "journals"
+        journals.mkdir(parents=True)
+        (journals / "intro.json").write_text(
+            json.dumps({"slug": "intro", "data": {"title": "Intro", "content": "<p>Hi</p>"}}),
+            encoding="utf-8",
+        )
+
+    def _build(self, foundry_version: int) -> Path:
+        spec = MagicMock()
+        spec.config = {
+            "converted_dir": str(self.temp_dir / "processed"),
+            "output_dir": str(self.temp_dir / "packs"),
+            "foundry_version": foundry_version,
+        }
+        result = CompendiumBuildProcessor(spec).process(
+            ProcessorInput(data={}), ExecutionContext(pipeline_name="test")
+        )
+        return Path(result.data["compendia"][0]["path"])
+
+    def test_version_selects_backend(self):
+        """Test v13 writes a LevelDB directory and v10 a NeDB file."""
+        self.assertTrue(uses_leveldb(13))
+        self.assertFalse(uses_leveldb(10))
+
+        leveldb_pack = self._build(13)
+        self.assertTrue(leveldb_pack.is_dir())
+        self.assertEqual(len(read_leveldb_pack(leveldb_pack)), 2)
+
+        nedb_pack = self._build(10)
+        self.assertEqual(nedb_pack.suffix, ".db")
+        self.assertTrue(nedb_pack.is_file())
+
+    def test_module_json_pack_paths_follow_version(self):
+        """Test module.json points at pack directories for v13."""
+        spec = MagicMock()
+        spec.config = {"output_dir": str(self.temp_dir)}
+        result = ModuleMetadataProcessor(spec).process(
+            ProcessorInput(data={}), ExecutionContext(pipeline_name="test")
+        )
+
+        paths = [pack["path"] for pack in result.data["module_data"]["packs"]]
+        self.assertEqual(paths, ["packs/dark-sun-ancestries", "packs/dark-sun-rules"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -178,7 +178,21 @@ class TestMasterTOCGenerator(unittest.TestCase):
         # Check that missing chapters section exists
         self.assertIn("Chapters Not Yet Converted", result)
         self.assertIn("Chapter Two: Player Character Races", result)
-    
+
+    def test_generate_html_with_search_page(self):
+        """Test _generate_html links the search page only when configured."""
+        spec = Mock()
+        spec.config = {"html_dir": str(self.html_dir)}
+        toc_entries = [
+            {"slug": "chapter-one", "title": "Chapter One", "file": "chapter-one.html"}
+        ]
+
+        self.assertNotIn("toc-search", MasterTOCGenerator(spec)._generate_html(toc_entries, []))
+
+        spec.config["search_page"] = "search.html"
+        result = MasterTOCGenerator(spec)._generate_html(toc_entries, [])
+        self.assertIn('<p class="toc-search"><a href="search.html">Search all chapters</a></p>', result)
+
     def test_process_no_html_dir(self):
         """Test process when HTML directory doesn't exist."""
         spec = Mock()
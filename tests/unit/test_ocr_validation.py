@@ -0,0 +1,188 @@
+"""Unit tests for OCR validation.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import fitz
+
+from tools.pdf_pipeline.stages.validate import ocr_validation
+from tools.pdf_pipeline.stages.validate.ocr_validation import OCRValidationProcessor
+
+
+def _fake_ocr(image, config=""):
+    """Return text identifying the rendered page by its size."""
+    return f"CHAPTER ONE: Page {image.size[1]}\n"
+
+
+class TestOCRPageCache(unittest.TestCase):
+    """Test per-page OCR caching and rendering."""
+
+    def setUp(self):
+        """Set up a three-page PDF of increasing page heights."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / "book.pdf"
+        doc = fitz.open()
+        for height in (100, 200, 300):
+            doc.new_page(width=100, height=height)
+        doc.save(self.pdf_path)
+        doc.close()
+        self.cache_dir = self.temp_dir / "ocr_cache"
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _processor(self, **config):
+        spec = MagicMock()
+        spec.config = {"ocr_dpi": 72, "ocr_batch_size": 2, **config}
+        return OCRValidationProcessor(spec)
+
+    @patch.object(ocr_validation.pytesseract, "image_to_string", side_effect=_fake_ocr)
+    def test_pages_rendered_and_cached(self, mock_ocr):
+        """Test each page is rendered at the configured DPI and cached individually."""
+        stats = {}
+        text, sections = self._processor()._extract_ocr_text(
+            self.pdf_path, self.cache_dir, stats=stats
+        )
+
+        self.assertEqual(mock_ocr.call_count, 3)
+        self.assertEqual([s["page"] for s in sections], [1, 2, 3])
+        self.assertIn("Page 300", text)
+        self.assertEqual(len(list(self.cache_dir.rglob("*.json"))), 3)
+        self.assertEqual(stats, {"pages": 3, "cached": 0, "ocr": 3})
+
+    @patch.object(ocr_validation.pytesseract, "image_to_string", side_effect=_fake_ocr)
+    def test_changed_sample_pages_reuse_cache(self, mock_ocr):
+        """Test a new sample only OCRs pages that are not cached yet."""
+        self._processor()._extract_ocr_text(self.pdf_path, self.cache_dir, [1, 2])
+        mock_ocr.reset_mock()
+
+        stats = {}
+        text, _ = self._processor()._extract_ocr_text(
+            self.pdf_path, self.cache_dir, [2, 3], stats=stats
+        )
+
+        self.assertEqual(mock_ocr.call_count, 1)
+        self.assertEqual(stats, {"pages": 2, "cached": 1, "ocr": 1})
+        self.assertEqual(text, "CHAPTER ONE: Page 200\n\n\nCHAPTER ONE: Page 300\n")
+
+    @patch.object(ocr_validation.pytesseract, "image_to_string", side_effect=_fake_ocr)
+    def test_cache_keyed_by_dpi_and_config(self, mock_ocr):
+        """Test changing DPI or Tesseract config does not reuse cached pages."""
+        self._processor()._extract_ocr_text(self.pdf_path, self.cache_dir, [1])
+        self._processor(ocr_dpi=144)._extract_ocr_text(self.pdf_path, self.cache_dir, [1])
+        self._processor(tesseract_config="--psm 6")._extract_ocr_text(
+            self.pdf_path, self.cache_dir, [1]
+        )
+
+        self.assertEqual(mock_ocr.call_count, 3)
+        self.assertEqual(mock_ocr.call_args_list[1].args[0].size, (200, 200))
+        self.assertEqual(mock_ocr.call_args_list[2].kwargs["config"], "--psm 6")
+
+    @patch.object(ocr_validation.pytesseract, "image_to_string", side_effect=_fake_ocr)
+    def test_changed_pdf_invalidates_cache(self, mock_ocr):
+        """Test cache entries are keyed by the PDF content hash."""
+        self._processor()._extract_ocr_text(self.pdf_path, self.cache_dir, [1])
+        doc = fitz.open()
+        doc.new_page(width=100, height=400)
+        doc.save(self.temp_dir / "changed.pdf")
+        doc.close()
+        shutil.move(self.temp_dir / "changed.pdf", self.pdf_path)
+
+        text, _ = self._processor()._extract_ocr_text(self.pdf_path, self.cache_dir, [1])
+
+        self.assertEqual(mock_ocr.call_count, 2)
+        self.assertEqual(text, "CHAPTER ONE: Page 400\n")
+
+
+PROSE = (
+    "The sun of Athas burns over the wastes, and the people of the cities "
+    "must trade with the tribes that wander in the sands. " * 3
+)
+
+
+class TestTextLayerFirst(unittest.TestCase):
+    """Test two-tier validation that OCRs only suspicious pages."""
+
+    def setUp(self):
+        """Set up a PDF with good, empty, garbled and misordered pages."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / "book.pdf"
+        pages = [
+            "CHAPTER ONE: Ability Scores\n" + PROSE,
+            "",
+            "Xq zvtk brrp qqlm " * 15,
+            "CHAPTER THREE: Classes\n" + PROSE,
+            "CHAPTER TWO: Races\n" + PROSE,
+            PROSE,
+        ]
+        doc = fitz.open()
+        for number, text in enumerate(pages, start=1):
+            page = doc.new_page(width=500, height=100 * number)
+            if text:
+                page.insert_textbox(fitz.Rect(10, 10, 490, 100 * number), text, fontsize=4)
+        doc.save(self.pdf_path)
+        doc.close()
+
+        self.structured = {
+            "chapter-one": {"slug": "chapter-one", "title": "Ability Scores", "start_page": 1},
+            "chapter-two": {"slug": "chapter-two", "title": "Races", "start_page": 5},
+            "chapter-three": {"slug": "chapter-three", "title": "Classes", "start_page": 4},
+            "chapter-four": {"slug": "chapter-four", "title": "Alignment", "start_page": 6},
+        }
+        self.expected_order = ["chapter-one", "chapter-two", "chapter-three", "chapter-four"]
+
+        spec = MagicMock()
+        spec.config = {"ocr_dpi": 72}
+        self.processor = OCRValidationProcessor(spec)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_is_garbled(self):
+        """Test the common-word ratio separates prose from garbage."""
+        self.assertFalse(self.processor._is_garbled(PROSE))
+        self.assertTrue(self.processor._is_garbled("Xq zvtk brrp qqlm " * 15))
+        self.assertFalse(self.processor._is_garbled("Xq zvtk"))
+
+    def test_suspicious_pages(self):
+        """Test empty, garbled, misordered and missing-section pages are flagged."""
+        pages = list(range(1, 7))
+        texts = self.processor._extract_text_layer(self.pdf_path, pages)
+        _, sections = self.processor._combine_pages(texts)
+
+        suspicious = self.processor._suspicious_pages(
+            texts, sections, self.structured, self.expected_order
+        )
+
+        self.assertEqual(
+            suspicious, {2: "empty", 3: "garbled", 4: "ordering", 5: "ordering", 6: "missing"}
+        )
+
+    @patch.object(ocr_validation.pytesseract, "image_to_string", side_effect=_fake_ocr)
+    def test_only_suspicious_pages_are_ocred(self, mock_ocr):
+        """Test OCR text replaces the text layer only on suspicious pages."""
+        stats = {}
+        text, sections = self.processor._extract_two_tier(
+            self.pdf_path, None, [1, 2], self.structured, self.expected_order, stats=stats
+        )
+
+        self.assertEqual(mock_ocr.call_count, 1)
+        self.assertEqual(mock_ocr.call_args.args[0].size[1], 200)
+        self.assertEqual([s["page"] for s in sections], [1, 2])
+        self.assertIn("Page 200", text)
+        self.assertEqual(stats["text_layer"], 2)
+        self.assertEqual(stats["suspicious"], {"empty": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
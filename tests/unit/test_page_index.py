@@ -0,0 +1,88 @@
+"""Unit tests for the page spatial index.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import unittest
+
+from tools.pdf_pipeline.utils.page_index import PageIndex
+
+
+def _line(text, x0, y0, x1, y1):
+    return {"bbox": [x0, y0, x1, y1], "spans": [{"text": text, "bbox": [x0, y0, x1, y1]}]}
+
+
+def _block(*lines, **extra):
+    x0 = min(l["bbox"][0] for l in lines)
+    y0 = min(l["bbox"][1] for l in lines)
+    x1 = max(l["bbox"][2] for l in lines)
+    y1 = max(l["bbox"][3] for l in lines)
+    return {"type": "text", "bbox": [x0, y0, x1, y1], "lines": list(lines), **extra}
+
+
+def _texts(entries):
+    return [e.line["spans"][0]["text"] for e in entries]
+
+
+class TestPageIndex(unittest.TestCase):
+    """Test spatial queries over a page."""
+
+    def setUp(self):
+        """Create a two-column page; the right column comes first in the block list."""
+        PageIndex.invalidate()
+        self.page = {"blocks": [
+            _block(_line("R1", 300, 100, 340, 110), _line("R2", 300, 120, 340, 130)),
+            {"type": "image", "bbox": [0, 0, 50, 50]},
+            _block(_line("L1", 50, 100, 90, 110), _line("L2", 50, 120, 90, 130), _line("L3", 50, 140, 90, 150)),
+        ]}
+
+    def test_between_y_document_order(self):
+        """Test y-range queries keep block/line order and honour bound inclusivity."""
+        index = PageIndex(self.page)
+        self.assertEqual(_texts(index.between_y(100, 140)), ["R2", "L2"])
+        self.assertEqual(_texts(index.between_y(100, 140, inclusive=True)), ["R1", "R2", "L1", "L2", "L3"])
+        self.assertEqual([e.block_idx for e in index.between_y(0, 200, level="block")], [0, 2])
+
+    def test_near_y_column_and_rect(self):
+        """Test row, column window and rectangle queries."""
+        index = PageIndex(self.page)
+        self.assertEqual(_texts(index.near_y(125, 3.5)), ["R2", "L2"])
+        self.assertEqual(_texts(index.column(40, 60, 90, 160)), ["L1", "L2", "L3"])
+        self.assertEqual(_texts(index.in_rect((40, 95, 100, 135))), ["L1", "L2"])
+
+    def test_nearest_ties_and_predicate(self):
+        """Test nearest picks the first entry in document order on ties."""
+        index = PageIndex(self.page)
+        self.assertEqual(index.nearest(195, 105, y_tol=3.5).line["spans"][0]["text"], "R1")
+        self.assertEqual(index.nearest(80, 105, y_tol=3.5).line["spans"][0]["text"], "L1")
+        self.assertIsNone(index.nearest(80, 105, y_tol=3.5, x_window=5))
+        found = index.nearest(80, 105, y_tol=3.5, predicate=lambda e: e.block_idx == 0)
+        self.assertEqual(found.line["spans"][0]["text"], "R1")
+
+    def test_hidden_blocks_read_live(self):
+        """Test __skip_render marks made after indexing are respected."""
+        index = PageIndex.for_page(self.page)
+        self.page["blocks"][0]["__skip_render"] = True
+        self.assertIs(PageIndex.for_page(self.page), index)
+        self.assertEqual(_texts(index.near_y(125, 3.5, include_hidden=False)), ["L2"])
+        self.assertEqual(_texts(index.near_y(125, 3.5)), ["R2", "L2"])
+
+    def test_cache_rebuilds_after_structural_change(self):
+        """Test inserting a marker block or replacing lines rebuilds the index."""
+        index = PageIndex.for_page(self.page)
+        self.assertIs(PageIndex.for_page(self.page), index)
+
+        self.page["blocks"].insert(0, _block(_line("Marker", 200, 122, 240, 128)))
+        rebuilt = PageIndex.for_page(self.page)
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(_texts(rebuilt.near_y(125, 3.5)), ["Marker", "R2", "L2"])
+        self.assertEqual(rebuilt.near_y(125, 3.5)[2].block_idx, 3)
+
+        self.page["blocks"][3]["lines"] = self.page["blocks"][3]["lines"][:1]
+        self.assertEqual(_texts(PageIndex.for_page(self.page).near_y(125, 3.5)), ["Marker", "R2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for the source-PDF page store and service.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import fitz
+
+from tools.pdf_pipeline.models import Section
+from tools.pdf_pipeline.stages.extract import _extract_section_task
+from tools.pdf_pipeline.utils.page_store import (
+    PageStore,
+    SourcePageService,
+    dict_from_rawdict,
+    jsonable_page,
+    store_pages,
+)
+
+
+class TestPageStore(unittest.TestCase):
+    """Test storing and serving page text."""
+
+    def setUp(self):
+        """Create a three-page PDF and an empty store root."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / "source.pdf"
+        self.store_dir = self.temp_dir / "store"
+        doc = fitz.open()
+        for number in range(1, 4):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Fighter/Cleric page {number}", fontsize=11)
+        doc.save(self.pdf_path)
+        doc.close()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _pdf_page(self, number, mode):
+        with fitz.open(self.pdf_path) as doc:
+            return jsonable_page(doc[number - 1].get_text(mode))
+
+    def test_service_reads_store_then_pdf(self):
+        """Test stored pages are served from the store and others from the PDF."""
+        written = store_pages(
+            self.store_dir, self.pdf_path,
+            [(1, {"dict": self._pdf_page(1, "dict"), "text": self._pdf_page(1, "text")})],
+            shard="section-a",
+        )
+        self.assertEqual(written, 2)
+
+        service = SourcePageService(self.pdf_path, self.store_dir)
+        try:
+            self.assertEqual(service.text(1), self._pdf_page(1, "text"))
+            self.assertEqual(service.page(1)["blocks"][0]["lines"][0]["spans"][0]["text"], "Fighter/Cleric page 1")
+            self.assertIn("page 2", service.text(2))
+            service.text(2)
+            self.assertEqual(service.stats, {"memory": 1, "store": 2, "pdf": 1})
+        finally:
+            service.close()
+
+    def test_dict_served_from_rawdict(self):
+        """Test a dict request is answered from a stored rawdict page."""
+        store_pages(self.store_dir, self.pdf_path, [(2, {"rawdict": self._pdf_page(2, "rawdict")})], shard="raw")
+        service = SourcePageService(self.pdf_path, self.store_dir)
+        try:
+            self.assertEqual(service.page(2, "dict"), self._pdf_page(2, "dict"))
+            self.assertEqual(service.stats["pdf"], 0)
+        finally:
+            service.close()
+
+    def test_existing_pages_not_rewritten_and_aborted_shards_hidden(self):
+        """Test overlapping sections store a page once and failed writes leave no shard."""
+        pages = [(1, {"text": "one"}), (2, {"text": "two"})]
+        self.assertEqual(store_pages(self.store_dir, self.pdf_path, pages, shard="parent"), 2)
+        self.assertEqual(store_pages(self.store_dir, self.pdf_path, pages[1:], shard="child"), 0)
+
+        store = PageStore(self.store_dir, self.pdf_path)
+        with self.assertRaises(RuntimeError):
+            with store.writer("text", "broken") as writer:
+                writer.put(3, "three")
+                raise RuntimeError("boom")
+        self.assertEqual(store.pages("text"), {1, 2})
+        self.assertIsNone(store.get(3, "text"))
+        store.close()
+
+    def test_rawdict_conversion_matches_dict(self):
+        """Test joining span characters reproduces PyMuPDF's dict layout."""
+        self.assertEqual(dict_from_rawdict(self._pdf_page(1, "rawdict")), self._pdf_page(1, "dict"))
+
+    def test_extraction_task_fills_store(self):
+        """Test structured extraction writes its pages to the store."""
+        section = Section(title="Section", slug="section", level=2, start_page=1, end_page=2)
+        result = _extract_section_task({
+            "pdf_path": str(self.pdf_path),
+            "section": {**section.model_dump(), "parent_slugs": []},
+            "output_path": str(self.temp_dir / "section.json"),
+            "mode": "structured",
+            "table_settings": None,
+            "page_store_dir": str(self.store_dir),
+            "page_store_modes": ["dict", "text"],
+        })
+        self.assertEqual(result["errors"], [])
+
+        store = PageStore(self.store_dir, self.pdf_path)
+        self.assertEqual(store.pages("dict"), {1, 2})
+        self.assertEqual(store.get(2, "text"), self._pdf_page(2, "text"))
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
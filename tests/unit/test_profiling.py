@@ -0,0 +1,105 @@
+"""Unit tests for the pipeline profiler.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import time
+import unittest
+
+from tools.pdf_pipeline.utils.artifacts import merge_artifacts
+from tools.pdf_pipeline.utils.parallel import _run_task, _task_label
+from tools.pdf_pipeline.utils.profiling import (
+    PROFILE_ARTIFACT,
+    PROFILER,
+    profile_call,
+    profile_span,
+)
+
+
+def _worker(task):
+    with profile_span("section", f"transform/{task['slug']}"):
+        time.sleep(0.01)
+    return {"items": 1, "warnings": [], "errors": [], "artifacts": [("other", {})]}
+
+
+class TestProfiler(unittest.TestCase):
+    """Test recording and reporting spans."""
+
+    def setUp(self):
+        """Start from an empty, enabled profiler."""
+        self.was_enabled = PROFILER.enabled
+        PROFILER.drain()
+        PROFILER.enable()
+
+    def tearDown(self):
+        """Restore the profiler state."""
+        PROFILER.drain()
+        if not self.was_enabled:
+            PROFILER.disable()
+
+    def test_disabled_records_nothing(self):
+        """Test spans and calls are pass-through while disabled."""
+        PROFILER.disable()
+        with profile_span("stage", "quiet"):
+            pass
+        self.assertEqual(profile_call("hook", len, "abc"), 3)
+        self.assertEqual(PROFILER.spans, [])
+
+    def test_nested_spans(self):
+        """Test nested spans are recorded and excluded from the parent's self time."""
+        with profile_span("stage", "outer"):
+            with profile_span("hook", "inner"):
+                time.sleep(0.02)
+        inner, outer = PROFILER.spans
+        self.assertEqual((inner["cat"], inner["name"]), ("hook", "inner"))
+        self.assertGreaterEqual(inner["dur"], 20000)
+        self.assertGreaterEqual(outer["dur"], inner["dur"])
+        self.assertLess(outer["self"], inner["dur"])
+        self.assertGreaterEqual(outer["rss_kb"], inner["rss_kb"])
+
+    def test_profile_call_names_span(self):
+        """Test hooks are named after their module and function."""
+        self.assertEqual(profile_call("hook", _task_label, {"slug": "chapter-x"}, 0), "chapter-x")
+        self.assertEqual(PROFILER.spans[0]["name"], "parallel._task_label")
+
+    def test_report_and_summary(self):
+        """Test the report is a Chrome trace with a summary per span name."""
+        for _ in range(2):
+            with profile_span("section", "transform/chapter-x", stage="transform"):
+                pass
+        report = PROFILER.report()
+        event = report["traceEvents"][0]
+        self.assertEqual((event["ph"], event["cat"]), ("X", "section"))
+        self.assertEqual(event["args"]["stage"], "transform")
+        self.assertEqual(report["summary"][0]["calls"], 2)
+
+        table = PROFILER.format_summary(baseline={"summary": []})
+        self.assertIn("transform/chapter-x", table)
+        self.assertIn("new", table)
+
+    def test_worker_spans_return_as_artifact(self):
+        """Test a pool task is timed and hands its spans back for merging."""
+        result = _run_task(_worker, {"slug": "chapter-x"}, "chapter-x")
+        self.assertEqual(result["task_stats"]["label"], "chapter-x")
+        self.assertGreaterEqual(result["task_stats"]["wall_s"], 0.01)
+        self.assertEqual(PROFILER.spans, [])
+
+        names = [name for name, _ in result["artifacts"]]
+        self.assertEqual(names, ["other", PROFILE_ARTIFACT])
+        merge_artifacts(result["artifacts"][1:])
+        self.assertEqual(
+            [(span["cat"], span["name"]) for span in PROFILER.spans],
+            [("section", "transform/chapter-x"), ("task", "chapter-x")],
+        )
+
+    def test_task_labels(self):
+        """Test tasks are labelled by slug or file name."""
+        self.assertEqual(_task_label({"section": {"slug": "chapter-y"}}, 0), "chapter-y")
+        self.assertEqual(_task_label({"json_file": "/data/journals/chapter-z.json"}, 1), "chapter-z.json")
+        self.assertEqual(_task_label(("a", "b"), 2), "task 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
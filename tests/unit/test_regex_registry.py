@@ -0,0 +1,110 @@
+"""Unit tests for the regex registry and regex profiler.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import re
+import unittest
+
+from tools.pdf_pipeline.postprocessors.html_export import _fix_letter_spacing
+from tools.pdf_pipeline.utils.artifacts import merge_artifacts
+from tools.pdf_pipeline.utils.parallel import _run_task
+from tools.pdf_pipeline.utils.regex_registry import (
+    PROFILER,
+    REGEX_PROFILE_ARTIFACT,
+    NamedPattern,
+    regex,
+    regex_scope,
+    registered_patterns,
+)
+
+
+class TestRegexRegistry(unittest.TestCase):
+    """Test registering named patterns."""
+
+    def test_register_and_use(self):
+        """Test a registered pattern behaves like a compiled one."""
+        pattern = regex("test.digits", r"\d+")
+        self.assertIsInstance(pattern, NamedPattern)
+        self.assertIs(registered_patterns()["test.digits"], pattern)
+        self.assertEqual(pattern.findall("a1b22"), ["1", "22"])
+        self.assertEqual(pattern.sub("#", "a1b22"), "a#b#")
+
+    def test_name_conflicts(self):
+        """Test re-registering is idempotent but a different pattern is rejected."""
+        first = regex("test.word", r"\w+", re.IGNORECASE)
+        self.assertIs(regex("test.word", r"\w+", re.IGNORECASE), first)
+        with self.assertRaises(ValueError):
+            regex("test.word", r"\W+")
+        with self.assertRaises(ValueError):
+            regex("test.word", r"\w+")
+
+
+class TestRegexProfiler(unittest.TestCase):
+    """Test recording regex timings."""
+
+    def setUp(self):
+        """Start from an empty, enabled profiler."""
+        self.was_enabled = PROFILER.enabled
+        PROFILER.drain()
+        PROFILER.enable()
+
+    def tearDown(self):
+        """Restore the profiler state."""
+        PROFILER.drain()
+        if not self.was_enabled:
+            PROFILER.disable()
+
+    def test_disable_restores_re(self):
+        """Test profiling wraps the re module only while enabled."""
+        self.assertNotEqual(re.sub.__module__, "re")
+        PROFILER.disable()
+        self.assertEqual(re.sub.__module__, "re")
+        PROFILER.enable()
+
+    def test_worker_stats_return_as_artifact(self):
+        """Test calls are attributed to the chapter and a pool task hands them back."""
+        pattern = regex("test.vowels", r"[aeiou]")
+
+        def worker(task):
+            with regex_scope(task["slug"]):
+                pattern.findall("profiling")
+                self.assertEqual(len(list(re.finditer(r"i", "profiling"))), 2)
+            return {"items": 1}
+
+        result = _run_task(worker, {"slug": "chapter-x"}, "chapter-x")
+        self.assertEqual(PROFILER.stats, {})
+        self.assertEqual([name for name, _ in result["artifacts"]], [REGEX_PROFILE_ARTIFACT])
+
+        merge_artifacts(result["artifacts"])
+        rows = {row["name"]: row for row in PROFILER.report()["patterns"]}
+        self.assertEqual(rows["test.vowels"]["chapter"], "chapter-x")
+        self.assertEqual(rows["test.vowels"]["input_chars"], len("profiling"))
+        self.assertIn(f"{__name__}:i", rows)
+        self.assertEqual(PROFILER.report()["chapters"]["chapter-x"]["calls"], 2)
+
+    def test_report_slowest_first(self):
+        """Test report rows are ordered by total time."""
+        PROFILER.record("fast", "a", 0.001, 10)
+        PROFILER.record("slow", "b", 0.5, 10)
+        PROFILER.record("slow", "b", 0.25, 10)
+        rows = PROFILER.report()["patterns"]
+        self.assertEqual([row["name"] for row in rows], ["slow", "fast"])
+        self.assertEqual(rows[0]["calls"], 2)
+        self.assertEqual(rows[0]["max_ms"], 500.0)
+
+
+class TestLetterSpacing(unittest.TestCase):
+    """Test the registered letter spacing patterns."""
+
+    def test_fix_letter_spacing(self):
+        """Test spaced letters are joined, also after digits inside words."""
+        self.assertEqual(_fix_letter_spacing("the d e s e r t sun"), "the desert sun")
+        self.assertEqual(_fix_letter_spacing("north o f Tyr"), "north of Tyr")
+        self.assertEqual(_fix_letter_spacing("x1north o f Tyr"), "x1north of Tyr")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Unit tests for the rules conversion stage.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput
+from tools.pdf_pipeline.stages.rules_conversion import ADnDToPF2EProcessor
+
+
+class TestADnDToPF2EProcessor(unittest.TestCase):
+    """Test incremental conversion with the conversion manifest."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.processed_dir = self.temp_dir / "processed"
+        (self.processed_dir / "journals").mkdir(parents=True)
+        self.output_dir = self.temp_dir / "pf2e_converted"
+
+        (self.processed_dir / "ancestries.json").write_text(
+            json.dumps({"ancestries": []}), encoding="utf-8"
+        )
+        self.journal = self.processed_dir / "journals" / "chapter.json"
+        self.journal.write_text(json.dumps({"slug": "chapter"}), encoding="utf-8")
+
+        spec = MagicMock()
+        spec.config = {
+            "processed_dir": str(self.processed_dir),
+            "output_dir": str(self.output_dir),
+            "knowledge_base_dir": str(self.temp_dir / "knowledge_base"),
+            "parallel": False,
+        }
+        self.processor = ADnDToPF2EProcessor(spec)
+
+    def _run(self):
+        context = ExecutionContext(pipeline_name="test")
+        result = self.processor.process(ProcessorInput(data={}), context)
+        return result, context
+
+    def test_first_run_converts_and_writes_manifest(self):
+        """Test every file is converted and recorded in the manifest."""
+        result, context = self._run()
+
+        self.assertEqual(context.items_processed, 2)
+        self.assertEqual(result.metadata["skipped_count"], 0)
+        converted = json.loads(
+            (self.output_dir / "journals" / "chapter.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(converted["slug"], "chapter")
+        self.assertEqual(converted["conversion_applied"], "semantic_mapping")
+
+        manifest = json.loads(
+            Path(result.data["manifest_file"]).read_text(encoding="utf-8")
+        )
+        self.assertEqual(
+            sorted(manifest["files"]), ["ancestries.json", "journals/chapter.json"]
+        )
+        self.assertEqual(
+            sorted(manifest["files"]["journals/chapter.json"]),
+            ["input_hash", "mapping_stats", "output_file"],
+        )
+
+    def test_rerun_skips_unchanged_files(self):
+        """Test a no-op rerun converts nothing but reports the same outputs."""
+        first, _ = self._run()
+        second, context = self._run()
+
+        self.assertEqual(context.items_processed, 0)
+        self.assertEqual(second.metadata["skipped_count"], 2)
+        self.assertEqual(second.data["converted_files"], first.data["converted_files"])
+        self.assertEqual(second.data["mapping_stats"], first.data["mapping_stats"])
+
+    def test_noop_rerun_builds_no_mapper(self):
+        """Test a rerun with nothing to convert reuses the cached coverage report."""
+        first, _ = self._run()
+        with patch("tools.pdf_pipeline.stages.rules_conversion.SemanticMapper") as mapper:
+            second, _ = self._run()
+
+        mapper.assert_not_called()
+        self.assertEqual(second.data["mapping_coverage"], first.data["mapping_coverage"])
+
+    def test_removed_input_is_pruned(self):
+        """Test outputs and manifest entries of deleted inputs are removed."""
+        self._run()
+        self.journal.unlink()
+
+        result, _ = self._run()
+
+        self.assertEqual(result.metadata["pruned_count"], 1)
+        self.assertFalse((self.output_dir / "journals" / "chapter.json").exists())
+        manifest = json.loads(
+            Path(result.data["manifest_file"]).read_text(encoding="utf-8")
+        )
+        self.assertEqual(sorted(manifest["files"]), ["ancestries.json"])
+
+    def test_changed_file_is_reconverted(self):
+        """Test only files whose content changed are converted again."""
+        self._run()
+        self.journal.write_text(
+            json.dumps({"slug": "chapter", "title": "Changed"}), encoding="utf-8"
+        )
+
+        result, context = self._run()
+
+        self.assertEqual(context.items_processed, 1)
+        self.assertEqual(result.metadata["skipped_count"], 1)
+        converted = json.loads(
+            (self.output_dir / "journals" / "chapter.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(converted["title"], "Changed")
+
+    def test_entity_files_are_copied_unconverted(self):
+        """Test entity files keep their rows and are not counted as mapped."""
+        entities_dir = self.processed_dir / "entities"
+        entities_dir.mkdir()
+        (entities_dir / "spell.jsonl").write_text(
+            json.dumps({"entity": "spell", "version": 1, "columns": ["name", "source", "level", "sphere"]})
+            + "\n" + json.dumps(["Bless", "chapter", 1, "Sun"]) + "\n",
+            encoding="utf-8",
+        )
+
+        result, context = self._run()
+
+        self.assertEqual(context.errors, [])
+        self.assertEqual(result.metadata["entity_file_count"], 1)
+        # Only the two JSON files count as mapped
+        self.assertEqual(result.data["mapping_stats"]["high_confidence"], 2)
+        lines = (self.output_dir / "entities" / "spell.jsonl").read_text(encoding="utf-8").splitlines()
+        header = json.loads(lines[0])
+        self.assertEqual((header["conversion_applied"], header["pf2e_compatible"]), ("none", False))
+        self.assertEqual(json.loads(lines[1]), ["Bless", "chapter", 1, "Sun"])
+        self.assertEqual(self._run()[0].metadata["skipped_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Unit tests for the search index generator.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput
+from tools.pdf_pipeline.postprocessors.search_index import SearchIndexGenerator, tokenize
+
+CHAPTER_HTML = """<!DOCTYPE html>
+<html><head><title>Chapter One: Magic</title><style>p { color: red; }</style></head>
+<body>
+<h1 id="top">Chapter One: Magic</h1>
+<p class="back-to-master-toc"><a href="table_of_contents.html">Back to Table of Contents</a></p>
+<nav id="table-of-contents"><ul><li><a href="#header-0-defilers">Defilers</a></li></ul></nav>
+<section class="content">
+<p>Magic on Athas draws on plant life.</p>
+<p id="header-0-defilers" class="h1-header">I. Defilers <a href="#top">[^]</a></p>
+<p>Defilers destroy plants when casting.</p>
+<table><tr><td>Defiler</td><td>Radius</td></tr></table>
+<p id="header-1-preservers" class="h2-header">Preservers</p>
+<p>Preservers protect plants.</p>
+</section>
+</body></html>
+"""
+
+
+class TestSearchIndexGenerator(unittest.TestCase):
+    """Test index sharding, document extraction and the search page."""
+
+    def setUp(self):
+        """Set up an HTML output directory with one chapter."""
+        self.html_dir = Path(tempfile.mkdtemp())
+        (self.html_dir / "chapter-one-magic.html").write_text(CHAPTER_HTML, encoding="utf-8")
+        (self.html_dir / "table_of_contents.html").write_text(
+            "<p>Unindexed page</p>", encoding="utf-8"
+        )
+
+        spec = MagicMock()
+        spec.config = {"html_dir": str(self.html_dir), "prefix_length": 2}
+        self.generator = SearchIndexGenerator(spec)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.html_dir, ignore_errors=True)
+
+    def _run(self):
+        context = ExecutionContext(pipeline_name="test")
+        result = self.generator.process(ProcessorInput(data={}), context)
+        return result, context
+
+    def _load(self, name):
+        return json.loads((self.html_dir / "search" / name).read_text(encoding="utf-8"))
+
+    def test_tokenize_drops_stopwords_and_short_terms(self):
+        """Test tokenization lowercases and filters terms."""
+        self.assertEqual(tokenize("The Tree of Life, a 3rd-level spell"), ["tree", "life", "3rd", "level", "spell"])
+
+    def test_sections_become_documents(self):
+        """Test each header anchor starts a document and navigation is skipped."""
+        result, context = self._run()
+
+        self.assertEqual(context.items_processed, 1)
+        self.assertEqual(result.data["documents"], 3)
+        docs = self._load("docs.json")
+        self.assertEqual(
+            [doc[0] for doc in docs],
+            [
+                "chapter-one-magic.html",
+                "chapter-one-magic.html#header-0-defilers",
+                "chapter-one-magic.html#header-1-preservers",
+            ],
+        )
+        self.assertEqual(docs[1][1], "Chapter One: Magic: Defilers")
+        self.assertEqual(docs[1][2], "Defilers destroy plants when casting. Defiler Radius")
+        self.assertNotIn("Back to Table", docs[0][2])
+        self.assertNotIn("color", docs[0][2])
+
+    def test_shards_rank_header_matches_first(self):
+        """Test postings are sharded by prefix and header terms outweigh body terms."""
+        self._run()
+
+        meta = self._load("meta.json")
+        self.assertIn("pl", meta["shards"])
+        self.assertEqual(meta["documents"], 3)
+        shard = self._load("shards/de.json")
+        self.assertEqual(shard["defilers"][0], 1)
+        self.assertEqual(self._load("shards/pl.json")["plants"], [1, 1, 2, 1])
+        self.assertNotIn("unindexed", self._load("shards/un.json") if "un" in meta["shards"] else {})
+
+    def test_rerun_replaces_stale_shards(self):
+        """Test shards for terms no longer present are removed on rebuild."""
+        self._run()
+        page = self.html_dir / "chapter-one-magic.html"
+        page.write_text(CHAPTER_HTML.replace("Athas", "Tyr"), encoding="utf-8")
+
+        self._run()
+
+        self.assertFalse((self.html_dir / "search" / "shards" / "at.json").exists())
+        self.assertIn("tyr", self._load("shards/ty.json"))
+
+    def test_search_page_and_script_written(self):
+        """Test the search page references the generated client script."""
+        result, _ = self._run()
+
+        page = Path(result.data["search_page"]).read_text(encoding="utf-8")
+        self.assertIn('<script src="search/search.js"></script>', page)
+        self.assertIn("DarkSunSearch", (self.html_dir / "search" / "search.js").read_text(encoding="utf-8"))
+
+    def test_missing_html_dir_warns(self):
+        """Test a missing HTML directory is reported as a warning."""
+        shutil.rmtree(self.html_dir)
+        result, context = self._run()
+
+        self.assertEqual(result.data["status"], "error")
+        self.assertEqual(len(context.warnings), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Unit tests for declarative section splits.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.pdf_pipeline.postprocessors.chapter_four_atlas_postprocessing import (
+    ATLAS_SPEC_PATH,
+    postprocess_chapter_four_atlas,
+)
+from tools.pdf_pipeline.utils.section_splits import (
+    SectionSplitSpec,
+    SectionSplitter,
+    split_paragraph_at_markers,
+)
+
+
+def _header(number, roman, slug, text, attrs=""):
+    return (
+        f'<p id="header-{number}-{slug}"{attrs}>{roman}.  <a href="#top" style="font-size: 0.8em; '
+        f'text-decoration: none;">[^]</a> <span style="color: #cd490a">{text}</span></p>'
+    )
+
+
+_PAGE = (
+    '<a id="top"></a><p>Intro one. Second thought here.</p>'
+    + _header(1, "II", "balic", "Balic")
+    + "<p>Balic is old. On the rare day</p><p> it rains.</p>"
+    + _header(2, "III", "draj", "Draj")
+    + "<p>Draj text. Be that as it may, more.</p>"
+)
+
+_SPEC = {
+    "headers": [
+        {"id": "header-1-balic", "text": "Balic"},
+        {"id": "header-2-draj", "text": "Draj"},
+    ],
+    "sections": [
+        {
+            "name": "intro", "start": '<a id="top"></a>', "end": ['<p id="header-1-balic">'],
+            "content": "first_paragraph", "markers": ["Second"], "paragraphs": 2,
+        },
+        {
+            "name": "Balic", "start": '<p id="header-1-balic">.*?</p>', "end": ['<p id="header-2-draj">'],
+            "markers": ["On the rare"], "paragraphs": 2,
+        },
+        {
+            "name": "Draj", "stage": "after_headers", "start": '<p id="header-2-draj"[^>]*>',
+            "markers": ["Be that as"], "paragraphs": 2,
+        },
+    ],
+}
+
+
+class TestSectionSplitter(unittest.TestCase):
+    """Test splitting sections and restyling headers in one pass."""
+
+    def test_split_at_markers(self):
+        """Test markers start new paragraphs and missing markers are skipped."""
+        self.assertEqual(
+            split_paragraph_at_markers("A b. C&#x27;s d. E f.", ["C's", "Zzz", "E f"]),
+            ["A b.", "C's d.", "E f."],
+        )
+
+    def test_splits_and_header_rules_in_one_rebuild(self):
+        """Test before- and after-header sections see the page in the right state."""
+        html = SectionSplitter(SectionSplitSpec.model_validate(_SPEC)).apply(_PAGE)
+
+        self.assertTrue(html.startswith('<a id="top"></a><p>Intro one.</p>\n<p>Second thought here.</p>'))
+        self.assertIn('<p id="header-1-balic" class="h2-header"><a href="#top"', html)
+        self.assertIn("</p><p>Balic is old.</p>\n<p>On the rare day it rains.</p>", html)
+        # The Draj section starts inside its restyled header and runs to the end of the page
+        self.assertIn('<p id="header-2-draj" class="h2-header"><p><a href="#top"', html)
+        self.assertTrue(html.endswith("<p>Be that as it may, more.</p>"))
+
+    def test_blockquote_layout_and_unmatched_anchor(self):
+        """Test block-quote layout and that sections with a missing end are left alone."""
+        spec = SectionSplitSpec.model_validate({"sections": [
+            {
+                "name": "Balic", "start": '<p id="header-1-balic">.*?</p>', "end": ['<p id="header-2-draj">'],
+                "markers": ["On the rare"], "blockquote": [0, 1],
+            },
+            {"name": "Draj", "start": '<p id="header-2-draj">.*?</p>', "end": ['<p id="header-3-gulg">'],
+             "markers": ["Be that as"]},
+        ]})
+        html = SectionSplitter(spec).apply(_PAGE)
+        self.assertIn(
+            '<blockquote style="margin: 1em 2em; font-style: italic;">\n<p><em>Balic is old.</em></p>\n'
+            "</blockquote>\n<p>On the rare day it rains.</p>",
+            html,
+        )
+        self.assertTrue(html.endswith("<p>Draj text. Be that as it may, more.</p>"))
+
+
+class TestChapterFourAtlasSpec(unittest.TestCase):
+    """Test the atlas spec file."""
+
+    def setUp(self):
+        """Create a temporary directory for spec files."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_atlas_spec_loads(self):
+        """Test the shipped spec validates and keeps its application order."""
+        spec = SectionSplitSpec.load(ATLAS_SPEC_PATH)
+        self.assertEqual(spec.sections[0].name, "main intro")
+        self.assertEqual(spec.sections[-1].end, None)
+        stages = [section.stage for section in spec.sections]
+        self.assertEqual(stages, sorted(stages, key=lambda stage: stage != "before_headers"))
+
+    def test_new_location_is_a_spec_entry(self):
+        """Test a location added to a spec file is split without code changes."""
+        spec_path = self.temp_dir / "atlas.json"
+        spec_path.write_text(json.dumps(_SPEC), encoding="utf-8")
+        html = postprocess_chapter_four_atlas(_PAGE, spec_path=spec_path)
+        self.assertIn("<p>On the rare day it rains.</p>", html)
+        self.assertEqual(postprocess_chapter_four_atlas(_PAGE, spec_path=self.temp_dir / "missing.json"), _PAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,17 +8,26 @@ Requirements:
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from tools.pdf_pipeline.knowledge_base.adnd_schema import (
     ADnDAbilityScore,
+    ADnDArmorClass,
+    ADnDCombatMechanic,
+    ADnDSavingThrow,
     ADnDSourcebook,
+    ADnDTHAC0,
 )
 from tools.pdf_pipeline.knowledge_base.knowledge_repository import (
     KnowledgeRepository,
     RuleCategory,
 )
 from tools.pdf_pipeline.mapping.context_analyzer import ContextAnalyzer, DarkSunContext
-from tools.pdf_pipeline.mapping.rule_translator import AbilityScoreTranslator
+from tools.pdf_pipeline.mapping.rule_translator import (
+    AbilityScoreTranslator,
+    CombatMechanicTranslator,
+    SavingThrowTranslator,
+)
 from tools.pdf_pipeline.mapping.semantic_mapper import (
     MappingConfidence,
     SemanticMapper,
@@ -111,6 +120,102 @@ class TestRuleTranslator(unittest.TestCase):
         self.assertEqual(result.conversion["pf2e_modifier"], 4)
 
 
+class TestBatchTranslation(unittest.TestCase):
+    """Test table-at-a-time translation of numeric progressions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.analyzer = ContextAnalyzer()
+        self.pf2e_client = MagicMock()
+        self.pf2e_client.query_ability_scores.return_value = []
+
+    def test_thac0_table_matches_single_rule(self):
+        """Test batch THAC0 conversion matches the single-rule wrapper."""
+        translator = CombatMechanicTranslator(self.analyzer)
+        rows = [
+            ADnDTHAC0(
+                class_name="Fighter",
+                level=level,
+                thac0=21 - level,
+                source=ADnDSourcebook.DMG_REVISED,
+            )
+            for level in range(1, 21)
+        ]
+
+        table = translator.convert_thac0_table(rows)
+
+        self.assertEqual([row["pf2e_attack_bonus"] for row in table], list(range(0, 20)))
+        self.assertEqual(table[4], translator._convert_thac0(rows[4]))
+        results = translator.translate_batch(rows, self.pf2e_client)
+        self.assertEqual(
+            results[4].conversion,
+            translator.translate(rows[4], self.pf2e_client).conversion,
+        )
+
+    def test_mixed_combat_table(self):
+        """Test THAC0, AC and generic rows keep their order in one batch."""
+        translator = CombatMechanicTranslator(self.analyzer)
+        rows = [
+            ADnDArmorClass(
+                armor_type="Hide", base_ac=6, source=ADnDSourcebook.DMG_REVISED
+            ),
+            ADnDTHAC0(
+                class_name="Thief", level=1, thac0=20, source=ADnDSourcebook.DMG_REVISED
+            ),
+            ADnDCombatMechanic(
+                name="Initiative",
+                category="initiative",
+                description="Roll a d10",
+                source=ADnDSourcebook.DMG_REVISED,
+            ),
+        ]
+
+        results = translator.translate_batch(rows, self.pf2e_client)
+
+        self.assertEqual(results[0].conversion["pf2e_ac"], 14)
+        self.assertEqual(results[1].conversion["pf2e_attack_bonus"], 0)
+        self.assertTrue(results[2].conversion["requires_manual_review"])
+
+    def test_ability_score_table(self):
+        """Test ability score modifiers are computed for a whole table."""
+        translator = AbilityScoreTranslator(self.analyzer)
+        rows = [
+            ADnDAbilityScore(
+                ability="CON", score=score, modifiers={}, source=ADnDSourcebook.DMG_REVISED
+            )
+            for score in (3, 10, 11, 18, 20)
+        ]
+
+        results = translator.translate_batch(rows, self.pf2e_client)
+
+        self.assertEqual(
+            [r.conversion["pf2e_modifier"] for r in results], [-4, 0, 0, 4, 5]
+        )
+        self.pf2e_client.query_ability_scores.assert_called_once()
+
+    def test_saving_throw_table(self):
+        """Test saving throws fold into PF2E saves with proficiency ranks."""
+        translator = SavingThrowTranslator(self.analyzer)
+        row = ADnDSavingThrow(
+            class_name="Fighter",
+            level=17,
+            paralyzation_poison_death=3,
+            rod_staff_wand=5,
+            petrification_polymorph=4,
+            breath_weapon=4,
+            spell=6,
+            source=ADnDSourcebook.DMG_REVISED,
+        )
+        weak = row.model_copy(update={"level": 1, "spell": 17})
+
+        table = translator.convert_saving_throw_table([row, weak])
+
+        self.assertEqual(table[0]["pf2e_saves"]["fortitude"]["adnd_target"], 3)
+        self.assertEqual(table[0]["pf2e_saves"]["fortitude"]["proficiency"], "legendary")
+        self.assertEqual(table[0]["pf2e_saves"]["will"]["proficiency"], "master")
+        self.assertEqual(table[1]["pf2e_saves"]["will"]["proficiency"], "trained")
+
+
 class TestSemanticMapper(unittest.TestCase):
     """Test semantic mapper."""
 
@@ -162,6 +267,64 @@ class TestSemanticMapper(unittest.TestCase):
         self.assertIn("total_rules", stats)
         self.assertGreaterEqual(stats["total_rules"], 0)
 
+    def test_analyze_mapping_coverage_histogram(self):
+        """Test coverage analysis builds a per-category confidence histogram."""
+        stats = self.mapper.analyze_mapping_coverage(ADnDSourcebook.DMG_REVISED)
+
+        self.assertEqual(stats["total_rules"], 1)
+        self.assertEqual(stats["mapped_rules"], 1)
+        category_stats = stats["by_category"][RuleCategory.ABILITY_SCORES.value]
+        self.assertEqual(category_stats["total_rules"], 1)
+        self.assertEqual(sum(category_stats["histogram"].values()), 1)
+        self.assertEqual(category_stats["histogram"][MappingConfidence.UNMAPPABLE.value], 0)
+
+    def test_map_batch_preserves_order_and_duplicates(self):
+        """Test batch mapping returns one result per requested id, in order."""
+        results = self.mapper.map_batch(
+            [self.test_rule_id, "missing_rule", self.test_rule_id],
+            RuleCategory.ABILITY_SCORES,
+            ADnDSourcebook.DMG_REVISED,
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].conversion, results[2].conversion)
+        self.assertEqual(results[1].confidence, MappingConfidence.UNMAPPABLE)
+        self.assertIsNot(results[0], results[2])
+
+    def test_map_batch_memoizes_identical_rules(self):
+        """Test rules with identical content are translated only once."""
+        duplicate_id = self.repo.store_adnd_rule(
+            ADnDAbilityScore(
+                ability="STR",
+                score=18,
+                modifiers={},
+                source=ADnDSourcebook.DMG_REVISED,
+            ),
+            RuleCategory.ABILITY_SCORES,
+            ADnDSourcebook.DMG_REVISED,
+            rule_id="duplicate_str_18",
+        )
+
+        with patch.object(
+            self.mapper.ability_translator,
+            "translate_batch",
+            wraps=self.mapper.ability_translator.translate_batch,
+        ) as translate_batch:
+            results = self.mapper.map_batch(
+                [self.test_rule_id, duplicate_id],
+                RuleCategory.ABILITY_SCORES,
+                ADnDSourcebook.DMG_REVISED,
+            )
+            self.mapper.map_batch(
+                [duplicate_id],
+                RuleCategory.ABILITY_SCORES,
+                ADnDSourcebook.DMG_REVISED,
+            )
+
+        translate_batch.assert_called_once()
+        self.assertEqual(len(translate_batch.call_args.args[0]), 1)
+        self.assertEqual(results[0].conversion, results[1].conversion)
+
 
 if __name__ == "__main__":
     unittest.main()
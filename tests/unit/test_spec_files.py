@@ -0,0 +1,60 @@
+"""Unit tests for cached spec file loading.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.pdf_pipeline.utils import spec_files
+from tools.pdf_pipeline.utils.spec_files import PROJECT_ROOT, load_spec, resolve_spec_path
+
+
+class TestLoadSpec(unittest.TestCase):
+    """Test compiling spec files once and rebuilding them on change."""
+
+    def setUp(self):
+        """Write a spec file in a temporary directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.spec = self.temp_dir / "spec.json"
+        self.spec.write_text("one", encoding="utf-8")
+        self.builds = []
+
+    def tearDown(self):
+        """Remove the temporary directory and its cache entry."""
+        spec_files._compiled.pop(str(self.spec), None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _build(self, path):
+        text = path.read_text(encoding="utf-8")
+        self.builds.append(text)
+        return text
+
+    def test_reused_until_changed(self):
+        """Test an unchanged file is built once and a changed one replaces its entry."""
+        self.assertEqual(load_spec(self.spec, self._build), "one")
+        self.assertEqual(load_spec(self.spec, self._build), "one")
+        self.assertEqual(self.builds, ["one"])
+
+        self.spec.write_text("two", encoding="utf-8")
+        stat = self.spec.stat()
+        os.utime(self.spec, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(load_spec(self.spec, self._build), "two")
+        self.assertEqual(self.builds, ["one", "two"])
+        self.assertEqual(sum(key == str(self.spec) for key in spec_files._compiled), 1)
+
+    def test_relative_path_falls_back_to_project_root(self):
+        """Test a relative path missing from the working directory resolves from the root."""
+        relative = Path("data/mappings/not-a-real-spec.json")
+        self.assertEqual(resolve_spec_path(relative), PROJECT_ROOT / relative)
+        self.assertEqual(resolve_spec_path(self.spec), self.spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
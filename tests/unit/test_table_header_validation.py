@@ -0,0 +1,165 @@
+"""Unit tests for table header and chapter HTML validation.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput
+from tools.pdf_pipeline.stages.validate import TableHeaderValidationProcessor
+from tools.pdf_pipeline.stages.validate.validators import (
+    ChapterDocument,
+    HTMLRuleValidator,
+    ParagraphCountRule,
+    RuleReport,
+)
+from tools.pdf_pipeline.stages.validate.validators.html_rules import CHAPTER_THREE, CHAPTER_TWO
+
+CHAPTER_HTML = """<html><body>
+<p id="header-1-warrior-classes">Warrior Classes</p>
+<p>Intro.</p>
+<p><span>Styled</span></p>
+<table class="ds-table"><tr><th>Level</th><th>XP</th></tr><tr><td>1</td><td><p>0</p></td></tr></table>
+<p>After table.</p>
+<p id="header-2-wizard-classes" class="h1-header">Wizard Classes</p>
+<p>Wizards.</p>
+</body></html>
+"""
+
+
+class TestChapterDocument(unittest.TestCase):
+    """Test the parsed chapter index."""
+
+    def setUp(self):
+        """Parse the sample chapter."""
+        self.doc = ChapterDocument("chapter.html", CHAPTER_HTML)
+
+    def test_headers_indexed_with_attributes(self):
+        """Test header tags are indexed and matched by tag prefix."""
+        self.assertEqual([h.id for h in self.doc.headers], ["header-1-warrior-classes", "header-2-wizard-classes"])
+        self.assertTrue(self.doc.headers[0].bare)
+        self.assertFalse(self.doc.headers[1].bare)
+        self.assertIsNone(self.doc.header('<p id="header-2-wizard-classes">'))
+        self.assertIsNotNone(self.doc.header('<p id="header-2'))
+
+    def test_tables_parsed_into_rows_and_cells(self):
+        """Test tables expose rows, cells and their context."""
+        table = self.doc.tables[0]
+        self.assertTrue(table.after_paragraph)
+        self.assertEqual(table.plain_row_count, 2)
+        self.assertEqual([c.text for c in table.rows[0].cells_named("th")], ["Level", "XP"])
+        self.assertEqual(table.rows[1].cells[1].text, "0")
+
+    def test_paragraph_counts_in_section(self):
+        """Test paragraph counting variants over a header-bounded section."""
+        span = self.doc.section('<p id="header-1-warrior-classes">', '<p id="header-2')
+        self.assertIsNotNone(span)
+        self.assertEqual(self.doc.paragraph_count(span), 4)
+        self.assertEqual(self.doc.paragraph_count(span, outside_tables=True), 3)
+        self.assertEqual(self.doc.paragraph_count(span, without_span=True), 3)
+
+        after = self.doc.section_after_table('<p id="header-1-warrior-classes">', '<p id="header-2')
+        self.assertEqual(self.doc.paragraph_count(after), 1)
+
+    def test_missing_section(self):
+        """Test a section whose closing header is absent is not found."""
+        self.assertIsNone(self.doc.section('<p id="header-1-warrior-classes">', '<p id="header-9'))
+
+
+class TestRules(unittest.TestCase):
+    """Test rule evaluation against a document."""
+
+    def test_paragraph_count_rule(self):
+        """Test the rule reports the actual count and counts an issue."""
+        rule = ParagraphCountRule(
+            "chapter.html", "warriors",
+            [('<p id="header-0-missing">', '<p id="header-2'), ('<p id="header-1-warrior-classes">', '<p id="header-2')],
+            expected=5,
+            message="Warriors has {count} paragraphs",
+        )
+        report = RuleReport()
+        rule.check(ChapterDocument("chapter.html", CHAPTER_HTML), report)
+        self.assertEqual(report.errors, ["Warriors has 4 paragraphs"])
+        self.assertEqual(report.issues, 1)
+
+    def test_rule_silent_when_section_missing(self):
+        """Test a rule does nothing when none of its sections exist."""
+        rule = ParagraphCountRule("chapter.html", "none", [('<p id="header-7', '<p id="header-8')], 1, "{count}")
+        report = RuleReport()
+        rule.check(ChapterDocument("chapter.html", CHAPTER_HTML), report)
+        self.assertEqual(report.errors, [])
+
+
+class TestTableHeaderValidationProcessor(unittest.TestCase):
+    """Test the processor over structured JSON and chapter HTML."""
+
+    def setUp(self):
+        """Create sections and HTML directories."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.sections_dir = self.temp_dir / "sections"
+        self.html_dir = self.temp_dir / "html"
+        self.sections_dir.mkdir()
+        self.html_dir.mkdir()
+
+        table = {"rows": [
+            {"cells": [{"text": "Level"}, {"text": "XP"}]},
+            {"cells": [{"text": "1"}, {"text": "0"}]},
+        ]}
+        (self.sections_dir / "ch.json").write_text(
+            json.dumps({"pages": [{"page_number": 3, "tables": [table]}]}), encoding="utf-8"
+        )
+        (self.html_dir / CHAPTER_TWO).write_text(
+            '<p id="header-8-other-languages">Other Languages</p><p>Elven, Dwarven.</p>'
+            '<p id="header-9-dwarves">Dwarves</p>',
+            encoding="utf-8",
+        )
+        (self.html_dir / CHAPTER_THREE).write_text(CHAPTER_HTML.replace(' class="h1-header"', ""), encoding="utf-8")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, **config):
+        spec = MagicMock()
+        spec.config = {"sections_dir": str(self.sections_dir), "html_dir": str(self.html_dir), **config}
+        context = ExecutionContext(pipeline_name="test")
+        return TableHeaderValidationProcessor(spec).process(ProcessorInput(data={}), context), context
+
+    def test_json_and_html_errors_in_chapter_order(self):
+        """Test JSON header errors come first, then chapter 2 and chapter 3 rules."""
+        result, context = self._run()
+
+        errors = result.data["errors"]
+        self.assertEqual(context.items_processed, 1)
+        self.assertTrue(errors[0].startswith("Table in ch, page 3, table 0"))
+        self.assertTrue(errors[1].startswith("Other Languages section in Chapter 2 is missing its language table"))
+        self.assertTrue(errors[2].startswith("Warrior Classes section in Chapter 3 has 4 paragraphs"))
+        # The missing Inherent Potential header is reported without counting as a table issue
+        self.assertIn("Inherent Potential Table header not found in HTML", errors)
+        self.assertEqual(result.data["tables_with_issues"], len(errors) - 1)
+        self.assertFalse(result.data["success"])
+
+    def test_missing_chapter_skipped(self):
+        """Test chapters without an HTML file produce no rule errors."""
+        (self.html_dir / CHAPTER_TWO).unlink()
+        errors, issues = HTMLRuleValidator().validate(self.html_dir)
+        self.assertFalse(any("Chapter 2" in e for e in errors))
+        self.assertTrue(any("Chapter 3" in e for e in errors))
+
+    def test_parallel_matches_serial(self):
+        """Test per-chapter workers return the same errors in the same order."""
+        serial, _ = self._run(parallel=False)
+        parallel, _ = self._run(parallel=True, max_workers=2)
+        self.assertEqual(parallel.data["errors"], serial.data["errors"])
+        self.assertEqual(parallel.data["tables_with_issues"], serial.data["tables_with_issues"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unit tests for declarative table reconstruction.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import unittest
+
+from tools.pdf_pipeline.transformers.chapter_10.tables import TREASURE_TABLES_SPEC_PATH
+from tools.pdf_pipeline.utils.table_specs import TableEngine, TableSpec, TableSpecFile
+
+
+def _block(text, bbox, lines=None):
+    lines = lines or [(text, bbox)]
+    return {
+        "type": "text",
+        "bbox": list(bbox),
+        "lines": [{"bbox": list(b), "spans": [{"text": t, "size": 9.0}]} for t, b in lines],
+    }
+
+
+def _page():
+    return {"blocks": [
+        _block("Prices", (50, 100, 150, 110)),
+        _block("Item", (50, 115, 80, 122), [
+            ("Item", (50, 115, 80, 122)), ("A", (50, 130, 60, 138)), ("B", (50, 150, 60, 158)),
+        ]),
+        _block("Cost", (100, 115, 140, 122), [
+            ("Cost", (100, 115, 140, 122)), ("1 0 gp", (100, 130, 140, 138)),
+            ("5 0 %", (100, 140, 140, 148)),
+        ]),
+        _block("Weights", (50, 200, 150, 210)),
+        _block("A", (50, 220, 60, 228), [("A", (50, 220, 60, 228)), ("3 lb", (100, 220, 140, 228))]),
+        _block("Next section", (50, 260, 150, 270)),
+    ]}
+
+
+def _spec(**overrides):
+    spec = {
+        "name": "Prices", "header": "Prices", "end": "Weights",
+        "columns": [{"name": "Item"}, {"name": "Cost", "x": [90, 200]}],
+        "row_anchor": {"values": ["A", "B"]},
+        "exclude": ["Cost"], "attach": "__prices_table",
+    }
+    spec.update(overrides)
+    return TableSpec.model_validate(spec)
+
+
+class TestTableEngine(unittest.TestCase):
+    """Test building tables from specs."""
+
+    def test_rows_columns_and_cleanup(self):
+        """Test rows are anchored on labels, cells bucketed by x band and sources hidden."""
+        page = _page()
+        built = TableEngine([_spec(clean=["nospace"])], {"nospace": lambda t: t.replace(" ", "")}).apply([page])
+        self.assertEqual(built, {"Prices": True})
+
+        table = page["blocks"][0]["__prices_table"]
+        self.assertEqual(
+            [[cell["text"] for cell in row["cells"]] for row in table["rows"]],
+            [["Item", "Cost"], ["A", "10gp\n50%"], ["B", "-"]],
+        )
+        self.assertTrue(page["blocks"][1]["__skip_render"])
+        self.assertNotIn("__skip_render", page["blocks"][3])
+
+    def test_cells_cleaned_once(self):
+        """Test each joined cell goes through the cleaners exactly once."""
+        cleaned = []
+        engine = TableEngine([_spec(clean=["record"])], {"record": lambda t: cleaned.append(t) or t})
+        engine.apply([_page()])
+        self.assertEqual(cleaned, ["1 0 gp\n5 0 %"])
+
+    def test_specs_share_one_page_pass(self):
+        """Test several tables on a page are built and a new table is just a spec."""
+        weights = _spec(name="Weights", header="Weights", end="Next section", attach="__weights_table",
+                        row_anchor={"values": ["A"]}, header_size=12.0)
+        page = _page()
+        built = TableEngine([_spec(), weights]).apply([{"blocks": []}, page])
+
+        self.assertEqual(built, {"Prices": True, "Weights": True})
+        self.assertEqual(page["blocks"][3]["__weights_table"]["rows"][1]["cells"][1]["text"], "3 lb")
+        self.assertEqual(page["blocks"][3]["lines"][0]["spans"][0]["size"], 12.0)
+        # The Weights block is the Prices end anchor, so it is never hidden
+        self.assertNotIn("__skip_render", page["blocks"][3])
+
+    def test_missing_header_and_unknown_cleaner(self):
+        """Test a table without its header is reported and bad specs are rejected."""
+        self.assertEqual(TableEngine([_spec(header="Absent")]).apply([_page()]), {"Prices": False})
+        with self.assertRaises(ValueError):
+            TableEngine([_spec(clean=["missing"])])
+
+    def test_treasure_spec_loads(self):
+        """Test the shipped Chapter 10 spec validates."""
+        specs = TableSpecFile.load(TREASURE_TABLES_SPEC_PATH).tables
+        self.assertEqual([spec.attach for spec in specs], ["__lair_treasures_table", "__individual_treasures_table"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Unit tests for the cached block text index.
+
+Requirements:
+- SWENG-6: Test-driven development pattern
+- SWENG-7: All functions MUST have automated unit tests
+"""
+
+import unittest
+
+from tools.pdf_pipeline.transformers.chapter_2.common import find_block, find_block_containing, find_block_exact
+from tools.pdf_pipeline.utils.text_index import PageTextIndex, SectionTextIndex
+
+
+def _block(*lines):
+    return {"type": "text", "bbox": [0, 0, 10, 10], "lines": [
+        {"spans": [{"text": part} for part in line]} for line in lines
+    ]}
+
+
+class TestPageTextIndex(unittest.TestCase):
+    """Test lookups over a page."""
+
+    def setUp(self):
+        """Create a page with split spans and typographic quotes."""
+        PageTextIndex.invalidate()
+        self.page = {"page_number": 5, "blocks": [
+            _block(["Fighter", "’s Followers"]),
+            {"type": "image", "bbox": [0, 0, 1, 1]},
+            _block(["Gladiator"], ["Ability Requirements: Str 13"]),
+            _block(["Gladiator"]),
+        ]}
+        self.normalize = lambda text: text.replace("’", "'")
+
+    def test_exact_prefix_and_containing(self):
+        """Test line lookups return the first block in document order."""
+        index = PageTextIndex(self.page, self.normalize)
+        self.assertEqual(index.line_texts(0), ["Fighter's Followers"])
+        self.assertEqual(index.find_exact("Gladiator")[0], 2)
+        self.assertEqual(index.find_prefix("Ability Req")[0], 2)
+        self.assertIsNone(index.find_prefix("Zzz"))
+        self.assertEqual(index.find_containing("Followers")[0], 0)
+        self.assertIsNone(index.find_containing("GladiatorAbility"))
+        self.assertEqual(index.find_containing("GladiatorAbility", within_line=False)[0], 2)
+
+    def test_block_text_lookups(self):
+        """Test whole-block text lookups with a line separator."""
+        index = PageTextIndex(self.page, self.normalize)
+        self.assertEqual(index.block_text(2, sep=" "), "Gladiator Ability Requirements: Str 13")
+        self.assertEqual(index.find_block_text("Gladiator", sep=" ")[0], 3)
+        found = index.find_block_where(lambda text: text.startswith("Gladiator Ability"), sep=" ")
+        self.assertEqual(found[0], 2)
+
+    def test_rebuilt_after_invalidate(self):
+        """Test the cached index is reused until the page is invalidated."""
+        index = PageTextIndex.for_page(self.page, self.normalize)
+        self.assertIs(PageTextIndex.for_page(self.page, self.normalize), index)
+
+        self.page["blocks"][3]["lines"][0]["spans"][0]["text"] = "Templar"
+        self.assertIs(PageTextIndex.for_page(self.page, self.normalize), index)
+        PageTextIndex.invalidate(self.page)
+        rebuilt = PageTextIndex.for_page(self.page, self.normalize)
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(rebuilt.find_exact("Templar")[0], 3)
+
+        self.page["blocks"].insert(0, _block(["Templar"]))
+        PageTextIndex.invalidate(self.page)
+        self.assertEqual(PageTextIndex.for_page(self.page, self.normalize).find_exact("Templar")[0], 0)
+
+    def test_section_lookup_by_page_number(self):
+        """Test section lookups report the page index and honour page_number."""
+        pages = [{"page_number": 4, "blocks": [_block(["Gladiator"])]}, self.page]
+        section = SectionTextIndex(pages)
+        self.assertEqual(section.find_exact("Gladiator")[:2], (0, 0))
+        self.assertEqual(section.find_exact("Gladiator", page_number=5)[:2], (1, 2))
+        self.assertIsNone(section.find_exact("Gladiator", page_number=6))
+
+
+class TestChapterTwoFindBlock(unittest.TestCase):
+    """Test the chapter 2 helpers built on the index."""
+
+    def test_helpers_agree_with_predicate_search(self):
+        """Test exact and containing lookups match the predicate form."""
+        page = {"blocks": [_block(["Starting Age"]), _block(["Age"]), _block(["Aging Effects"])]}
+        self.assertEqual(
+            find_block_exact(page, "Age"),
+            find_block(page, lambda texts: any(text == "Age" for text in texts)),
+        )
+        self.assertEqual(find_block_containing(page, "Age")[0], 0)
+        self.assertEqual(find_block_containing(page, "Aging")[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
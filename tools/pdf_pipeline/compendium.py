@@ -1,11 +1,85 @@
-"""Utilities for turning processed data into Foundry VTT compendia."""
+"""Utilities for turning processed data into Foundry VTT compendia.
+
+Document IDs are derived from each document's slug (and page index for
+journal pages), so rebuilding a pack from the same inputs yields the same
+IDs and Foundry clients only re-sync documents whose content changed.
+Packs are written incrementally: unchanged documents are left in place and
+changed ones are appended as NeDB update records. For Foundry v11+ the
+same documents go into a native LevelDB pack directory instead, whose log
+is appended to in the same way (see ``leveldb_pack``).
+
+Item and Actor packs are built from the typed entity files extracted at
+transform time (see ``utils.entities``); their AD&D values are kept in the
+documents' module flags until the rules conversion maps them to PF2E.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import html
 import json
-import uuid
+import logging
+import re
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .leveldb_pack import COMPACTION_RATIO, DEFAULT_BATCH_SIZE, uses_leveldb, write_leveldb_pack
+from .utils.entities import read_entities
+
+logger = logging.getLogger(__name__)
+
+# Foundry document IDs are 16 alphanumeric characters
+DOCUMENT_ID_LENGTH = 16
+
+MODULE_ID = "darksun-pf2e"
+
+# Entity packs: label, Foundry document type and the entity types they hold.
+# Packs marked ``held_back`` are not built into the module: rules conversion
+# does not map their entities yet, and a PF2E spell, class or NPC without its
+# system data (level, traits, attributes) imports as an empty shell.
+ENTITY_PACKS: Dict[str, Dict[str, Any]] = {
+    "dark-sun-equipment": {"label": "Dark Sun Equipment", "type": "Item", "entities": ["weapon", "equipment"]},
+    "dark-sun-spells": {"label": "Dark Sun Spells", "type": "Item", "entities": ["spell"], "held_back": True},
+    "dark-sun-classes": {"label": "Dark Sun Classes", "type": "Item", "entities": ["class"], "held_back": True},
+    "dark-sun-bestiary": {"label": "Dark Sun Bestiary", "type": "Actor", "entities": ["monster"], "held_back": True},
+}
+
+# PF2E document type of each entity type
+_ENTITY_DOCUMENT_TYPES = {
+    "weapon": "weapon",
+    "equipment": "equipment",
+    "spell": "spell",
+    "class": "class",
+    "monster": "npc",
+}
+# Entity fields rendered as description paragraphs rather than stat lines
+_ENTITY_TEXT_FIELDS = ("description", "combat", "habitat", "ecology")
+
+_TOC_RE = re.compile(r'<nav id="table-of-contents">.*?</nav>\s*', re.DOTALL)
+_TOP_ANCHOR = '<a id="top"></a>'
+# Header paragraphs written by journal_lib.toc.add_header_anchors; headers
+# without a level class predate the classes and are H1
+_HEADER_ANCHOR_RE = re.compile(
+    r'<p id="(header-\d+-[^"]*)"(?: class="h(\d)-header")?[^>]*>.*?<span[^>]*>([^<]*)</span></p>'
+)
+_INTERNAL_LINK_RE = re.compile(r'<a href="#([^"]+)"[^>]*>(.*?)</a>', re.DOTALL)
+
+
+def stable_id(*parts: Any) -> str:
+    """Derive a deterministic Foundry document ID from its identifying parts.
+
+    Args:
+        *parts: Identifying values (document kind, slug, page index, ...)
+
+    Returns:
+        16-character lowercase hex ID
+    """
+    key = "\x1f".join(str(part) for part in parts)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:DOCUMENT_ID_LENGTH]
+
+
+def _slugify(value: str) -> str:
+    return "-".join("".join(c if c.isalnum() else " " for c in value.lower()).split())
 
 
 def _paragraphs_to_html(paragraphs: Iterable[str]) -> str:
@@ -49,21 +123,140 @@ def _read_processed(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def build_ancestry_pack(processed_path: Path, output_path: Path) -> Path:
-    """Create a Foundry-ready ancestry pack from processed ancestry data."""
+def _entry_line(entry: dict) -> str:
+    return json.dumps(entry, ensure_ascii=False)
+
+
+def read_pack(path: Path) -> Dict[str, dict]:
+    """Load the live documents of a NeDB pack.
+
+    Later lines for the same ``_id`` supersede earlier ones and
+    ``$$deleted`` records remove a document, as NeDB does on load.
+
+    Args:
+        path: Pack ``.db`` file
+
+    Returns:
+        Documents keyed by ``_id`` in first-seen order
+    """
+    documents: Dict[str, dict] = {}
+    if not path.exists():
+        return documents
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            doc_id = record.get("_id")
+            if record.get("$$deleted"):
+                documents.pop(doc_id, None)
+            else:
+                documents[doc_id] = record
+    return documents
+
+
+def _count_lines(path: Path) -> int:
+    with path.open(encoding="utf-8") as fh:
+        return sum(1 for line in fh if line.strip())
+
+
+def write_pack(entries: Iterable[dict], output_path: Path) -> Dict[str, Any]:
+    """Write documents to a NeDB pack, touching only what changed.
+
+    Documents are diffed by ``_id`` against the existing pack. New and
+    changed documents are appended as update records and removed ones as
+    ``$$deleted`` records; the file is rewritten in full only when it does
+    not exist, cannot be parsed, or superseded lines would outnumber live
+    documents by more than ``COMPACTION_RATIO``.
+
+    Args:
+        entries: Documents with stable ``_id`` values
+        output_path: Pack ``.db`` file
+
+    Returns:
+        Counts of added, updated, removed and unchanged documents plus
+        whether the file was rewritten
+    """
+    entries = list(entries)
+    stats: Dict[str, Any] = {
+        "added": 0,
+        "updated": 0,
+        "removed": 0,
+        "unchanged": 0,
+        "rewritten": False,
+    }
+
+    try:
+        existing = read_pack(output_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Rewriting unreadable pack {output_path}: {e}")
+        existing = {}
+        output_path.unlink(missing_ok=True)
+
+    appended: List[str] = []
+    seen = set()
+    for entry in entries:
+        doc_id = entry["_id"]
+        seen.add(doc_id)
+        previous = existing.get(doc_id)
+        if previous == entry:
+            stats["unchanged"] += 1
+            continue
+        stats["added" if previous is None else "updated"] += 1
+        appended.append(_entry_line(entry))
+    for doc_id in existing:
+        if doc_id not in seen:
+            stats["removed"] += 1
+            appended.append(_entry_line({"_id": doc_id, "$$deleted": True}))
+
+    if not appended and output_path.exists():
+        return stats
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stale_lines = 0
+    if output_path.exists():
+        stale_lines = _count_lines(output_path) + len(appended) - len(entries)
+
+    if not output_path.exists() or stale_lines > COMPACTION_RATIO * max(len(entries), 1):
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        tmp_path.write_text(
+            "".join(_entry_line(entry) + "\n" for entry in entries), encoding="utf-8"
+        )
+        tmp_path.replace(output_path)
+        stats["rewritten"] = True
+    else:
+        with output_path.open("rb+") as fh:
+            fh.seek(0, 2)
+            needs_newline = fh.tell() > 0
+            if needs_newline:
+                fh.seek(-1, 2)
+                needs_newline = fh.read(1) != b"\n"
+            payload = "".join(line + "\n" for line in appended)
+            fh.write((("\n" if needs_newline else "") + payload).encode("utf-8"))
+
+    logger.info(
+        f"Wrote pack {output_path}: {stats['added']} added, {stats['updated']} updated, "
+        f"{stats['removed']} removed, {stats['unchanged']} unchanged"
+    )
+    return stats
+
+
+def iter_ancestry_entries(processed_path: Path) -> Iterator[dict]:
+    """Yield ancestry Item documents for processed ancestry data."""
 
     processed = _read_processed(processed_path)
     entities = processed.get("data", {}).get("entities", [])
 
-    entries = []
     for entity in entities:
         pf2e = entity.get("pf2e", {})
         description_html = _description_to_html(entity.get("description", ""))
         boosts = pf2e.get("boosts", [])
         flaws = pf2e.get("flaws", [])
 
+        slug = entity.get("slug") or _slugify(entity["name"])
         entry = {
-            "_id": uuid.uuid4().hex,
+            "_id": stable_id("ancestry", slug),
             "name": entity["name"],
             "type": "ancestry",
             "img": "systems/pf2e/icons/default-icons/ancestry.svg",
@@ -92,21 +285,227 @@ def build_ancestry_pack(processed_path: Path, output_path: Path) -> Path:
             "flags": {},
             "source": {"value": entity.get("source_section", "Dark Sun")},
         }
-        entries.append(entry)
+        yield entry
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(
-        "\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries),
-        encoding="utf-8",
+
+def _entity_value(value: Any) -> str:
+    """Render an entity field value as a stat line value."""
+    if isinstance(value, dict):
+        return "; ".join(f"{key} {item}" for key, item in value.items())
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return str(value)
+
+
+def _entity_description(record: Dict[str, Any]) -> str:
+    """Render an entity's AD&D values as description HTML."""
+    stat_lines = []
+    for key, value in record.items():
+        if key in ("name", "source") or key in _ENTITY_TEXT_FIELDS or value in ("", None, [], {}):
+            continue
+        label = key.replace("_", " ").capitalize()
+        stat_lines.append(f"<strong>{label}:</strong> {html.escape(_entity_value(value), quote=False)}")
+    blocks = [f"<p>{'<br>'.join(stat_lines)}</p>"] if stat_lines else []
+    for key in _ENTITY_TEXT_FIELDS:
+        if record.get(key):
+            blocks.append(f"<h3>{key.capitalize()}</h3>")
+            blocks.append(_description_to_html(html.escape(record[key], quote=False)))
+    return "\n".join(blocks)
+
+
+def iter_entity_entries(entities_dir: Path, entity_types: Iterable[str]) -> Iterator[dict]:
+    """Yield Item or Actor documents for extracted entities.
+
+    IDs derive from the entity type, source chapter and name; repeated names
+    within a chapter get an occurrence number.
+
+    Args:
+        entities_dir: Directory of entity ``.jsonl`` files
+        entity_types: Entity types to include, in pack order
+    """
+    for entity_type in entity_types:
+        document_type = _ENTITY_DOCUMENT_TYPES[entity_type]
+        seen: Dict[tuple, int] = {}
+        for record in read_entities(entity_type, entities_dir):
+            key = (record["source"], _slugify(record["name"]))
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            id_parts = (entity_type,) + key + ((occurrence,) if occurrence else ())
+            adnd = {k: v for k, v in record.items() if k not in ("name", "source")}
+            entry = {
+                "_id": stable_id(*id_parts),
+                "name": record["name"],
+                "type": document_type,
+                "img": f"systems/pf2e/icons/default-icons/{document_type}.svg",
+                "system": {"description": {"value": _entity_description(record)}},
+                "effects": [],
+                "flags": {MODULE_ID: {"entity": entity_type, "source": record["source"], "adnd": adnd}},
+            }
+            if document_type == "npc":
+                entry["system"] = {"details": {"publicNotes": entry["system"]["description"]["value"]}}
+                entry["items"] = []
+            yield entry
+
+
+def build_entity_pack(
+    entities_dir: Path,
+    output_path: Path,
+    pack_name: str,
+    foundry_version: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """Create one of the ``ENTITY_PACKS`` from extracted entity files.
+
+    Writes a NeDB ``.db`` file, or a LevelDB directory when
+    ``foundry_version`` is 11 or later.
+    """
+    pack = ENTITY_PACKS[pack_name]
+    _write_entries(
+        iter_entity_entries(entities_dir, pack["entities"]),
+        output_path,
+        pack["type"],
+        foundry_version,
+        batch_size,
     )
     return output_path
 
 
-def build_journal_pack(processed_dir: Path, output_path: Path) -> Path:
-    """Create a journal compendium that mirrors the extracted source material."""
+def pack_filename(name: str, foundry_version: Optional[int] = None) -> str:
+    """Return the pack path component for a pack name and Foundry version."""
+    return name if uses_leveldb(foundry_version) else f"{name}.db"
+
+
+def _write_entries(
+    entries: Iterable[dict],
+    output_path: Path,
+    document_type: str,
+    foundry_version: Optional[int],
+    batch_size: int,
+) -> None:
+    if uses_leveldb(foundry_version):
+        write_leveldb_pack(entries, output_path, document_type, batch_size=batch_size)
+    else:
+        write_pack(entries, output_path)
+
+
+def build_ancestry_pack(
+    processed_path: Path,
+    output_path: Path,
+    foundry_version: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """Create a Foundry-ready ancestry pack from processed ancestry data.
+
+    Writes a NeDB ``.db`` file, or a LevelDB directory when
+    ``foundry_version`` is 11 or later.
+    """
+
+    _write_entries(
+        iter_ancestry_entries(processed_path), output_path, "Item", foundry_version, batch_size
+    )
+    return output_path
+
+
+def _text_page(page_id: str, name: str, content: str, sort: int) -> dict:
+    return {
+        "_id": page_id,
+        "name": name,
+        "type": "text",
+        "text": {
+            "format": 1,
+            "content": content,
+        },
+        "title": {"show": False},
+        "image": {"displayMode": 0},
+        "sort": sort,
+    }
+
+
+def split_journal_pages(
+    slug: str, title: str, content: str, entry_uuid: str
+) -> List[dict]:
+    """Split chapter HTML into one text page per H1 section.
+
+    The chapter's inline TOC is replaced by a navigation index page. Links
+    to header anchors on other pages, and back-to-top links, become Foundry
+    ``@UUID`` links; links within the same page are kept as they are.
+    Content without H1 anchors stays a single page.
+
+    Args:
+        slug: Journal slug (page IDs derive from it)
+        title: Journal title, used for the introduction page
+        content: Chapter HTML with ``header-N-*`` anchors
+        entry_uuid: UUID of the owning JournalEntry
+
+    Returns:
+        JournalEntryPage documents in display order
+    """
+    body = _TOC_RE.sub("", content, count=1)
+    headers = list(_HEADER_ANCHOR_RE.finditer(body))
+    starts = [m for m in headers if (m.group(2) or "1") == "1"]
+    if not starts:
+        return [_text_page(stable_id("journal", slug, "page", 0), title, content, 1000)]
+
+    sections = []
+    intro = body[: starts[0].start()].replace(_TOP_ANCHOR, "").strip()
+    if intro:
+        sections.append(("intro", title, intro))
+    for idx, match in enumerate(starts):
+        end = starts[idx + 1].start() if idx + 1 < len(starts) else len(body)
+        name = html.unescape(match.group(3)).strip() or title
+        sections.append((match.group(1), name, body[match.start() : end].strip()))
+
+    index_id = stable_id("journal", slug, "page", "index")
+    page_ids = {key: stable_id("journal", slug, "page", key) for key, _, _ in sections}
+
+    # Every anchor maps to the page of the H1 section it falls in
+    anchor_pages: Dict[str, str] = {}
+    owner = sections[0][0]
+    for match in headers:
+        if match.group(1) in page_ids:
+            owner = match.group(1)
+        anchor_pages[match.group(1)] = page_ids[owner]
+
+    def page_link(page_id: str, label: str) -> str:
+        return f"@UUID[{entry_uuid}.JournalEntryPage.{page_id}]{{{label}}}"
+
+    pages = []
+    index_items = []
+    for sort_idx, (key, name, section_html) in enumerate(sections, start=2):
+        page_id = page_ids[key]
+
+        def rewrite(match: re.Match) -> str:
+            target, label = match.group(1), match.group(2)
+            if target == "top":
+                return page_link(index_id, label)
+            target_page = anchor_pages.get(target)
+            if target_page is None or target_page == page_id:
+                return match.group(0)
+            return page_link(target_page, label)
+
+        pages.append(
+            _text_page(page_id, name, _INTERNAL_LINK_RE.sub(rewrite, section_html), sort_idx * 1000)
+        )
+        index_items.append(f"<li>{page_link(page_id, html.escape(name, quote=False))}</li>")
+
+    index_html = '<nav class="journal-index">\n<ul>\n' + "\n".join(index_items) + "\n</ul>\n</nav>"
+    return [_text_page(index_id, "Contents", index_html, 1000)] + pages
+
+
+def iter_journal_entries(
+    processed_dir: Path, pack_name: str = "dark-sun-rules", split_pages: bool = True
+) -> Iterator[dict]:
+    """Yield JournalEntry documents for processed journal files.
+
+    Args:
+        processed_dir: Directory of processed journal JSON files
+        pack_name: Pack the entries belong to (used in ``@UUID`` links)
+        split_pages: Split chapters into one page per H1 section
+    """
 
     processed_files = sorted(processed_dir.glob("*.json"))
-    entries = []
     sort = 1000
     for processed_file in processed_files:
         processed = _read_processed(processed_file)
@@ -115,41 +514,51 @@ def build_journal_pack(processed_dir: Path, output_path: Path) -> Path:
         if not title:
             continue
         content = data.get("content", "")
+        slug = processed.get("slug") or processed_file.stem
 
-        page_id = uuid.uuid4().hex
+        entry_id = stable_id("journal", slug)
+        if split_pages:
+            entry_uuid = f"Compendium.{MODULE_ID}.{pack_name}.JournalEntry.{entry_id}"
+            pages = split_journal_pages(slug, title, content, entry_uuid)
+        else:
+            pages = [_text_page(stable_id("journal", slug, "page", 0), title, content, sort)]
         entry = {
-            "_id": uuid.uuid4().hex,
+            "_id": entry_id,
             "name": title,
             "type": "JournalEntry",
             "flags": {
-                "darksun-pf2e": {
+                MODULE_ID: {
                     "slug": processed.get("slug"),
                     "source_pages": data.get("source_pages"),
                 }
             },
             "ownership": {},
-            "pages": [
-                {
-                    "_id": page_id,
-                    "name": title,
-                    "type": "text",
-                    "text": {
-                        "format": 1,
-                        "content": content,
-                    },
-                    "title": {"show": False},
-                    "image": {"displayMode": 0},
-                    "sort": sort,
-                }
-            ],
+            "pages": pages,
             "sort": sort,
         }
         sort += 1000
-        entries.append(entry)
+        yield entry
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(
-        "\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries),
-        encoding="utf-8",
+
+def build_journal_pack(
+    processed_dir: Path,
+    output_path: Path,
+    foundry_version: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """Create a journal compendium that mirrors the extracted source material.
+
+    Each chapter becomes a JournalEntry with a navigation index page and one
+    page per H1 section. Writes a NeDB ``.db`` file, or a LevelDB directory when
+    ``foundry_version`` is 11 or later.
+    """
+
+    pack_name = output_path.name[: -len(".db")] if output_path.suffix == ".db" else output_path.name
+    _write_entries(
+        iter_journal_entries(processed_dir, pack_name=pack_name),
+        output_path,
+        "JournalEntry",
+        foundry_version,
+        batch_size,
     )
     return output_path
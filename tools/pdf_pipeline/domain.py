@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .utils.profiling import profile_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -300,12 +302,15 @@ class TransformerStage:
         context.stage_name = self.spec.name
         
         try:
-            # Execute processor
-            output = self.processor.process(input_data, context)
-            
-            # Execute postprocessor if present
-            if self.postprocessor:
-                output = self.postprocessor.postprocess(output, context)
+            with profile_span("stage", self.spec.name):
+                # Execute processor
+                with profile_span("processor", type(self.processor).__name__):
+                    output = self.processor.process(input_data, context)
+                
+                # Execute postprocessor if present
+                if self.postprocessor:
+                    with profile_span("postprocessor", type(self.postprocessor).__name__):
+                        output = self.postprocessor.postprocess(output, context)
             
             return StageResult(
                 stage_name=self.spec.name,
@@ -351,6 +356,11 @@ class Transformer:
         Returns:
             TransformerResult containing results from all stages
         """
+        with profile_span("transformer", self.name):
+            return self._run_stages(input_data, context)
+    
+    def _run_stages(self, input_data: TransformerInput, context: ExecutionContext) -> TransformerResult:
+        """Run the stages in order, stopping at the first failure (see ``transform``)."""
         context.transformer_name = self.name
         stage_results: List[StageResult] = []
         current_input = input_data
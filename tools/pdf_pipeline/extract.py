@@ -22,6 +22,7 @@ from .models import (
     TableCell,
     TableRow,
 )
+from .utils.page_store import dict_from_rawdict, jsonable_page
 
 DEFAULT_TABLE_SETTINGS: Dict[str, object] = {
     "vertical_strategy": "lines",
@@ -319,6 +320,18 @@ def _structured_tables(plumber_page, *, table_settings: Dict[str, object]) -> Li
     return tables
 
 
+def _capture_page_text(page: fitz.Page, raw_dict: dict, page_number: int, page_capture: Dict[str, Dict[int, object]]) -> None:
+    """Record a page's text in the requested page-store modes."""
+    raw = None
+    for mode, captured in page_capture.items():
+        if mode == "text":
+            captured[page_number] = page.get_text("text")
+            continue
+        if raw is None:
+            raw = jsonable_page(raw_dict)
+        captured[page_number] = raw if mode == "rawdict" else dict_from_rawdict(raw)
+
+
 def _extract_structured_section(
     doc: fitz.Document,
     plumber_doc: pdfplumber.PDF,
@@ -326,12 +339,21 @@ def _extract_structured_section(
     parents: Tuple[str, ...],
     *,
     table_settings: Dict[str, object],
+    page_capture: Dict[str, Dict[int, object]] | None = None,
 ) -> StructuredSection:
+    """Extract one section into its structured representation.
+
+    ``page_capture`` maps page-store modes ("dict", "rawdict", "text") to
+    dicts that are filled with each page's text in that mode, so the caller
+    can persist them without reopening the PDF.
+    """
     pages: List[Page] = []
     for page_number in section.page_span:
         page = doc[page_number - 1]
         plumber_page = plumber_doc.pages[page_number - 1]
         raw_dict = page.get_text("rawdict")
+        if page_capture:
+            _capture_page_text(page, raw_dict, page_number, page_capture)
         # Pass page width for column detection and sorting
         blocks = _structured_blocks(raw_dict, page_width=page.rect.width)
         tables = _structured_tables(plumber_page, table_settings=table_settings)
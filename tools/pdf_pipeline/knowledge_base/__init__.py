@@ -25,6 +25,7 @@ from .pf2e_schema import (
     PF2ESpell,
     PF2ETrait,
 )
+from .snapshot import KnowledgeSnapshot, build_snapshot, open_snapshot
 
 __all__ = [
     # AD&D 2E Schemas
@@ -48,5 +49,9 @@ __all__ = [
     # Repository
     "KnowledgeRepository",
     "RuleCategory",
+    # Snapshot
+    "KnowledgeSnapshot",
+    "build_snapshot",
+    "open_snapshot",
 ]
 
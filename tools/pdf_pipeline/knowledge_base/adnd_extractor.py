@@ -17,12 +17,13 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pdfplumber
 
 from ..base import BaseProcessor
 from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
+from ..utils.parallel import get_max_workers, run_process_pool, should_parallelize
 from .adnd_schema import (
     ADnDAbilityScore,
     ADnDArmorClass,
@@ -40,13 +41,99 @@ from .knowledge_repository import KnowledgeRepository, RuleCategory
 logger = logging.getLogger(__name__)
 
 
+def _page_range(entry: Any) -> Tuple[int, int]:
+    """Return the inclusive 1-based page range of a page map entry.
+
+    Args:
+        entry: Page map entry, either ``[start, end]`` or
+            ``{"pages": [start, end], "tables": bool}``
+
+    Returns:
+        Tuple of (first_page, last_page)
+    """
+    pages = entry["pages"] if isinstance(entry, dict) else entry
+    start, end = int(pages[0]), int(pages[-1])
+    return start, end
+
+
+def _scan_sourcebook_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Open a sourcebook once and cache text/tables for every mapped page.
+
+    Module-level so it can run in a process pool worker.
+
+    Args:
+        task: Dict with sourcebook_id, pdf_path and page_map
+
+    Returns:
+        Worker result dict with the page cache under ``pages``
+    """
+    sourcebook_id = task["sourcebook_id"]
+    pdf_path = Path(task["pdf_path"])
+    page_map: Dict[str, Any] = task["page_map"]
+
+    # Union of requested pages; tables are parsed only where a rule type needs them
+    wanted: Dict[int, bool] = {}
+    for entry in page_map.values():
+        start, end = _page_range(entry)
+        want_tables = bool(entry.get("tables", False)) if isinstance(entry, dict) else False
+        for page_num in range(start, end + 1):
+            wanted[page_num] = wanted.get(page_num, False) or want_tables
+
+    pages: Dict[int, Dict[str, Any]] = {}
+    warnings: List[str] = []
+    errors: List[str] = []
+
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            for page_num in sorted(wanted):
+                if page_num > page_count:
+                    warnings.append(
+                        f"{sourcebook_id}: page {page_num} beyond end of PDF ({page_count} pages)"
+                    )
+                    break
+
+                page = pdf.pages[page_num - 1]
+                pages[page_num] = {
+                    "text": page.extract_text() or "",
+                    "tables": page.extract_tables() if wanted[page_num] else [],
+                }
+    except Exception as e:
+        errors.append(f"Error scanning {sourcebook_id}: {e}")
+
+    logger.info(f"Scanned {len(pages)} pages from {sourcebook_id}")
+    return {
+        "items": len(pages),
+        "warnings": warnings,
+        "errors": errors,
+        "sourcebook_id": sourcebook_id,
+        "pages": pages,
+    }
+
+
 class ADnDRuleExtractor(BaseProcessor):
     """Processor for extracting AD&D 2E rules from PDF sourcebooks.
 
     This processor reads AD&D 2E PDFs, extracts structured rules,
     and stores them in the knowledge repository.
+
+    Each sourcebook is opened once: pages listed in the registry's
+    ``page_map`` are scanned into a shared page-text/table cache, and every
+    registered extractor reads its own page range from that cache.
+    Sourcebooks are scanned in parallel when the stage is configured with
+    ``parallel``.
     """
 
+    # Rule type -> extractor method; each takes (pages, sourcebook)
+    RULE_EXTRACTORS: Dict[str, str] = {
+        "ability_scores": "_extract_ability_scores",
+        "saves": "_extract_saving_throws",
+        "thac0": "_extract_thac0",
+        "armor_class": "_extract_armor_class",
+        "combat": "_extract_combat_mechanics",
+        "proficiencies": "_extract_proficiencies",
+    }
+
     def process(
         self, input_data: ProcessorInput, context: ExecutionContext
     ) -> ProcessorOutput:
@@ -72,17 +159,27 @@ class ADnDRuleExtractor(BaseProcessor):
         # Initialize repository
         repo = KnowledgeRepository(kb_dir)
 
-        # Extract rules from each sourcebook
-        extracted_rules = []
-
+        # Scan every sourcebook once, then feed the registered extractors
+        scan_tasks = []
         for sourcebook_config in registry["sourcebooks"]:
             if not sourcebook_config.get("extract_rules"):
                 logger.info(f"Skipping {sourcebook_config['id']} (no extraction rules)")
                 continue
 
+            task = self._build_scan_task(sourcebook_config, context)
+            if task is not None:
+                scan_tasks.append((sourcebook_config, task))
+
+        page_caches = self._scan_sourcebooks([task for _, task in scan_tasks], context)
+
+        extracted_rules = []
+        for sourcebook_config, task in scan_tasks:
             try:
                 rules = self._extract_from_sourcebook(
-                    sourcebook_config, repo, context
+                    sourcebook_config,
+                    page_caches.get(task["sourcebook_id"], {}),
+                    repo,
+                    context,
                 )
                 extracted_rules.extend(rules)
             except Exception as e:
@@ -100,16 +197,81 @@ class ADnDRuleExtractor(BaseProcessor):
             metadata={"sourcebooks_processed": registry["extraction_order"]},
         )
 
+    def _build_scan_task(
+        self, sourcebook_config: Dict[str, Any], context: ExecutionContext
+    ) -> Optional[Dict[str, Any]]:
+        """Build the page scan task for a sourcebook.
+
+        Args:
+            sourcebook_config: Sourcebook configuration
+            context: Execution context
+
+        Returns:
+            Scan task dict, or None if the PDF is missing
+        """
+        sourcebook_id = sourcebook_config["id"]
+        pdf_path = Path(sourcebook_config["filename"])
+        if not pdf_path.exists():
+            context.warnings.append(f"PDF not found: {pdf_path}")
+            return None
+
+        page_map = {
+            rule_type: entry
+            for rule_type, entry in sourcebook_config.get("page_map", {}).items()
+            if rule_type in sourcebook_config["extract_rules"]
+        }
+        return {
+            "sourcebook_id": sourcebook_id,
+            "pdf_path": str(pdf_path),
+            "page_map": page_map,
+        }
+
+    def _scan_sourcebooks(
+        self, tasks: List[Dict[str, Any]], context: ExecutionContext
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """Scan sourcebooks into page caches, in parallel when configured.
+
+        Args:
+            tasks: Scan tasks from _build_scan_task
+            context: Execution context
+
+        Returns:
+            Page cache per sourcebook ID
+        """
+        tasks = [task for task in tasks if task["page_map"]]
+        if not tasks:
+            return {}
+
+        if should_parallelize(self.config) and len(tasks) > 1:
+            results = run_process_pool(
+                tasks,
+                _scan_sourcebook_task,
+                max_workers=get_max_workers(self.config),
+                desc="sourcebook scan",
+            )["results"]
+        else:
+            results = [_scan_sourcebook_task(task) for task in tasks]
+
+        page_caches = {}
+        for result in results:
+            context.warnings.extend(result.get("warnings", []))
+            context.errors.extend(result.get("errors", []))
+            if "sourcebook_id" in result:
+                page_caches[result["sourcebook_id"]] = result["pages"]
+        return page_caches
+
     def _extract_from_sourcebook(
         self,
         sourcebook_config: Dict[str, Any],
+        page_cache: Dict[int, Dict[str, Any]],
         repo: KnowledgeRepository,
         context: ExecutionContext,
     ) -> List[str]:
-        """Extract rules from a single sourcebook.
+        """Extract rules from a single sourcebook's page cache.
 
         Args:
             sourcebook_config: Sourcebook configuration
+            page_cache: Scanned pages keyed by 1-based page number
             repo: Knowledge repository
             context: Execution context
 
@@ -119,6 +281,7 @@ class ADnDRuleExtractor(BaseProcessor):
         sourcebook_id = sourcebook_config["id"]
         filename = sourcebook_config["filename"]
         extract_rules = sourcebook_config["extract_rules"]
+        page_map = sourcebook_config.get("page_map", {})
 
         logger.info(f"Extracting rules from {sourcebook_id}: {filename}")
 
@@ -131,31 +294,26 @@ class ADnDRuleExtractor(BaseProcessor):
             )
             sourcebook = ADnDSourcebook.DMG_REVISED
 
-        pdf_path = Path(filename)
-        if not pdf_path.exists():
-            context.warnings.append(f"PDF not found: {pdf_path}")
-            return []
-
         extracted = []
 
         # Extract each rule type
         for rule_type in extract_rules:
+            method_name = self.RULE_EXTRACTORS.get(rule_type)
+            if method_name is None:
+                logger.warning(f"Unknown rule type: {rule_type}")
+                continue
+
             try:
-                if rule_type == "ability_scores":
-                    rules = self._extract_ability_scores(pdf_path, sourcebook)
-                elif rule_type == "saves":
-                    rules = self._extract_saving_throws(pdf_path, sourcebook)
-                elif rule_type == "thac0":
-                    rules = self._extract_thac0(pdf_path, sourcebook)
-                elif rule_type == "armor_class":
-                    rules = self._extract_armor_class(pdf_path, sourcebook)
-                elif rule_type == "combat":
-                    rules = self._extract_combat_mechanics(pdf_path, sourcebook)
-                elif rule_type == "proficiencies":
-                    rules = self._extract_proficiencies(pdf_path, sourcebook)
-                else:
-                    logger.warning(f"Unknown rule type: {rule_type}")
-                    continue
+                pages = {}
+                if rule_type in page_map:
+                    start, end = _page_range(page_map[rule_type])
+                    pages = {
+                        page_num: page
+                        for page_num, page in page_cache.items()
+                        if start <= page_num <= end
+                    }
+
+                rules = getattr(self, method_name)(pages, sourcebook)
 
                 # Store extracted rules
                 for rule in rules:
@@ -174,51 +332,45 @@ class ADnDRuleExtractor(BaseProcessor):
         return extracted
 
     def _extract_ability_scores(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDAbilityScore]:
         """Extract ability score tables from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of ability score rules
         """
-        logger.debug(f"Extracting ability scores from {pdf_path}")
+        logger.debug(f"Extracting ability scores from {len(pages)} pages")
 
         # This is a placeholder for actual extraction logic
-        # Real implementation would parse PDF tables on pages 13-16
+        # Real implementation would parse the cached page tables
         # Per AGENT-6, we must extract from source, not hard-code
 
         rules = []
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # Extract from pages 13-16 (0-indexed: 12-15)
-                for page_num in range(12, 16):
-                    if page_num >= len(pdf.pages):
-                        break
-
-                    page = pdf.pages[page_num]
-                    text = page.extract_text()
-
-                    # Look for ability score patterns
-                    # This is a simplified example - real implementation needs table parsing
-                    ability_pattern = r"(STR|DEX|CON|INT|WIS|CHA)\s+(\d+)"
-                    matches = re.findall(ability_pattern, text)
-
-                    for ability, score in matches:
-                        # Extract modifiers from surrounding context
-                        # Real implementation would parse complete tables
-                        rule = ADnDAbilityScore(
-                            ability=ability,
-                            score=int(score),
-                            modifiers={},
-                            source=sourcebook,
-                            page_reference=str(page_num + 1),
-                        )
-                        rules.append(rule)
+            for page_num in sorted(pages):
+                text = pages[page_num]["text"]
+
+                # Look for ability score patterns
+                # This is a simplified example - real implementation needs table parsing
+                ability_pattern = r"(STR|DEX|CON|INT|WIS|CHA)\s+(\d+)"
+                matches = re.findall(ability_pattern, text)
+
+                for ability, score in matches:
+                    # Extract modifiers from surrounding context
+                    # Real implementation would parse complete tables
+                    rule = ADnDAbilityScore(
+                        ability=ability,
+                        score=int(score),
+                        modifiers={},
+                        source=sourcebook,
+                        page_reference=str(page_num),
+                    )
+                    rules.append(rule)
 
         except Exception as e:
             logger.error(f"Error extracting ability scores: {e}", exc_info=True)
@@ -227,18 +379,18 @@ class ADnDRuleExtractor(BaseProcessor):
         return rules
 
     def _extract_saving_throws(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDSavingThrow]:
         """Extract saving throw tables from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of saving throw rules
         """
-        logger.debug(f"Extracting saving throws from {pdf_path}")
+        logger.debug(f"Extracting saving throws from {len(pages)} pages")
 
         # Placeholder for actual extraction logic
         # Real implementation would parse saving throw tables from pages 101-102
@@ -248,18 +400,18 @@ class ADnDRuleExtractor(BaseProcessor):
         return rules
 
     def _extract_thac0(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDTHAC0]:
         """Extract THAC0 progression tables from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of THAC0 rules
         """
-        logger.debug(f"Extracting THAC0 from {pdf_path}")
+        logger.debug(f"Extracting THAC0 from {len(pages)} pages")
 
         # Placeholder for actual extraction logic
         # Real implementation would parse THAC0 tables from pages 91-92
@@ -269,18 +421,18 @@ class ADnDRuleExtractor(BaseProcessor):
         return rules
 
     def _extract_armor_class(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDArmorClass]:
         """Extract armor class tables from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of armor class rules
         """
-        logger.debug(f"Extracting armor class from {pdf_path}")
+        logger.debug(f"Extracting armor class from {len(pages)} pages")
 
         # Placeholder for actual extraction logic
         # Real implementation would parse AC tables from pages 75-76
@@ -290,18 +442,18 @@ class ADnDRuleExtractor(BaseProcessor):
         return rules
 
     def _extract_combat_mechanics(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDCombatMechanic]:
         """Extract combat mechanics from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of combat mechanic rules
         """
-        logger.debug(f"Extracting combat mechanics from {pdf_path}")
+        logger.debug(f"Extracting combat mechanics from {len(pages)} pages")
 
         # Placeholder for actual extraction logic
         # Real implementation would parse combat rules from pages 89-120
@@ -311,18 +463,18 @@ class ADnDRuleExtractor(BaseProcessor):
         return rules
 
     def _extract_proficiencies(
-        self, pdf_path: Path, sourcebook: ADnDSourcebook
+        self, pages: Dict[int, Dict[str, Any]], sourcebook: ADnDSourcebook
     ) -> List[ADnDProficiency]:
         """Extract proficiency rules from DMG.
 
         Args:
-            pdf_path: Path to PDF file
+            pages: Cached pages (1-based page number -> text/tables)
             sourcebook: Sourcebook identifier
 
         Returns:
             List of proficiency rules
         """
-        logger.debug(f"Extracting proficiencies from {pdf_path}")
+        logger.debug(f"Extracting proficiencies from {len(pages)} pages")
 
         # Placeholder for actual extraction logic
         # Real implementation would parse proficiency tables
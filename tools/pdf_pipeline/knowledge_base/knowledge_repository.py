@@ -12,6 +12,7 @@ Requirements:
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from enum import Enum
@@ -44,6 +45,7 @@ from .pf2e_schema import (
     PF2ESpell,
     PF2ETrait,
 )
+from .snapshot import KnowledgeSnapshot, open_snapshot
 
 # Set up logging per PY-6
 logger = logging.getLogger(__name__)
@@ -105,17 +107,34 @@ class KnowledgeRepository:
         RuleCategory.GENERAL: PF2ERule,
     }
 
-    def __init__(self, base_dir: Union[str, Path]):
+    def __init__(self, base_dir: Union[str, Path], use_snapshot: bool = True):
         """Initialize the knowledge repository.
 
+        When a current snapshot (see ``snapshot.py``) exists, the index and
+        rules are served read-only from it; the first store switches back to
+        the directory layout.
+
         Args:
             base_dir: Base directory for knowledge base storage
+            use_snapshot: Read from the knowledge base snapshot when it is current
         """
         self.base_dir = Path(base_dir)
         self.adnd_dir = self.base_dir / "adnd_2e"
         self.pf2e_dir = self.base_dir / "pf2e_cache"
         self.index_file = self.base_dir / "index.json"
 
+        self.snapshot: Optional[KnowledgeSnapshot] = (
+            open_snapshot(self.base_dir) if use_snapshot else None
+        )
+
+        if self.snapshot is not None and self.snapshot.index is not None:
+            # Shared with other repositories; copied before any mutation
+            self.index = self.snapshot.index
+            logger.info(f"Initialized KnowledgeRepository at {self.base_dir} from snapshot")
+            return
+
+        self.snapshot = None
+
         # Create directory structure
         self.adnd_dir.mkdir(parents=True, exist_ok=True)
         self.pf2e_dir.mkdir(parents=True, exist_ok=True)
@@ -125,6 +144,34 @@ class KnowledgeRepository:
 
         logger.info(f"Initialized KnowledgeRepository at {self.base_dir}")
 
+    def detach_snapshot(self) -> None:
+        """Stop serving from the snapshot before the directory layout changes."""
+        if self.snapshot is None:
+            return
+
+        logger.debug("Detaching KnowledgeRepository from snapshot")
+        self.index = copy.deepcopy(self.index)
+        self.snapshot = None
+        self.adnd_dir.mkdir(parents=True, exist_ok=True)
+        self.pf2e_dir.mkdir(parents=True, exist_ok=True)
+
+    def read_record(self, relative_path: str) -> Optional[Any]:
+        """Read a JSON record by path relative to the knowledge base root.
+
+        Args:
+            relative_path: Record path, e.g. ``pf2e_cache/saves/saves.json``
+
+        Returns:
+            Decoded JSON, or None if the record does not exist
+        """
+        if self.snapshot is not None:
+            return self.snapshot.read_json(relative_path)
+
+        record_file = self.base_dir / relative_path
+        if not record_file.exists():
+            return None
+        return json.loads(record_file.read_text(encoding="utf-8"))
+
     def _load_index(self) -> Dict[str, Any]:
         """Load the knowledge base index.
 
@@ -182,6 +229,8 @@ class KnowledgeRepository:
                 f"Rule type {type(rule).__name__} doesn't match category {category}"
             )
 
+        self.detach_snapshot()
+
         # Generate rule ID if not provided
         if rule_id is None:
             rule_id = self._generate_rule_id(rule, category, sourcebook.value)
@@ -235,6 +284,8 @@ class KnowledgeRepository:
                 f"Rule type {type(rule).__name__} doesn't match category {category}"
             )
 
+        self.detach_snapshot()
+
         # Generate rule ID if not provided
         if rule_id is None:
             rule_id = self._generate_rule_id(rule, category, "pf2e")
@@ -273,11 +324,7 @@ class KnowledgeRepository:
         Returns:
             Pydantic model instance or None if not found
         """
-        rule_file = self.adnd_dir / sourcebook.value / category.value / f"{rule_id}.json"
-
-        if not rule_file.exists():
-            logger.warning(f"AD&D rule not found: {rule_id}")
-            return None
+        relative_path = f"adnd_2e/{sourcebook.value}/{category.value}/{rule_id}.json"
 
         # Load and validate against schema
         schema_type = self.ADND_SCHEMA_REGISTRY.get(category)
@@ -285,8 +332,12 @@ class KnowledgeRepository:
             logger.error(f"No schema registered for category: {category}")
             return None
 
-        logger.debug(f"Loading AD&D rule: {rule_id} from {rule_file}")
-        rule_data = json.loads(rule_file.read_text(encoding="utf-8"))
+        logger.debug(f"Loading AD&D rule: {rule_id} from {relative_path}")
+        rule_data = self.read_record(relative_path)
+        if rule_data is None:
+            logger.warning(f"AD&D rule not found: {rule_id}")
+            return None
+
         return schema_type(**rule_data)
 
     def get_pf2e_rule(self, rule_id: str, category: RuleCategory) -> Optional[BaseModel]:
@@ -299,11 +350,7 @@ class KnowledgeRepository:
         Returns:
             Pydantic model instance or None if not found
         """
-        rule_file = self.pf2e_dir / category.value / f"{rule_id}.json"
-
-        if not rule_file.exists():
-            logger.warning(f"PF2E rule not found: {rule_id}")
-            return None
+        relative_path = f"pf2e_cache/{category.value}/{rule_id}.json"
 
         # Load and validate against schema
         schema_type = self.PF2E_SCHEMA_REGISTRY.get(category)
@@ -311,8 +358,12 @@ class KnowledgeRepository:
             logger.error(f"No schema registered for category: {category}")
             return None
 
-        logger.debug(f"Loading PF2E rule: {rule_id} from {rule_file}")
-        rule_data = json.loads(rule_file.read_text(encoding="utf-8"))
+        logger.debug(f"Loading PF2E rule: {rule_id} from {relative_path}")
+        rule_data = self.read_record(relative_path)
+        if rule_data is None:
+            logger.warning(f"PF2E rule not found: {rule_id}")
+            return None
+
         return schema_type(**rule_data)
 
     def list_adnd_rules(
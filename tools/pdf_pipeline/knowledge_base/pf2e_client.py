@@ -45,19 +45,27 @@ class PF2EMCPClient:
     redundant queries. Results are stored in the knowledge repository.
     """
 
-    def __init__(self, cache_dir: Path, mcp_server: str = "p2fe"):
+    def __init__(
+        self,
+        cache_dir: Path,
+        mcp_server: str = "p2fe",
+        repo: Optional[KnowledgeRepository] = None,
+    ):
         """Initialize the PF2E MCP client.
 
         Args:
             cache_dir: Directory for caching query results
             mcp_server: MCP server identifier
+            repo: Existing repository for the knowledge base containing
+                ``cache_dir``; one is created if not provided
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.mcp_server = mcp_server
 
         # Initialize knowledge repository for PF2E rules
-        self.repo = KnowledgeRepository(self.cache_dir.parent)
+        self.repo = repo or KnowledgeRepository(self.cache_dir.parent)
+        if self.repo.snapshot is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Initialized PF2E MCP client with cache at {self.cache_dir}")
 
@@ -243,11 +251,19 @@ class PF2EMCPClient:
         """
         cache_file = self.cache_dir / category.value / f"{cache_key}.json"
 
-        if not cache_file.exists():
-            return None
-
         try:
-            cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if self.repo.snapshot is not None and self.cache_dir == self.repo.pf2e_dir:
+                cache_data = self.repo.snapshot.read_json(
+                    f"pf2e_cache/{category.value}/{cache_key}.json"
+                )
+            elif cache_file.exists():
+                cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+            else:
+                cache_data = None
+
+            if cache_data is None:
+                return None
+
             cached_query = PF2ECachedQuery(**cache_data)
 
             logger.debug(f"Cache hit for {cache_key}")
@@ -273,6 +289,9 @@ class PF2EMCPClient:
             category: Rule category
             results: Query results to cache
         """
+        # New cache entries are not in the snapshot; read from disk from now on
+        self.repo.detach_snapshot()
+
         cache_file = self.cache_dir / category.value / f"{cache_key}.json"
         cache_file.parent.mkdir(parents=True, exist_ok=True)
 
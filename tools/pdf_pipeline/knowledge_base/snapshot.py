@@ -0,0 +1,281 @@
+"""Precompiled, memory-mapped snapshot of the knowledge base.
+
+The directory layout written by KnowledgeRepository (``index.json``,
+``adnd_2e/**`` and ``pf2e_cache/**``) is serialized into a single file so
+repositories and PF2E clients can open the whole knowledge base with one
+mmap and decode individual records lazily.
+
+File layout::
+
+    MAGIC (8 bytes) | header length (8 bytes, little-endian) | header JSON | record blob
+
+The header holds the source fingerprint, the parsed index and an
+``offset, length`` pair (relative to the blob) for every record.
+
+Requirements:
+- SWENG-1: Single Responsibility Principle
+- PY-6: Console logs tracing execution
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..base import BaseProcessor
+from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
+
+# Set up logging per PY-6
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "kb_snapshot.bin"
+SNAPSHOT_MAGIC = b"DSKBSNP1"
+_HEADER_LEN = struct.Struct("<Q")
+
+# Directories (relative to the knowledge base root) captured in a snapshot
+SNAPSHOT_TREES = ("adnd_2e", "pf2e_cache")
+
+# Open snapshots shared across repositories, keyed by (path, fingerprint)
+_OPEN_SNAPSHOTS: Dict[Tuple[str, str], "KnowledgeSnapshot"] = {}
+
+
+def compute_fingerprint(base_dir: Union[str, Path]) -> str:
+    """Fingerprint the knowledge base directory layout cheaply.
+
+    Every store through KnowledgeRepository rewrites ``index.json``, and new
+    PF2E cache entries touch their category directory, so stat-ing those is
+    enough to detect a stale snapshot without walking every record.
+
+    Args:
+        base_dir: Knowledge base root
+
+    Returns:
+        Fingerprint string
+    """
+    base_dir = Path(base_dir)
+    parts: List[str] = []
+
+    index_file = base_dir / "index.json"
+    if index_file.exists():
+        stat = index_file.stat()
+        parts.append(f"index.json:{stat.st_mtime_ns}:{stat.st_size}")
+
+    pf2e_dir = base_dir / "pf2e_cache"
+    if pf2e_dir.is_dir():
+        with os.scandir(pf2e_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir():
+                    parts.append(f"pf2e_cache/{entry.name}:{entry.stat().st_mtime_ns}")
+
+    return "|".join(parts)
+
+
+class KnowledgeSnapshot:
+    """Read-only view over a knowledge base snapshot file.
+
+    Opening maps the file and parses only the header; record payloads are
+    decoded on first access.
+    """
+
+    def __init__(self, path: Path):
+        """Open a snapshot file.
+
+        Args:
+            path: Snapshot file path
+
+        Raises:
+            ValueError: If the file is not a knowledge base snapshot
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a knowledge base snapshot: {self.path}")
+
+        header_start = len(SNAPSHOT_MAGIC) + _HEADER_LEN.size
+        (header_len,) = _HEADER_LEN.unpack_from(self._mm, len(SNAPSHOT_MAGIC))
+        header = json.loads(self._mm[header_start : header_start + header_len])
+
+        self._blob_start = header_start + header_len
+        self.fingerprint: str = header["fingerprint"]
+        self.index: Dict[str, Any] = header["index"]
+        self._records: Dict[str, List[int]] = header["records"]
+        self._decoded: Dict[str, Any] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """List record keys under a prefix.
+
+        Args:
+            prefix: Relative path prefix (e.g. ``pf2e_cache/saves/``)
+
+        Returns:
+            Sorted record keys
+        """
+        return sorted(key for key in self._records if key.startswith(prefix))
+
+    def read_json(self, key: str) -> Optional[Any]:
+        """Decode a record, caching the result.
+
+        Args:
+            key: Record path relative to the knowledge base root
+
+        Returns:
+            Decoded JSON value, or None if the record is absent
+        """
+        if key in self._decoded:
+            return self._decoded[key]
+
+        location = self._records.get(key)
+        if location is None:
+            return None
+
+        offset, length = location
+        start = self._blob_start + offset
+        value = json.loads(self._mm[start : start + length])
+        self._decoded[key] = value
+        return value
+
+
+def snapshot_path_for(base_dir: Union[str, Path]) -> Path:
+    """Return the default snapshot path for a knowledge base root."""
+    return Path(base_dir) / SNAPSHOT_FILENAME
+
+
+def build_snapshot(
+    base_dir: Union[str, Path], snapshot_path: Optional[Path] = None
+) -> Path:
+    """Serialize the knowledge base directory layout into a snapshot file.
+
+    Args:
+        base_dir: Knowledge base root
+        snapshot_path: Output path (default: ``<base_dir>/kb_snapshot.bin``)
+
+    Returns:
+        Path of the written snapshot
+    """
+    base_dir = Path(base_dir)
+    snapshot_path = Path(snapshot_path or snapshot_path_for(base_dir))
+
+    fingerprint = compute_fingerprint(base_dir)
+    index_file = base_dir / "index.json"
+    index = json.loads(index_file.read_text(encoding="utf-8")) if index_file.exists() else None
+
+    records: Dict[str, List[int]] = {}
+    payloads: List[bytes] = []
+    offset = 0
+    for tree in SNAPSHOT_TREES:
+        tree_dir = base_dir / tree
+        if not tree_dir.is_dir():
+            continue
+        for record_file in sorted(tree_dir.rglob("*.json")):
+            payload = record_file.read_bytes()
+            key = record_file.relative_to(base_dir).as_posix()
+            records[key] = [offset, len(payload)]
+            payloads.append(payload)
+            offset += len(payload)
+
+    header = json.dumps(
+        {"fingerprint": fingerprint, "index": index, "records": records},
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(SNAPSHOT_MAGIC)
+        fh.write(_HEADER_LEN.pack(len(header)))
+        fh.write(header)
+        for payload in payloads:
+            fh.write(payload)
+    tmp_path.replace(snapshot_path)
+
+    logger.info(f"Wrote knowledge base snapshot with {len(records)} records to {snapshot_path}")
+    return snapshot_path
+
+
+def open_snapshot(
+    base_dir: Union[str, Path], snapshot_path: Optional[Path] = None
+) -> Optional[KnowledgeSnapshot]:
+    """Open the snapshot for a knowledge base if it exists and is current.
+
+    Opened snapshots are shared, so repeated repository construction costs
+    one fingerprint check.
+
+    Args:
+        base_dir: Knowledge base root
+        snapshot_path: Snapshot path (default: ``<base_dir>/kb_snapshot.bin``)
+
+    Returns:
+        Snapshot, or None if missing, unreadable or stale
+    """
+    snapshot_path = Path(snapshot_path or snapshot_path_for(base_dir))
+    if not snapshot_path.exists():
+        return None
+
+    fingerprint = compute_fingerprint(base_dir)
+    cache_key = (str(snapshot_path.resolve()), fingerprint)
+    snapshot = _OPEN_SNAPSHOTS.get(cache_key)
+    if snapshot is not None:
+        return snapshot
+
+    try:
+        snapshot = KnowledgeSnapshot(snapshot_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable knowledge base snapshot {snapshot_path}: {e}")
+        return None
+
+    if snapshot.fingerprint != fingerprint:
+        logger.info(f"Knowledge base snapshot {snapshot_path} is stale, using directory layout")
+        return None
+
+    _OPEN_SNAPSHOTS[cache_key] = snapshot
+    logger.debug(f"Opened knowledge base snapshot {snapshot_path} ({len(snapshot)} records)")
+    return snapshot
+
+
+class KnowledgeSnapshotBuilder(BaseProcessor):
+    """Processor that compiles the knowledge base into a snapshot file.
+
+    Runs after the knowledge base build stages so later stages can open the
+    repository without walking the directory tree.
+    """
+
+    def process(
+        self, input_data: ProcessorInput, context: ExecutionContext
+    ) -> ProcessorOutput:
+        """Build the knowledge base snapshot.
+
+        Args:
+            input_data: Unused
+            context: Execution context
+
+        Returns:
+            ProcessorOutput with the snapshot path and record count
+        """
+        kb_dir = Path(self.config.get("knowledge_base_dir", "data/knowledge_base"))
+        snapshot_file = self.config.get("snapshot_file")
+
+        if not kb_dir.exists():
+            context.warnings.append(f"Knowledge base not found: {kb_dir}")
+            return ProcessorOutput(data={"snapshot_file": None, "records": 0})
+
+        path = build_snapshot(kb_dir, Path(snapshot_file) if snapshot_file else None)
+        snapshot = KnowledgeSnapshot(path)
+        context.items_processed += len(snapshot)
+
+        return ProcessorOutput(
+            data={"snapshot_file": str(path), "records": len(snapshot)},
+            metadata={"fingerprint": snapshot.fingerprint},
+        )
@@ -0,0 +1,521 @@
+"""Native LevelDB compendium packs for Foundry VTT v11+.
+
+Foundry v11 moved compendia from NeDB ``.db`` files to LevelDB directories
+and migrates NeDB packs on load. This module writes the LevelDB layout
+directly so no migration is needed:
+
+* ``CURRENT`` names ``MANIFEST-000002``, whose single version edit records
+  the bytewise comparator and ``000003.log`` as the live log.
+* ``000003.log`` holds the documents as LevelDB write batches in the
+  standard 32 KiB block log format. LevelDB replays the log into tables the
+  first time Foundry opens the pack.
+
+Keys follow the layout Foundry's own pack tooling uses: primary documents
+are stored under ``!<collection>!<id>`` and embedded documents (journal
+pages, item effects) under ``!<collection>.<field>!<parentId>.<childId>``,
+with the parent holding the list of child IDs.
+
+A new pack is written from a stream of entries in batches, so only one
+batch is held in memory. An existing pack is diffed against the entries
+and only new, changed and removed records are appended to its log, as the
+NeDB writer does for ``.db`` files. ``read_leveldb_pack`` reads the log back
+for diffing and verification; it does not parse ``.ldb`` tables, so a pack
+that LevelDB has already opened (and compacted) is rebuilt instead.
+
+Requirements:
+- SWENG-1: Single Responsibility Principle
+- PY-6: Console logs tracing execution
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Set up logging per PY-6
+logger = logging.getLogger(__name__)
+
+# Foundry version that introduced LevelDB packs
+LEVELDB_MIN_VERSION = 11
+
+# Collection name and embedded collections per Foundry document type
+DOCUMENT_COLLECTIONS: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "Actor": ("actors", {"items": "actors.items", "effects": "actors.effects"}),
+    "Item": ("items", {"effects": "items.effects"}),
+    "JournalEntry": ("journal", {"pages": "journal.pages"}),
+}
+
+DEFAULT_BATCH_SIZE = 200
+
+# Rewrite a pack from scratch once superseded records outnumber live ones
+COMPACTION_RATIO = 1.0
+
+_BLOCK_SIZE = 32768
+_HEADER = struct.Struct("<IHB")
+_FULL, _FIRST, _MIDDLE, _LAST = 1, 2, 3, 4
+_TYPE_DELETION, _TYPE_VALUE = 0, 1
+_BATCH_HEADER = struct.Struct("<QI")
+
+_MANIFEST_NUMBER = 2
+_LOG_NUMBER = 3
+_NEXT_FILE_NUMBER = 4
+_COMPARATOR = b"leveldb.BytewiseComparator"
+
+
+def _make_crc32c_table() -> List[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def crc32c(data: bytes) -> int:
+    """Compute the CRC-32C (Castagnoli) checksum LevelDB uses."""
+    crc = 0xFFFFFFFF
+    table = _CRC32C_TABLE
+    for byte in data:
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _masked_crc(data: bytes) -> int:
+    crc = crc32c(data)
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _length_prefixed(value: bytes) -> bytes:
+    return _varint(len(value)) + value
+
+
+class _LogWriter:
+    """Append records to a file in LevelDB's block log format."""
+
+    def __init__(self, path: Path, append: bool = False):
+        self._fh = path.open("ab" if append else "wb")
+        self._block_offset = self._fh.tell() % _BLOCK_SIZE
+
+    def add_record(self, data: bytes) -> None:
+        pos = 0
+        left = len(data)
+        begin = True
+        while True:
+            leftover = _BLOCK_SIZE - self._block_offset
+            if leftover < _HEADER.size:
+                self._fh.write(b"\x00" * leftover)
+                self._block_offset = 0
+
+            available = _BLOCK_SIZE - self._block_offset - _HEADER.size
+            length = min(left, available)
+            end = length == left
+            if begin and end:
+                record_type = _FULL
+            elif begin:
+                record_type = _FIRST
+            elif end:
+                record_type = _LAST
+            else:
+                record_type = _MIDDLE
+
+            fragment = data[pos : pos + length]
+            crc = _masked_crc(bytes([record_type]) + fragment)
+            self._fh.write(_HEADER.pack(crc, length, record_type))
+            self._fh.write(fragment)
+            self._block_offset += _HEADER.size + length
+
+            pos += length
+            left -= length
+            begin = False
+            if left == 0:
+                break
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def _iter_log_records(path: Path) -> Iterator[bytes]:
+    """Yield reassembled records from a LevelDB log file.
+
+    Raises:
+        ValueError: On a checksum mismatch or malformed fragment sequence
+    """
+    data = path.read_bytes()
+    pending: Optional[bytearray] = None
+    for block_start in range(0, len(data), _BLOCK_SIZE):
+        block = data[block_start : block_start + _BLOCK_SIZE]
+        pos = 0
+        while len(block) - pos >= _HEADER.size:
+            crc, length, record_type = _HEADER.unpack_from(block, pos)
+            if record_type == 0 and length == 0:
+                break
+            fragment = block[pos + _HEADER.size : pos + _HEADER.size + length]
+            if len(fragment) != length or crc != _masked_crc(bytes([record_type]) + fragment):
+                raise ValueError(f"Corrupt log record at offset {block_start + pos} in {path}")
+            pos += _HEADER.size + length
+
+            if record_type == _FULL:
+                yield fragment
+            elif record_type == _FIRST:
+                pending = bytearray(fragment)
+            elif record_type in (_MIDDLE, _LAST) and pending is not None:
+                pending.extend(fragment)
+                if record_type == _LAST:
+                    yield bytes(pending)
+                    pending = None
+            else:
+                raise ValueError(f"Unexpected log record type {record_type} in {path}")
+
+
+class LevelDBPackWriter:
+    """Write key/value pairs into a LevelDB directory in batches.
+
+    A new database is assembled in a sibling ``.tmp`` directory and moved
+    into place on close, so a failed build never leaves a half-written pack.
+    Appending to an existing pack writes its log in place.
+    """
+
+    def __init__(
+        self, path: Path, batch_size: int = DEFAULT_BATCH_SIZE, append_after: Optional[int] = None
+    ):
+        """Start a new pack, or continue an existing one.
+
+        Args:
+            path: Pack directory to create (replaced if it exists)
+            batch_size: Puts per write batch (a batch may run over to keep
+                a document with its embedded documents)
+            append_after: Last sequence number of an existing pack written
+                by this module, to append to it instead of replacing it
+        """
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self._appending = append_after is not None
+        if self._appending:
+            self._dir = self.path
+        else:
+            self._dir = self.path.with_name(self.path.name + ".tmp")
+            if self._dir.exists():
+                shutil.rmtree(self._dir)
+            self._dir.mkdir(parents=True)
+
+        self._log = _LogWriter(self._dir / f"{_LOG_NUMBER:06d}.log", append=self._appending)
+        self._batch: List[Tuple[bytes, Optional[bytes]]] = []
+        self._sequence = append_after or 0
+        self.batches = 0
+        self.puts = 0
+
+    def put(self, key: str, value: bytes) -> None:
+        """Queue a put, writing the batch once it is full."""
+        self.put_all([(key, value)])
+
+    def put_all(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """Queue puts that must land in the same write batch.
+
+        Used for a document and its embedded documents, so a pack never
+        holds a parent without its children.
+        """
+        for key, value in items:
+            self._batch.append((key.encode("utf-8"), value))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def delete(self, key: str) -> None:
+        """Queue a deletion, writing the batch once it is full."""
+        self._batch.append((key.encode("utf-8"), None))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write queued puts and deletions as one write batch."""
+        if not self._batch:
+            return
+        parts = [_BATCH_HEADER.pack(self._sequence + 1, len(self._batch))]
+        for key, value in self._batch:
+            if value is None:
+                parts.append(bytes([_TYPE_DELETION]) + _length_prefixed(key))
+            else:
+                parts.append(bytes([_TYPE_VALUE]) + _length_prefixed(key) + _length_prefixed(value))
+        self._log.add_record(b"".join(parts))
+
+        self._sequence += len(self._batch)
+        self.puts += len(self._batch)
+        self.batches += 1
+        self._batch = []
+
+    def close(self) -> Path:
+        """Flush, write the manifest and move a new pack into place.
+
+        Returns:
+            Pack directory path
+        """
+        self.flush()
+        self._log.close()
+
+        edit = b"".join(
+            [
+                _varint(1) + _length_prefixed(_COMPARATOR),
+                _varint(2) + _varint(_LOG_NUMBER),
+                _varint(9) + _varint(0),
+                _varint(3) + _varint(_NEXT_FILE_NUMBER),
+                _varint(4) + _varint(self._sequence),
+            ]
+        )
+        manifest_name = f"MANIFEST-{_MANIFEST_NUMBER:06d}"
+        manifest_tmp = self._dir / (manifest_name + ".tmp")
+        manifest = _LogWriter(manifest_tmp)
+        manifest.add_record(edit)
+        manifest.close()
+        manifest_tmp.replace(self._dir / manifest_name)
+        if self._appending:
+            return self.path
+
+        (self._dir / "CURRENT").write_text(manifest_name + "\n", encoding="ascii")
+        if self.path.exists():
+            shutil.rmtree(self.path)
+        self._dir.rename(self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Discard a partially written new pack."""
+        self._log.close()
+        if not self._appending:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+
+def uses_leveldb(foundry_version: Optional[int]) -> bool:
+    """Return True if packs for this Foundry version are LevelDB directories."""
+    return foundry_version is not None and int(foundry_version) >= LEVELDB_MIN_VERSION
+
+
+def _document_records(
+    entry: Dict[str, Any], document_type: str
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Split a document into its primary and embedded key/value records."""
+    collection, embedded = DOCUMENT_COLLECTIONS[document_type]
+    parent_id = entry["_id"]
+    document = dict(entry)
+    for field, sub_collection in embedded.items():
+        children = document.get(field) or []
+        document[field] = [child["_id"] for child in children]
+        for child in children:
+            yield f"!{sub_collection}!{parent_id}.{child['_id']}", child
+    yield f"!{collection}!{parent_id}", document
+
+
+def _encoded(records: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, bytes]]:
+    """Serialize a document's records as LevelDB values."""
+    return [(key, json.dumps(value, ensure_ascii=False).encode("utf-8")) for key, value in records]
+
+
+def _rewrite_pack(
+    documents: Iterable[List[Tuple[str, Dict[str, Any]]]], output_path: Path, batch_size: int
+) -> Tuple[List[str], int, int]:
+    """Write a new pack from per-document records.
+
+    Returns:
+        Keys written, document count and write batch count
+    """
+    writer = LevelDBPackWriter(output_path, batch_size=batch_size)
+    keys: List[str] = []
+    count = 0
+    try:
+        for records in documents:
+            writer.put_all(_encoded(records))
+            keys.extend(key for key, _ in records)
+            count += 1
+        writer.close()
+    except Exception:
+        writer.abort()
+        raise
+    return keys, count, writer.batches
+
+
+def write_leveldb_pack(
+    entries: Iterable[Dict[str, Any]],
+    output_path: Path,
+    document_type: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    verify: bool = True,
+) -> Dict[str, Any]:
+    """Write documents to a LevelDB pack directory, touching only what changed.
+
+    Records are diffed by key against the existing pack. Puts for new and
+    changed documents and deletions for removed records are appended to its
+    log; the pack is rewritten in full only when it does not exist, cannot
+    be read (for instance once Foundry has opened it), or superseded records
+    would outnumber live ones by more than ``COMPACTION_RATIO``. A new pack
+    consumes the entries lazily.
+
+    Args:
+        entries: Documents with ``_id`` values
+        output_path: Pack directory
+        document_type: Foundry document type (``Actor``, ``Item`` or ``JournalEntry``)
+        batch_size: Records per write batch
+        verify: Read the pack back and check every key was written
+
+    Returns:
+        Counts of documents, embedded documents, unchanged documents and
+        write batches, and whether the pack was rewritten and verified
+
+    Raises:
+        ValueError: If document_type is unsupported or verification fails
+    """
+    if document_type not in DOCUMENT_COLLECTIONS:
+        raise ValueError(f"Unsupported pack document type: {document_type}")
+
+    output_path = Path(output_path)
+    existing: Optional[Dict[str, Any]] = None
+    if output_path.exists():
+        try:
+            existing, sequence = _replay_pack(output_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rewriting LevelDB pack {output_path}: {e}")
+
+    documents = (list(_document_records(entry, document_type)) for entry in entries)
+    unchanged = 0
+    if existing is None:
+        keys, count, batches = _rewrite_pack(documents, output_path, batch_size)
+        rewritten = True
+    else:
+        all_documents = list(documents)
+        changed = []
+        for records in all_documents:
+            if all(existing.get(key) == value for key, value in records):
+                unchanged += 1
+            else:
+                changed.append(records)
+        keys = [key for records in all_documents for key, _ in records]
+        live = set(keys)
+        removed = [key for key in existing if key not in live]
+        count = len(all_documents)
+        batches = 0
+        rewritten = False
+
+        writes = sum(len(records) for records in changed) + len(removed)
+        if sequence + writes - len(keys) > COMPACTION_RATIO * max(len(keys), 1):
+            keys, count, batches = _rewrite_pack(all_documents, output_path, batch_size)
+            rewritten = True
+        elif writes:
+            writer = LevelDBPackWriter(output_path, batch_size=batch_size, append_after=sequence)
+            try:
+                for records in changed:
+                    writer.put_all(_encoded(records))
+                for key in removed:
+                    writer.delete(key)
+                writer.close()
+            except Exception:
+                writer.abort()
+                raise
+            batches = writer.batches
+
+    if verify:
+        verify_leveldb_pack(output_path, keys)
+
+    stats = {
+        "documents": count,
+        "embedded": len(keys) - count,
+        "unchanged": unchanged,
+        "batches": batches,
+        "rewritten": rewritten,
+        "verified": verify,
+    }
+    logger.info(
+        f"Wrote LevelDB pack {output_path}: {count} documents ({unchanged} unchanged), "
+        f"{stats['embedded']} embedded, {batches} batches"
+    )
+    return stats
+
+
+def _replay_pack(path: Path) -> Tuple[Dict[str, Any], int]:
+    """Replay the log of a pack written by ``write_leveldb_pack``.
+
+    Returns:
+        Decoded values keyed by LevelDB key, in write order, and the last
+        sequence number used
+
+    Raises:
+        ValueError: If the pack is missing its log or the log is corrupt
+    """
+    path = Path(path)
+    current = path / "CURRENT"
+    log_path = path / f"{_LOG_NUMBER:06d}.log"
+    if not current.exists() or not log_path.exists():
+        raise ValueError(f"Not an unopened LevelDB pack: {path}")
+
+    values: Dict[str, Any] = {}
+    sequence = 0
+    for record in _iter_log_records(log_path):
+        first, count = _BATCH_HEADER.unpack_from(record, 0)
+        sequence = max(sequence, first + count - 1)
+        pos = _BATCH_HEADER.size
+        for _ in range(count):
+            tag = record[pos]
+            key_len, pos = _read_varint(record, pos + 1)
+            key = record[pos : pos + key_len].decode("utf-8")
+            pos += key_len
+            if tag == _TYPE_DELETION:
+                values.pop(key, None)
+                continue
+            value_len, pos = _read_varint(record, pos)
+            values[key] = json.loads(record[pos : pos + value_len])
+            pos += value_len
+    return values, sequence
+
+
+def read_leveldb_pack(path: Path) -> Dict[str, Any]:
+    """Read the documents in a pack written by ``write_leveldb_pack``.
+
+    Args:
+        path: Pack directory
+
+    Returns:
+        Decoded values keyed by LevelDB key, in write order
+
+    Raises:
+        ValueError: If the pack is missing its log or the log is corrupt
+    """
+    return _replay_pack(path)[0]
+
+
+def verify_leveldb_pack(path: Path, expected_keys: Iterable[str]) -> None:
+    """Check a pack decodes cleanly and holds exactly the expected keys.
+
+    Raises:
+        ValueError: On corruption or a key mismatch
+    """
+    written = set(read_leveldb_pack(path))
+    expected = set(expected_keys)
+    if written != expected:
+        missing = sorted(expected - written)[:5]
+        extra = sorted(written - expected)[:5]
+        raise ValueError(
+            f"LevelDB pack {path} failed verification (missing {missing}, unexpected {extra})"
+        )
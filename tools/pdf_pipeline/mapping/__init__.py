@@ -9,6 +9,7 @@ from .rule_translator import (
     AbilityScoreTranslator,
     CombatMechanicTranslator,
     RuleTranslator,
+    SavingThrowTranslator,
     SpellTranslator,
 )
 from .semantic_mapper import MappingConfidence, MappingResult, SemanticMapper
@@ -20,6 +21,7 @@ __all__ = [
     "RuleTranslator",
     "AbilityScoreTranslator",
     "CombatMechanicTranslator",
+    "SavingThrowTranslator",
     "SpellTranslator",
     "ContextAnalyzer",
     "DarkSunContext",
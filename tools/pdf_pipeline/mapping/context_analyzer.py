@@ -12,13 +12,24 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
 # Set up logging per PY-6
 logger = logging.getLogger(__name__)
 
+# An int, or a NumPy array of ability scores
+Score = TypeVar("Score")
+
+
+def score_to_modifier(score: Score) -> Score:
+    """Convert AD&D ability scores to PF2E modifiers ((score - 10) // 2).
+
+    Works on a single score or element-wise on a NumPy array of scores.
+    """
+    return (score - 10) // 2
+
 
 class SettingTheme(str, Enum):
     """Enumeration of Dark Sun setting themes."""
@@ -245,7 +256,5 @@ class ContextAnalyzer:
         Returns:
             PF2E ability modifier (-5 to +7)
         """
-        # PF2E uses (score - 10) // 2
-        # But we need to map from AD&D scores
-        return (score - 10) // 2
+        return score_to_modifier(score)
 
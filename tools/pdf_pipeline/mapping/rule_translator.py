@@ -3,6 +3,10 @@
 This module provides specialized translators for different types of game rules,
 converting from AD&D 2E to PF2E while preserving flavor and context.
 
+Numeric progressions (THAC0, armor class, ability scores, saving throws) are
+converted a whole table at a time with NumPy; the single-rule translate()
+methods are thin wrappers over the same table conversions.
+
 Requirements:
 - SWENG-1: Single Responsibility Principle
 - PY-4: ABC for interface definition
@@ -13,8 +17,11 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
+
+import numpy as np
 
+from .context_analyzer import score_to_modifier
 from .semantic_mapper import MappingConfidence, MappingResult
 
 if TYPE_CHECKING:
@@ -24,6 +31,28 @@ if TYPE_CHECKING:
 # Set up logging per PY-6
 logger = logging.getLogger(__name__)
 
+PROFICIENCY_RANKS = ["trained", "expert", "master", "legendary"]
+
+# Upper bounds (exclusive) of AD&D save targets for legendary, master, expert;
+# anything at or above the last bound is trained
+SAVE_TARGET_BOUNDS = np.array([5, 9, 13])
+
+
+def thac0_to_attack_bonus(thac0: np.ndarray) -> np.ndarray:
+    """Convert THAC0 values to PF2E attack bonuses (simplified: 20 - THAC0)."""
+    return 20 - np.asarray(thac0)
+
+
+def descending_to_ascending_ac(adnd_ac: np.ndarray) -> np.ndarray:
+    """Convert descending AD&D AC to ascending PF2E AC (20 - AD&D AC)."""
+    return 20 - np.asarray(adnd_ac)
+
+
+def save_target_to_proficiency(targets: np.ndarray) -> np.ndarray:
+    """Bucket AD&D save targets into indexes of PROFICIENCY_RANKS."""
+    buckets = np.digitize(np.asarray(targets), SAVE_TARGET_BOUNDS)
+    return len(PROFICIENCY_RANKS) - 1 - buckets
+
 
 class RuleTranslator(ABC):
     """Abstract base class for rule translators.
@@ -55,6 +84,23 @@ class RuleTranslator(ABC):
         """
         pass
 
+    def translate_batch(
+        self, adnd_rules: Sequence[Any], pf2e_client: PF2EMCPClient
+    ) -> List[MappingResult]:
+        """Translate a table of AD&D rules in one call.
+
+        Translators with numeric progressions override this with a
+        vectorized implementation; the default translates rule by rule.
+
+        Args:
+            adnd_rules: AD&D rules to translate
+            pf2e_client: PF2E client for querying target rules
+
+        Returns:
+            Mapping results, in the same order as ``adnd_rules``
+        """
+        return [self.translate(rule, pf2e_client) for rule in adnd_rules]
+
     def _calculate_confidence(
         self, conversion: Dict[str, Any], recommendations: List[str]
     ) -> MappingConfidence:
@@ -91,39 +137,63 @@ class AbilityScoreTranslator(RuleTranslator):
         Returns:
             Mapping result
         """
-        logger.debug(f"Translating ability score: {adnd_rule.ability}")
+        return self.translate_batch([adnd_rule], pf2e_client)[0]
 
-        # Get PF2E ability scores for reference
-        pf2e_abilities = pf2e_client.query_ability_scores()
+    def translate_batch(
+        self, adnd_rules: Sequence[Any], pf2e_client: PF2EMCPClient
+    ) -> List[MappingResult]:
+        """Translate a table of AD&D ability scores to PF2E modifiers.
 
-        # Analyze with context
-        analysis = self.context_analyzer.analyze_ability_conversion(
-            adnd_rule.ability, adnd_rule.score
-        )
+        Args:
+            adnd_rules: AD&D ability score rules
+            pf2e_client: PF2E client
 
-        # Create conversion
-        conversion = {
-            "ability": adnd_rule.ability,
-            "pf2e_modifier": analysis["pf2e_modifier"],
-            "original_score": adnd_rule.score,
-            "conversion_method": "score_to_modifier",
-        }
+        Returns:
+            Mapping results, in the same order as ``adnd_rules``
+        """
+        if not adnd_rules:
+            return []
 
-        result = MappingResult(
-            adnd_rule_id=f"{adnd_rule.ability}_{adnd_rule.score}",
-            confidence=self._calculate_confidence(
-                conversion, analysis["recommendations"]
-            ),
-            conversion=conversion,
-            recommendations=analysis["recommendations"],
-            context_notes=analysis["context_notes"],
-            metadata={"category": "ability_scores"},
-        )
+        logger.debug(f"Translating {len(adnd_rules)} ability scores")
 
-        logger.info(
-            f"Translated {adnd_rule.ability} {adnd_rule.score} → modifier {analysis['pf2e_modifier']}"
-        )
-        return result
+        # Get PF2E ability scores for reference
+        pf2e_abilities = pf2e_client.query_ability_scores()
+
+        modifiers = score_to_modifier(np.array([r.score for r in adnd_rules]))
+
+        # Context guidance depends only on the ability, so analyze each once
+        analyses: Dict[str, Dict[str, Any]] = {}
+        results = []
+        for adnd_rule, modifier in zip(adnd_rules, modifiers.tolist()):
+            analysis = analyses.get(adnd_rule.ability)
+            if analysis is None:
+                analysis = self.context_analyzer.analyze_ability_conversion(
+                    adnd_rule.ability, adnd_rule.score
+                )
+                analyses[adnd_rule.ability] = analysis
+
+            conversion = {
+                "ability": adnd_rule.ability,
+                "pf2e_modifier": modifier,
+                "original_score": adnd_rule.score,
+                "conversion_method": "score_to_modifier",
+            }
+
+            results.append(
+                MappingResult(
+                    adnd_rule_id=f"{adnd_rule.ability}_{adnd_rule.score}",
+                    confidence=self._calculate_confidence(
+                        conversion, analysis["recommendations"]
+                    ),
+                    conversion=conversion,
+                    recommendations=list(analysis["recommendations"]),
+                    context_notes=list(analysis["context_notes"]),
+                    metadata={"category": "ability_scores"},
+                )
+            )
+
+        logger.info(f"Translated {len(results)} ability scores")
+        return results
 
 
 class CombatMechanicTranslator(RuleTranslator):
@@ -141,39 +211,118 @@ class CombatMechanicTranslator(RuleTranslator):
         Returns:
             Mapping result
         """
-        logger.debug(f"Translating combat mechanic: {getattr(adnd_rule, 'name', 'unknown')}")
+        return self.translate_batch([adnd_rule], pf2e_client)[0]
+
+    def translate_batch(
+        self, adnd_rules: Sequence[Any], pf2e_client: PF2EMCPClient
+    ) -> List[MappingResult]:
+        """Translate a table of AD&D combat mechanics to PF2E.
 
-        recommendations = []
-        context_notes = []
+        THAC0 and armor class rows are each converted in one vectorized pass.
+
+        Args:
+            adnd_rules: AD&D combat mechanic rules
+            pf2e_client: PF2E client
 
-        # THAC0 conversion
-        if hasattr(adnd_rule, "thac0"):
-            conversion = self._convert_thac0(adnd_rule)
-            recommendations.append(
+        Returns:
+            Mapping results, in the same order as ``adnd_rules``
+        """
+        logger.debug(f"Translating {len(adnd_rules)} combat mechanics")
+
+        thac0_idx = [i for i, r in enumerate(adnd_rules) if hasattr(r, "thac0")]
+        ac_idx = [
+            i for i, r in enumerate(adnd_rules)
+            if not hasattr(r, "thac0") and hasattr(r, "base_ac")
+        ]
+
+        conversions: List[Dict[str, Any]] = [
+            {"mechanic": "generic", "requires_manual_review": True}
+        ] * len(adnd_rules)
+        recommendations = [
+            "Combat mechanic requires manual conversion"
+        ] * len(adnd_rules)
+
+        thac0_rows = self.convert_thac0_table([adnd_rules[i] for i in thac0_idx])
+        for i, row in zip(thac0_idx, thac0_rows):
+            conversions[i] = row
+            recommendations[i] = (
                 "THAC0 converted to PF2E attack bonus - verify against class progression"
             )
-        # AC conversion
-        elif hasattr(adnd_rule, "base_ac"):
-            conversion = self._convert_armor_class(adnd_rule)
-            recommendations.append(
+
+        ac_rows = self.convert_armor_class_table([adnd_rules[i] for i in ac_idx])
+        for i, row in zip(ac_idx, ac_rows):
+            conversions[i] = row
+            recommendations[i] = (
                 "AC converted from descending to ascending - verify modifiers"
             )
-        # Generic combat mechanic
-        else:
-            conversion = {"mechanic": "generic", "requires_manual_review": True}
-            recommendations.append("Combat mechanic requires manual conversion")
 
-        result = MappingResult(
-            adnd_rule_id=getattr(adnd_rule, "name", "unknown"),
-            confidence=self._calculate_confidence(conversion, recommendations),
-            conversion=conversion,
-            recommendations=recommendations,
-            context_notes=context_notes,
-            metadata={"category": "combat"},
-        )
+        results = []
+        for adnd_rule, conversion, recommendation in zip(
+            adnd_rules, conversions, recommendations
+        ):
+            results.append(
+                MappingResult(
+                    adnd_rule_id=getattr(adnd_rule, "name", "unknown"),
+                    confidence=self._calculate_confidence(conversion, [recommendation]),
+                    conversion=dict(conversion),
+                    recommendations=[recommendation],
+                    context_notes=[],
+                    metadata={"category": "combat"},
+                )
+            )
 
-        logger.info(f"Translated combat mechanic: {result.adnd_rule_id}")
-        return result
+        logger.info(f"Translated {len(results)} combat mechanics")
+        return results
+
+    def convert_thac0_table(self, adnd_rules: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Convert a THAC0 progression table to PF2E attack bonuses.
+
+        Args:
+            adnd_rules: AD&D THAC0 rows
+
+        Returns:
+            Conversion rows, in the same order as ``adnd_rules``
+        """
+        if not adnd_rules:
+            return []
+
+        thac0 = np.array([r.thac0 for r in adnd_rules])
+        attack_bonus = thac0_to_attack_bonus(thac0)
+
+        return [
+            {
+                "adnd_thac0": int(t),
+                "pf2e_attack_bonus": int(bonus),
+                "level": rule.level,
+                "conversion_method": "thac0_to_attack_bonus",
+            }
+            for rule, t, bonus in zip(adnd_rules, thac0.tolist(), attack_bonus.tolist())
+        ]
+
+    def convert_armor_class_table(self, adnd_rules: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Convert an AD&D armor class table to PF2E AC.
+
+        Args:
+            adnd_rules: AD&D armor class rows
+
+        Returns:
+            Conversion rows, in the same order as ``adnd_rules``
+        """
+        if not adnd_rules:
+            return []
+
+        adnd_ac = np.array([r.base_ac for r in adnd_rules])
+        pf2e_ac = descending_to_ascending_ac(adnd_ac)
+
+        return [
+            {
+                "adnd_ac": int(ac),
+                "pf2e_ac": int(converted),
+                "armor_type": rule.armor_type,
+                "conversion_method": "descending_to_ascending",
+            }
+            for rule, ac, converted in zip(adnd_rules, adnd_ac.tolist(), pf2e_ac.tolist())
+        ]
 
     def _convert_thac0(self, adnd_rule: Any) -> Dict[str, Any]:
         """Convert THAC0 to PF2E attack bonus.
@@ -184,17 +333,7 @@ class CombatMechanicTranslator(RuleTranslator):
         Returns:
             Conversion data
         """
-        # PF2E attack bonus ≈ (20 - THAC0)
-        # This is a simplified conversion
-        thac0 = adnd_rule.thac0
-        attack_bonus = 20 - thac0
-
-        return {
-            "adnd_thac0": thac0,
-            "pf2e_attack_bonus": attack_bonus,
-            "level": adnd_rule.level,
-            "conversion_method": "thac0_to_attack_bonus",
-        }
+        return self.convert_thac0_table([adnd_rule])[0]
 
     def _convert_armor_class(self, adnd_rule: Any) -> Dict[str, Any]:
         """Convert AD&D AC to PF2E AC.
@@ -205,16 +344,111 @@ class CombatMechanicTranslator(RuleTranslator):
         Returns:
             Conversion data
         """
-        # PF2E AC ≈ 20 - AD&D AC (descending to ascending)
-        adnd_ac = adnd_rule.base_ac
-        pf2e_ac = 20 - adnd_ac
-
-        return {
-            "adnd_ac": adnd_ac,
-            "pf2e_ac": pf2e_ac,
-            "armor_type": adnd_rule.armor_type,
-            "conversion_method": "descending_to_ascending",
-        }
+        return self.convert_armor_class_table([adnd_rule])[0]
+
+
+class SavingThrowTranslator(RuleTranslator):
+    """Translator for saving throw progressions.
+
+    AD&D's five save categories are folded into PF2E's three saves (the
+    better of the two physical categories for Fortitude and Reflex) and each
+    target number is bucketed into a PF2E proficiency rank.
+    """
+
+    # PF2E save -> AD&D save columns it is derived from
+    SAVE_COLUMNS: Dict[str, List[str]] = {
+        "fortitude": ["paralyzation_poison_death", "petrification_polymorph"],
+        "reflex": ["breath_weapon", "rod_staff_wand"],
+        "will": ["spell"],
+    }
+
+    def translate(
+        self, adnd_rule: Any, pf2e_client: PF2EMCPClient
+    ) -> MappingResult:
+        """Translate an AD&D saving throw row to PF2E save proficiencies.
+
+        Args:
+            adnd_rule: AD&D saving throw rule
+            pf2e_client: PF2E client
+
+        Returns:
+            Mapping result
+        """
+        return self.translate_batch([adnd_rule], pf2e_client)[0]
+
+    def translate_batch(
+        self, adnd_rules: Sequence[Any], pf2e_client: PF2EMCPClient
+    ) -> List[MappingResult]:
+        """Translate a saving throw table to PF2E save proficiencies.
+
+        Args:
+            adnd_rules: AD&D saving throw rules
+            pf2e_client: PF2E client
+
+        Returns:
+            Mapping results, in the same order as ``adnd_rules``
+        """
+        logger.debug(f"Translating {len(adnd_rules)} saving throw rows")
+
+        recommendations = [
+            "Save proficiency derived from AD&D target numbers - verify against class progression"
+        ]
+        results = [
+            MappingResult(
+                adnd_rule_id=f"{rule.class_name}_{rule.level}",
+                confidence=self._calculate_confidence(conversion, recommendations),
+                conversion=conversion,
+                recommendations=list(recommendations),
+                context_notes=[],
+                metadata={"category": "saves"},
+            )
+            for rule, conversion in zip(
+                adnd_rules, self.convert_saving_throw_table(adnd_rules)
+            )
+        ]
+
+        logger.info(f"Translated {len(results)} saving throw rows")
+        return results
+
+    def convert_saving_throw_table(self, adnd_rules: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Convert a saving throw table to PF2E save proficiency ranks.
+
+        Args:
+            adnd_rules: AD&D saving throw rows
+
+        Returns:
+            Conversion rows, in the same order as ``adnd_rules``
+        """
+        if not adnd_rules:
+            return []
+
+        ranks = {}
+        targets = {}
+        for save, columns in self.SAVE_COLUMNS.items():
+            table = np.array(
+                [[getattr(rule, column) for column in columns] for rule in adnd_rules]
+            )
+            # Lower AD&D targets are better
+            targets[save] = table.min(axis=1)
+            ranks[save] = save_target_to_proficiency(targets[save])
+
+        rows = []
+        for i, rule in enumerate(adnd_rules):
+            rows.append(
+                {
+                    "class_name": rule.class_name,
+                    "level": rule.level,
+                    "pf2e_saves": {
+                        save: {
+                            "adnd_target": int(targets[save][i]),
+                            "proficiency": PROFICIENCY_RANKS[int(ranks[save][i])],
+                        }
+                        for save in self.SAVE_COLUMNS
+                    },
+                    "conversion_method": "save_target_to_proficiency",
+                }
+            )
+        return rows
 
 
 class SpellTranslator(RuleTranslator):
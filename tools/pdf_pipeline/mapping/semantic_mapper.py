@@ -11,10 +11,14 @@ Requirements:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +31,8 @@ if TYPE_CHECKING:
     from .rule_translator import (
         AbilityScoreTranslator,
         CombatMechanicTranslator,
+        RuleTranslator,
+        SavingThrowTranslator,
         SpellTranslator,
     )
 
@@ -89,6 +95,7 @@ class SemanticMapper:
         knowledge_base_dir: Path,
         context: Optional[DarkSunContext] = None,
         mcp_server: str = "p2fe",
+        max_workers: Optional[int] = None,
     ):
         """Initialize the semantic mapper.
 
@@ -96,17 +103,20 @@ class SemanticMapper:
             knowledge_base_dir: Path to knowledge base directory
             context: Optional Dark Sun context
             mcp_server: MCP server identifier for PF2E queries
+            max_workers: Thread pool size for batch mapping
+                (default: min(4, cpu_count))
         """
         # Import translators at runtime to avoid circular import
         from .rule_translator import (
             AbilityScoreTranslator,
             CombatMechanicTranslator,
+            SavingThrowTranslator,
             SpellTranslator,
         )
-        
+
         self.repo = KnowledgeRepository(knowledge_base_dir)
         self.pf2e_client = PF2EMCPClient(
-            knowledge_base_dir / "pf2e_cache", mcp_server
+            knowledge_base_dir / "pf2e_cache", mcp_server, repo=self.repo
         )
         self.context_analyzer = ContextAnalyzer(context)
 
@@ -114,6 +124,16 @@ class SemanticMapper:
         self.ability_translator = AbilityScoreTranslator(self.context_analyzer)
         self.combat_translator = CombatMechanicTranslator(self.context_analyzer)
         self.spell_translator = SpellTranslator(self.context_analyzer)
+        self.saves_translator = SavingThrowTranslator(self.context_analyzer)
+
+        self.max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+
+        # Translator results keyed on (rule content hash, context hash)
+        self._context_hash = self._hash_text(
+            self.context_analyzer.context.model_dump_json()
+        )
+        self._translation_cache: Dict[Tuple[str, str], MappingResult] = {}
+        self._cache_lock = threading.Lock()
 
         logger.info(f"Initialized SemanticMapper with KB at {knowledge_base_dir}")
 
@@ -142,16 +162,8 @@ class SemanticMapper:
                 rule_id, "Rule not found in knowledge base"
             )
 
-        # Route to appropriate translator
         try:
-            if category == RuleCategory.ABILITY_SCORES:
-                return self.ability_translator.translate(adnd_rule, self.pf2e_client)
-            elif category == RuleCategory.COMBAT:
-                return self.combat_translator.translate(adnd_rule, self.pf2e_client)
-            elif category == RuleCategory.SPELLS:
-                return self.spell_translator.translate(adnd_rule, self.pf2e_client)
-            else:
-                return self._create_generic_mapping(adnd_rule, category)
+            return self._translate_cached(adnd_rule, category)
 
         except Exception as e:
             logger.error(f"Error mapping rule {rule_id}: {e}", exc_info=True)
@@ -165,28 +177,75 @@ class SemanticMapper:
     ) -> List[MappingResult]:
         """Map multiple AD&D rules in batch.
 
+        Duplicate rule identifiers are mapped once, and rules with identical
+        content share a single memoized translation. Rules are loaded across
+        a thread pool and all cache misses go to the category's translator
+        in a single translate_batch call.
+
         Args:
             rule_ids: List of AD&D rule identifiers
             category: Rule category
             sourcebook: Source sourcebook
 
         Returns:
-            List of mapping results
+            List of mapping results, in the same order as ``rule_ids``
         """
-        logger.info(f"Mapping batch of {len(rule_ids)} rules")
+        unique_ids = list(dict.fromkeys(rule_ids))
+        logger.info(
+            f"Mapping batch of {len(rule_ids)} rules ({len(unique_ids)} unique)"
+        )
 
-        results = []
-        for rule_id in rule_ids:
-            result = self.map_rule(rule_id, category, sourcebook)
-            results.append(result)
+        def load(rule_id: str) -> Optional[BaseModel]:
+            return self.repo.get_adnd_rule(rule_id, category, sourcebook)
+
+        if len(unique_ids) <= 1 or self.max_workers == 1:
+            loaded = [load(rid) for rid in unique_ids]
+        else:
+            workers = min(self.max_workers, len(unique_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(load, unique_ids))
+
+        by_id: Dict[str, MappingResult] = {}
+        pending: Dict[Tuple[str, str], Tuple[BaseModel, List[str]]] = {}
+        for rule_id, adnd_rule in zip(unique_ids, loaded):
+            if adnd_rule is None:
+                by_id[rule_id] = self._create_unmappable_result(
+                    rule_id, "Rule not found in knowledge base"
+                )
+                continue
+
+            key = self._cache_key(adnd_rule, category)
+            with self._cache_lock:
+                cached = self._translation_cache.get(key)
+            if cached is not None:
+                by_id[rule_id] = cached
+            else:
+                pending.setdefault(key, (adnd_rule, []))[1].append(rule_id)
+
+        if pending:
+            keys = list(pending)
+            translated = self._translate_many(
+                [pending[key][0] for key in keys],
+                [pending[key][1][0] for key in keys],
+                category,
+            )
+            for key, result in zip(keys, translated):
+                if result.confidence != MappingConfidence.UNMAPPABLE:
+                    with self._cache_lock:
+                        self._translation_cache.setdefault(key, result)
+                for rule_id in pending[key][1]:
+                    by_id[rule_id] = result
 
-        return results
+        return [by_id[rule_id].model_copy(deep=True) for rule_id in rule_ids]
 
     def analyze_mapping_coverage(
         self, sourcebook: ADnDSourcebook
     ) -> Dict[str, Any]:
         """Analyze mapping coverage for a sourcebook.
 
+        Maps every indexed rule of the sourcebook in a single sweep and
+        builds a confidence histogram per category.
+
         Args:
             sourcebook: Source sourcebook
 
@@ -195,7 +254,7 @@ class SemanticMapper:
         """
         logger.info(f"Analyzing mapping coverage for {sourcebook.value}")
 
-        stats = {
+        stats: Dict[str, Any] = {
             "total_rules": 0,
             "mapped_rules": 0,
             "high_confidence": 0,
@@ -205,15 +264,158 @@ class SemanticMapper:
             "by_category": {},
         }
 
-        # Get all rules from sourcebook
-        all_rules = self.repo.list_adnd_rules(sourcebook=sourcebook)
-        stats["total_rules"] = len(all_rules)
+        categories = self.repo.index["adnd_2e"].get(sourcebook.value, {})
+        for category_name, rule_ids in categories.items():
+            try:
+                category = RuleCategory(category_name)
+            except ValueError:
+                logger.warning(f"Skipping unknown rule category: {category_name}")
+                continue
+
+            histogram = {confidence.value: 0 for confidence in MappingConfidence}
+            for result in self.map_batch(rule_ids, category, sourcebook):
+                histogram[result.confidence.value] += 1
+
+            stats["by_category"][category_name] = {
+                "total_rules": len(rule_ids),
+                "histogram": histogram,
+            }
+            stats["total_rules"] += len(rule_ids)
+            stats["high_confidence"] += histogram[MappingConfidence.HIGH.value]
+            stats["medium_confidence"] += histogram[MappingConfidence.MEDIUM.value]
+            stats["low_confidence"] += histogram[MappingConfidence.LOW.value]
+            stats["unmappable"] += histogram[MappingConfidence.UNMAPPABLE.value]
+
+        stats["mapped_rules"] = stats["total_rules"] - stats["unmappable"]
 
-        # For now, return basic stats
-        # Real implementation would analyze all mappings
         logger.debug(f"Coverage analysis complete: {stats}")
         return stats
 
+    def _cache_key(
+        self, adnd_rule: BaseModel, category: RuleCategory
+    ) -> Tuple[str, str]:
+        """Return the memoization key for a rule.
+
+        Args:
+            adnd_rule: AD&D rule
+            category: Rule category
+
+        Returns:
+            (rule content hash, context hash)
+        """
+        return (
+            self._hash_text(f"{category.value}:{adnd_rule.model_dump_json()}"),
+            self._context_hash,
+        )
+
+    def _translate_cached(
+        self, adnd_rule: BaseModel, category: RuleCategory
+    ) -> MappingResult:
+        """Translate a rule, reusing results for identical rule content.
+
+        Args:
+            adnd_rule: AD&D rule
+            category: Rule category
+
+        Returns:
+            Mapping result (a private copy of the memoized result)
+        """
+        key = self._cache_key(adnd_rule, category)
+
+        with self._cache_lock:
+            cached = self._translation_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Translation cache hit for {category.value} rule")
+            return cached.model_copy(deep=True)
+
+        result = self._translate(adnd_rule, category)
+
+        with self._cache_lock:
+            self._translation_cache.setdefault(key, result)
+        return result.model_copy(deep=True)
+
+    def _translator_for(self, category: RuleCategory) -> Optional[RuleTranslator]:
+        """Return the translator for a category, or None for generic mapping.
+
+        Args:
+            category: Rule category
+
+        Returns:
+            Translator instance or None
+        """
+        return {
+            RuleCategory.ABILITY_SCORES: self.ability_translator,
+            RuleCategory.COMBAT: self.combat_translator,
+            RuleCategory.SPELLS: self.spell_translator,
+            RuleCategory.SAVES: self.saves_translator,
+        }.get(category)
+
+    def _translate(
+        self, adnd_rule: BaseModel, category: RuleCategory
+    ) -> MappingResult:
+        """Route a rule to the appropriate translator.
+
+        Args:
+            adnd_rule: AD&D rule
+            category: Rule category
+
+        Returns:
+            Mapping result
+        """
+        translator = self._translator_for(category)
+        if translator is None:
+            return self._create_generic_mapping(adnd_rule, category)
+        return translator.translate(adnd_rule, self.pf2e_client)
+
+    def _translate_many(
+        self,
+        adnd_rules: List[BaseModel],
+        rule_ids: List[str],
+        category: RuleCategory,
+    ) -> List[MappingResult]:
+        """Translate a table of rules with one translate_batch call.
+
+        Falls back to per-rule translation if the batch fails, so one bad
+        rule only marks itself unmappable.
+
+        Args:
+            adnd_rules: AD&D rules
+            rule_ids: Identifier of each rule, for error reporting
+            category: Rule category
+
+        Returns:
+            Mapping results, in the same order as ``adnd_rules``
+        """
+        translator = self._translator_for(category)
+        if translator is None:
+            return [self._create_generic_mapping(rule, category) for rule in adnd_rules]
+
+        try:
+            return translator.translate_batch(adnd_rules, self.pf2e_client)
+        except Exception as e:
+            logger.warning(f"Batch translation failed, retrying rule by rule: {e}")
+
+        results = []
+        for rule_id, adnd_rule in zip(rule_ids, adnd_rules):
+            try:
+                results.append(translator.translate(adnd_rule, self.pf2e_client))
+            except Exception as e:
+                logger.error(f"Error mapping rule {rule_id}: {e}", exc_info=True)
+                results.append(self._create_unmappable_result(rule_id, str(e)))
+        return results
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        """Return a stable content hash for memoization keys.
+
+        Args:
+            text: Text to hash
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
     def _create_generic_mapping(
         self, adnd_rule: Any, category: RuleCategory
     ) -> MappingResult:
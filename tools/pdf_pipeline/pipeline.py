@@ -27,6 +27,7 @@ from .domain import (
     TransformerStageSpec,
 )
 from .loader import load_postprocessor, load_processor, REGISTRY
+from .utils.profiling import profile_span
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -199,7 +200,8 @@ class PipelineEngine:
         start_time = time.time()
         
         # Execute pipeline with global parallel flag
-        result = self.pipeline.execute(start_from=start_from, global_parallel=self.spec.parallel)
+        with profile_span("pipeline", self.spec.name):
+            result = self.pipeline.execute(start_from=start_from, global_parallel=self.spec.parallel)
         
         elapsed_time = time.time() - start_time
         result.context.elapsed_time = elapsed_time
@@ -12,6 +12,12 @@ from __future__ import annotations
 import re
 from typing import Dict, Callable
 from tools.pdf_pipeline.utils.header_conversion import convert_all_styled_headers_to_semantic
+from tools.pdf_pipeline.utils.regex_registry import regex
+
+# Paragraph and tag scans shared by most fixes below
+_PARAGRAPH_RE = regex("chapter_2_fixes.paragraph", r'<p>(.*?)</p>', re.DOTALL)
+_ANY_PARAGRAPH_RE = regex("chapter_2_fixes.any_paragraph", r'<p[^>]*>(.*?)</p>', re.DOTALL)
+_TAG_RE = regex("chapter_2_fixes.tag", r'<[^>]+>')
 
 
 def _apply_subheader_styling(html: str) -> str:
@@ -70,7 +76,7 @@ def _fix_half_elves_roleplaying_paragraphs(html: str) -> str:
     
     # Extract all paragraph text from the content, ignoring section tags
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -120,7 +126,7 @@ def _fix_half_giants_main_section(html: str) -> str:
     
     # Extract all text from paragraphs
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -182,7 +188,7 @@ def _fix_half_giants_roleplaying_paragraphs(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -238,7 +244,7 @@ def _fix_halflings_main_section(html: str) -> str:
     
     # Extract all text from paragraphs
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -299,7 +305,7 @@ def _fix_halflings_roleplaying_paragraphs(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -362,7 +368,7 @@ def _fix_human_section(html: str) -> str:
     
     # Extract all text from paragraphs
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -425,7 +431,7 @@ def _fix_mul_main_section(html: str) -> str:
     
     # Extract all text from paragraphs (skip table headers but extract text after table data)
     paragraphs_text = []
-    for p_match in re.finditer(r'<p[^>]*>(.*?)</p>', content, re.DOTALL):
+    for p_match in _ANY_PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         # Check if this is a table header paragraph
         if 'id="header-20' in p_match.group(0) or 'id="header-21' in p_match.group(0):
@@ -514,7 +520,7 @@ def _fix_mul_roleplaying_paragraphs(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -580,7 +586,7 @@ def _fix_mul_main_section_v2(html: str) -> str:
     
     # Extract all paragraph text, excluding table-related headers
     paragraphs_text = []
-    for p_match in re.finditer(r'<p[^>]*>(.*?)</p>', combined_content, re.DOTALL):
+    for p_match in _ANY_PARAGRAPH_RE.finditer(combined_content):
         text = p_match.group(1).strip()
         # Skip table headers
         if 'id="header-20' in text or 'id="header-21' in text:
@@ -589,7 +595,7 @@ def _fix_mul_main_section_v2(html: str) -> str:
             paragraphs_text.append(text)
         elif '<span' in text:
             # Extract text from span
-            span_text = re.sub(r'<[^>]+>', '', text)
+            span_text = _TAG_RE.sub('', text)
             if span_text.strip():
                 paragraphs_text.append(span_text.strip())
     
@@ -657,7 +663,7 @@ def _fix_mul_roleplaying_paragraphs_v2(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
@@ -920,7 +926,7 @@ def _fix_thri_kreen_main_section(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p[^>]*>(.*?)</p>', content, re.DOTALL):
+    for p_match in _ANY_PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         # Skip headers
         if 'id="header-' in p_match.group(0):
@@ -929,7 +935,7 @@ def _fix_thri_kreen_main_section(html: str) -> str:
             paragraphs_text.append(text)
         elif '<span' in text:
             # Extract text from span
-            span_text = re.sub(r'<[^>]+>', '', text)
+            span_text = _TAG_RE.sub('', text)
             if span_text.strip():
                 paragraphs_text.append(span_text.strip())
     
@@ -1011,7 +1017,7 @@ def _fix_thri_kreen_roleplaying_paragraphs(html: str) -> str:
     
     # Extract all paragraph text
     paragraphs_text = []
-    for p_match in re.finditer(r'<p>(.*?)</p>', content, re.DOTALL):
+    for p_match in _PARAGRAPH_RE.finditer(content):
         text = p_match.group(1).strip()
         if text:
             paragraphs_text.append(text)
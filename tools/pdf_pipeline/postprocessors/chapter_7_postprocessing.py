@@ -8,10 +8,30 @@ import json
 import logging
 import re
 from pathlib import Path
+from tools.pdf_pipeline.transformers.chapter_7_processing import SPELL_ENTITY_SOURCE, spell_entities
+from tools.pdf_pipeline.utils.artifacts import emit_artifact, register_merger
+from tools.pdf_pipeline.utils.entities import emit_entities
 from tools.pdf_pipeline.utils.header_conversion import convert_all_styled_headers_to_semantic
+from tools.pdf_pipeline.utils.regex_registry import regex
 
 logger = logging.getLogger(__name__)
 
+# Section anchors several fixes locate, and cleanup patterns they share
+_COSMOS_HEADER_RE = regex("chapter_7_postprocessing.cosmos_header", r'<p id="header-5-sphere-of-the-cosmos">')
+_WIZARDLY_MAGIC_HEADER_RE = regex(
+    "chapter_7_postprocessing.wizardly_magic_header", r'<p id="header-6-wizardly-magic">'
+)
+_EMPTY_PARAGRAPH_RE = regex("chapter_7_postprocessing.empty_paragraph", r'<p>\s*</p>')
+# Empty spell list items (only whitespace) left by extraction
+_EMPTY_SPELL_LIST_RE = regex(
+    "chapter_7_postprocessing.empty_spell_list",
+    r'<ul class="spell-list"><li class="spell-list-item">\s*</li></ul>',
+)
+
+# Artifact carrying spells extracted from embedded text, merged into the
+# spell JSON by the parent process (see utils.artifacts)
+EXTRACTED_SPELLS_ARTIFACT = "chapter-seven-extracted-spells"
+
 
 def postprocess_chapter_7(html: str) -> str:
     """Apply Chapter 7-specific HTML postprocessing.
@@ -54,16 +74,10 @@ def _fix_cosmos_spell_ordering(html: str) -> str:
     logger.warning("=== Starting _fix_cosmos_spell_ordering ===")
     try:
         # Find the Sphere of the Cosmos header
-        cosmos_match = re.search(
-            r'<p id="header-5-sphere-of-the-cosmos">',
-            html
-        )
+        cosmos_match = _COSMOS_HEADER_RE.search(html)
         
         # Find the Wizardly Magic header
-        wizardly_magic_match = re.search(
-            r'<p id="header-6-wizardly-magic">',
-            html
-        )
+        wizardly_magic_match = _WIZARDLY_MAGIC_HEADER_RE.search(html)
         
         if not cosmos_match:
             logger.warning("Could not find Sphere of the Cosmos header")
@@ -176,8 +190,8 @@ def _fix_cosmos_spell_ordering(html: str) -> str:
         for spell_text, spell_name, spell_level in extracted_spells[:5]:
             logger.warning(f"  Example: {spell_name} ({spell_level})")
         
-        # Update the JSON spell data file to include these extracted spells
-        _update_spell_json_with_extracted_spells(extracted_spells)
+        # Have the parent process add these extracted spells to the JSON spell data file
+        emit_artifact(EXTRACTED_SPELLS_ARTIFACT, [list(spell) for spell in extracted_spells])
         
         # Create <li> elements for extracted spells
         spell_items = []
@@ -228,10 +242,7 @@ def _fix_cosmos_sphere_paragraphs(html: str) -> str:
     """
     try:
         # Find the Wizardly Magic header to determine where to insert the paragraphs
-        wizardly_magic_match = re.search(
-            r'<p id="header-6-wizardly-magic">',
-            html
-        )
+        wizardly_magic_match = _WIZARDLY_MAGIC_HEADER_RE.search(html)
         
         if not wizardly_magic_match:
             logger.warning("Could not find Wizardly Magic header, skipping cosmos paragraph fix")
@@ -240,10 +251,7 @@ def _fix_cosmos_sphere_paragraphs(html: str) -> str:
         wizardly_magic_pos = wizardly_magic_match.start()
         
         # Extract the section between Sphere of the Cosmos header and Wizardly Magic
-        cosmos_match = re.search(
-            r'<p id="header-5-sphere-of-the-cosmos">',
-            html
-        )
+        cosmos_match = _COSMOS_HEADER_RE.search(html)
         
         if not cosmos_match:
             logger.warning("Could not find Sphere of the Cosmos header, skipping paragraph fix")
@@ -311,10 +319,10 @@ def _fix_cosmos_sphere_paragraphs(html: str) -> str:
             html = html[:match.start()] + html[match.end():]
         
         # Also remove any empty <p> tags that might be left behind
-        html = re.sub(r'<p>\s*</p>', '', html)
+        html = _EMPTY_PARAGRAPH_RE.sub('', html)
         
         # Recalculate wizardly_magic_pos after all removals
-        wizardly_magic_match = re.search(r'<p id="header-6-wizardly-magic">', html)
+        wizardly_magic_match = _WIZARDLY_MAGIC_HEADER_RE.search(html)
         wizardly_magic_pos = wizardly_magic_match.start() if wizardly_magic_match else len(html)
         
         # Create properly formatted paragraphs (without extra whitespace)
@@ -444,6 +452,9 @@ def _update_spell_json_with_extracted_spells(extracted_spells):
         with open(spell_json_path, 'w', encoding='utf-8') as f:
             json.dump(spell_data, f, indent=2, ensure_ascii=False)
         
+        # Keep the spell entities in step with the patched list
+        emit_entities("spell", SPELL_ENTITY_SOURCE, spell_entities(spell_data["spheres"]))
+        
         logger.warning(f"Updated spell JSON: added {added_count} new spells, skipped {skipped_count} duplicates")
         logger.warning(f"Total Cosmos spells now: {len(cosmos_spells)}")
         
@@ -453,6 +464,20 @@ def _update_spell_json_with_extracted_spells(extracted_spells):
         logger.error(traceback.format_exc())
 
 
+def _merge_extracted_spells(payloads):
+    """Merge extracted-spell artifacts from all export tasks into the spell JSON.
+
+    Args:
+        payloads: Lists of [spell_with_level, spell_name, spell_level] entries
+    """
+    _update_spell_json_with_extracted_spells(
+        [tuple(spell) for payload in payloads for spell in payload]
+    )
+
+
+register_merger(EXTRACTED_SPELLS_ARTIFACT, _merge_extracted_spells)
+
+
 def _add_sphere_header_line_breaks(html: str) -> str:
     """Add line breaks above Sphere of Air, Fire, Water, and Cosmos headers.
     
@@ -507,14 +532,11 @@ def _remove_empty_spell_items(html: str) -> str:
     This function removes them to keep the spell lists clean.
     """
     try:
-        # Pattern to match empty spell list items (with only whitespace)
-        empty_item_pattern = r'<ul class="spell-list"><li class="spell-list-item">\s*</li></ul>'
-        
         # Count how many we're removing
-        count_before = len(re.findall(empty_item_pattern, html))
+        count_before = len(_EMPTY_SPELL_LIST_RE.findall(html))
         
         # Remove empty spell list items
-        html = re.sub(empty_item_pattern, '', html)
+        html = _EMPTY_SPELL_LIST_RE.sub('', html)
         
         if count_before > 0:
             logger.info(f"Removed {count_before} empty spell list items")
@@ -3,14 +3,34 @@ Chapter Five: Monsters of Athas - Monster Manual Page Reconstruction
 
 This module handles reconstruction of scattered monster stat blocks into 
 proper AD&D 2E monster manual pages with tables and structured descriptions.
+
+All monster sections are located with a single scan of the chapter HTML,
+parsed once into ``MonsterRecord`` objects and rendered in one rebuild. The
+records are also emitted as a ``MONSTER_RECORDS_ARTIFACT`` and written to
+``MONSTER_RECORDS_PATH`` by the parent process, and as monster entities, so
+bestiary/NPC compendium building can use them without re-parsing the HTML.
 """
 
+import json
 import re
 import logging
+from bisect import bisect_left
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from pydantic import BaseModel, Field
+
+from tools.pdf_pipeline.utils.artifacts import emit_artifact, register_merger
+from tools.pdf_pipeline.utils.entities import ENTITIES_DIRNAME, MonsterEntity, emit_entities
+
 logger = logging.getLogger(__name__)
 
+# Structured monster records produced alongside the reconstructed HTML
+MONSTER_RECORDS_PATH = Path("data/processed/chapter-five-monsters.json")
+MONSTER_RECORDS_ARTIFACT = "chapter-five-monster-records"
+# The records are also monster entities (see utils.entities)
+MONSTER_ENTITY_SOURCE = "chapter-five-monsters-of-athas"
+
 
 # Valid values for each monster stat field (used for intelligent line break insertion)
 # 
@@ -118,15 +138,65 @@ MONSTERS = [
 ]
 
 
+# The 21 stat labels in table order (PSIONICS removed - now in separate Psionics Summary)
+STATS_ORDER = [
+    "CLIMATE/TERRAIN",
+    "FREQUENCY",
+    "ORGANIZATION",
+    "ACTIVITY CYCLE",
+    "DIET",
+    "INTELLIGENCE",
+    "TREASURE",
+    "ALIGNMENT",
+    "NO. APPEARING",
+    "ARMOR CLASS",
+    "MOVEMENT",
+    "HIT DICE",
+    "THAC0",
+    "NO. OF ATTACKS",
+    "DAMAGE/ATTACK",
+    "SPECIAL ATTACKS",
+    "SPECIAL DEFENSES",
+    "MAGIC RESISTANCE",
+    "SIZE",
+    "MORALE",
+    "XP VALUE"
+]
+
+
+class MonsterRecord(BaseModel):
+    """A reconstructed monster manual entry."""
+
+    name: str
+    header_id: str
+    has_psionics: bool = False
+    stats: Dict[str, str] = Field(default_factory=dict)
+    description: str = ""
+    combat: str = ""
+    habitat: str = ""
+    ecology: str = ""
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HEADER_ID_RE = re.compile(r'id="([^"]+)"')
+_STRONG_NAME_RE = re.compile(r'<strong>([^<]+)</strong>')
+
+# Valid values sorted longest first, so the longest match wins
+_VALID_VALUES_BY_LENGTH = {
+    field: sorted(values, key=len, reverse=True) for field, values in VALID_VALUES.items()
+}
+
+
 def _extract_plain_text(html: str) -> str:
     """
     Extract plain text from HTML, removing tags and normalizing whitespace.
     Handles extraneous spaces like "N i l" -> "Nil".
     """
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html)
+    text = _TAG_RE.sub(' ', html)
     # Normalize multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
     return text
 
@@ -134,45 +204,32 @@ def _extract_plain_text(html: str) -> str:
 def _split_merged_value(raw_value: str, current_field: str, next_field: str = None) -> Tuple[str, str]:
     """
     Split merged values using the line break reconstruction rule:
-    "For rows with documented valid value ranges, any text that does NOT match 
+    "For rows with documented valid value ranges, any text that does NOT match
     those valid values/patterns is NOT part of that row."
-    
+
     Args:
         raw_value: The raw extracted value that may contain merged fields
         current_field: The name of the current field (e.g., "CLIMATE/TERRAIN")
         next_field: The name of the next field (e.g., "FREQUENCY")
-        
+
     Returns:
         Tuple of (current_field_value, remaining_text)
     """
     if not raw_value:
         return ("", "")
-    
+
     # Check if current field has known valid values
-    if current_field in VALID_VALUES:
-        valid_values = VALID_VALUES[current_field]
-        
+    if current_field in _VALID_VALUES_BY_LENGTH:
         # Try to find the longest matching valid value from the start
-        best_match = ""
-        remaining = raw_value
-        
-        # Sort by length descending to try longest matches first
-        for valid_value in sorted(valid_values, key=len, reverse=True):
+        for valid_value in _VALID_VALUES_BY_LENGTH[current_field]:
             if raw_value.startswith(valid_value):
                 # Found a valid match
-                best_match = valid_value
-                remaining = raw_value[len(valid_value):].strip()
-                break
-        
-        if best_match:
-            return (best_match, remaining)
-    
+                return (valid_value, raw_value[len(valid_value):].strip())
+
     # If no valid value list, try to detect boundary using next field's valid values
-    if next_field and next_field in VALID_VALUES:
-        next_valid_values = VALID_VALUES[next_field]
-        
+    if next_field and next_field in _VALID_VALUES_BY_LENGTH:
         # Find where the next field's value starts
-        for valid_value in sorted(next_valid_values, key=len, reverse=True):
+        for valid_value in _VALID_VALUES_BY_LENGTH[next_field]:
             if valid_value in raw_value:
                 idx = raw_value.index(valid_value)
                 if idx > 0:
@@ -180,120 +237,112 @@ def _split_merged_value(raw_value: str, current_field: str, next_field: str = No
                     current_value = raw_value[:idx].strip()
                     remaining = raw_value[idx:].strip()
                     return (current_value, remaining)
-    
+
     # Default: return the whole value as-is
     return (raw_value, "")
 
 
-def _normalize_stat_labels(text: str) -> str:
-    """
-    Normalize stat labels by removing extraneous spaces.
-    Handles cases like "MOR A L E" -> "MORALE", "N i l" -> "Nil", etc.
-    """
-    # List of labels to normalize (remove spaces within these words)
-    labels_to_normalize = [
+
+def _spaced_label_pattern(label: str) -> "re.Pattern":
+    """Compile a pattern matching ``label`` with extraneous spaces between its characters."""
+    pattern_chars = []
+    for char in label:
+        if char.isalnum() or char in './-':
+            pattern_chars.append(f'{re.escape(char)}\\s*')
+        elif char == ' ':
+            pattern_chars.append(r'\s+')
+        else:
+            pattern_chars.append(re.escape(char))
+
+    spaced_pattern = ''.join(pattern_chars).rstrip(r'\s*')  # Remove trailing \s*
+    return re.compile(spaced_pattern, re.IGNORECASE)
+
+
+# Labels to normalize (remove spaces within these words)
+_SPACED_LABELS = [
+    (_spaced_label_pattern(label), label)
+    for label in [
         "CLIMATE/TERRAIN", "FREQUENCY", "ORGANIZATION", "ACTIVITY CYCLE", "DIET",
         "INTELLIGENCE", "TREASURE", "ALIGNMENT", "NO. APPEARING", "ARMOR CLASS",
         "MOVEMENT", "HIT DICE", "THAC0", "NO. OF ATTACKS", "DAMAGE/ATTACK",
         "SPECIAL ATTACKS", "SPECIAL DEFENSES", "MAGIC RESISTANCE", "SIZE",
         "MORALE", "XP VALUE", "PSIONICS SUMMARY", "Nil", "Combat", "Habitat", "Ecology"
     ]
-    
+]
+
+
+def _normalize_stat_labels(text: str) -> str:
+    """
+    Normalize stat labels by removing extraneous spaces.
+    Handles cases like "MOR A L E" -> "MORALE", "N i l" -> "Nil", etc.
+    """
     normalized = text
-    for label in labels_to_normalize:
-        # Create pattern that matches the label with optional spaces between each character
-        pattern_chars = []
-        for char in label:
-            if char.isalnum() or char in './-':
-                pattern_chars.append(f'{re.escape(char)}\\s*')
-            elif char == ' ':
-                pattern_chars.append(r'\s+')
-            else:
-                pattern_chars.append(re.escape(char))
-        
-        spaced_pattern = ''.join(pattern_chars).rstrip(r'\s*')  # Remove trailing \s*
-        
+    for pattern, label in _SPACED_LABELS:
         # Replace spaced version with normalized version
-        normalized = re.sub(spaced_pattern, label, normalized, flags=re.IGNORECASE)
-    
+        normalized = pattern.sub(label, normalized)
+
     return normalized
 
 
+def _stat_label_patterns(label: str) -> List[Tuple[str, "re.Pattern"]]:
+    """Compile the "LABEL:" patterns tried for a stat label.
+
+    Also tries the singular variant of labels ending in 'S'
+    (SPECIAL ATTACKS/DEFENSES), with an optional colon or semicolon.
+    """
+    patterns_to_try = [label]
+    if label.endswith('S'):
+        patterns_to_try.append(label[:-1])
+
+    compiled = []
+    for pattern_label in patterns_to_try:
+        label_pattern = pattern_label.replace('/', r'\s*/\s*').replace(' ', r'\s+')
+        compiled.append((pattern_label, re.compile(rf'{label_pattern}\s*[:;]', re.IGNORECASE)))
+    return compiled
+
+
+_STAT_LABEL_PATTERNS = {label: _stat_label_patterns(label) for label in STATS_ORDER}
+
+
 def _parse_stat_block(html_fragment: str) -> Dict[str, str]:
     """
     Parse monster statistics from scattered HTML paragraphs.
     Uses intelligent value splitting to handle merged rows.
-    
+
     Args:
         html_fragment: HTML containing the stat block paragraphs
-        
+
     Returns:
         Dict mapping stat labels to values
     """
     text = _extract_plain_text(html_fragment)
-    
+
     # Normalize stat labels (remove extraneous spaces like "MOR A L E" -> "MORALE")
     text = _normalize_stat_labels(text)
-    
-    # Define the 21 stat labels in order (PSIONICS removed - now in separate Psionics Summary)
-    stats_order = [
-        "CLIMATE/TERRAIN",
-        "FREQUENCY",
-        "ORGANIZATION",
-        "ACTIVITY CYCLE",
-        "DIET",
-        "INTELLIGENCE",
-        "TREASURE",
-        "ALIGNMENT",
-        "NO. APPEARING",
-        "ARMOR CLASS",
-        "MOVEMENT",
-        "HIT DICE",
-        "THAC0",
-        "NO. OF ATTACKS",
-        "DAMAGE/ATTACK",
-        "SPECIAL ATTACKS",
-        "SPECIAL DEFENSES",
-        "MAGIC RESISTANCE",
-        "SIZE",
-        "MORALE",
-        "XP VALUE"
-    ]
-    
+
     # STEP 1: Extract values
     # Two possible formats:
     #   A) "LABEL: VALUE" (standard)
     #   B) "VALUE LABEL:" (reverse - value before label)
     raw_stats = {}
-    
+
     logger.debug(f"Stat block text (first 500 chars): {text[:500]}")
-    
+
     # Find positions of all labels
     label_positions = []
-    for label in stats_order:
-        # Create flexible pattern to match label variations (with optional trailing spaces, colon or semicolon)
-        # Also try singular/plural variations for SPECIAL ATTACKS/DEFENSES
-        patterns_to_try = [label]
-        
-        # Add singular variant if label ends with 'S'
-        if label.endswith('S'):
-            patterns_to_try.append(label[:-1])
-        
+    for label in STATS_ORDER:
         match = None
-        for pattern_label in patterns_to_try:
-            label_pattern = pattern_label.replace('/', r'\s*/\s*').replace(' ', r'\s+')
-            pattern = rf'{label_pattern}\s*[:;]'
-            
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern_label, pattern in _STAT_LABEL_PATTERNS[label]:
+            match = pattern.search(text)
             if match:
                 logger.debug(f"  Found label '{label}' (as '{pattern_label}') at position {match.start()}")
                 break
-        
+
         if match:
             label_positions.append((label, match.start(), match.end()))
         else:
             logger.debug(f"  Label '{label}' NOT FOUND")
-    
+
     # Detect format by checking if first label is near the start of text
     if label_positions:
         first_label_pos = label_positions[0][1]
@@ -301,10 +350,10 @@ def _parse_stat_block(html_fragment: str) -> Dict[str, str]:
         # Otherwise, it's format B (VALUE LABEL:)
         header_end = text.rfind('[^]')
         effective_start = header_end + 50 if header_end != -1 else 50
-        
+
         is_format_a = first_label_pos < effective_start
         logger.debug(f"Format detection: first_label_pos={first_label_pos}, effective_start={effective_start}, is_format_a={is_format_a}")
-        
+
         if is_format_a:
             # Format A: "LABEL: VALUE"  - value comes AFTER label
             logger.debug("Using Format A (LABEL: VALUE)")
@@ -320,7 +369,7 @@ def _parse_stat_block(html_fragment: str) -> Dict[str, str]:
                         marker_pos = text.find(marker, end_pos)
                         if marker_pos != -1 and marker_pos < value_end:
                             value_end = marker_pos
-                
+
                 value = text[end_pos:value_end].strip()
                 raw_stats[label] = value
                 logger.debug(f"  [{label}] = '{value[:50]}'")
@@ -342,48 +391,47 @@ def _parse_stat_block(html_fragment: str) -> Dict[str, str]:
                 else:
                     # Value is from end of previous label to current label
                     value_start = label_positions[i-1][2]
-                
+
                 value = text[value_start:start_pos].strip()
                 raw_stats[label] = value
                 logger.debug(f"  [{label}] = '{value[:50]}'")
-    
+
     # Handle missing labels
-    for label in stats_order:
+    for label in STATS_ORDER:
         if label not in raw_stats:
             raw_stats[label] = ""
             logger.debug(f"  [{label}] = '' (label not found)")
-    
+
     # STEP 2: Semantic value matching using VALID_VALUES
     # Instead of relying on label positions, search the entire text for valid values
     logger.debug(f"\n=== STEP 2: Semantic value matching ===")
     stats = {}
     used_text_ranges = []  # Track which parts of text we've already assigned
-    
+
     # Build a searchable text corpus from all raw values
-    all_text = " ".join([raw_stats.get(label, "") for label in stats_order])
+    all_text = " ".join([raw_stats.get(label, "") for label in STATS_ORDER])
     logger.debug(f"All text to parse: {all_text[:200]}")
-    
-    for label in stats_order:
-        if label in VALID_VALUES:
+
+    for label in STATS_ORDER:
+        if label in _VALID_VALUES_BY_LENGTH:
             # Try to find a valid value for this field
-            valid_values = VALID_VALUES[label]
             best_match = None
             best_match_pos = -1
-            
-            # Sort by length descending to prefer longer matches
-            for valid_value in sorted(valid_values, key=len, reverse=True):
+
+            # Prefer longer matches
+            for valid_value in _VALID_VALUES_BY_LENGTH[label]:
                 # Look for this value in the text
                 pos = all_text.find(valid_value)
                 if pos != -1:
                     # Check if this text range hasn't been used yet
                     end_pos = pos + len(valid_value)
-                    overlaps = any(start <= pos < end or start < end_pos <= end 
+                    overlaps = any(start <= pos < end or start < end_pos <= end
                                   for start, end in used_text_ranges)
                     if not overlaps:
                         best_match = valid_value
                         best_match_pos = pos
                         break
-            
+
             if best_match:
                 stats[label] = best_match
                 used_text_ranges.append((best_match_pos, best_match_pos + len(best_match)))
@@ -399,300 +447,423 @@ def _parse_stat_block(html_fragment: str) -> Dict[str, str]:
                 logger.debug(f"  [{label}] = '{stats[label][:30]}' (no valid values)")
             else:
                 logger.debug(f"  [{label}] = '' (EMPTY - EXTRACTION FAILURE)")
-    
+
     # Count non-empty values
     filled_count = sum(1 for v in stats.values() if v)
     empty_count = 21 - filled_count
     logger.debug(f"\n📊 Results: {filled_count}/21 filled, {empty_count}/21 empty")
-    
+
     if empty_count > 0:
         logger.warning(f"⚠️  {empty_count} empty cells detected - parsing failure per spec!")
-    
+
     return stats
 
 
+_SPAN_TEXT_RE = re.compile(r'<span[^>]*>(.*?)</span>', re.DOTALL)
+
+_DESCRIPTION_SECTION_RES = {
+    # Combat starts with "Combat:" and ends at "Habitat/Society:"
+    'combat': re.compile(
+        r'<span[^>]*>Combat:</span>(.*?)(?=<span[^>]*>Habitat/Society:</span>|$)',
+        re.DOTALL | re.IGNORECASE
+    ),
+    'habitat': re.compile(
+        r'<span[^>]*>Habitat/Society:</span>(.*?)(?=<span[^>]*>Ecology:</span>|$)',
+        re.DOTALL | re.IGNORECASE
+    ),
+    'ecology': re.compile(
+        r'<span[^>]*>Ecology:</span>(.*?)$',
+        re.DOTALL | re.IGNORECASE
+    ),
+}
+
+
 def _extract_description_sections(html_fragment: str) -> Dict[str, str]:
     """
     Extract Combat, Habitat/Society, and Ecology description sections.
-    
+
     Args:
         html_fragment: HTML containing the description sections
-        
+
     Returns:
         Dict with keys 'combat', 'habitat', 'ecology' containing extracted text
     """
     sections = {}
-    
-    # Extract Combat section (starts with "Combat:" ends at "Habitat/Society:")
-    combat_match = re.search(
-        r'<span[^>]*>Combat:</span>(.*?)(?=<span[^>]*>Habitat/Society:</span>|$)',
-        html_fragment,
-        re.DOTALL | re.IGNORECASE
-    )
-    if combat_match:
-        combat_html = combat_match.group(1)
-        # Extract paragraphs
-        paragraphs = re.findall(r'<span[^>]*>(.*?)</span>', combat_html, re.DOTALL)
-        combat_text = ' '.join(_extract_plain_text(p) for p in paragraphs)
-        sections['combat'] = combat_text
-    else:
-        sections['combat'] = ""
-    
-    # Extract Habitat/Society section
-    habitat_match = re.search(
-        r'<span[^>]*>Habitat/Society:</span>(.*?)(?=<span[^>]*>Ecology:</span>|$)',
-        html_fragment,
-        re.DOTALL | re.IGNORECASE
-    )
-    if habitat_match:
-        habitat_html = habitat_match.group(1)
-        paragraphs = re.findall(r'<span[^>]*>(.*?)</span>', habitat_html, re.DOTALL)
-        habitat_text = ' '.join(_extract_plain_text(p) for p in paragraphs)
-        sections['habitat'] = habitat_text
-    else:
-        sections['habitat'] = ""
-    
-    # Extract Ecology section
-    ecology_match = re.search(
-        r'<span[^>]*>Ecology:</span>(.*?)$',
-        html_fragment,
-        re.DOTALL | re.IGNORECASE
-    )
-    if ecology_match:
-        ecology_html = ecology_match.group(1)
-        paragraphs = re.findall(r'<span[^>]*>(.*?)</span>', ecology_html, re.DOTALL)
-        ecology_text = ' '.join(_extract_plain_text(p) for p in paragraphs)
-        sections['ecology'] = ecology_text
-    else:
-        sections['ecology'] = ""
-    
+    for key, pattern in _DESCRIPTION_SECTION_RES.items():
+        match = pattern.search(html_fragment)
+        if match:
+            # Extract paragraphs
+            paragraphs = _SPAN_TEXT_RE.findall(match.group(1))
+            sections[key] = ' '.join(_extract_plain_text(p) for p in paragraphs)
+        else:
+            sections[key] = ""
+
     return sections
 
 
 def _build_monster_stats_table(stats: Dict[str, str]) -> str:
     """
     Build HTML table for monster statistics (21 rows, PSIONICS not included).
-    
+
     Args:
         stats: Dict mapping stat labels to values
-        
+
     Returns:
         HTML table string
     """
-    stats_order = [
-        "CLIMATE/TERRAIN",
-        "FREQUENCY",
-        "ORGANIZATION",
-        "ACTIVITY CYCLE",
-        "DIET",
-        "INTELLIGENCE",
-        "TREASURE",
-        "ALIGNMENT",
-        "NO. APPEARING",
-        "ARMOR CLASS",
-        "MOVEMENT",
-        "HIT DICE",
-        "THAC0",
-        "NO. OF ATTACKS",
-        "DAMAGE/ATTACK",
-        "SPECIAL ATTACKS",
-        "SPECIAL DEFENSES",
-        "MAGIC RESISTANCE",
-        "SIZE",
-        "MORALE",
-        "XP VALUE"
-    ]
-    
-    html = '<table class="monster-stats">\n'
-    
-    for label in stats_order:
+    rows = ['<table class="monster-stats">\n']
+
+    for label in STATS_ORDER:
         value = stats.get(label, "")
-        html += '  <tr>\n'
-        html += f'    <td class="stat-label"><strong>{label}:</strong></td>\n'
-        html += f'    <td class="stat-value">{value}</td>\n'
-        html += '  </tr>\n'
-    
-    html += '</table>\n'
-    
-    return html
+        rows.append('  <tr>\n')
+        rows.append(f'    <td class="stat-label"><strong>{label}:</strong></td>\n')
+        rows.append(f'    <td class="stat-value">{value}</td>\n')
+        rows.append('  </tr>\n')
+
+    rows.append('</table>\n')
+
+    return ''.join(rows)
+
+
+def _monster_slug(name: str) -> str:
+    """Generate the header slug used for monsters without an ID."""
+    return name.lower().replace(' ', '-').replace(',', '').replace('(', '').replace(')', '')
+
+
+def _header_pattern(monster_config: Dict) -> str:
+    """Regex for a monster's header paragraph."""
+    id_pattern = monster_config['id_pattern']
+    if '<' in id_pattern or '>' in id_pattern:
+        # This is a full HTML pattern (e.g., '<p><span...>')
+        return id_pattern
+    # This is just an ID, need to wrap it (e.g., 'header-\d+-belgoi')
+    return rf'<p id="{id_pattern}">'
+
+
+def _reconstructed_marker_pattern(next_marker: str) -> Optional[str]:
+    """Regex for the end marker once the next monster has been reconstructed.
+
+    Reconstructed headers are ``<h2 id="...">`` instead of ``<p id="...">``;
+    monsters that had no ID get a generated ``monster-<slug>`` ID.
+    """
+    if '<p id="header-' in next_marker:
+        return next_marker.replace('<p id="', '<h2 id="')
+    if '<p><span[^>]*><strong>' in next_marker:
+        name_match = _STRONG_NAME_RE.search(next_marker)
+        if name_match:
+            return rf'<h2 id="monster-{_monster_slug(name_match.group(1))}">'
+    return None
+
+
+class MonsterSegment:
+    """Location of one monster section in the chapter HTML."""
+
+    __slots__ = ("config", "start", "end", "header")
+
+    def __init__(self, config: Dict, start: int, end: int, header: str):
+        self.config = config
+        self.start = start
+        self.end = end
+        self.header = header
+
+
+class MonsterBoundaryScanner:
+    """Locates every monster section of the chapter in one pass.
+
+    The header and end-marker patterns of all monsters are compiled into a
+    single alternation; one ``finditer`` over the HTML records where each of
+    them occurs, and the section bounds are then resolved from those offsets.
+    The alternation has no capture groups (groups defeat the regex engine's
+    first-character filter and make the scan an order of magnitude slower);
+    the few boundary matches are classified afterwards.
+    """
+
+    def __init__(self, monsters: List[Dict] = MONSTERS):
+        """Compile the combined boundary pattern.
+
+        Args:
+            monsters: Monster definitions in document order
+        """
+        self.monsters = monsters
+        self._groups: Dict[str, str] = {}
+        self._roles: List[Tuple[Dict, str, str, Optional[str]]] = []
+        for monster_config in monsters:
+            next_marker = monster_config['next_marker']
+            alt_marker = _reconstructed_marker_pattern(next_marker)
+            self._roles.append((
+                monster_config,
+                self._group(_header_pattern(monster_config)),
+                self._group(next_marker),
+                self._group(alt_marker) if alt_marker else None,
+            ))
+        self._pattern = re.compile('|'.join(f'(?:{pattern})' for pattern in self._groups))
+        self._classifiers = [(re.compile(pattern), name) for pattern, name in self._groups.items()]
+
+    def _group(self, pattern: str) -> str:
+        """Key for a pattern (patterns shared between monsters share a key)."""
+        if pattern not in self._groups:
+            self._groups[pattern] = f'b{len(self._groups)}'
+        return self._groups[pattern]
+
+    def scan(self, html: str) -> List[MonsterSegment]:
+        """Find all monster sections.
+
+        Each header is the first match of its pattern; a section ends at the
+        first end marker after its header, falling back to the reconstructed
+        form of that marker.
+
+        Args:
+            html: Full chapter HTML
+
+        Returns:
+            Non-overlapping segments in document order
+        """
+        hits: Dict[str, List[Tuple[int, int, str]]] = {}
+        for match in self._pattern.finditer(html):
+            text = match.group(0)
+            for classifier, name in self._classifiers:
+                if classifier.fullmatch(text):
+                    hits.setdefault(name, []).append((match.start(), match.end(), text))
+                    break
+        starts = {name: [hit[0] for hit in group] for name, group in hits.items()}
+
+        def first_after(name: Optional[str], pos: int) -> Optional[int]:
+            if name is None or name not in hits:
+                return None
+            idx = bisect_left(starts[name], pos)
+            return starts[name][idx] if idx < len(starts[name]) else None
+
+        segments = []
+        for monster_config, header_group, next_group, alt_group in self._roles:
+            monster_name = monster_config['name']
+            if header_group not in hits:
+                logger.warning(f"Could not find {monster_name} header")
+                continue
+            start, header_end, header = hits[header_group][0]
+            end = first_after(next_group, header_end)
+            if end is None:
+                end = first_after(alt_group, header_end)
+            if end is None:
+                logger.warning(f"Could not find end marker for {monster_name}")
+                continue
+            segments.append(MonsterSegment(monster_config, start, end, header))
+
+        segments.sort(key=lambda segment: segment.start)
+        kept = []
+        for segment in segments:
+            if kept and segment.start < kept[-1].end:
+                logger.warning(f"Skipping {segment.config['name']}: section overlaps {kept[-1].config['name']}")
+                continue
+            kept.append(segment)
+        return kept
+
+
+_SCANNER = MonsterBoundaryScanner(MONSTERS)
+
+
+def parse_monster_record(section_html: str, header: str, monster_config: Dict) -> MonsterRecord:
+    """
+    Parse one monster section into a record.
+
+    Args:
+        section_html: HTML from the monster header up to the next monster
+        header: The matched header markup at the start of ``section_html``
+        monster_config: Configuration dict for the monster
+
+    Returns:
+        MonsterRecord with the stat block and description sections
+    """
+    monster_name = monster_config['name']
+    description_start = monster_config['description_start']
+
+    # Extract header ID if present, otherwise generate a slug
+    header_id_match = _HEADER_ID_RE.search(header)
+    header_id = header_id_match.group(1) if header_id_match else f"monster-{_monster_slug(monster_name)}"
+
+    # Find where the stat block ends (at description_start text)
+    desc_start_match = re.search(rf'<[^>]+>{description_start}', section_html)
+    if desc_start_match:
+        stat_block_html = section_html[len(header):desc_start_match.start()]
+        description_html = section_html[desc_start_match.start():]
+    else:
+        logger.warning(f"Could not find description start for {monster_name}")
+        stat_block_html = section_html[len(header):]
+        description_html = ""
+
+    stats = _parse_stat_block(stat_block_html)
+    sections = _extract_description_sections(description_html)
+
+    # General description is the text before "Combat:"
+    desc_intro = ""
+    desc_intro_match = re.search(
+        rf'{description_start}.*?(?=Combat:|$)',
+        _extract_plain_text(description_html),
+        re.DOTALL
+    )
+    if desc_intro_match:
+        desc_intro = desc_intro_match.group(0).strip()
+
+    return MonsterRecord(
+        name=monster_name,
+        header_id=header_id,
+        has_psionics=monster_config.get('has_psionics', False),
+        stats=stats,
+        description=desc_intro,
+        combat=sections['combat'],
+        habitat=sections['habitat'],
+        ecology=sections['ecology'],
+    )
+
+
+def render_monster_page(record: MonsterRecord) -> str:
+    """
+    Render a monster record as a monster manual page.
+
+    Args:
+        record: Parsed monster record
+
+    Returns:
+        HTML for the reconstructed page
+    """
+    parts = [
+        f'<h2 id="{record.header_id}">{record.name} <a href="#top" style="font-size: 0.8em; text-decoration: none;">[^]</a></h2>\n\n',
+        _build_monster_stats_table(record.stats),
+        '\n',
+    ]
+
+    # Psionics summary not rendered yet (Phase 2)
+    # TODO: Extract and format psionics summary
+
+    if record.description:
+        parts.append(f'<p>{record.description}</p>\n\n')
+    if record.combat:
+        parts.append(f'<p><strong>Combat:</strong> {record.combat}</p>\n\n')
+    if record.habitat:
+        parts.append(f'<p><strong>Habitat/Society:</strong> {record.habitat}</p>\n\n')
+    if record.ecology:
+        parts.append(f'<p><strong>Ecology:</strong> {record.ecology}</p>\n\n')
+
+    return ''.join(parts)
+
+
+def _parse_segments(html: str, segments: List[MonsterSegment]) -> List[Tuple[MonsterSegment, MonsterRecord]]:
+    """Parse each located segment, skipping monsters that fail to parse."""
+    parsed = []
+    for segment in segments:
+        monster_name = segment.config['name']
+        try:
+            record = parse_monster_record(html[segment.start:segment.end], segment.header, segment.config)
+        except Exception as e:
+            logger.error(f"Failed to reconstruct {monster_name}: {e}", exc_info=True)
+            continue
+        filled = len([v for v in record.stats.values() if v])
+        logger.info(f"✅ Parsed {monster_name}: {filled}/{len(STATS_ORDER)} stats with values")
+        parsed.append((segment, record))
+    return parsed
+
+
+def _rebuild(html: str, parsed: List[Tuple[MonsterSegment, MonsterRecord]]) -> str:
+    """Replace every parsed segment with its rendered page in one pass."""
+    parts = []
+    cursor = 0
+    for segment, record in parsed:
+        parts.append(html[cursor:segment.start])
+        parts.append(render_monster_page(record))
+        cursor = segment.end
+    parts.append(html[cursor:])
+    return ''.join(parts)
+
+
+def extract_monster_records(html: str) -> List[MonsterRecord]:
+    """
+    Parse all monster sections of the chapter into records.
+
+    Args:
+        html: Full chapter HTML
+
+    Returns:
+        Records in document order
+    """
+    return [record for _, record in _parse_segments(html, _SCANNER.scan(html))]
+
+
+def write_monster_records(records: List[MonsterRecord], path: Path = MONSTER_RECORDS_PATH) -> None:
+    """
+    Write monster records as a JSON artifact.
+
+    Args:
+        records: Parsed monster records
+        path: Output JSON path
+    """
+    data = {
+        "chapter": "Chapter 5 - Monsters of Athas",
+        "monsters": [record.model_dump() for record in records],
+        "metadata": {
+            "total_monsters": len(records),
+            "stats_order": STATS_ORDER,
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    logger.info(f"Wrote {len(records)} monster records to {path}")
+
+
+def _merge_monster_records(payloads: List[Dict]) -> None:
+    """Write monster record artifacts; the last payload for a path wins."""
+    by_path = {payload["path"]: payload["records"] for payload in payloads}
+    for path, records in by_path.items():
+        write_monster_records([MonsterRecord.model_validate(r) for r in records], Path(path))
+
+
+register_merger(MONSTER_RECORDS_ARTIFACT, _merge_monster_records)
 
 
 def reconstruct_monster_page(html: str, monster_config: Dict) -> str:
     """
     Reconstruct a single monster manual page from scattered HTML.
-    
+
     Args:
         html: Full chapter HTML
         monster_config: Configuration dict for the monster
-        
+
     Returns:
         Updated HTML with reconstructed monster page
     """
-    monster_name = monster_config['name']
-    print(f"  🔍 Attempting to reconstruct: {monster_name}")
-    logger.info(f"Reconstructing {monster_name} monster manual page")
-    
-    try:
-        # Find the monster section boundaries
-        if '<' in monster_config['id_pattern'] or '>' in monster_config['id_pattern']:
-            # This is a full HTML pattern (e.g., '<p><span...>')
-            print(f"    - Using full HTML pattern: {monster_config['id_pattern'][:50]}...")
-            header_match = re.search(monster_config['id_pattern'], html)
-        else:
-            # This is just an ID, need to wrap it (e.g., 'header-\d+-belgoi')
-            print(f"    - Using ID pattern: {monster_config['id_pattern']}")
-            header_match = re.search(rf'<p id="{monster_config["id_pattern"]}">', html)
-        
-        if not header_match:
-            print(f"    ❌ Could not find header for {monster_name}")
-            logger.warning(f"Could not find {monster_name} header")
-            return html
-        
-        print(f"    ✓ Found header at position {header_match.start()}")
-        
-        section_start = header_match.start()
-        
-        # Find section end (next monster or end marker)
-        # Note: markers might have been reconstructed already, so check for both patterns
-        print(f"    - Looking for end marker: {monster_config['next_marker'][:50]}...")
-        next_match = re.search(monster_config['next_marker'], html[section_start + len(header_match.group(0)):])
-        
-        # If not found, try alternate patterns (reconstructed headers)
-        if not next_match:
-            if '<p id="header-' in monster_config['next_marker']:
-                # Try reconstructed pattern: <h2 id="..."> instead of <p id="...">
-                alt_pattern = monster_config['next_marker'].replace('<p id="', '<h2 id="')
-                print(f"    - Trying alternate pattern 1: {alt_pattern[:50]}...")
-                next_match = re.search(alt_pattern, html[section_start + len(header_match.group(0)):])
-            elif '<p><span[^>]*><strong>' in monster_config['next_marker']:
-                # Extract monster name from pattern like '<p><span[^>]*><strong>Jozhal</strong></span></p>'
-                name_match = re.search(r'<strong>([^<]+)</strong>', monster_config['next_marker'])
-                if name_match:
-                    target_name = name_match.group(1)
-                    # Generate slug like the reconstruction does
-                    slug = target_name.lower().replace(' ', '-').replace(',', '').replace('(', '').replace(')', '')
-                    alt_pattern = rf'<h2 id="monster-{slug}">'
-                    print(f"    - Trying alternate pattern 2 for '{target_name}': {alt_pattern}...")
-                    next_match = re.search(alt_pattern, html[section_start + len(header_match.group(0)):])
-        
-        if not next_match:
-            print(f"    ❌ Could not find end marker for {monster_name}")
-            logger.warning(f"Could not find end marker for {monster_name}")
-            return html
-        
-        print(f"    ✓ Found end marker at relative position {next_match.start()}")
-        section_end = section_start + len(header_match.group(0)) + next_match.start()
-        section_html = html[section_start:section_end]
-        print(f"    - Section length: {len(section_html)} chars")
-        
-        # Extract header ID if present
-        header_id_match = re.search(r'id="([^"]+)"', header_match.group(0))
-        if header_id_match:
-            header_id = header_id_match.group(1)
-            print(f"    - Using existing ID: {header_id}")
-        else:
-            # Generate a slug for monsters without IDs
-            header_id = f"monster-{monster_name.lower().replace(' ', '-').replace(',', '').replace('(', '').replace(')', '')}"
-            print(f"    - Generated new ID: {header_id}")
-        
-        # Find where the stat block ends (at description_start text)
-        print(f"    - Looking for description start: '{monster_config['description_start'][:30]}...'")
-        desc_start_match = re.search(
-            rf'<[^>]+>{monster_config["description_start"]}',
-            section_html
-        )
-        
-        if desc_start_match:
-            print(f"    ✓ Found description start at position {desc_start_match.start()}")
-            stat_block_html = section_html[len(header_match.group(0)):desc_start_match.start()]
-            description_html = section_html[desc_start_match.start():]
-            print(f"    - Stat block: {len(stat_block_html)} chars, Description: {len(description_html)} chars")
-        else:
-            print(f"    ❌ Could not find description start for {monster_name}")
-            logger.warning(f"Could not find description start for {monster_name}")
-            stat_block_html = section_html[len(header_match.group(0)):]
-            description_html = ""
-        
-        # Parse stat block
-        print(f"    - Parsing stat block...")
-        stats = _parse_stat_block(stat_block_html)
-        print(f"    - Extracted {len([v for v in stats.values() if v])} stats with values")
-        
-        # Extract description sections
-        print(f"    - Extracting description sections...")
-        sections = _extract_description_sections(description_html)
-        print(f"    - Found sections: {list(sections.keys())}")
-        
-        # Build reconstructed page
-        print(f"    - Building reconstructed HTML...")
-        reconstructed = f'<h2 id="{header_id}">{monster_name} <a href="#top" style="font-size: 0.8em; text-decoration: none;">[^]</a></h2>\n\n'
-        
-        # Add stats table
-        reconstructed += _build_monster_stats_table(stats)
-        reconstructed += '\n'
-        
-        # Add psionics summary if present (for now, skip - will be Phase 2)
-        # TODO: Extract and format psionics summary
-        
-        # Extract general description (text before "Combat:")
-        desc_intro_match = re.search(
-            rf'{monster_config["description_start"]}.*?(?=Combat:|$)',
-            _extract_plain_text(description_html),
-            re.DOTALL
-        )
-        if desc_intro_match:
-            desc_intro = desc_intro_match.group(0).strip()
-            if desc_intro:
-                reconstructed += f'<p>{desc_intro}</p>\n\n'
-        
-        # Add description sections
-        if sections.get('combat'):
-            reconstructed += f'<p><strong>Combat:</strong> {sections["combat"]}</p>\n\n'
-        
-        if sections.get('habitat'):
-            reconstructed += f'<p><strong>Habitat/Society:</strong> {sections["habitat"]}</p>\n\n'
-        
-        if sections.get('ecology'):
-            reconstructed += f'<p><strong>Ecology:</strong> {sections["ecology"]}</p>\n\n'
-        
-        print(f"    - Reconstructed HTML length: {len(reconstructed)} chars")
-        print(f"    - Replacing section from {section_start} to {section_end}")
-        
-        # Replace the section
-        html = html[:section_start] + reconstructed + html[section_end:]
-        
-        print(f"    ✅ Successfully reconstructed {monster_name}")
-        logger.info(f"✅ Successfully reconstructed {monster_name}")
-        return html
-        
-    except Exception as e:
-        logger.error(f"Failed to reconstruct {monster_name}: {e}", exc_info=True)
-        return html
-
-
-def reconstruct_all_monster_pages(html: str) -> str:
+    logger.info(f"Reconstructing {monster_config['name']} monster manual page")
+    segments = MonsterBoundaryScanner([monster_config]).scan(html)
+    return _rebuild(html, _parse_segments(html, segments))
+
+
+def reconstruct_all_monster_pages(html: str, records_path: Optional[Path] = MONSTER_RECORDS_PATH) -> str:
     """
     Reconstruct all monster manual pages in Chapter Five.
-    
+
     Args:
         html: Full chapter HTML
-        
+        records_path: Where to write the monster records JSON (None to skip);
+            the monster entities go to the ``entities`` directory beside it
+
     Returns:
         HTML with all monster pages reconstructed
     """
-    print("=" * 80)
-    print("!!! MONSTER RECONSTRUCTION CALLED !!!")
-    print(f"Starting reconstruction for {len(MONSTERS)} monsters")
-    print("=" * 80)
     logger.info("Reconstructing all monster manual pages")
-    
-    # Process monsters in reverse order to avoid position shifting issues
-    # (later replacements don't affect earlier positions in the HTML)
-    for i, monster_config in enumerate(reversed(MONSTERS), 1):
-        print(f"\n>>> Processing monster {i}/{len(MONSTERS)}: {monster_config['name']} (REVERSE ORDER)")
-        html = reconstruct_monster_page(html, monster_config)
-    
-    print("\n✅ Completed all monster reconstructions")
-    logger.info("✅ Completed reconstruction of all monster manual pages")
-    return html
 
+    segments = _SCANNER.scan(html)
+    logger.info(f"Found {len(segments)}/{len(MONSTERS)} monster sections")
+
+    parsed = _parse_segments(html, segments)
+    html = _rebuild(html, parsed)
+
+    if records_path is not None and parsed:
+        emit_artifact(MONSTER_RECORDS_ARTIFACT, {
+            "path": str(records_path),
+            "records": [record.model_dump() for _, record in parsed],
+        })
+        emit_entities("monster", MONSTER_ENTITY_SOURCE, [
+            MonsterEntity(source=MONSTER_ENTITY_SOURCE, **record.model_dump(exclude={"header_id"}))
+            for _, record in parsed
+        ], entities_dir=Path(records_path).parent / ENTITIES_DIRNAME)
+
+    logger.info(f"✅ Completed reconstruction of {len(parsed)} monster manual pages")
+    return html
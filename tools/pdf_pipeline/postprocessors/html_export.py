@@ -6,7 +6,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from tools.pdf_pipeline.base import BasePostProcessor
 from tools.pdf_pipeline.domain import ExecutionContext, ProcessorOutput
@@ -19,43 +19,183 @@ from tools.pdf_pipeline.postprocessors.chapter_4_postprocessing import apply_cha
 from tools.pdf_pipeline.postprocessors.chapter_5_postprocessing import apply_chapter_5_fixes, apply_chapter_5_html_fixes
 from tools.pdf_pipeline.postprocessors.chapter_7_postprocessing import postprocess_chapter_7
 from tools.pdf_pipeline.postprocessors.chapter_10_postprocessing import postprocess as postprocess_chapter_10
+from tools.pdf_pipeline.postprocessors.chapter_10_html import postprocess_chapter_10_html
 from tools.pdf_pipeline.postprocessors.chapter_11_postprocessing import apply_chapter_11_content_fixes
+from tools.pdf_pipeline.postprocessors.chapter_12_postprocessing import apply_chapter_12_content_fixes
 from tools.pdf_pipeline.postprocessors.chapter_13_postprocessing import apply_chapter_13_content_fixes
 from tools.pdf_pipeline.postprocessors.chapter_14_postprocessing import postprocess_chapter_14_html
 from tools.pdf_pipeline.postprocessors.chapter_15_postprocessing import postprocess as postprocess_chapter_15
 from tools.pdf_pipeline.postprocessors.chapter_four_atlas_postprocessing import postprocess_chapter_four_atlas
 from tools.pdf_pipeline.postprocessors.chapter_five_monsters_postprocessing import postprocess_chapter_five_monsters
+from tools.pdf_pipeline.utils.artifacts import collect_artifacts, merge_artifacts
 from tools.pdf_pipeline.utils.parallel import run_process_pool, should_parallelize, get_max_workers
+from tools.pdf_pipeline.utils.profiling import profile_call, profile_span
+from tools.pdf_pipeline.utils.regex_registry import regex, regex_scope
 
 logger = logging.getLogger(__name__)
 
 
+# Page chrome around the TOC and content slots. Pages are assembled from
+# these parts and the TOC/content buffers with a single join, so chapter
+# fixups never need to re-find the content inside a rendered document.
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="generator" content="Dark Sun PF2E Pipeline">
+    <meta name="source" content="AD&D 2E Dark Sun Box Set">
+    <meta name="slug" content="{slug}">
+    <title>{title_prefix}{title}</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+    <a id="top"></a>
+    <h1>{title}</h1>
+    <p class="back-to-master-toc">
+        <a href="table_of_contents.html">Back to Table of Contents</a>
+    </p>
+    """
+_SLOT_INDENT = "\n    "
+_SECTION_OPEN_TAG = '<section class="content">'
+_SECTION_CLOSE_TAG = "</section>"
+_CONTENT_OPEN = _SLOT_INDENT + _SECTION_OPEN_TAG + _SLOT_INDENT
+_CONTENT_CLOSE = _SLOT_INDENT + _SECTION_CLOSE_TAG
+_PAGE_TAIL = """
+</body>
+</html>"""
+
+_TOC_START = '<nav id="table-of-contents">'
+_TOC_END = '</nav>'
+
+# A page under construction: TOC buffer and content buffer
+PageParts = Tuple[str, str]
+PartsFixer = Callable[[str, str], PageParts]
+
+
+def _split_toc(content: str) -> PageParts:
+    """Separate the journal's TOC nav from the rest of its content."""
+    nav_start = content.find(_TOC_START)
+    if nav_start != -1:
+        nav_end = content.find(_TOC_END, nav_start)
+        if nav_end != -1:
+            nav_end += len(_TOC_END)
+            return content[nav_start:nav_end], content[:nav_start] + content[nav_end:]
+    return "", content
+
+
+def _on_content(fixer: Callable[[str], str]) -> PartsFixer:
+    """Adapt an HTML fixer so it only sees the content buffer."""
+    def apply(toc_html: str, main_content: str) -> PageParts:
+        return toc_html, profile_call("hook", fixer, main_content)
+    return apply
+
+
+def _on_body(fixer: Callable[[str], str]) -> PartsFixer:
+    """Adapt an HTML fixer that also edits the TOC or the section markup.
+
+    The fixer sees the TOC followed by the content section (the markup these
+    fixers anchor on), never the page chrome.
+    """
+    def apply(toc_html: str, main_content: str) -> PageParts:
+        body = profile_call("hook", fixer, toc_html + _CONTENT_OPEN + main_content + _CONTENT_CLOSE)
+        open_at = body.find(_SECTION_OPEN_TAG)
+        close_at = body.rfind(_SECTION_CLOSE_TAG)
+        if open_at == -1 or close_at < open_at:
+            raise ValueError("HTML fixer removed the content section")
+        # Drop the slot indentation the template adds back; fixers may have
+        # already consumed it
+        toc_html = body[:open_at].removesuffix(_SLOT_INDENT)
+        main_content = body[open_at + len(_SECTION_OPEN_TAG) : close_at]
+        return toc_html, main_content.removeprefix(_SLOT_INDENT).removesuffix(_SLOT_INDENT)
+    return apply
+
+
+def _on_stripped(fixer: Callable[[str], str], text: str) -> str:
+    """Apply a fixer to text without its surrounding whitespace."""
+    stripped = text.strip()
+    if not stripped:
+        return text
+    lead = text[: len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()) :]
+    return lead + fixer(stripped) + trail
+
+
+def _fix_chapter_one_world(toc_html: str, main_content: str) -> PageParts:
+    """Apply TOC generation, header anchors, and Roman numerals."""
+    from tools.pdf_pipeline.transformers.journal_lib import (
+        apply_subheader_styling,
+        add_header_anchors,
+        generate_table_of_contents,
+    )
+
+    def anchor(content: str) -> str:
+        # Apply subheader styling (H2 for Clerical Magic, Wizardry, Psionics)
+        content = apply_subheader_styling(content, "chapter-one-the-world-of-athas")
+        # Add header anchors and Roman numerals
+        return add_header_anchors(content)
+
+    main_content = _on_stripped(anchor, main_content)
+    if not toc_html:
+        toc_html = generate_table_of_contents(main_content.strip())
+    # Apply History paragraph breaks
+    return toc_html, profile_call("hook", postprocess_chapter_one_world, main_content)
+
+
+def _fix_chapter_four_atlas(toc_html: str, main_content: str) -> PageParts:
+    """Apply atlas fixes, then regenerate the TOC to capture all H2 headers."""
+    from tools.pdf_pipeline.transformers.journal_lib import generate_table_of_contents
+
+    main_content = profile_call("hook", postprocess_chapter_four_atlas, main_content)
+    new_toc = generate_table_of_contents(main_content)
+    return (new_toc or toc_html), main_content
+
+
+def _cleanup_artifacts(html: str) -> str:
+    """Remove extraction artifacts (dash/number rules, spaced-out letters)."""
+    html = _ARTIFACT_RULE_RE.sub('', html)
+    html = _ARTIFACT_NUMBERS_RE.sub('', html)
+    html = _ARTIFACT_PREFIX_RE.sub(r'\1\3', html)
+    return _fix_letter_spacing(html)
+
+
+def _render_parts(title: str, slug: str, title_prefix: str, toc_html: str, main_content: str) -> str:
+    """Fix up a journal's TOC and content buffers and assemble the page."""
+    fixer = _CHAPTER_FIXES.get(slug)
+    if fixer:
+        toc_html, main_content = fixer(toc_html, main_content)
+
+    toc_html = _cleanup_artifacts(toc_html)
+    main_content = _cleanup_artifacts(main_content)
+
+    fixer = _LATE_CHAPTER_FIXES.get(slug)
+    if fixer:
+        toc_html, main_content = fixer(toc_html, main_content)
+
+    return _generate_html_template(title, toc_html, main_content, slug, title_prefix)
+
+
 def _export_html_task(task: Dict[str, Any]) -> Dict[str, Any]:
     """Worker function to export a single journal JSON to HTML.
     
+    Chapter fixers never write shared files from here; their side artifacts
+    are returned for the parent to merge (see utils.artifacts).
+    
     Args:
         task: Dict with json_file, output_dir, title_prefix, and config
         
     Returns:
-        Dict with items, warnings, errors, and output_file
+        Dict with items, warnings, errors, output_file, and artifacts
     """
-    import json
-    import re
-    from pathlib import Path
-    from tools.pdf_pipeline.postprocessors.chapter_1_postprocessing import apply_chapter_1_content_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_one_world_postprocessing import postprocess_chapter_one_world
-    from tools.pdf_pipeline.postprocessors.chapter_2_fixes import apply_chapter_2_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_two_athasian_society_postprocessing import postprocess_chapter_two_athasian_society
-    from tools.pdf_pipeline.postprocessors.chapter_3_postprocessing import apply_chapter_3_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_4_postprocessing import apply_chapter_4_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_5_postprocessing import apply_chapter_5_fixes, apply_chapter_5_html_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_7_postprocessing import postprocess_chapter_7
-    from tools.pdf_pipeline.postprocessors.chapter_11_postprocessing import apply_chapter_11_content_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_13_postprocessing import apply_chapter_13_content_fixes
-    from tools.pdf_pipeline.postprocessors.chapter_14_postprocessing import postprocess_chapter_14_html
-    from tools.pdf_pipeline.postprocessors.chapter_15_postprocessing import postprocess as postprocess_chapter_15
-    from tools.pdf_pipeline.postprocessors.chapter_five_monsters_postprocessing import postprocess_chapter_five_monsters
-    
+    slug = Path(task["json_file"]).stem
+    with collect_artifacts() as artifacts, regex_scope(slug), profile_span("section", f"export/{slug}"):
+        result = _export_html(task)
+    result["artifacts"] = artifacts
+    return result
+
+
+def _export_html(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Export a single journal JSON to HTML (see ``_export_html_task``)."""
     json_file = Path(task["json_file"])
     output_dir = Path(task["output_dir"])
     title_prefix = task.get("title_prefix", "Dark Sun - ")
@@ -82,138 +222,13 @@ def _export_html_task(task: Dict[str, Any]) -> Dict[str, Any]:
                 "output_file": None,
             }
         
-        # Generate HTML file (inline simplified version)
-        # Separate TOC from main content
-        toc_html = ""
-        main_content = content
-        try:
-            nav_start = content.find('<nav id="table-of-contents">')
-            if nav_start != -1:
-                nav_end = content.find('</nav>', nav_start)
-                if nav_end != -1:
-                    nav_end += len('</nav>')
-                    toc_html = content[nav_start:nav_end]
-                    main_content = content[:nav_start] + content[nav_end:]
-        except Exception:
-            pass
+        raw_fixer = _RAW_CONTENT_FIXES.get(slug)
+        if raw_fixer:
+            content = profile_call("hook", raw_fixer, content)
         
-        # Chapter-specific content postprocessing (before template generation)
-        if slug == "chapter-five-proficiencies":
-            # Apply chapter 5 fixes to content before HTML generation
-            content = apply_chapter_5_fixes(content)
-            # Re-extract TOC and main content after fixes
-            toc_html = ""
-            main_content = content
-            try:
-                nav_start = content.find('<nav id="table-of-contents">')
-                if nav_start != -1:
-                    nav_end = content.find('</nav>', nav_start)
-                    if nav_end != -1:
-                        nav_end += len('</nav>')
-                        toc_html = content[nav_start:nav_end]
-                        main_content = content[:nav_start] + content[nav_end:]
-            except Exception:
-                pass
-        
-        # Generate complete HTML (using template from original)
-        html_content = _generate_html_template(title, toc_html, main_content, slug, title_prefix)
-        
-        # Chapter-specific HTML postprocessing (after template generation)
-        if slug == "chapter-one-ability-scores":
-            html_content = apply_chapter_1_content_fixes(html_content)
-        elif slug == "chapter-one-the-world-of-athas":
-            # Apply TOC generation, header anchors, and Roman numerals
-            import re
-            from tools.pdf_pipeline.transformers.journal_lib import (
-                apply_subheader_styling,
-                add_header_anchors,
-                generate_table_of_contents,
-            )
-            # Extract content section
-            content_match = re.search(r'<section class="content">\s*(.*?)\s*</section>', html_content, re.DOTALL)
-            if content_match:
-                content = content_match.group(1)
-                # Apply subheader styling (H2 for Clerical Magic, Wizardry, Psionics)
-                content = apply_subheader_styling(content, "chapter-one-the-world-of-athas")
-                # Add header anchors and Roman numerals
-                content = add_header_anchors(content)
-                # Generate TOC
-                toc_html = generate_table_of_contents(content)
-                # Replace content in HTML
-                html_content = html_content[:content_match.start(1)] + content + html_content[content_match.end(1):]
-                # Insert TOC
-                if toc_html:
-                    toc_insertion_match = re.search(
-                        r'(<p class="back-to-master-toc">.*?</p>)\s*(<section class="content">)',
-                        html_content,
-                        re.DOTALL
-                    )
-                    if toc_insertion_match:
-                        html_content = (
-                            html_content[:toc_insertion_match.end(1)] + 
-                            '\n    ' + toc_html + '\n    ' +
-                            html_content[toc_insertion_match.start(2):]
-                        )
-            # Apply History paragraph breaks
-            html_content = postprocess_chapter_one_world(html_content)
-        elif slug == "chapter-two-player-character-races":
-            html_content = _reposition_chapter2_tables(html_content)
-        elif slug == "chapter-two-athasian-society":
-            html_content = postprocess_chapter_two_athasian_society(html_content)
-        elif slug == "chapter-five-monsters-of-athas":
-            html_content = postprocess_chapter_five_monsters(html_content)
-        elif slug == "chapter-three-player-character-classes":
-            html_content = apply_chapter_3_fixes(html_content)
-        elif slug == "chapter-four-alignment":
-            html_content = apply_chapter_4_fixes(html_content)
-        elif slug == "chapter-five-proficiencies":
-            html_content = apply_chapter_5_html_fixes(html_content)
-        elif slug == "chapter-seven-magic":
-            html_content = postprocess_chapter_7(html_content)
-        elif slug == "chapter-ten-treasure":
-            from .chapter_10_html import postprocess_chapter_10_html
-            html_content = postprocess_chapter_10_html(html_content)
-        elif slug == "chapter-eleven-encounters":
-            html_content = apply_chapter_11_content_fixes(html_content)
-        elif slug == "chapter-twelve-npcs":
-            from .chapter_12_postprocessing import apply_chapter_12_content_fixes
-            html_content = apply_chapter_12_content_fixes(html_content)
-        elif slug == "chapter-thirteen-vision-and-light":
-            html_content = apply_chapter_13_content_fixes(html_content)
-        # Note: chapter-fourteen postprocessing runs AFTER cleanup (see below)
-        
-        # Clean up extraction artifacts
-        html_content = re.sub(r'<p>[-\s]{10,}</p>', '', html_content)
-        html_content = re.sub(r'<p>\s*[\d\s\-]{8,}\s*</p>', '', html_content)
-        html_content = re.sub(r'(<p>)([-\s\d]{10,})(\s*[A-Z])', r'\1\3', html_content)
-        html_content = _fix_letter_spacing(html_content)
-        
-        # Chapter-specific HTML postprocessing (after ALL content generation and cleanup)
-        # This ensures all malformed content has been generated before we try to remove it
-        if slug == "chapter-four-atlas-of-the-tyr-region":
-            html_content = postprocess_chapter_four_atlas(html_content)
-            # Generate TOC after postprocessing to capture all H2 headers
-            from tools.pdf_pipeline.transformers.journal_lib import generate_table_of_contents
-            # Extract just the body content for TOC generation
-            body_match = re.search(r'<body>(.*?)</body>', html_content, re.DOTALL)
-            if body_match:
-                body_content = body_match.group(1)
-                # Remove old TOC if it exists
-                body_content = re.sub(r'<nav id="table-of-contents">.*?</nav>', '', body_content, flags=re.DOTALL)
-                # Generate new TOC
-                new_toc = generate_table_of_contents(body_content)
-                if new_toc:
-                    # Find the <body> opening tag and insert TOC after it, before <a id="top">
-                    html_content = html_content.replace(
-                        '<body>',
-                        f'<body>\n{new_toc}\n'
-                    )
-        elif slug == "chapter-ten-treasure":
-            html_content = postprocess_chapter_10(html_content)
-        elif slug == "chapter-fourteen-time-and-movement":
-            html_content = postprocess_chapter_14_html(html_content)
-        elif slug == "chapter-fifteen-new-spells":
-            html_content = postprocess_chapter_15(html_content)
+        # Separate TOC from main content, fix both up, then assemble once
+        toc_html, main_content = _split_toc(content)
+        html_content = _render_parts(title, slug, title_prefix, toc_html, main_content)
         
         # Write HTML file
         output_file = output_dir / f"{slug}.html"
@@ -237,24 +252,45 @@ def _export_html_task(task: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+# Letter-spaced words ("s u c h" -> "such"). Word fragments are only
+# anchored at the start of a letter run; trying every position inside long
+# words made these the slowest patterns of the export.
+_SPACED_LETTERS_RE = regex(
+    "html_export.spaced_letters",
+    r'\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b(?:\s+\b[a-z]\b)*',
+    re.IGNORECASE,
+)
+_WORD_THEN_2_LETTERS_RE = regex(
+    "html_export.word_then_2_letters", r'(?<![a-z])([a-z]{5,})\s+\b([a-z])\b\s+\b([a-z])\b\s', re.IGNORECASE
+)
+_WORD_THEN_3_LETTERS_RE = regex(
+    "html_export.word_then_3_letters",
+    r'(?<![a-z])([a-z]{5,})\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s',
+    re.IGNORECASE,
+)
+_NUMBER_THEN_4_LETTERS_RE = regex(
+    "html_export.number_then_4_letters",
+    r'([0-9:])\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s',
+    re.IGNORECASE,
+)
+_NUMBER_THEN_3_LETTERS_RE = regex(
+    "html_export.number_then_3_letters", r'([0-9:])\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s', re.IGNORECASE
+)
+
+
 def _fix_letter_spacing(text: str) -> str:
     """Fix sequences where every character is separated by single spaces."""
     max_iterations = 15
     for _ in range(max_iterations):
         before = text
-        text = re.sub(
-            r'\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b(?:\s+\b[a-z]\b)*',
-            lambda m: m.group(0).replace(' ', ''),
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _SPACED_LETTERS_RE.sub(lambda m: m.group(0).replace(' ', ''), text)
         if before == text:
             break
     
-    text = re.sub(r'([a-z]{5,})\s+\b([a-z])\b\s+\b([a-z])\b\s', r'\1 \2\3 ', text, flags=re.IGNORECASE)
-    text = re.sub(r'([a-z]{5,})\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s', r'\1 \2\3\4 ', text, flags=re.IGNORECASE)
-    text = re.sub(r'([0-9:])\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s', r'\1 \2\3\4\5 ', text, flags=re.IGNORECASE)
-    text = re.sub(r'([0-9:])\s+\b([a-z])\b\s+\b([a-z])\b\s+\b([a-z])\b\s', r'\1 \2\3\4 ', text, flags=re.IGNORECASE)
+    text = _WORD_THEN_2_LETTERS_RE.sub(r'\1 \2\3 ', text)
+    text = _WORD_THEN_3_LETTERS_RE.sub(r'\1 \2\3\4 ', text)
+    text = _NUMBER_THEN_4_LETTERS_RE.sub(r'\1 \2\3\4\5 ', text)
+    text = _NUMBER_THEN_3_LETTERS_RE.sub(r'\1 \2\3\4 ', text)
     return text
 
 
@@ -299,29 +335,51 @@ def _reposition_chapter2_tables(html: str) -> str:
 
 def _generate_html_template(title: str, toc_html: str, main_content: str, slug: str, title_prefix: str) -> str:
     """Generate complete HTML document with styling."""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="generator" content="Dark Sun PF2E Pipeline">
-    <meta name="source" content="AD&D 2E Dark Sun Box Set">
-    <meta name="slug" content="{slug}">
-    <title>{title_prefix}{title}</title>
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-    <a id="top"></a>
-    <h1>{title}</h1>
-    <p class="back-to-master-toc">
-        <a href="table_of_contents.html">Back to Table of Contents</a>
-    </p>
-    {toc_html}
-    <section class="content">
-    {main_content}
-    </section>
-</body>
-</html>"""
+    return "".join((
+        _PAGE_HEAD.format(slug=slug, title=title, title_prefix=title_prefix),
+        toc_html,
+        _CONTENT_OPEN,
+        main_content,
+        _CONTENT_CLOSE,
+        _PAGE_TAIL,
+    ))
+
+
+
+_ARTIFACT_RULE_RE = re.compile(r'<p>[-\s]{10,}</p>')
+_ARTIFACT_NUMBERS_RE = re.compile(r'<p>\s*[\d\s\-]{8,}\s*</p>')
+_ARTIFACT_PREFIX_RE = re.compile(r'(<p>)([-\s\d]{10,})(\s*[A-Z])')
+
+# Fixes applied to the raw journal content, before the TOC is split off
+_RAW_CONTENT_FIXES: Dict[str, Callable[[str], str]] = {
+    "chapter-five-proficiencies": apply_chapter_5_fixes,
+}
+
+# Chapter fixes applied before artifact cleanup
+_CHAPTER_FIXES: Dict[str, PartsFixer] = {
+    "chapter-one-ability-scores": _on_body(apply_chapter_1_content_fixes),
+    "chapter-one-the-world-of-athas": _fix_chapter_one_world,
+    "chapter-two-player-character-races": _on_content(_reposition_chapter2_tables),
+    "chapter-two-athasian-society": _on_body(postprocess_chapter_two_athasian_society),
+    "chapter-five-monsters-of-athas": _on_content(postprocess_chapter_five_monsters),
+    "chapter-three-player-character-classes": _on_content(apply_chapter_3_fixes),
+    "chapter-four-alignment": _on_body(apply_chapter_4_fixes),
+    "chapter-five-proficiencies": _on_body(apply_chapter_5_html_fixes),
+    "chapter-seven-magic": _on_content(postprocess_chapter_7),
+    "chapter-ten-treasure": _on_content(postprocess_chapter_10_html),
+    "chapter-eleven-encounters": _on_body(apply_chapter_11_content_fixes),
+    "chapter-twelve-npcs": _on_body(apply_chapter_12_content_fixes),
+    "chapter-thirteen-vision-and-light": _on_body(apply_chapter_13_content_fixes),
+}
+
+# Chapter fixes applied after artifact cleanup, so all malformed content has
+# been generated before they try to remove it
+_LATE_CHAPTER_FIXES: Dict[str, PartsFixer] = {
+    "chapter-four-atlas-of-the-tyr-region": _fix_chapter_four_atlas,
+    "chapter-ten-treasure": _on_content(postprocess_chapter_10),
+    "chapter-fourteen-time-and-movement": _on_body(postprocess_chapter_14_html),
+    "chapter-fifteen-new-spells": _on_body(postprocess_chapter_15),
+}
 
 
 
@@ -382,8 +440,9 @@ class HTMLExportPostProcessor(BasePostProcessor):
             }
             tasks.append(task)
         
-        # Export (parallel or sequential)
+        # Export (parallel or sequential), then merge side artifacts once
         exported_files = []
+        artifacts = []
         if use_parallel and len(tasks) > 1:
             max_workers = get_max_workers(self.config, default=4)
             chunksize = int(self.config.get("chunksize", 1))
@@ -400,6 +459,7 @@ class HTMLExportPostProcessor(BasePostProcessor):
             context.items_processed += result["items_processed"]
             context.warnings.extend(result["warnings"])
             context.errors.extend(result["errors"])
+            artifacts = result["artifacts"]
             exported_files = sorted([r["output_file"] for r in result["results"] if r.get("output_file")])
         
         else:
@@ -410,14 +470,18 @@ class HTMLExportPostProcessor(BasePostProcessor):
                 context.items_processed += result["items"]
                 context.warnings.extend(result["warnings"])
                 context.errors.extend(result["errors"])
+                artifacts.extend(result["artifacts"])
                 if result.get("output_file"):
                     exported_files.append(result["output_file"])
             exported_files = sorted(exported_files)
         
+        context.errors.extend(merge_artifacts(artifacts))
+        
         # Update output metadata
         output.metadata["html_exported_files"] = exported_files
         output.metadata["html_export_count"] = len(exported_files)
         output.metadata["html_output_dir"] = str(self.output_dir)
+        output.metadata["html_export_artifacts"] = len(artifacts)
         output.metadata["parallel"] = use_parallel
         
         return output
@@ -434,44 +498,8 @@ class HTMLExportPostProcessor(BasePostProcessor):
             Complete HTML document as string
         """
         # Separate TOC from main content to ensure TOC appears before sections
-        toc_html = ""
-        main_content = content
-        try:
-            nav_start = content.find('<nav id="table-of-contents">')
-            if nav_start != -1:
-                nav_end = content.find('</nav>', nav_start)
-                if nav_end != -1:
-                    nav_end += len('</nav>')
-                    toc_html = content[nav_start:nav_end]
-                    main_content = content[:nav_start] + content[nav_end:]
-        except Exception:
-            # Fallback to original content if parsing fails
-            toc_html = ""
-            main_content = content
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="generator" content="Dark Sun PF2E Pipeline">
-    <meta name="source" content="AD&D 2E Dark Sun Box Set">
-    <meta name="slug" content="{slug}">
-    <title>{self.title_prefix}{title}</title>
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-    <a id="top"></a>
-    <h1>{title}</h1>
-    <p class="back-to-master-toc">
-        <a href="table_of_contents.html">Back to Table of Contents</a>
-    </p>
-    {toc_html}
-    <section class="content">
-    {main_content}
-    </section>
-</body>
-</html>"""
+        toc_html, main_content = _split_toc(content)
+        return _generate_html_template(title, toc_html, main_content, slug, self.title_prefix)
     
     def _reposition_hw_table(self, html: str) -> str:
         """Move the Height & Weight table to immediately follow its header in Chapter 2."""
@@ -575,7 +603,7 @@ class HTMLExportPostProcessor(BasePostProcessor):
         
         postprocessor = postprocessors.get(slug)
         if postprocessor:
-            return postprocessor(html)
+            return profile_call("hook", postprocessor, html)
         
         return html
     
@@ -54,11 +54,13 @@ class MasterTOCGenerator(BaseProcessor):
                 - html_dir: Directory containing HTML files
                 - output_file: Path to output table_of_contents.html
                 - manifest_path: Optional path to pdf_manifest.json (for ordering)
+                - search_page: Optional search page to link from the TOC
         """
         config = spec.config if hasattr(spec, 'config') else spec
         self.html_dir = Path(config.get("html_dir", "data/html_output"))
         self.output_file = Path(config.get("output_file", "data/html_output/table_of_contents.html"))
         self.manifest_path = Path(config.get("manifest_path", "data/raw/pdf_manifest.json"))
+        self.search_page = config.get("search_page")
         self.logger = logging.getLogger(__name__)
     
     def process(self, input_data: ProcessorInput, context: ExecutionContext) -> ProcessorOutput:
@@ -346,6 +348,10 @@ class MasterTOCGenerator(BaseProcessor):
         
         toc_content = '\n'.join(toc_html)
         
+        search_html = ""
+        if self.search_page:
+            search_html = f'<p class="toc-search"><a href="{self.search_page}">Search all chapters</a></p>'
+        
         # Build missing chapters list (if any)
         missing_html = ""
         if missing_chapters:
@@ -371,6 +377,7 @@ class MasterTOCGenerator(BaseProcessor):
 </head>
 <body>
     <h1>Dark Sun - Master Table of Contents</h1>
+    {search_html}
     
     <section>
         <h2>Available Chapters</h2>
@@ -0,0 +1,361 @@
+"""Generate a sharded cross-chapter search index for the HTML output.
+
+The exported chapter pages are read in a single streaming pass. Every header
+anchor starts a new search document (the chapter top is the first), and the
+text of headers, paragraphs, list items and table cells is folded into an
+inverted index. The index is written as small JSON shards keyed by term
+prefix, so the client script only fetches the shards a query touches:
+
+    search/meta.json            prefix length, shard keys, document count
+    search/docs.json            [href, title, snippet] per document
+    search/shards/<prefix>.json {term: [doc, weight, doc, weight, ...]}
+    search/search.js            client-side lookup
+    search.html                 search page using the script
+"""
+
+import json
+import logging
+import re
+import shutil
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.pdf_pipeline.base import BaseProcessor
+from tools.pdf_pipeline.domain import ExecutionContext, ProcessorInput, ProcessorOutput
+
+INDEX_VERSION = 1
+
+# Pages in the HTML output that are not chapters
+NON_CHAPTER_PAGES = {"index", "table_of_contents", "search"}
+
+# Weight of a term occurrence in a section header relative to body text
+HEADER_WEIGHT = 10
+
+SNIPPET_LENGTH = 160
+READ_CHUNK_SIZE = 1 << 16
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+ROMAN_PREFIX_RE = re.compile(r"^[IVXLCDM]+\.\s+")
+STOPWORDS = frozenset(
+    "an and are as at be by for from has he his in is it its of on or that the "
+    "their this to was were which will with".split()
+)
+
+_TEXT_TAGS = {"p", "li", "td", "th", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote"}
+_ANCHOR_TAGS = {"p", "h1", "h2", "h3", "h4", "h5", "h6"}
+_SKIP_TAGS = {"head", "nav", "script", "style"}
+_SKIP_CLASSES = {"back-to-master-toc"}
+_IGNORED_IDS = {"top", "table-of-contents"}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms, dropping stopwords and single characters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class _ChapterParser(HTMLParser):
+    """Split one chapter page into (anchor, header text, body text) sections."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.sections: List[Tuple[str, str, List[str]]] = [("", "", [])]
+        self._skip: List[str] = []
+        self._in_title = False
+        self._header_tag: Optional[str] = None
+        self._header_text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        if self._skip:
+            if tag == self._skip[-1]:
+                self._skip.append(tag)
+            return
+        if tag in _SKIP_TAGS or _SKIP_CLASSES.intersection((attributes.get("class") or "").split()):
+            self._skip.append(tag)
+            return
+        if tag == "h1" and not self.title and len(self.sections) == 1:
+            self._in_title = True
+            return
+        anchor = attributes.get("id")
+        if tag in _ANCHOR_TAGS and anchor and anchor not in _IGNORED_IDS:
+            self.sections.append((anchor, "", []))
+            self._header_tag = tag
+            self._header_text = []
+        elif tag in _TEXT_TAGS:
+            self._separate()
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip:
+            if tag == self._skip[-1]:
+                self._skip.pop()
+            return
+        if self._in_title and tag == "h1":
+            self._in_title = False
+        elif tag == self._header_tag:
+            anchor, _, body = self.sections[-1]
+            header = " ".join("".join(self._header_text).replace("[^]", "").split())
+            self.sections[-1] = (anchor, ROMAN_PREFIX_RE.sub("", header), body)
+            self._header_tag = None
+        elif tag in _TEXT_TAGS:
+            self._separate()
+
+    def handle_data(self, data: str) -> None:
+        if self._skip:
+            return
+        if self._in_title:
+            self.title += data
+        elif self._header_tag:
+            self._header_text.append(data)
+        else:
+            self.sections[-1][2].append(data)
+
+    def _separate(self) -> None:
+        self.sections[-1][2].append(" ")
+
+
+class SearchIndexGenerator(BaseProcessor):
+    """Build the cross-chapter search index next to the master TOC."""
+
+    def __init__(self, spec: Any):
+        """Initialize the search index generator.
+
+        Args:
+            spec: ProcessorSpec with config containing:
+                - html_dir: Directory containing exported chapter HTML
+                - output_dir: Index directory (default: <html_dir>/search)
+                - prefix_length: Term prefix length used to shard the index
+                - search_page: Search page file name, relative to html_dir
+        """
+        config = spec.config if hasattr(spec, "config") else spec
+        self.html_dir = Path(config.get("html_dir", "data/html_output"))
+        self.output_dir = Path(config.get("output_dir", self.html_dir / "search"))
+        self.prefix_length = int(config.get("prefix_length", 2))
+        self.search_page = config.get("search_page", "search.html")
+        self.logger = logging.getLogger(__name__)
+
+    def process(self, input_data: ProcessorInput, context: ExecutionContext) -> ProcessorOutput:
+        """Index every chapter page and write the shards, script and search page.
+
+        Args:
+            input_data: Input from previous stage
+            context: Execution context
+
+        Returns:
+            ProcessorOutput with index statistics
+        """
+        if not self.html_dir.exists():
+            context.warnings.append(f"HTML directory not found: {self.html_dir}")
+            return ProcessorOutput(data={"status": "error", "documents": 0})
+
+        pages = sorted(
+            f for f in self.html_dir.glob("*.html") if f.stem not in NON_CHAPTER_PAGES
+        )
+        docs: List[List[str]] = []
+        postings: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        for page in pages:
+            self._index_page(page, docs, postings)
+
+        shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+        for term in sorted(postings):
+            ranked = sorted(postings[term].items(), key=lambda item: (-item[1], item[0]))
+            shards[term[: self.prefix_length]][term] = [v for pair in ranked for v in pair]
+
+        self._write_index(docs, shards)
+        context.items_processed += len(pages)
+        self.logger.info(
+            "Indexed %d sections from %d pages into %d shards",
+            len(docs), len(pages), len(shards),
+        )
+
+        return ProcessorOutput(
+            data={
+                "status": "success",
+                "output_dir": str(self.output_dir),
+                "search_page": str(self.html_dir / self.search_page),
+                "documents": len(docs),
+                "terms": len(postings),
+                "shards": len(shards),
+            },
+            metadata={"pages_indexed": len(pages)},
+        )
+
+    def _index_page(
+        self,
+        page: Path,
+        docs: List[List[str]],
+        postings: Dict[str, Dict[int, int]],
+    ) -> None:
+        """Stream one page through the parser and add its sections to the index."""
+        parser = _ChapterParser()
+        with page.open("r", encoding="utf-8") as fh:
+            for chunk in iter(lambda: fh.read(READ_CHUNK_SIZE), ""):
+                parser.feed(chunk)
+        parser.close()
+
+        chapter_title = " ".join(parser.title.split()) or page.stem
+        for anchor, header, body_parts in parser.sections:
+            body = " ".join("".join(body_parts).split())
+            if not header and not body:
+                continue
+            doc_id = len(docs)
+            href = f"{page.name}#{anchor}" if anchor else page.name
+            title = f"{chapter_title}: {header}" if header else chapter_title
+            docs.append([href, title, body[:SNIPPET_LENGTH]])
+
+            for term in tokenize(header):
+                postings[term][doc_id] += HEADER_WEIGHT
+            for term in tokenize(body):
+                postings[term][doc_id] += 1
+
+    def _write_index(self, docs: List[List[str]], shards: Dict[str, Dict[str, List[int]]]) -> None:
+        """Write the index files, the client script and the search page."""
+        shard_dir = self.output_dir / "shards"
+        if shard_dir.exists():
+            shutil.rmtree(shard_dir)
+        shard_dir.mkdir(parents=True)
+
+        def dump(path: Path, value: Any) -> None:
+            path.write_text(
+                json.dumps(value, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+            )
+
+        for key, terms in shards.items():
+            dump(shard_dir / f"{key}.json", terms)
+        dump(self.output_dir / "docs.json", docs)
+        dump(
+            self.output_dir / "meta.json",
+            {
+                "version": INDEX_VERSION,
+                "prefix_length": self.prefix_length,
+                "shards": sorted(shards),
+                "documents": len(docs),
+                "stopwords": sorted(STOPWORDS),
+            },
+        )
+        (self.output_dir / "search.js").write_text(SEARCH_SCRIPT, encoding="utf-8")
+
+        script_src = self.output_dir.relative_to(self.html_dir).as_posix() + "/search.js"
+        (self.html_dir / self.search_page).write_text(
+            SEARCH_PAGE.replace("{script_src}", script_src), encoding="utf-8"
+        )
+
+
+SEARCH_SCRIPT = r"""/* Dark Sun search: loads meta.json, then only the shards a query needs. */
+(function (global) {
+  "use strict";
+  var script = document.currentScript;
+  var base = script ? script.src.replace(/[^\/]*$/, "") : "search/";
+  var meta = null, docs = null, shards = {};
+
+  function getJSON(path) {
+    return fetch(base + path).then(function (r) {
+      if (!r.ok) { throw new Error(path + ": " + r.status); }
+      return r.json();
+    });
+  }
+
+  function ready() {
+    if (!meta) {
+      meta = Promise.all([getJSON("meta.json"), getJSON("docs.json")]).then(function (res) {
+        docs = res[1];
+        return res[0];
+      });
+    }
+    return meta;
+  }
+
+  function tokenize(text, stopwords) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(function (t) {
+      return t.length > 1 && stopwords.indexOf(t) === -1;
+    });
+  }
+
+  function shard(m, term) {
+    var key = term.slice(0, m.prefix_length);
+    if (m.shards.indexOf(key) === -1) { return Promise.resolve({}); }
+    if (!shards[key]) { shards[key] = getJSON("shards/" + key + ".json"); }
+    return shards[key];
+  }
+
+  /* Every term must match; the last one also matches as a prefix. */
+  function search(query, limit) {
+    return ready().then(function (m) {
+      var terms = tokenize(query, m.stopwords);
+      return Promise.all(terms.map(function (t) { return shard(m, t); })).then(function (loaded) {
+        var scores = null;
+        terms.forEach(function (term, i) {
+          var hits = {}, table = loaded[i];
+          Object.keys(table).forEach(function (candidate) {
+            if (candidate !== term && (i !== terms.length - 1 || candidate.indexOf(term) !== 0)) { return; }
+            var list = table[candidate];
+            for (var j = 0; j < list.length; j += 2) {
+              hits[list[j]] = (hits[list[j]] || 0) + list[j + 1];
+            }
+          });
+          if (scores === null) { scores = hits; return; }
+          Object.keys(scores).forEach(function (d) {
+            if (d in hits) { scores[d] += hits[d]; } else { delete scores[d]; }
+          });
+        });
+        return Object.keys(scores || {}).sort(function (a, b) {
+          return scores[b] - scores[a] || a - b;
+        }).slice(0, limit || 50).map(function (d) {
+          var doc = docs[d];
+          return { href: doc[0], title: doc[1], snippet: doc[2], score: scores[d] };
+        });
+      });
+    });
+  }
+
+  function bind(input, output) {
+    var pending = 0;
+    input.addEventListener("input", function () {
+      var ticket = ++pending;
+      search(input.value).then(function (results) {
+        if (ticket !== pending) { return; }
+        output.innerHTML = "";
+        results.forEach(function (r) {
+          var li = document.createElement("li"), a = document.createElement("a");
+          var p = document.createElement("p");
+          a.href = r.href;
+          a.textContent = r.title;
+          p.textContent = r.snippet;
+          li.appendChild(a);
+          li.appendChild(p);
+          output.appendChild(li);
+        });
+      });
+    });
+  }
+
+  global.DarkSunSearch = { search: search, bind: bind };
+
+  var input = document.getElementById("search-input");
+  var output = document.getElementById("search-results");
+  if (input && output) { bind(input, output); }
+})(window);
+"""
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="generator" content="Dark Sun PF2E Pipeline">
+    <title>Dark Sun - Search</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+    <h1>Dark Sun - Search</h1>
+    <p class="back-to-master-toc">
+        <a href="table_of_contents.html">Back to Table of Contents</a>
+    </p>
+    <input id="search-input" type="search" placeholder="Search all chapters" autofocus>
+    <ul id="search-results"></ul>
+    <script src="{script_src}"></script>
+</body>
+</html>
+"""
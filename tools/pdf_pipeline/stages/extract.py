@@ -15,7 +15,9 @@ from ..base import BasePostProcessor, BaseProcessor
 from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
 from .. import generate_manifest, load_manifest
 from ..models import Section, Manifest, StructuredSection
+from ..utils.page_store import DEFAULT_PAGE_STORE_DIR, DEFAULT_STORE_MODES, PageStore
 from ..utils.parallel import run_process_pool, should_parallelize, get_max_workers
+from ..utils.profiling import profile_span
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,19 @@ def _extract_section_task(task: Dict[str, Any]) -> Dict[str, Any]:
     This function is called in parallel by SectionExtractionProcessor.
     It must be at module level to be picklable.
     
+    Args:
+        task: See ``_extract_section``
+        
+    Returns:
+        Dict with items, warnings, errors, and path
+    """
+    with profile_span("section", f"extract/{task['section'].get('slug')}"):
+        return _extract_section(task)
+
+
+def _extract_section(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract a single section from PDF (see ``_extract_section_task``).
+    
     Args:
         task: Dict containing:
             - pdf_path: Path to PDF file
@@ -33,6 +48,9 @@ def _extract_section_task(task: Dict[str, Any]) -> Dict[str, Any]:
             - output_path: Path where to write the output JSON
             - mode: "structured" or "legacy"
             - table_settings: Optional table detection settings
+            - page_store_dir: Optional page store root; extracted page text is
+              written there for later stages (structured mode only)
+            - page_store_modes: Modes to store (e.g. ["dict", "text"])
             
     Returns:
         Dict with items, warnings, errors, and path
@@ -46,6 +64,7 @@ def _extract_section_task(task: Dict[str, Any]) -> Dict[str, Any]:
         _structured_tables, _extract_structured_section, DEFAULT_TABLE_SETTINGS
     )
     from ..models import Section, StructuredSection
+    from ..utils.page_store import store_pages
     
     pdf_path = Path(task["pdf_path"])
     section_dict = task["section"]
@@ -95,6 +114,9 @@ def _extract_section_task(task: Dict[str, Any]) -> Dict[str, Any]:
             if table_settings:
                 settings.update(table_settings)
             
+            store_dir = task.get("page_store_dir")
+            page_capture = {mode: {} for mode in task.get("page_store_modes", [])} if store_dir else None
+            
             with fitz.open(pdf_path) as doc, pdfplumber.open(str(pdf_path)) as plumber_doc:
                 structured_section = _extract_structured_section(
                     doc,
@@ -102,12 +124,25 @@ def _extract_section_task(task: Dict[str, Any]) -> Dict[str, Any]:
                     section,
                     parent_slugs,
                     table_settings=settings,
+                    page_capture=page_capture,
                 )
                 
                 output_path.write_text(
                     json.dumps(structured_section.model_dump(), ensure_ascii=False, indent=2),
                     encoding="utf-8",
                 )
+            
+            if page_capture:
+                try:
+                    store_pages(
+                        Path(store_dir),
+                        pdf_path,
+                        ((page_number, {mode: captured[page_number] for mode, captured in page_capture.items()})
+                         for page_number in section.page_span),
+                        shard=section.slug,
+                    )
+                except OSError as e:
+                    warnings.append(f"Could not store page text for {section.slug}: {e}")
         
         return {
             "items": 1,
@@ -177,7 +212,11 @@ class ManifestProcessor(BaseProcessor):
 class SectionExtractionProcessor(BaseProcessor):
     """Processor for extracting sections from PDF based on manifest.
     
-    Supports parallel extraction when enabled via config.
+    Supports parallel extraction when enabled via config. In structured mode
+    each page's text is also written to the shared page store
+    (``page_store_dir``, modes ``page_store_modes``; disable with
+    ``page_store: false``) so later stages can read it without reopening
+    the PDF.
     """
     
     def process(self, input_data: ProcessorInput, context: ExecutionContext) -> ProcessorOutput:
@@ -197,6 +236,11 @@ class SectionExtractionProcessor(BaseProcessor):
         mode = self.config.get("mode", "structured")
         min_level = self.config.get("min_level", 2)
         table_settings = self.config.get("table_settings")
+        # Page text store read by later stages instead of reopening the PDF
+        page_store_dir = None
+        if self.config.get("page_store", True) and mode == "structured":
+            page_store_dir = str(self.config.get("page_store_dir", DEFAULT_PAGE_STORE_DIR))
+        page_store_modes = list(self.config.get("page_store_modes", DEFAULT_STORE_MODES))
         
         # Parallel config
         global_parallel = context.metadata.get("parallel", False)
@@ -207,6 +251,8 @@ class SectionExtractionProcessor(BaseProcessor):
         
         # Load manifest
         manifest = load_manifest(manifest_path)
+        if page_store_dir and pdf_path.exists():
+            PageStore(Path(page_store_dir), pdf_path).write_meta({"page_count": manifest.page_count})
         
         # Build task list for sections
         tasks = []
@@ -227,6 +273,8 @@ class SectionExtractionProcessor(BaseProcessor):
                 "output_path": str(output_path),
                 "mode": mode,
                 "table_settings": table_settings,
+                "page_store_dir": page_store_dir,
+                "page_store_modes": page_store_modes,
             }
             tasks.append(task)
         
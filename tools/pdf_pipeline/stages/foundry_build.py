@@ -6,13 +6,53 @@ following the domain model architecture.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from ..base import BaseProcessor
 from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
-from ..compendium import build_ancestry_pack, build_journal_pack
+from ..compendium import (
+    ENTITY_PACKS,
+    build_ancestry_pack,
+    build_entity_pack,
+    build_journal_pack,
+    pack_filename,
+)
+from ..leveldb_pack import DEFAULT_BATCH_SIZE
+from ..utils.entities import ENTITIES_DIRNAME, entity_file
+
+logger = logging.getLogger(__name__)
+
+# Bump when pack document layout changes so existing manifests are invalidated
+COMPENDIUM_VERSION = 2
+
+
+def _hash_file(path: Path) -> str:
+    """Return the sha256 of a file's contents, streamed in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_output(path: Path) -> str:
+    """Hash a pack file, or every file in a LevelDB pack directory."""
+    if not path.is_dir():
+        return _hash_file(path)
+    return _hash_inputs([p for p in path.rglob("*") if p.is_file()], path)
+
+
+def _hash_inputs(paths: List[Path], root: Path) -> str:
+    """Hash a set of input files by relative name and content."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(_hash_file(path).encode("ascii"))
+    return digest.hexdigest()
 
 
 class CompendiumBuildProcessor(BaseProcessor):
@@ -37,53 +77,175 @@ class CompendiumBuildProcessor(BaseProcessor):
         output_dir = Path(self.config.get("output_dir", "packs"))
         foundry_version = self.config.get("foundry_version", 13)
         system = self.config.get("system", "pf2e")
+        batch_size = self.config.get("batch_size", DEFAULT_BATCH_SIZE)
+        
+        manifest_file = Path(
+            self.config.get("manifest_file", output_dir / ".compendium_manifest.json")
+        )
         
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        manifest = self._load_manifest(manifest_file)
         built_compendia = []
+        skipped = []
         
         # Build ancestry compendium
         ancestry_file = converted_dir / "ancestries.json"
         if ancestry_file.exists():
-            ancestry_db = output_dir / "dark-sun-ancestries.db"
-            try:
-                build_ancestry_pack(ancestry_file, ancestry_db)
-                built_compendia.append({
-                    "name": "dark-sun-ancestries",
-                    "path": str(ancestry_db),
-                    "type": "ancestry"
-                })
-                context.items_processed += 1
-            except Exception as e:
-                context.errors.append(f"Error building ancestry compendium: {e}")
+            self._build_pack(
+                name="dark-sun-ancestries",
+                pack_type="ancestry",
+                inputs=[ancestry_file],
+                input_root=converted_dir,
+                builder=lambda db: build_ancestry_pack(
+                    ancestry_file, db, foundry_version, batch_size
+                ),
+                output_dir=output_dir,
+                foundry_version=foundry_version,
+                manifest=manifest,
+                built=built_compendia,
+                skipped=skipped,
+                context=context,
+            )
         
         # Build rules compendium (journals)
         journals_dir = converted_dir / "journals"
         if journals_dir.exists():
-            rules_db = output_dir / "dark-sun-rules.db"
-            try:
-                build_journal_pack(journals_dir, rules_db)
-                built_compendia.append({
-                    "name": "dark-sun-rules",
-                    "path": str(rules_db),
-                    "type": "journal"
-                })
-                context.items_processed += 1
-            except Exception as e:
-                context.errors.append(f"Error building rules compendium: {e}")
+            self._build_pack(
+                name="dark-sun-rules",
+                pack_type="journal",
+                inputs=list(journals_dir.glob("*.json")),
+                input_root=converted_dir,
+                builder=lambda db: build_journal_pack(
+                    journals_dir, db, foundry_version, batch_size
+                ),
+                output_dir=output_dir,
+                foundry_version=foundry_version,
+                manifest=manifest,
+                built=built_compendia,
+                skipped=skipped,
+                context=context,
+            )
+        
+        # Build item and actor compendia from the extracted entities
+        entities_dir = converted_dir / ENTITIES_DIRNAME
+        for pack_name, pack in ENTITY_PACKS.items():
+            if pack.get("held_back"):
+                continue
+            entity_files = [
+                path
+                for path in (entity_file(entity_type, entities_dir) for entity_type in pack["entities"])
+                if path.exists()
+            ]
+            if not entity_files:
+                continue
+            self._build_pack(
+                name=pack_name,
+                pack_type=pack["type"].lower(),
+                inputs=entity_files,
+                input_root=converted_dir,
+                builder=lambda db, pack_name=pack_name: build_entity_pack(
+                    entities_dir, db, pack_name, foundry_version, batch_size
+                ),
+                output_dir=output_dir,
+                foundry_version=foundry_version,
+                manifest=manifest,
+                built=built_compendia,
+                skipped=skipped,
+                context=context,
+            )
+        
+        self._save_manifest(manifest_file, manifest)
         
         return ProcessorOutput(
             data={
                 "output_dir": str(output_dir),
                 "compendia": built_compendia,
+                "manifest_file": str(manifest_file),
             },
             metadata={
                 "compendium_count": len(built_compendia),
+                "skipped_packs": skipped,
                 "foundry_version": foundry_version,
                 "system": system,
             }
         )
+    
+    def _build_pack(
+        self,
+        name: str,
+        pack_type: str,
+        inputs: List[Path],
+        input_root: Path,
+        builder: Callable[[Path], Path],
+        output_dir: Path,
+        foundry_version: int,
+        manifest: Dict[str, Any],
+        built: List[Dict[str, str]],
+        skipped: List[str],
+        context: ExecutionContext,
+    ) -> None:
+        """Build one pack unless its inputs and output match the manifest.
+        
+        Args:
+            name: Pack name (file stem)
+            pack_type: Pack content type reported in the output
+            inputs: Source files the pack is built from
+            input_root: Directory input paths are recorded relative to
+            builder: Callable writing the pack to the given path
+            output_dir: Pack output directory
+            foundry_version: Target Foundry version (selects the pack format)
+            manifest: Build manifest, updated in place
+            built: Built compendia list, appended to
+            skipped: Names of packs skipped as unchanged, appended to
+            context: Execution context
+        """
+        pack_db = output_dir / pack_filename(name, foundry_version)
+        try:
+            input_hash = _hash_inputs(inputs, input_root)
+            recorded = manifest["packs"].get(name)
+            if (
+                recorded
+                and recorded.get("input_hash") == input_hash
+                and pack_db.exists()
+                and recorded.get("output_hash") == _hash_output(pack_db)
+            ):
+                logger.info(f"Compendium {name} unchanged, skipping build")
+                skipped.append(name)
+                built.append({"name": name, "path": str(pack_db), "type": pack_type})
+                return
+            
+            builder(pack_db)
+            manifest["packs"][name] = {
+                "input_hash": input_hash,
+                "output_hash": _hash_output(pack_db),
+            }
+            built.append({"name": name, "path": str(pack_db), "type": pack_type})
+            context.items_processed += 1
+        except Exception as e:
+            label = {"ancestry": "ancestry", "journal": "rules"}.get(pack_type, name)
+            context.errors.append(f"Error building {label} compendium: {e}")
+    
+    @staticmethod
+    def _load_manifest(manifest_file: Path) -> Dict[str, Any]:
+        """Load the build manifest, discarding it if written by another version."""
+        if manifest_file.exists():
+            try:
+                manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+                if manifest.get("version") == COMPENDIUM_VERSION:
+                    return manifest
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable compendium manifest {manifest_file}: {e}")
+        return {"version": COMPENDIUM_VERSION, "packs": {}}
+    
+    @staticmethod
+    def _save_manifest(manifest_file: Path, manifest: Dict[str, Any]) -> None:
+        """Persist the build manifest."""
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        manifest_file.write_text(
+            json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+        )
 
 
 class ModuleMetadataProcessor(BaseProcessor):
@@ -108,6 +270,9 @@ class ModuleMetadataProcessor(BaseProcessor):
         title = self.config.get("title", "Dark Sun for PF2E")
         version = self.config.get("version", "1.0.0")
         compatibility = self.config.get("compatibility", {"minimum": "13", "verified": "13"})
+        foundry_version = int(
+            self.config.get("foundry_version", compatibility.get("minimum", "13"))
+        )
         
         # Build module.json structure
         module_data = {
@@ -129,7 +294,7 @@ class ModuleMetadataProcessor(BaseProcessor):
                 {
                     "name": "dark-sun-ancestries",
                     "label": "Dark Sun Ancestries",
-                    "path": "packs/dark-sun-ancestries.db",
+                    "path": f"packs/{pack_filename('dark-sun-ancestries', foundry_version)}",
                     "type": "Item",
                     "system": "pf2e",
                     "ownership": {
@@ -140,7 +305,7 @@ class ModuleMetadataProcessor(BaseProcessor):
                 {
                     "name": "dark-sun-rules",
                     "label": "Dark Sun Rules",
-                    "path": "packs/dark-sun-rules.db",
+                    "path": f"packs/{pack_filename('dark-sun-rules', foundry_version)}",
                     "type": "JournalEntry",
                     "system": "pf2e",
                     "ownership": {
@@ -164,6 +329,24 @@ class ModuleMetadataProcessor(BaseProcessor):
             "download": f"https://example.com/modules/{module_id}/module.zip"
         }
         
+        # Entity packs are only declared once the compendium build wrote them,
+        # and never while held back
+        for pack_name, pack in ENTITY_PACKS.items():
+            pack_path = f"packs/{pack_filename(pack_name, foundry_version)}"
+            if pack.get("held_back") or not (output_dir / pack_path).exists():
+                continue
+            module_data["packs"].append({
+                "name": pack_name,
+                "label": pack["label"],
+                "path": pack_path,
+                "type": pack["type"],
+                "system": "pf2e",
+                "ownership": {
+                    "PLAYER": "OBSERVER",
+                    "ASSISTANT": "OWNER"
+                }
+            })
+        
         # Write module.json
         module_json_path = output_dir / "module.json"
         module_json_path.write_text(
@@ -10,21 +10,135 @@ Requirements:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
 from ..base import BasePostProcessor, BaseProcessor
-from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
+from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput, ProcessorSpec
 from ..knowledge_base.adnd_schema import ADnDSourcebook
 from ..knowledge_base.knowledge_repository import RuleCategory
 from ..mapping.context_analyzer import DarkSunContext
 from ..mapping.semantic_mapper import MappingConfidence, SemanticMapper
+from ..utils.entities import ENTITIES_DIRNAME, load_entity_file, write_entity_file
+from ..utils.parallel import get_max_workers, run_process_pool, should_parallelize
 
 # Set up logging per PY-6
 logger = logging.getLogger(__name__)
 
+# Bump when converted output changes so cached outputs are rebuilt
+CONVERSION_VERSION = 2
+
+# Mappers built inside pool workers, one per knowledge base directory
+_WORKER_MAPPERS: Dict[str, SemanticMapper] = {}
+
+
+def _empty_mapping_stats() -> Dict[str, int]:
+    """Return a zeroed mapping statistics dict."""
+    return {
+        "high_confidence": 0,
+        "medium_confidence": 0,
+        "low_confidence": 0,
+        "unmappable": 0,
+    }
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the SHA-256 of a file without loading it whole.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _convert_file_task(
+    task: Dict[str, Any], mapper: Optional[SemanticMapper] = None
+) -> Dict[str, Any]:
+    """Worker function to convert a processed JSON file or copy an entity file.
+
+    Args:
+        task: Dict with input_file, output_file, relative_path, input_hash, config
+        mapper: Mapper to use; pool workers build and reuse their own
+
+    Returns:
+        Dict with items, warnings, errors, output_file and manifest entry data
+    """
+    input_file = Path(task["input_file"])
+    output_file = Path(task["output_file"])
+    config = task["config"]
+
+    if mapper is None:
+        kb_dir = config.get("knowledge_base_dir", "data/knowledge_base")
+        mapper = _WORKER_MAPPERS.get(kb_dir)
+        if mapper is None:
+            mapper = SemanticMapper(Path(kb_dir), DarkSunContext())
+            _WORKER_MAPPERS[kb_dir] = mapper
+
+    processor = ADnDToPF2EProcessor(ProcessorSpec(name="ADnDToPF2EProcessor", config=config))
+    local_context = ExecutionContext(pipeline_name="rules_conversion")
+    mapping_stats = _empty_mapping_stats()
+
+    try:
+        logger.debug(f"Processing {input_file.name}")
+        if input_file.suffix == ".jsonl":
+            processor._copy_entity_file(
+                input_file, output_file, config.get("preserve_flavor", True)
+            )
+            return {
+                "items": 1,
+                "warnings": local_context.warnings,
+                "errors": local_context.errors,
+                "relative_path": task["relative_path"],
+                "output_file": str(output_file),
+                "input_hash": task["input_hash"],
+                "mapping_stats": mapping_stats,
+            }
+
+        with input_file.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+
+        converted = processor._convert_with_mapper(
+            data, mapper, config.get("preserve_flavor", True), local_context, mapping_stats
+        )
+        del data
+
+        # Stream to a temp file so a crash never leaves a truncated output
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with tmp_file.open("w", encoding="utf-8") as fh:
+            json.dump(converted, fh, indent=2, ensure_ascii=False)
+        tmp_file.replace(output_file)
+
+        return {
+            "items": 1,
+            "warnings": local_context.warnings,
+            "errors": local_context.errors,
+            "relative_path": task["relative_path"],
+            "output_file": str(output_file),
+            "input_hash": task["input_hash"],
+            "mapping_stats": mapping_stats,
+        }
+
+    except Exception as e:
+        error_msg = f"Error converting {input_file.name}: {e}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            "items": 0,
+            "warnings": local_context.warnings,
+            "errors": local_context.errors + [error_msg],
+            "output_file": None,
+        }
+
 
 class ADnDToPF2EProcessor(BaseProcessor):
     """Processor for converting AD&D 2E rules to Pathfinder 2E equivalents.
@@ -36,6 +150,13 @@ class ADnDToPF2EProcessor(BaseProcessor):
     def process(self, input_data: ProcessorInput, context: ExecutionContext) -> ProcessorOutput:
         """Convert AD&D 2E rules to PF2E.
         
+        Processed JSON files are converted. The extracted entity files
+        (``entities/*.jsonl``) are copied through unmapped and marked
+        ``conversion_applied: "none"``. Files whose content hash matches the
+        conversion manifest (and whose output still exists) are skipped; the
+        rest are handled in a process pool when parallel execution is
+        enabled.
+        
         Args:
             input_data: Input containing processed AD&D 2E data
             context: Execution context
@@ -48,6 +169,14 @@ class ADnDToPF2EProcessor(BaseProcessor):
         output_dir = Path(self.config.get("output_dir", "data/pf2e_converted"))
         kb_dir = Path(self.config.get("knowledge_base_dir", "data/knowledge_base"))
         preserve_flavor = self.config.get("preserve_flavor", True)
+        coverage_report = self.config.get("coverage_report", True)
+        manifest_path = Path(
+            self.config.get("manifest_file", output_dir / "conversion_manifest.json")
+        )
+        
+        # Parallel config
+        global_parallel = context.metadata.get("parallel", False)
+        use_parallel = should_parallelize(self.config, global_parallel)
         
         logger.info(f"Starting AD&D 2E to PF2E conversion")
         logger.info(f"Knowledge base: {kb_dir}")
@@ -56,65 +185,264 @@ class ADnDToPF2EProcessor(BaseProcessor):
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize semantic mapper with Dark Sun context
+        # The mapper is only built when something needs it: a no-op rerun
+        # converts nothing and reuses the cached coverage report
         dark_sun_context = DarkSunContext()
-        mapper = SemanticMapper(kb_dir, dark_sun_context)
+        mapper: Optional[SemanticMapper] = None
         
-        converted_files = []
-        mapping_stats = {
-            "high_confidence": 0,
-            "medium_confidence": 0,
-            "low_confidence": 0,
-            "unmappable": 0,
+        def get_mapper() -> SemanticMapper:
+            nonlocal mapper
+            if mapper is None:
+                mapper = SemanticMapper(
+                    kb_dir, dark_sun_context, max_workers=self.config.get("max_workers")
+                )
+            return mapper
+        
+        config_hash = self._config_fingerprint(kb_dir, dark_sun_context, preserve_flavor)
+        manifest = self._load_manifest(manifest_path, config_hash)
+        worker_config = {
+            "knowledge_base_dir": str(kb_dir),
+            "preserve_flavor": preserve_flavor,
         }
         
-        # Process all JSON files in processed directory
-        for json_file in processed_dir.rglob("*.json"):
+        converted_files = []
+        mapping_stats = _empty_mapping_stats()
+        manifest_files: Dict[str, Any] = {}
+        tasks = []
+        skipped = 0
+        
+        input_files = sorted(processed_dir.rglob("*.json"))
+        input_files += sorted((processed_dir / ENTITIES_DIRNAME).glob("*.jsonl"))
+        entity_files = 0
+        
+        for input_file in input_files:
+            relative_path = input_file.relative_to(processed_dir).as_posix()
+            output_file = output_dir / relative_path
+            if input_file.suffix == ".jsonl":
+                entity_files += 1
             try:
-                logger.debug(f"Processing {json_file.name}")
-                data = json.loads(json_file.read_text(encoding="utf-8"))
-                
-                # Perform conversion using semantic mapper
-                converted_data = self._convert_with_mapper(
-                    data, mapper, preserve_flavor, context, mapping_stats
-                )
-                
-                # Write converted data
-                relative_path = json_file.relative_to(processed_dir)
-                output_file = output_dir / relative_path
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                output_file.write_text(
-                    json.dumps(converted_data, indent=2, ensure_ascii=False),
-                    encoding="utf-8"
-                )
-                
-                converted_files.append(str(output_file))
-                context.items_processed += 1
-                
-            except Exception as e:
-                error_msg = f"Error converting {json_file.name}: {e}"
+                input_hash = _hash_file(input_file)
+            except OSError as e:
+                error_msg = f"Error converting {input_file.name}: {e}"
                 context.errors.append(error_msg)
-                logger.error(error_msg, exc_info=True)
+                logger.error(error_msg)
+                continue
+            
+            entry = manifest["files"].get(relative_path)
+            if entry and entry.get("input_hash") == input_hash and output_file.exists():
+                logger.debug(f"Unchanged, skipping {relative_path}")
+                manifest_files[relative_path] = entry
+                converted_files.append(str(output_file))
+                for key, value in entry.get("mapping_stats", {}).items():
+                    mapping_stats[key] = mapping_stats.get(key, 0) + value
+                skipped += 1
+                continue
+            
+            tasks.append({
+                "input_file": str(input_file),
+                "output_file": str(output_file),
+                "relative_path": relative_path,
+                "input_hash": input_hash,
+                "config": worker_config,
+            })
+        
+        pruned = self._prune_stale_outputs(
+            manifest["files"],
+            {input_file.relative_to(processed_dir).as_posix() for input_file in input_files},
+            output_dir,
+        )
+        
+        logger.info(f"{len(tasks)} files to convert, {skipped} unchanged")
+        
+        if use_parallel and len(tasks) > 1:
+            result = run_process_pool(
+                tasks,
+                _convert_file_task,
+                max_workers=get_max_workers(self.config, default=4),
+                desc="rules conversion",
+            )
+            results = result["results"]
+            context.warnings.extend(result["warnings"])
+            context.errors.extend(result["errors"])
+        else:
+            results = []
+            for task in tasks:
+                task_result = _convert_file_task(task, get_mapper())
+                context.warnings.extend(task_result["warnings"])
+                context.errors.extend(task_result["errors"])
+                results.append(task_result)
+        
+        for task_result in results:
+            if not task_result.get("output_file"):
+                continue
+            converted_files.append(task_result["output_file"])
+            context.items_processed += task_result["items"]
+            for key, value in task_result["mapping_stats"].items():
+                mapping_stats[key] = mapping_stats.get(key, 0) + value
+            manifest_files[task_result["relative_path"]] = {
+                "input_hash": task_result["input_hash"],
+                "output_file": task_result["output_file"],
+                "mapping_stats": task_result["mapping_stats"],
+            }
+        
+        converted_files.sort()
         
         logger.info(
-            f"Conversion complete: {len(converted_files)} files, "
+            f"Conversion complete: {len(converted_files)} files "
+            f"({skipped} unchanged, {pruned} pruned), "
             f"{mapping_stats['high_confidence']} high confidence mappings"
         )
         
+        # Coverage depends only on the knowledge base, which is part of the
+        # config hash, so the cached report is valid while the manifest is
+        mapping_coverage = {}
+        if coverage_report:
+            if not tasks and "coverage" in manifest:
+                mapping_coverage = manifest["coverage"]
+            else:
+                mapping_coverage = self._build_coverage_report(get_mapper(), context)
+        
+        self._save_manifest(
+            manifest_path, config_hash, manifest_files,
+            mapping_coverage if coverage_report else None,
+        )
+        
         return ProcessorOutput(
             data={
                 "output_dir": str(output_dir),
                 "converted_files": converted_files,
                 "mapping_stats": mapping_stats,
+                "mapping_coverage": mapping_coverage,
+                "manifest_file": str(manifest_path),
             },
             metadata={
                 "file_count": len(converted_files),
+                "skipped_count": skipped,
+                "pruned_count": pruned,
+                "entity_file_count": entity_files,
                 "conversion_mode": "semantic_mapping",
                 "preserve_flavor": preserve_flavor,
+                "parallel": use_parallel,
             }
         )
     
+    def _config_fingerprint(
+        self, kb_dir: Path, dark_sun_context: DarkSunContext, preserve_flavor: bool
+    ) -> str:
+        """Hash everything besides the input file that affects conversion output.
+        
+        Args:
+            kb_dir: Knowledge base directory
+            dark_sun_context: Dark Sun context used by the mapper
+            preserve_flavor: Whether flavor text is preserved
+            
+        Returns:
+            Hex digest
+        """
+        index_file = kb_dir / "index.json"
+        fingerprint = {
+            "version": CONVERSION_VERSION,
+            "preserve_flavor": preserve_flavor,
+            "context": dark_sun_context.model_dump(mode="json"),
+            "kb_index": _hash_file(index_file) if index_file.exists() else None,
+        }
+        return hashlib.sha256(
+            json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    
+    def _load_manifest(self, manifest_path: Path, config_hash: str) -> Dict[str, Any]:
+        """Load the conversion manifest, discarding it if the config changed.
+        
+        Args:
+            manifest_path: Manifest file path
+            config_hash: Current configuration fingerprint
+            
+        Returns:
+            Manifest dict with a ``files`` mapping
+        """
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if manifest.get("config_hash") == config_hash:
+                    return manifest
+                logger.info("Conversion inputs changed, reconverting all files")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {"config_hash": config_hash, "files": {}}
+    
+    def _save_manifest(
+        self,
+        manifest_path: Path,
+        config_hash: str,
+        files: Dict[str, Any],
+        coverage: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write the conversion manifest.
+        
+        Args:
+            manifest_path: Manifest file path
+            config_hash: Current configuration fingerprint
+            files: Per-file manifest entries
+            coverage: Mapping coverage report to cache, if one was built
+        """
+        manifest = {
+            "version": CONVERSION_VERSION,
+            "config_hash": config_hash,
+            "files": dict(sorted(files.items())),
+        }
+        if coverage is not None:
+            manifest["coverage"] = coverage
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps(manifest, indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    
+    def _prune_stale_outputs(
+        self, previous: Dict[str, Any], inputs: Set[str], output_dir: Path
+    ) -> int:
+        """Delete outputs whose input file no longer exists.
+        
+        Args:
+            previous: Manifest entries from the last run
+            inputs: Relative paths of this run's input files
+            output_dir: Conversion output directory
+            
+        Returns:
+            Number of outputs removed
+        """
+        pruned = 0
+        for relative_path in sorted(set(previous) - inputs):
+            output_file = output_dir / relative_path
+            if output_file.is_file():
+                output_file.unlink()
+                logger.debug(f"Input removed, pruning {relative_path}")
+                pruned += 1
+        return pruned
+    
+    def _build_coverage_report(
+        self, mapper: SemanticMapper, context: ExecutionContext
+    ) -> Dict[str, Any]:
+        """Compute mapping coverage for every indexed sourcebook.
+        
+        Args:
+            mapper: Semantic mapper instance
+            context: Execution context
+            
+        Returns:
+            Coverage statistics keyed by sourcebook
+        """
+        coverage = {}
+        for sourcebook_name in mapper.repo.index["adnd_2e"].keys():
+            try:
+                sourcebook = ADnDSourcebook(sourcebook_name)
+                coverage[sourcebook_name] = mapper.analyze_mapping_coverage(sourcebook)
+            except Exception as e:
+                warning_msg = f"Coverage analysis failed for {sourcebook_name}: {e}"
+                context.warnings.append(warning_msg)
+                logger.warning(warning_msg)
+        return coverage
+    
     def _convert_with_mapper(
         self,
         data: Dict[str, Any],
@@ -135,7 +463,8 @@ class ADnDToPF2EProcessor(BaseProcessor):
         Returns:
             Converted PF2E data
         """
-        converted = data.copy()
+        # The caller owns ``data``; annotate it in place rather than copying
+        converted = data
         converted["conversion_applied"] = "semantic_mapping"
         converted["pf2e_compatible"] = True
         
@@ -155,6 +484,33 @@ class ADnDToPF2EProcessor(BaseProcessor):
         
         return converted
 
+    def _copy_entity_file(
+        self,
+        input_file: Path,
+        output_file: Path,
+        preserve_flavor: bool,
+    ) -> None:
+        """Copy an entity file to the output, keeping its columnar layout.
+        
+        Records are not mapped yet: they keep their AD&D values, the header
+        marks the file as unconverted and no mapping is counted for them.
+        
+        Args:
+            input_file: Entity file under the processed directory
+            output_file: Entity file to write
+            preserve_flavor: Whether to preserve flavor text
+        """
+        header, rows = load_entity_file(input_file)
+        write_entity_file(
+            output_file,
+            header["entity"],
+            rows,
+            conversion_applied="none",
+            pf2e_compatible=False,
+            preserve_flavor=preserve_flavor,
+        )
+        logger.debug(f"Copied {len(rows)} unconverted {header['entity']} entities")
+
 
 class RulesValidationPostProcessor(BasePostProcessor):
     """PostProcessor for validating converted rules for PF2E compliance.
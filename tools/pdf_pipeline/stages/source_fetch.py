@@ -31,6 +31,7 @@ class SourceFetchProcessor(BaseProcessor):
     FETCH-3: MUST skip files that already exist.
     FETCH-4: MUST use parallel downloads with auto-detected thread count.
     FETCH-5: MUST extract ZIP files and create markers.
+    FETCH-6: MUST extract ZIP files in a worker pool overlapped with downloads.
     """
 
     def process(
@@ -57,6 +58,7 @@ class SourceFetchProcessor(BaseProcessor):
             "https://archive.org/download/advanced-dungeons-dragons-2nd-edition"
         )
         max_workers = self.config.get("max_workers", None)
+        extract_workers = self.config.get("extract_workers", None)
         
         # Auto-detect optimal threads if not specified
         if max_workers is None:
@@ -65,7 +67,7 @@ class SourceFetchProcessor(BaseProcessor):
 
         # Initialize fetcher
         sources_dir.mkdir(parents=True, exist_ok=True)
-        fetcher = ArchiveOrgFetcher(sources_dir)
+        fetcher = ArchiveOrgFetcher(sources_dir, pool_size=max_workers)
 
         # Initialize statistics
         stats = {
@@ -74,6 +76,7 @@ class SourceFetchProcessor(BaseProcessor):
             "failed": 0,
             "skipped": 0,
             "extracted": 0,
+            "extract_failed": 0,
         }
 
         try:
@@ -96,6 +99,7 @@ class SourceFetchProcessor(BaseProcessor):
 
             # Step 4: Filter existing files
             logger.info("\n✅ Step 4: Filtering for missing files...")
+            fetcher.apply_file_metadata(unique_files, fetcher.fetch_file_metadata())
             missing_files = fetcher.filter_existing_files(unique_files)
 
             stats["total"] = len(missing_files)
@@ -129,7 +133,9 @@ class SourceFetchProcessor(BaseProcessor):
             )
             logger.info("-" * 80)
 
-            fetcher.download_files_parallel(missing_files, stats, max_workers=max_workers)
+            fetcher.download_files_parallel(
+                missing_files, stats, max_workers=max_workers, extract_workers=extract_workers
+            )
             context.items_processed += len(missing_files)
 
             # Display final statistics
@@ -141,7 +147,12 @@ class SourceFetchProcessor(BaseProcessor):
                 context.warnings.append(
                     f"{stats['failed']} source files failed to download"
                 )
-            else:
+            if stats["extract_failed"] > 0:
+                logger.warning(f"\n⚠️  {stats['extract_failed']} ZIP file(s) failed to extract")
+                context.warnings.append(
+                    f"{stats['extract_failed']} source ZIP files failed to extract"
+                )
+            if not stats["failed"] and not stats["extract_failed"]:
                 logger.info("\n✅ All downloads completed successfully!")
 
             return ProcessorOutput(
@@ -156,6 +167,7 @@ class SourceFetchProcessor(BaseProcessor):
                     "failed": stats["failed"],
                     "skipped": stats["skipped"],
                     "extracted": stats["extracted"],
+                    "extract_failed": stats["extract_failed"],
                 },
             )
 
@@ -172,6 +184,9 @@ class SourceFetchProcessor(BaseProcessor):
             context.errors.append(f"Source fetch failed: {str(e)}")
             raise
 
+        finally:
+            fetcher.close()
+
 
 class PF2ESourceFetchProcessor(BaseProcessor):
     """
@@ -14,7 +14,10 @@ from typing import Any, Dict, List
 from ..base import BaseProcessor
 from ..domain import ExecutionContext, ProcessorInput, ProcessorOutput
 from ..transformers import REGISTRY as TRANSFORMER_REGISTRY
+from ..utils.artifacts import collect_artifacts, merge_artifacts
 from ..utils.parallel import run_process_pool, should_parallelize, get_max_workers
+from ..utils.profiling import profile_span
+from ..utils.regex_registry import regex_scope
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +29,18 @@ def _transform_journal_task(task: Dict[str, Any]) -> Dict[str, Any]:
         task: Dict with section_file, output_file, slug, config, etc.
         
     Returns:
-        Dict with items, warnings, errors, and output_file
+        Dict with items, warnings, errors, output_file, and artifacts
+        (see utils.artifacts)
     """
+    slug = task["slug"]
+    with collect_artifacts() as artifacts, regex_scope(slug), profile_span("section", f"transform/{slug}"):
+        result = _transform_journal(task)
+    result["artifacts"] = artifacts
+    return result
+
+
+def _transform_journal(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a single section to journal (see ``_transform_journal_task``)."""
     from pathlib import Path
     import json
     from ..transformers import REGISTRY as TRANSFORMER_REGISTRY
@@ -190,8 +203,9 @@ class JournalTransformProcessor(BaseProcessor):
                         context.warnings.append(f"Failed to read {section_file.name}: {e}")
                         continue
         
-        # Transform (parallel or sequential)
+        # Transform (parallel or sequential), then merge side artifacts once
         transformed_files = []
+        artifacts = []
         if use_parallel and len(tasks) > 1:
             max_workers = get_max_workers(self.config, default=4)
             chunksize = int(self.config.get("chunksize", 1))
@@ -208,6 +222,7 @@ class JournalTransformProcessor(BaseProcessor):
             context.items_processed = result["items_processed"]
             context.warnings.extend(result["warnings"])
             context.errors.extend(result["errors"])
+            artifacts = result["artifacts"]
             transformed_files = sorted([r["output_file"] for r in result["results"] if r.get("output_file")])
         
         else:
@@ -218,10 +233,13 @@ class JournalTransformProcessor(BaseProcessor):
                 context.items_processed += result["items"]
                 context.warnings.extend(result["warnings"])
                 context.errors.extend(result["errors"])
+                artifacts.extend(result["artifacts"])
                 if result.get("output_file"):
                     transformed_files.append(result["output_file"])
             transformed_files = sorted(transformed_files)
         
+        context.errors.extend(merge_artifacts(artifacts))
+        
         return ProcessorOutput(
             data={
                 "output_dir": str(output_dir),
@@ -1,13 +1,20 @@
 """Validation processor: OCRValidationProcessor.
 
 This module contains the OCRValidationProcessor for the Dark Sun PDF pipeline.
+
+By default the PDF's text layer is checked first and only suspicious pages
+(empty, garbled, or involved in an ordering disagreement) are OCRed. The text
+layer comes from the page store written during extraction when available.
+Pages are rendered with PyMuPDF and OCRed in a process pool. Each page's text
+is cached under a key built from the PDF content hash, page number, DPI and
+Tesseract config, so changing the sampled pages only OCRs pages that have not
+been seen before.
 """
 
 from __future__ import annotations
 
 try:
     import pytesseract
-    from pdf2image import convert_from_path
     from PIL import Image
     TESSERACT_AVAILABLE = True
 except ImportError:
@@ -15,13 +22,125 @@ except ImportError:
 
 import fitz  # PyMuPDF
 
+import hashlib
 import json
+import logging
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...base import BaseProcessor
 from ...domain import ExecutionContext, ProcessorInput, ProcessorOutput
+from ...utils.page_store import DEFAULT_PAGE_STORE_DIR, SourcePageService, get_page_service
+from ...utils.parallel import get_max_workers, run_process_pool, should_parallelize
+
+# Set up logging per PY-6
+logger = logging.getLogger(__name__)
+
+OCR_CACHE_VERSION = 1
+DEFAULT_OCR_DPI = 200
+
+# A text layer with fewer common words than this ratio is treated as garbled
+DEFAULT_MIN_WORD_RATIO = 0.15
+# Pages with fewer words than this are too short to judge (titles, maps, tables)
+MIN_WORDS_FOR_RATIO = 40
+
+# High-frequency English words; ordinary prose is roughly 40% these
+COMMON_WORDS = frozenset(
+    "a about after all also an and any are as at be been but by can could each "
+    "for from had has have he her his if in into is it its may more must no "
+    "not of on one only or other out over some such than that the their them "
+    "then there these they this those through to up upon was were what when "
+    "which while who will with would you your".split()
+)
+_WORD_RE = re.compile(r"[A-Za-z]+")
+
+# PDF opened by the current worker process, keyed by (path, mtime, size)
+_WORKER_DOCUMENT: Dict[str, Any] = {"key": None, "doc": None}
+
+
+def _hash_pdf(pdf_path: Path) -> str:
+    """Compute the SHA-256 of a PDF's bytes.
+    
+    Args:
+        pdf_path: PDF file
+        
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _page_cache_file(
+    cache_dir: Path, pdf_hash: str, page_num: int, dpi: int, tesseract_config: str
+) -> Path:
+    """Return the cache file for one OCRed page.
+    
+    Args:
+        cache_dir: OCR cache root
+        pdf_hash: SHA-256 of the PDF
+        page_num: Page number (1-indexed)
+        dpi: Render resolution
+        tesseract_config: Tesseract command-line config
+        
+    Returns:
+        Path of the page's cache entry
+    """
+    key = hashlib.sha256(
+        f"{OCR_CACHE_VERSION}|{dpi}|{tesseract_config}".encode("utf-8")
+    ).hexdigest()[:16]
+    return cache_dir / pdf_hash[:16] / f"p{page_num:04d}_{key}.json"
+
+
+def _ocr_pages_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Render and OCR a batch of pages (process pool worker).
+    
+    Each page's text is written to its cache file as soon as it is read, so
+    an interrupted run keeps the pages it finished.
+    
+    Args:
+        task: Dict with pdf_path, dpi, tesseract_config and pages, a list of
+            (page_num, cache_file or None) pairs
+        
+    Returns:
+        Result dict with items, warnings, errors and texts ({page_num: text})
+    """
+    pdf_path = task["pdf_path"]
+    stat = Path(pdf_path).stat()
+    key = (pdf_path, stat.st_mtime_ns, stat.st_size)
+    if _WORKER_DOCUMENT["key"] != key:
+        if _WORKER_DOCUMENT["doc"] is not None:
+            _WORKER_DOCUMENT["doc"].close()
+        _WORKER_DOCUMENT.update(key=key, doc=fitz.open(pdf_path))
+    doc = _WORKER_DOCUMENT["doc"]
+    
+    texts: Dict[int, str] = {}
+    for page_num, cache_file in task["pages"]:
+        pix = doc[page_num - 1].get_pixmap(dpi=task["dpi"], colorspace=fitz.csGRAY)
+        image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        text = pytesseract.image_to_string(image, config=task["tesseract_config"])
+        texts[page_num] = text
+        
+        if cache_file:
+            cache_path = Path(cache_file)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({
+                    "page": page_num,
+                    "dpi": task["dpi"],
+                    "tesseract_config": task["tesseract_config"],
+                    "text": text,
+                }),
+                encoding="utf-8",
+            )
+            tmp_path.replace(cache_path)
+    
+    return {"items": len(texts), "warnings": [], "errors": [], "texts": texts}
 
 
 class OCRValidationProcessor(BaseProcessor):
@@ -42,14 +161,15 @@ class OCRValidationProcessor(BaseProcessor):
         Returns:
             ProcessorOutput with validation results and correction suggestions
         """
-        if not TESSERACT_AVAILABLE:
+        text_layer_first = self.config.get("text_layer_first", True)
+        if not TESSERACT_AVAILABLE and not text_layer_first:
             context.warnings.append("OCR libraries not available - skipping OCR validation")
             return ProcessorOutput(
                 data={
                     "skipped": True,
                     "reason": "OCR libraries not installed",
                     "errors": [],
-                    "warnings": ["Install pytesseract, pdf2image, and Pillow for OCR validation"],
+                    "warnings": ["Install pytesseract and Pillow for OCR validation"],
                 },
                 metadata={"skipped": True}
             )
@@ -80,21 +200,41 @@ class OCRValidationProcessor(BaseProcessor):
             errors.append(f"Failed to load manifest: {e}")
             return self._error_output(errors, warnings, context)
         
-        # Extract OCR text from PDF
+        # Load structured sections for comparison
+        structured_sections = self._load_structured_sections(structured_dir)
+        parallel = should_parallelize(self.config, context.metadata.get("parallel", False))
+        
+        # Extract text from PDF: text layer first, OCR for suspicious pages
+        ocr_stats: Dict[str, Any] = {}
         try:
-            ocr_text, ocr_sections = self._extract_ocr_text(
-                pdf_path, 
-                ocr_cache_dir if use_cache else None,
-                sample_pages
-            )
+            if text_layer_first:
+                ocr_text, ocr_sections = self._extract_two_tier(
+                    pdf_path,
+                    ocr_cache_dir if use_cache else None,
+                    sample_pages,
+                    structured_sections,
+                    expected_order,
+                    parallel=parallel,
+                    stats=ocr_stats,
+                )
+                if ocr_stats.get("skipped_ocr"):
+                    warnings.append(
+                        f"OCR libraries not available - {ocr_stats['skipped_ocr']} "
+                        f"suspicious pages validated from the text layer only"
+                    )
+            else:
+                ocr_text, ocr_sections = self._extract_ocr_text(
+                    pdf_path, 
+                    ocr_cache_dir if use_cache else None,
+                    sample_pages,
+                    parallel=parallel,
+                    stats=ocr_stats,
+                )
             context.items_processed += 1
         except Exception as e:
             errors.append(f"OCR extraction failed: {e}")
             return self._error_output(errors, warnings, context)
         
-        # Load structured sections for comparison
-        structured_sections = self._load_structured_sections(structured_dir)
-        
         # Compare ordering
         ordering_issues = self._compare_ordering(
             ocr_text,
@@ -141,14 +281,32 @@ class OCRValidationProcessor(BaseProcessor):
                 "structured_sections": len(structured_sections),
                 "issues_found": len(ordering_issues),
                 "corrections_generated": len(corrections),
+                "ocr_pages": ocr_stats,
             }
         )
     
+    def _select_pages(self, pdf_path: Path, sample_pages: Optional[List[int]]) -> List[int]:
+        """Resolve the pages to validate.
+        
+        Args:
+            pdf_path: Path to PDF file
+            sample_pages: Optional list of page numbers (1-indexed)
+            
+        Returns:
+            Sorted page numbers (1-indexed) present in the PDF
+        """
+        page_count = self._page_service(pdf_path).page_count()
+        if sample_pages:
+            return sorted({p for p in sample_pages if 0 < p <= page_count})
+        return list(range(1, page_count + 1))
+    
     def _extract_ocr_text(
         self, 
         pdf_path: Path, 
         cache_dir: Optional[Path] = None,
-        sample_pages: Optional[List[int]] = None
+        sample_pages: Optional[List[int]] = None,
+        parallel: bool = False,
+        stats: Optional[Dict[str, Any]] = None,
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """Extract text from PDF using OCR.
         
@@ -156,76 +314,246 @@ class OCRValidationProcessor(BaseProcessor):
             pdf_path: Path to PDF file
             cache_dir: Directory to cache OCR results
             sample_pages: Optional list of page numbers to process (1-indexed)
+            parallel: Whether to OCR pages in a process pool
+            stats: Dictionary to fill with page counts (pages, cached, ocr)
             
         Returns:
             Tuple of (full OCR text, list of detected sections with page info)
         """
-        # Check cache first
-        if cache_dir:
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / f"{pdf_path.stem}_ocr.json"
+        pages_to_process = self._select_pages(pdf_path, sample_pages)
+        texts = self._ocr_pages(pdf_path, cache_dir, pages_to_process, parallel, stats)
+        return self._combine_pages(texts)
+    
+    def _ocr_pages(
+        self,
+        pdf_path: Path,
+        cache_dir: Optional[Path],
+        pages: List[int],
+        parallel: bool = False,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> Dict[int, str]:
+        """OCR pages, reusing cached results.
+        
+        Cached pages are read back directly; the remaining pages are rendered
+        and OCRed in batches of ``ocr_batch_size`` pages, across a process
+        pool when ``parallel`` is set.
+        
+        Args:
+            pdf_path: Path to PDF file
+            cache_dir: Directory to cache OCR results
+            pages: Page numbers to OCR (1-indexed)
+            parallel: Whether to OCR pages in a process pool
+            stats: Dictionary to fill with page counts (pages, cached, ocr)
             
-            if cache_file.exists():
-                try:
-                    cached = json.loads(cache_file.read_text(encoding="utf-8"))
-                    return cached["text"], cached["sections"]
-                except Exception:
-                    pass  # Cache invalid, regenerate
-        
-        # Open PDF with PyMuPDF for metadata
-        doc = fitz.open(pdf_path)
-        page_count = len(doc)
-        
-        # Determine which pages to process
-        if sample_pages:
-            pages_to_process = [p - 1 for p in sample_pages if 0 < p <= page_count]
+        Returns:
+            Mapping of page number to OCR text
+            
+        Raises:
+            RuntimeError: If any page fails to OCR
+        """
+        dpi = int(self.config.get("ocr_dpi", DEFAULT_OCR_DPI))
+        tesseract_config = self.config.get("tesseract_config", "")
+        batch_size = max(1, int(self.config.get("ocr_batch_size", 5)))
+        
+        texts: Dict[int, str] = {}
+        pending: List[Tuple[int, Optional[str]]] = []
+        pdf_hash = _hash_pdf(pdf_path) if cache_dir and pages else ""
+        for page_num in pages:
+            cache_file = None
+            if cache_dir:
+                cache_file = _page_cache_file(cache_dir, pdf_hash, page_num, dpi, tesseract_config)
+                if cache_file.exists():
+                    try:
+                        texts[page_num] = json.loads(cache_file.read_text(encoding="utf-8"))["text"]
+                        continue
+                    except (OSError, ValueError, KeyError):
+                        pass  # Cache entry invalid, OCR again
+            pending.append((page_num, str(cache_file) if cache_file else None))
+        
+        tasks = [
+            {
+                "pdf_path": str(pdf_path),
+                "dpi": dpi,
+                "tesseract_config": tesseract_config,
+                "pages": pending[i:i + batch_size],
+            }
+            for i in range(0, len(pending), batch_size)
+        ]
+        logger.info(f"OCR: {len(pages)} pages, {len(texts)} cached, {len(pending)} to OCR")
+        
+        if parallel and len(tasks) > 1:
+            result = run_process_pool(
+                tasks,
+                _ocr_pages_task,
+                max_workers=get_max_workers({"max_workers": self.config.get("ocr_workers")}),
+                chunksize=self.config.get("ocr_chunksize", 1),
+                desc="OCR validation",
+            )
+            if result["errors"]:
+                raise RuntimeError("; ".join(result["errors"]))
+            results = result["results"]
         else:
-            pages_to_process = list(range(page_count))
+            results = [_ocr_pages_task(task) for task in tasks]
+        
+        for task_result in results:
+            texts.update(task_result["texts"])
         
-        doc.close()
+        if stats is not None:
+            stats.update(pages=len(pages), cached=len(pages) - len(pending), ocr=len(pending))
+        return texts
+    
+    def _combine_pages(self, texts: Dict[int, str]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Join page texts and detect section headers in page order.
         
-        # Convert PDF pages to images and OCR
+        Args:
+            texts: Mapping of page number to text
+            
+        Returns:
+            Tuple of (full text, list of detected sections with page info)
+        """
         full_text = []
         sections = []
+        for page_num in sorted(texts):
+            full_text.append(texts[page_num])
+            sections.extend(self._detect_section_headers(texts[page_num], page_num))
+        return "\n\n".join(full_text), sections
+    
+    def _extract_text_layer(self, pdf_path: Path, pages: List[int]) -> Dict[int, str]:
+        """Read the embedded text layer of pages.
+        
+        Args:
+            pdf_path: Path to PDF file
+            pages: Page numbers (1-indexed)
+            
+        Returns:
+            Mapping of page number to text
+        """
+        service = self._page_service(pdf_path)
+        return {page_num: service.text(page_num) for page_num in pages}
+    
+    def _page_service(self, pdf_path: Path) -> SourcePageService:
+        """Return the shared page service, reading the extraction page store.
         
-        # Process in batches to manage memory
-        batch_size = 10
-        for batch_start in range(0, len(pages_to_process), batch_size):
-            batch_pages = pages_to_process[batch_start:batch_start + batch_size]
+        Args:
+            pdf_path: Path to PDF file
             
-            # Convert pages to images
-            images = convert_from_path(
-                str(pdf_path),
-                first_page=batch_pages[0] + 1,
-                last_page=batch_pages[-1] + 1,
-                dpi=200
-            )
+        Returns:
+            SourcePageService for the PDF
+        """
+        store_dir = self.config.get("page_store_dir", DEFAULT_PAGE_STORE_DIR)
+        return get_page_service(pdf_path, Path(store_dir) if store_dir else None)
+    
+    def _is_garbled(self, text: str) -> bool:
+        """Check whether a page's text layer looks garbled.
+        
+        Args:
+            text: Text layer of one page
             
-            # OCR each image
-            for idx, image in enumerate(images):
-                page_num = batch_pages[idx]
-                text = pytesseract.image_to_string(image)
-                full_text.append(text)
-                
-                # Detect section headers (chapters, major headings)
-                section_headers = self._detect_section_headers(text, page_num + 1)
-                sections.extend(section_headers)
-        
-        combined_text = "\n\n".join(full_text)
-        
-        # Cache results
-        if cache_dir:
-            cache_data = {
-                "text": combined_text,
-                "sections": sections,
-                "page_count": len(pages_to_process),
-            }
-            cache_file.write_text(
-                json.dumps(cache_data, indent=2),
-                encoding="utf-8"
+        Returns:
+            True if the page has enough words to judge and too few are common
+            English words
+        """
+        words = [w.lower() for w in _WORD_RE.findall(text)]
+        if len(words) < MIN_WORDS_FOR_RATIO:
+            return False
+        ratio = sum(1 for w in words if w in COMMON_WORDS) / len(words)
+        return ratio < self.config.get("min_word_ratio", DEFAULT_MIN_WORD_RATIO)
+    
+    def _suspicious_pages(
+        self,
+        texts: Dict[int, str],
+        sections: List[Dict[str, Any]],
+        structured_sections: Dict[str, Dict[str, Any]],
+        expected_order: List[str],
+    ) -> Dict[int, str]:
+        """Find pages whose text layer cannot be trusted for ordering checks.
+        
+        Args:
+            texts: Text layer per page
+            sections: Section headers detected in the text layer
+            structured_sections: Structured section metadata
+            expected_order: Expected section order from manifest
+            
+        Returns:
+            Mapping of page number to reason (empty, garbled, ordering, missing)
+        """
+        suspicious: Dict[int, str] = {}
+        for page_num, text in texts.items():
+            if not text.strip():
+                suspicious[page_num] = "empty"
+            elif self._is_garbled(text):
+                suspicious[page_num] = "garbled"
+        
+        matches = self._match_sections(sections, structured_sections)
+        pages_by_slug: Dict[str, List[int]] = {}
+        for match in matches:
+            pages_by_slug.setdefault(match["structured_slug"], []).append(match["ocr_section"]["page"])
+        
+        # Pages whose headers disagree with the expected order
+        issues = self._compare_ordering("", sections, structured_sections, expected_order)
+        for issue in issues:
+            if issue["type"] != "order_mismatch":
+                continue
+            for slug in (issue["detected_slug"], issue["previous_slug"]):
+                for page_num in pages_by_slug.get(slug, []):
+                    suspicious.setdefault(page_num, "ordering")
+        
+        # Start pages of expected sections the text layer did not find
+        for slug in expected_order:
+            start_page = structured_sections.get(slug, {}).get("start_page")
+            if slug not in pages_by_slug and start_page in texts:
+                suspicious.setdefault(start_page, "missing")
+        
+        return suspicious
+    
+    def _extract_two_tier(
+        self,
+        pdf_path: Path,
+        cache_dir: Optional[Path],
+        sample_pages: Optional[List[int]],
+        structured_sections: Dict[str, Dict[str, Any]],
+        expected_order: List[str],
+        parallel: bool = False,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Extract text from the text layer, OCRing only suspicious pages.
+        
+        Args:
+            pdf_path: Path to PDF file
+            cache_dir: Directory to cache OCR results
+            sample_pages: Optional list of page numbers to process (1-indexed)
+            structured_sections: Structured section metadata
+            expected_order: Expected section order from manifest
+            parallel: Whether to OCR pages in a process pool
+            stats: Dictionary to fill with page counts, including text_layer
+                pages and suspicious pages by reason
+            
+        Returns:
+            Tuple of (full text, list of detected sections with page info)
+        """
+        pages = self._select_pages(pdf_path, sample_pages)
+        texts = self._extract_text_layer(pdf_path, pages)
+        _, sections = self._combine_pages(texts)
+        suspicious = self._suspicious_pages(texts, sections, structured_sections, expected_order)
+        
+        reasons: Dict[str, int] = {}
+        for reason in suspicious.values():
+            reasons[reason] = reasons.get(reason, 0) + 1
+        logger.info(
+            f"Text layer: {len(pages)} pages, {len(suspicious)} suspicious {reasons or ''}"
+        )
+        
+        page_stats: Dict[str, Any] = {"pages": 0, "cached": 0, "ocr": 0}
+        if suspicious and TESSERACT_AVAILABLE:
+            texts.update(
+                self._ocr_pages(pdf_path, cache_dir, sorted(suspicious), parallel, page_stats)
             )
+        else:
+            page_stats["skipped_ocr"] = len(suspicious)
         
-        return combined_text, sections
+        if stats is not None:
+            stats.update(page_stats, text_layer=len(pages), suspicious=reasons)
+        return self._combine_pages(texts)
     
     def _detect_section_headers(self, text: str, page_num: int) -> List[Dict[str, Any]]:
         """Detect section headers in OCR text.
@@ -281,6 +609,7 @@ class OCRValidationProcessor(BaseProcessor):
                     "slug": slug,
                     "title": data.get("title", ""),
                     "pages": data.get("metadata", {}).get("pages", []),
+                    "start_page": data.get("start_page"),
                     "section_number": data.get("metadata", {}).get("section_number", ""),
                 }
             except Exception:
@@ -307,30 +636,7 @@ class OCRValidationProcessor(BaseProcessor):
             List of ordering issues found
         """
         issues = []
-        
-        # Sort OCR sections by page number
-        ocr_sections_sorted = sorted(ocr_sections, key=lambda x: x["page"])
-        
-        # Try to match OCR sections to structured sections
-        ocr_to_structured = []
-        
-        for ocr_section in ocr_sections_sorted:
-            # Attempt to match by title
-            best_match = None
-            best_score = 0
-            
-            for slug, struct_data in structured_sections.items():
-                score = self._title_similarity(ocr_section["title"], struct_data["title"])
-                if score > best_score and score > 0.5:  # Threshold
-                    best_score = score
-                    best_match = slug
-            
-            if best_match:
-                ocr_to_structured.append({
-                    "ocr_section": ocr_section,
-                    "structured_slug": best_match,
-                    "match_score": best_score,
-                })
+        ocr_to_structured = self._match_sections(ocr_sections, structured_sections)
         
         # Compare detected order with expected order
         detected_order = [item["structured_slug"] for item in ocr_to_structured]
@@ -372,6 +678,42 @@ class OCRValidationProcessor(BaseProcessor):
         
         return issues
     
+    def _match_sections(
+        self,
+        ocr_sections: List[Dict[str, Any]],
+        structured_sections: Dict[str, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Match detected section headers to structured sections by title.
+        
+        Args:
+            ocr_sections: Sections detected from OCR or the text layer
+            structured_sections: Structured section metadata
+            
+        Returns:
+            Matches in page order, each with ocr_section, structured_slug and match_score
+        """
+        ocr_to_structured = []
+        
+        for ocr_section in sorted(ocr_sections, key=lambda x: x["page"]):
+            # Attempt to match by title
+            best_match = None
+            best_score = 0
+            
+            for slug, struct_data in structured_sections.items():
+                score = self._title_similarity(ocr_section["title"], struct_data["title"])
+                if score > best_score and score > 0.5:  # Threshold
+                    best_score = score
+                    best_match = slug
+            
+            if best_match:
+                ocr_to_structured.append({
+                    "ocr_section": ocr_section,
+                    "structured_slug": best_match,
+                    "match_score": best_score,
+                })
+        
+        return ocr_to_structured
+    
     def _title_similarity(self, title1: str, title2: str) -> float:
         """Calculate similarity between two titles.
         
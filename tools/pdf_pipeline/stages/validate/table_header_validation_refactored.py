@@ -1,450 +0,0 @@
-"""Validation processor: TableHeaderValidationProcessor (Refactored).
-
-This module contains the TableHeaderValidationProcessor for the Dark Sun PDF pipeline.
-Refactored to follow best practices - no function exceeds 250 lines.
-"""
-
-from __future__ import annotations
-
-import json
-import logging
-import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-from ...base import BaseProcessor
-from ...domain import ExecutionContext, ProcessorInput, ProcessorOutput
-
-logger = logging.getLogger(__name__)
-
-
-class TableHeaderValidationProcessor(BaseProcessor):
-    """Processor for validating table header metadata.
-    
-    Ensures that tables with header rows have the header_rows metadata set correctly.
-    This prevents tables from rendering with <td> tags in header rows instead of <th> tags.
-    
-    Also checks for specific tables that must exist in certain chapters.
-    """
-    
-    def __init__(self, *args, **kwargs):
-        """Initialize validation processor."""
-        super().__init__(*args, **kwargs)
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.tables_checked = 0
-        self.tables_with_issues = 0
-    
-    def process(self, input_data: ProcessorInput, context: ExecutionContext) -> ProcessorOutput:
-        """Validate table headers and content structure.
-        
-        Main orchestrator that delegates to specialized validation methods.
-        
-        Args:
-            input_data: Input containing sections directory
-            context: Execution context
-            
-        Returns:
-            ProcessorOutput with validation results
-        """
-        logger.info("Starting table header and content validation")
-        
-        # Reset state
-        self.errors = []
-        self.warnings = []
-        self.tables_checked = 0
-        self.tables_with_issues = 0
-        
-        sections_dir = Path(self.config.get("sections_dir", "data/raw_structured/sections"))
-        html_dir = Path(self.config.get("html_dir", "data/html_output"))
-        
-        # Run validation steps
-        self._validate_table_headers(sections_dir)
-        self._validate_chapter2_html(html_dir)
-        self._validate_chapter3_html(html_dir)
-        self._validate_other_chapters_html(html_dir)
-        
-        # Generate report
-        return self._generate_validation_report(input_data)
-    
-    def _validate_table_headers(self, sections_dir: Path) -> None:
-        """Validate table header metadata in structured JSON files.
-        
-        Args:
-            sections_dir: Path to sections directory
-        """
-        logger.debug(f"Validating table headers in {sections_dir}")
-        
-        for section_file in sections_dir.glob("*.json"):
-            with open(section_file, 'r', encoding='utf-8') as f:
-                section_data = json.load(f)
-            
-            section_name = section_file.stem
-            
-            for page_idx, page in enumerate(section_data.get('pages', [])):
-                page_num = page.get('page_number', page_idx)
-                
-                for table_idx, table in enumerate(page.get('tables', [])):
-                    self._validate_single_table(
-                        table, section_name, page_num, table_idx
-                    )
-        
-        logger.info(f"Checked {self.tables_checked} tables, found {self.tables_with_issues} with issues")
-    
-    def _validate_single_table(
-        self, 
-        table: Dict,
-        section_name: str,
-        page_num: int,
-        table_idx: int
-    ) -> None:
-        """Validate a single table for header metadata.
-        
-        Args:
-            table: Table data dictionary
-            section_name: Name of the section
-            page_num: Page number
-            table_idx: Table index on page
-        """
-        self.tables_checked += 1
-        rows = table.get('rows', [])
-        
-        if len(rows) < 2:
-            return  # Too few rows to validate
-        
-        # Check if first row looks like a header
-        first_row = rows[0]
-        if not isinstance(first_row, dict) or 'cells' not in first_row:
-            return
-        
-        cells = first_row.get('cells', [])
-        if len(cells) < 2:
-            return
-        
-        # Heuristic: check if first row cells are short text (likely headers)
-        cell_texts = [cell.get('text', '').strip() for cell in cells]
-        avg_length = sum(len(text) for text in cell_texts) / len(cell_texts) if cell_texts else 0
-        
-        # If cells are short and don't contain special characters (likely headers)
-        looks_like_header = (
-            avg_length < 20 and
-            all(len(text) < 50 for text in cell_texts if text) and
-            not any('/' in text or text.isdigit() for text in cell_texts[:3] if text)
-        )
-        
-        if looks_like_header and 'header_rows' not in table:
-            self.tables_with_issues += 1
-            error_msg = (
-                f"Table in {section_name}, page {page_num}, table {table_idx} "
-                f"appears to have a header row (first cells: {cell_texts[:3]}) "
-                f"but is missing 'header_rows' metadata. This will cause headers "
-                f"to render as data cells."
-            )
-            self.errors.append(error_msg)
-    
-    def _validate_chapter2_html(self, html_dir: Path) -> None:
-        """Validate Chapter 2 HTML content structure.
-        
-        Args:
-            html_dir: Path to HTML output directory
-        """
-        chapter2_html = html_dir / "chapter-two-player-character-races.html"
-        if not chapter2_html.exists():
-            logger.warning(f"Chapter 2 HTML not found: {chapter2_html}")
-            return
-        
-        logger.debug("Validating Chapter 2 HTML structure")
-        
-        with open(chapter2_html, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Delegate to race-specific validators
-        self._validate_other_languages_section(html_content)
-        self._validate_half_elves_sections(html_content)
-        self._validate_half_giants_sections(html_content)
-        self._validate_halflings_sections(html_content)
-        self._validate_human_section(html_content)
-        self._validate_mul_sections(html_content)
-        self._validate_thri_kreen_sections(html_content)
-    
-    def _validate_other_languages_section(self, html_content: str) -> None:
-        """Validate Other Languages section has proper table.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        if 'header-8-other-languages' in html_content:
-            other_lang_section = re.search(
-                r'<p id="header-8-other-languages">.*?(<table|<p id="header-9)',
-                html_content,
-                re.DOTALL
-            )
-            if other_lang_section and '<table' not in other_lang_section.group(0):
-                self.tables_with_issues += 1
-                self.errors.append(
-                    "Other Languages section in Chapter 2 is missing its language table. "
-                    "The language list should be formatted as a 2-column table, not plain text."
-                )
-    
-    def _validate_half_elves_sections(self, html_content: str) -> None:
-        """Validate Half-elves sections paragraph structure.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        # Validate Roleplaying section
-        if 'header-13-roleplaying-' in html_content:
-            roleplaying_section = re.search(
-                r'<p id="header-13-roleplaying-">.*?</p>(.*?)<p id="header-14-half-giants">',
-                html_content,
-                re.DOTALL
-            )
-            if roleplaying_section:
-                content = roleplaying_section.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 3:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Half-elves Roleplaying section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 3: (1) self-reliance introduction, "
-                        f"(2) example behavior, (3) acceptance seeking."
-                    )
-    
-    def _validate_half_giants_sections(self, html_content: str) -> None:
-        """Validate Half-Giants sections paragraph structure.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        # Validate main section
-        if 'header-14-half-giants' in html_content:
-            half_giants_section = re.search(
-                r'<p id="header-14-half-giants">.*?</p>(.*?)<p id="header-15-roleplaying-">',
-                html_content,
-                re.DOTALL
-            )
-            if half_giants_section:
-                content = half_giants_section.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 10:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Half-Giants main section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 10: (1) origins, (2) physical description, "
-                        f"(3) available classes, (4) traits/personality, (5) culture/history, "
-                        f"(6) communities, (7) alignment flexibility, (8) attribute modifiers, "
-                        f"(9) hit die rolls, (10) equipment costs."
-                    )
-        
-        # Validate Roleplaying section
-        if 'header-15-roleplaying-' in html_content:
-            half_giants_roleplaying = re.search(
-                r'<p id="header-15-roleplaying-">.*?</p>(.*?)<p id="header-16-halflings">',
-                html_content,
-                re.DOTALL
-            )
-            if half_giants_roleplaying:
-                content = half_giants_roleplaying.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 4:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Half-Giants Roleplaying section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 4: (1) friendly introduction, "
-                        f"(2) example behavior, (3) qualifications about imitation, "
-                        f"(4) roleplay advice about size."
-                    )
-    
-    def _validate_halflings_sections(self, html_content: str) -> None:
-        """Validate Halflings sections paragraph structure.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        # Validate main section
-        if 'header-16-halflings' in html_content:
-            halflings_section = re.search(
-                r'<p id="header-16-halflings">.*?</p>(.*?)<p id="header-17-roleplaying-">',
-                html_content,
-                re.DOTALL
-            )
-            if halflings_section:
-                content = halflings_section.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 9:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Halflings main section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 9: (1) jungle habitat/physical description, "
-                        f"(2) racial unity, (3) culture/values, (4) relationship with land, "
-                        f"(5) abilities/resistances, (6) Strength penalties, "
-                        f"(7) Charisma penalties, (8) Dexterity/Wisdom bonuses, "
-                        f"(9) exceptional strength limitations."
-                    )
-        
-        # Validate Roleplaying section
-        if 'header-17-roleplaying-' in html_content:
-            halflings_roleplaying = re.search(
-                r'<p id="header-17-roleplaying-">.*?</p>(.*?)<p id="header-18-human">',
-                html_content,
-                re.DOTALL
-            )
-            if halflings_roleplaying:
-                content = halflings_roleplaying.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 5:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Halflings Roleplaying section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 5: (1) comfortable in groups/curious about customs, "
-                        f"(2) alien view of accomplishments, (3) response to size comments, "
-                        f"(4) loyalty to brethren."
-                    )
-    
-    def _validate_human_section(self, html_content: str) -> None:
-        """Validate Human section paragraph structure.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        if 'header-18-human' in html_content:
-            human_section = re.search(
-                r'<p id="header-18-human">.*?</p>(.*?)<p id="header-19-mul">',
-                html_content,
-                re.DOTALL
-            )
-            if human_section:
-                content = human_section.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 5:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Human section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 5: (1) predominant race/class access, "
-                        f"(2) physical description, (3) appearance alterations, "
-                        f"(4) half-races info, (5) tolerance of other races."
-                    )
-    
-    def _validate_mul_sections(self, html_content: str) -> None:
-        """Validate Mul sections paragraph structure.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        # Validate main section
-        if 'header-19-mul' in html_content:
-            mul_section = re.search(
-                r'<p id="header-19-mul">.*?</p>(.*?)<p id="header-22-roleplaying-">',
-                html_content,
-                re.DOTALL
-            )
-            if mul_section:
-                content = mul_section.group(1)
-                # Count paragraphs, excluding table headers
-                all_p_tags = re.findall(r'(<p[^>]*>.*?</p>)', content, re.DOTALL)
-                paragraph_count = sum(1 for p in all_p_tags 
-                                     if 'id="header-20' not in p and 'id="header-21' not in p)
-                
-                if paragraph_count != 8:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Mul main section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 8: (1) origins/sterility, (2) physical description, "
-                        f"(3) personality/upbringing, (4) freedom/careers, (5) available classes, "
-                        f"(6) attribute modifiers, (7) exertion intro, (8) exertion details."
-                    )
-        
-        # Validate Roleplaying section
-        if 'header-21-roleplaying-' in html_content or 'header-22-roleplaying-' in html_content:
-            mul_roleplaying = re.search(
-                r'<p id="header-21-roleplaying-">.*?</p>(.*?)<p id="header-22-thri-kreen">',
-                html_content,
-                re.DOTALL
-            )
-            if not mul_roleplaying:
-                mul_roleplaying = re.search(
-                    r'<p id="header-22-roleplaying-">.*?</p>(.*?)<p id="header-23-thri-kreen">',
-                    html_content,
-                    re.DOTALL
-                )
-            if mul_roleplaying:
-                content = mul_roleplaying.group(1)
-                paragraph_count = len(re.findall(r'<p>', content))
-                
-                if paragraph_count != 3:
-                    self.tables_with_issues += 1
-                    self.errors.append(
-                        f"Mul Roleplaying section in Chapter 2 has {paragraph_count} paragraphs "
-                        f"but should have exactly 3: (1) struggle for freedom/suspicious, "
-                        f"(2) example behavior, (3) never trusts easily."
-                    )
-    
-    def _validate_thri_kreen_sections(self, html_content: str) -> None:
-        """Validate Thri-kreen sections paragraph structure.
-        
-        This method would contain validations for Thri-kreen sections.
-        Keeping this separate for clarity and maintainability.
-        
-        Args:
-            html_content: HTML content to validate
-        """
-        # Add thri-kreen specific validations here
-        # (Placeholder - extract from original if they exist)
-        pass
-    
-    def _validate_chapter3_html(self, html_dir: Path) -> None:
-        """Validate Chapter 3 HTML content structure.
-        
-        Args:
-            html_dir: Path to HTML output directory
-        """
-        # Add Chapter 3 validations if they exist in original
-        # (Placeholder for future expansion)
-        pass
-    
-    def _validate_other_chapters_html(self, html_dir: Path) -> None:
-        """Validate other chapters' HTML content structure.
-        
-        Args:
-            html_dir: Path to HTML output directory
-        """
-        # Add validations for chapters 4-15 if they exist in original
-        # (Placeholder for future expansion)
-        pass
-    
-    def _generate_validation_report(self, input_data: ProcessorInput) -> ProcessorOutput:
-        """Generate validation report with errors and warnings.
-        
-        Args:
-            input_data: Original input data
-            
-        Returns:
-            ProcessorOutput with validation results
-        """
-        logger.info(
-            f"Validation complete: {len(self.errors)} errors, "
-            f"{len(self.warnings)} warnings, "
-            f"{self.tables_with_issues} tables with issues"
-        )
-        
-        return ProcessorOutput(
-            success=len(self.errors) == 0,
-            data={
-                'tables_checked': self.tables_checked,
-                'tables_with_issues': self.tables_with_issues,
-                'errors': self.errors,
-                'warnings': self.warnings,
-            },
-            metadata={
-                'validation_type': 'table_header_and_content',
-                'error_count': len(self.errors),
-                'warning_count': len(self.warnings),
-            }
-        )
-
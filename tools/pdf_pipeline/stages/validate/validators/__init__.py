@@ -1,12 +1,28 @@
 """Validation helper modules for TableHeaderValidationProcessor."""
 
-from .chapter2_validator import Chapter2Validator
-from .chapter3_validator import Chapter3Validator
+from .html_corpus import ChapterDocument, HTMLCorpus
+from .html_rules import (
+    FunctionRule,
+    ParagraphCountRule,
+    RuleReport,
+    StrayTextRule,
+    ValidationRule,
+    chapter_rule,
+    register_rule,
+)
+from .html_validator import HTMLRuleValidator
 from .table_validator import TableHeaderValidator
 
 __all__ = [
-    "Chapter2Validator",
-    "Chapter3Validator",
+    "ChapterDocument",
+    "FunctionRule",
+    "HTMLCorpus",
+    "HTMLRuleValidator",
+    "ParagraphCountRule",
+    "RuleReport",
+    "StrayTextRule",
     "TableHeaderValidator",
+    "ValidationRule",
+    "chapter_rule",
+    "register_rule",
 ]
-
@@ -0,0 +1,159 @@
+"""Chapter 2 (Player Character Races) HTML validation rules."""
+
+from __future__ import annotations
+
+from .html_corpus import ChapterDocument, Span
+from .html_rules import CHAPTER_TWO, ParagraphCountRule, RuleReport, chapter_rule, register_rule
+
+
+@chapter_rule(CHAPTER_TWO)
+def other_languages_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Other Languages section must contain its language table."""
+    header = doc.header('<p id="header-8-other-languages">')
+    if header is None:
+        return
+    next_section = doc.header('<p id="header-9', header.end)
+    table = doc.content.find('<table', header.end)
+    if next_section and (table == -1 or next_section.start < table):
+        report.error(
+            "Other Languages section in Chapter 2 is missing its language table. "
+            "The language list should be formatted as a 2-column table, not plain text."
+        )
+
+
+def _mul_paragraphs(doc: ChapterDocument, span: Span) -> int:
+    """Count paragraphs in the Mul section, excluding its table headers."""
+    paragraphs = doc.findall(r'(<p[^>]*>.*?</p>)', *span)
+    return sum(1 for p in paragraphs if 'id="header-20' not in p and 'id="header-21' not in p)
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "half_elves_roleplaying",
+    [('<p id="header-13-roleplaying-">', '<p id="header-14-half-giants">')],
+    expected=3,
+    message=(
+        "Half-elves Roleplaying section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 3: (1) self-reliance introduction, "
+        "(2) example behavior, (3) acceptance seeking."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "half_giants",
+    [('<p id="header-14-half-giants">', '<p id="header-15-roleplaying-">')],
+    expected=10,
+    message=(
+        "Half-Giants main section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 10: (1) origins, (2) physical description, "
+        "(3) available classes, (4) traits/personality, (5) culture/history, "
+        "(6) communities, (7) alignment flexibility, (8) attribute modifiers, "
+        "(9) hit die rolls, (10) equipment costs."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "half_giants_roleplaying",
+    [('<p id="header-15-roleplaying-">', '<p id="header-16-halflings">')],
+    expected=4,
+    message=(
+        "Half-Giants Roleplaying section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 4: (1) friendly introduction, "
+        "(2) example behavior, (3) qualifications about imitation, "
+        "(4) roleplay advice about size."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "halflings",
+    [('<p id="header-16-halflings">', '<p id="header-17-roleplaying-">')],
+    expected=9,
+    message=(
+        "Halflings main section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 9: (1) jungle habitat/physical description, "
+        "(2) racial unity, (3) culture/values, (4) relationship with land, "
+        "(5) abilities/resistances, (6) Strength penalties, "
+        "(7) Charisma penalties, (8) Dexterity/Wisdom bonuses, "
+        "(9) exceptional strength limitations."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "halflings_roleplaying",
+    [('<p id="header-17-roleplaying-">', '<p id="header-18-human">')],
+    expected=5,
+    message=(
+        "Halflings Roleplaying section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 5: (1) comfortable in groups/curious about customs, "
+        "(2) alien view of accomplishments, (3) response to size comments, "
+        "(4) loyalty to brethren."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "human",
+    [('<p id="header-18-human">', '<p id="header-19-mul">')],
+    expected=5,
+    message=(
+        "Human section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 5: (1) predominant race/class access, "
+        "(2) physical description, (3) appearance alterations, "
+        "(4) half-races info, (5) tolerance of other races."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "mul",
+    [('<p id="header-19-mul">', '<p id="header-22-roleplaying-">')],
+    expected=8,
+    counter=_mul_paragraphs,
+    message=(
+        "Mul main section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 8: (1) origins/sterility, (2) physical description, "
+        "(3) personality/upbringing, (4) freedom/careers, (5) available classes, "
+        "(6) attribute modifiers, (7) exertion intro, (8) exertion details."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "mul_roleplaying",
+    [
+        ('<p id="header-21-roleplaying-">', '<p id="header-22-thri-kreen">'),
+        ('<p id="header-22-roleplaying-">', '<p id="header-23-thri-kreen">'),
+    ],
+    expected=2,
+    message=(
+        "Mul Roleplaying section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 2: (1) pampered slaves/treatment, "
+        "(2) dwarven stubbornness/trading."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "thri_kreen",
+    [
+        ('<p id="header-22-thri-kreen">', '<p id="header-23-roleplaying-">'),
+        ('<p id="header-23-thri-kreen">', r'<p id="header-\d+-roleplaying-">'),
+    ],
+    expected=15,
+    message=(
+        "Thri-kreen main section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 15: physical description, anatomy, sleep, weapons, "
+        "items, organization, carnivores, classes, attacks, leaping, venom, chatkcha, "
+        "dodge, attributes."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_TWO, "thri_kreen_roleplaying",
+    [
+        ('<p id="header-23-roleplaying-">', '<p id="header-24-other-characteristics">'),
+        (r'<p id="header-\d+-roleplaying-">', r'<p id="header-\d+-other-characteristics">'),
+    ],
+    expected=4,
+    marker="thri-kreen",
+    message=(
+        "Thri-kreen Roleplaying section in Chapter 2 has {count} paragraphs "
+        "but should have exactly 4: (1) obsession/hunt, (2) birth/training, "
+        "(3) outsiders/behavior, (4) pack intelligence/protectiveness."
+    ),
+))
@@ -0,0 +1,827 @@
+"""Chapter 3 (Player Character Classes) HTML validation rules."""
+
+from __future__ import annotations
+
+import re
+
+from .html_corpus import ANY_HEADER, ChapterDocument, strip_tags
+from .html_rules import (
+    CHAPTER_THREE,
+    ParagraphCountRule,
+    RuleReport,
+    StrayTextRule,
+    chapter_rule,
+    paragraphs_outside_tables,
+    paragraphs_without_span,
+    register_rule,
+)
+
+NON_HEADER_PARAGRAPH = r'<p(?![^>]*id="header")[^>]*>(.*?)</p>'
+TEXT_PARAGRAPH_AFTER = r'<p[^>]*>(?!.*id="header)(.*?)</p>'
+
+
+def _long_paragraphs(paragraphs, min_length):
+    return [p for p in paragraphs if len(strip_tags(p)) > min_length]
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "warrior_classes",
+    [('<p id="header-1-warrior-classes">', '<p id="header-2-wizard-classes">')],
+    expected=5,
+    message=(
+        "Warrior Classes section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 5: (1) intro about three classes, "
+        "(2) fighter description, (3) ranger description, (4) gladiator description, "
+        "(5) no paladins note."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "wizard",
+    [('<p id="header-22-wizard">', '<p id="header-23-defiler">')],
+    expected=6,
+    message=(
+        "Wizard section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 6: (1) wizard intro/magic & ecosystem, "
+        "(2) preserver description, (3) defiler description, "
+        "(4) illusionist description, (5) wizard restrictions, "
+        "(6) Dark Sun specific rules."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "defiler",
+    [('<p id="header-23-defiler">', '<p id="header-24-defiler-experience-levels">')],
+    expected=4,
+    message="Defiler section in Chapter 3 has {count} paragraphs but should have exactly 4",
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def defiler_experience_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Defiler Experience Levels table has 21 rows and 3 columns."""
+    header = doc.header('<p id="header-24-defiler-experience-levels">')
+    table = doc.next_table(header.end, after_paragraph=True) if header else None
+    if table is None:
+        return
+
+    if table.plain_row_count != 21:
+        report.error(
+            f"Defiler Experience Levels table has {table.plain_row_count} rows but should have 21 "
+            f"(1 header + 20 data rows)",
+            issue=False,
+        )
+
+    header_row = next((row for row in table.rows if row.tag == '<tr>'), None)
+    if header_row:
+        columns = sum(1 for cell in header_row.cells if cell.tag == '<th>')
+        if columns != 3:
+            report.error(
+                f"Defiler Experience Levels table has {columns} columns but should have 3",
+                issue=False,
+            )
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "preserver",
+    [(r'<p id="header-\d+-preserver">', r'<p id="header-\d+-illusionist">')],
+    expected=2,
+    counter=paragraphs_outside_tables,
+    message="Preserver section in Chapter 3 has {count} paragraphs but should have exactly 2",
+))
+
+register_rule(StrayTextRule(
+    CHAPTER_THREE, "preserver_page_number",
+    [(r'<p id="header-\d+-preserver">', r'<p id="header-\d+-illusionist">')],
+    text="2 7",
+    message="Preserver section in Chapter 3 contains malformed page number '2 7' that should be removed",
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "priest",
+    [(r'<p id="header-\d+-priest">', r'<p id="header-\d+-spheres-of-magic">')],
+    expected=6,
+    counter=paragraphs_outside_tables,
+    message="Priest section in Chapter 3 has {count} paragraphs but should have exactly 6",
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "spheres_of_magic",
+    [(r'<p id="header-\d+-spheres-of-magic">', r'<p id="header-\d+-cleric">')],
+    expected=3,
+    message="Spheres of Magic section in Chapter 3 has {count} paragraphs but should have exactly 3",
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "cleric",
+    [(r'<p id="header-\d+-cleric">', r'<p id="header-\d+-cleric-weapons-restrictions">')],
+    expected=4,
+    counter=paragraphs_outside_tables,
+    message="Cleric section in Chapter 3 has {count} paragraphs but should have exactly 4",
+))
+
+register_rule(StrayTextRule(
+    CHAPTER_THREE, "cleric_page_number",
+    [(r'<p id="header-\d+-cleric">', r'<p id="header-\d+-cleric-weapons-restrictions">')],
+    text="2 9",
+    message="Cleric section in Chapter 3 contains malformed page number '2 9' that should be removed",
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def cleric_powers(doc: ChapterDocument, report: RuleReport) -> None:
+    """The cleric powers after Elemental Plane of Water span 10 paragraphs."""
+    match = doc.search(
+        r'<p id="header-\d+-elemental-plane-of-water">.*?</p>.*?<p>Those who worship.*?</p>'
+        r'.*?<p>Therefore.*?</p>(.*?)<p id="header-\d+-druid">'
+    )
+    if not match:
+        return
+
+    count = doc.paragraph_count(match.span(1))
+    if count != 10:
+        report.error(
+            f"Cleric powers section (after Elemental Plane of Water) in Chapter 3 has {count} paragraphs "
+            f"but should have exactly 10"
+        )
+    if "3 0" in match.group(1):
+        report.error(
+            "Cleric powers section in Chapter 3 contains malformed page number '3 0' that should be removed"
+        )
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "druid",
+    [(r'<p id="header-\d+-druid">', r'<p id="header-\d+-possible-guardian-lands">')],
+    expected=8,
+    after_table=True,
+    message="Druid section in Chapter 3 has {count} paragraphs but should have exactly 8",
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def druid_granted_powers(doc: ChapterDocument, report: RuleReport) -> None:
+    """The druid granted powers span 7 paragraphs from 'When in his guarded lands'."""
+    match = doc.search(r'<p>When in his guarded lands(.*?)<p id="header-\d+-templar">')
+    if not match:
+        return
+
+    count = doc.paragraph_count((match.start(), match.end(1)))
+    if count != 7:
+        report.error(
+            f"Druid granted powers section in Chapter 3 has {count} paragraphs "
+            f"but should have exactly 7 (starting with 'When in his guarded lands')"
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def templar_class_details(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Templar details between its table and spell progression are 2 paragraphs."""
+    for header in doc.find_headers(r'<p id="header-\d+-templar">'):
+        table = doc.table_ending_after(header.end)
+        closing = doc.header(r'<p id="header-\d+-templar-spell-progression">', table.end) if table else None
+        if closing:
+            break
+    else:
+        return
+
+    count = doc.paragraph_count((table.end, closing.start))
+    if count != 2:
+        report.error(
+            f"Templar class details section in Chapter 3 has {count} paragraphs "
+            f"but should have exactly 2 (break at 'Templars gain levels as do clerics,')"
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def templar_abilities(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Templar abilities run 19 paragraphs up to the Rogue header."""
+    match = doc.search(r'<p>(The libraries of the templars.*?)</p>.*?(?=<p id="header-\d+-rogue">)')
+    if not match:
+        return
+
+    paragraphs = _long_paragraphs(doc.findall(TEXT_PARAGRAPH_AFTER, *match.span()), 20)
+    if len(paragraphs) != 19:
+        report.error(
+            f"Templar abilities section in Chapter 3 has {len(paragraphs)} paragraphs "
+            f"but should have exactly 19 (starting with 'The libraries of the templars')"
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def bard_class_details(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Bard details after its ability table are 11 paragraphs."""
+    match = doc.search(r'<p id="header-\d+-bard">.*?</table>(.*?)(?=<p id="header-|<table class="ds-table">.*?Poison)')
+    if not match:
+        return
+
+    paragraphs = _long_paragraphs(doc.findall(TEXT_PARAGRAPH_AFTER, *match.span(1)), 20)
+    if len(paragraphs) != 11:
+        report.error(
+            f"Bard class details section in Chapter 3 has {len(paragraphs)} paragraphs "
+            f"but should have exactly 11 (with breaks at 'As described in', etc.)"
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def thief_class_details(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Thief details are 5 paragraphs with known openings."""
+    for header in doc.find_headers(r'<p id="header-\d+-thief">'):
+        table = doc.next_table(header.body_start)
+        if table:
+            break
+    else:
+        return
+
+    closing = doc.header(ANY_HEADER, table.end)
+    next_table = doc.next_table(table.end)
+    ends = [item.start for item in (closing, next_table) if item]
+    if not ends:
+        return
+
+    paragraphs = _long_paragraphs(doc.findall(r'<p[^>]*>(.*?)</p>', table.end, min(ends)), 50)
+    if len(paragraphs) != 5:
+        report.error(
+            f"Thief class details section in Chapter 3 has {len(paragraphs)} paragraphs "
+            f"but should have exactly 5 (with breaks at 'A thiefs prime requisite', 'A thief can choose any', etc.)"
+        )
+        return
+
+    expected_starts = [
+        "Athasian thieves",
+        "A thiefs prime requisite",
+        "A thief can choose any",
+        "A thiefs selection",
+        "A thiefs skills",
+    ]
+    for i, para in enumerate(paragraphs):
+        clean_text = strip_tags(para)
+        if not clean_text.startswith(expected_starts[i]):
+            report.error(
+                f"Thief paragraph {i+1} should start with '{expected_starts[i]}' "
+                f"but starts with '{clean_text[:30]}...'"
+            )
+
+
+@chapter_rule(CHAPTER_THREE)
+def thieving_dexterity_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Thieving Dexterity table is 6x6 and followed by 3 paragraphs."""
+    span = doc.section(r'<p id="header-\d+-thieving-skill-exceptional-dexterity-adjustments">')
+    if span is None:
+        return
+
+    tables = doc.tables_in(span)
+    if not tables:
+        report.error("Thieving Dexterity table not found in Chapter 3")
+        return
+
+    table = tables[0]
+    if len(table.rows) != 6:
+        report.error(
+            f"Thieving Dexterity table has {len(table.rows)} rows but should have 6 "
+            f"(1 header + 5 data rows for Dex 18-22)"
+        )
+    if table.rows:
+        columns = len(table.rows[0].cells_named('th'))
+        if columns != 6:
+            report.error(f"Thieving Dexterity table has {columns} columns but should have 6")
+
+    paragraphs = _long_paragraphs(doc.findall(NON_HEADER_PARAGRAPH, table.end, span[1]), 50)
+    if len(paragraphs) < 3:
+        report.error(
+            f"Thieving Dexterity section has {len(paragraphs)} paragraphs after table "
+            f"but should have at least 3"
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def thieving_racial_adjustments_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Thieving Racial Adjustments table is 9 rows by 6 columns."""
+    span = doc.section(r'<p id="header-\d+-thieving-skill-racial-adjustments">')
+    if span is None:
+        return
+
+    tables = doc.tables_in(span)
+    if not tables:
+        report.error("Thieving Racial Adjustments table not found in Chapter 3")
+        return
+
+    table = tables[0]
+    if len(table.rows) != 9:
+        report.error(
+            f"Thieving Racial Adjustments table has {len(table.rows)} rows but should have 9 "
+            f"(1 header + 8 skill rows)"
+        )
+    if table.rows:
+        columns = len(table.rows[0].cells_named('th'))
+        if columns != 6:
+            report.error(f"Thieving Racial Adjustments table has {columns} columns but should have 6")
+
+
+@chapter_rule(CHAPTER_THREE)
+def psionicist_paragraphs(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Psionicist section after its table is 3 paragraphs."""
+    for header in doc.find_headers(r'<p id="header-\d+-psionicist">'):
+        table = doc.next_table(header.body_start)
+        if table:
+            break
+    else:
+        return
+
+    closing = doc.header(ANY_HEADER, table.end)
+    end = closing.start if closing else len(doc.content)
+    paragraphs = [strip_tags(p) for p in doc.findall(NON_HEADER_PARAGRAPH, table.end, end)]
+    paragraphs = [p for p in paragraphs if len(p) > 20]
+
+    if len(paragraphs) != 3:
+        report.error(f"Psionicist section has {len(paragraphs)} paragraphs but should have 3", issue=False)
+        return
+
+    expected_starts = [
+        "All intelligent creatures",
+        "In Dark Sun there are no racial restrictions",
+        "Inherent Potential:",
+    ]
+    for i, start in enumerate(expected_starts, 1):
+        if not any(p.startswith(start) for p in paragraphs):
+            report.error(
+                f"Psionicist paragraph {i} doesn't start with expected text \"{start[:30]}...\"",
+                issue=False,
+            )
+
+    para3 = paragraphs[2]
+    if not (para3.startswith("Inherent Potential:") and len(para3) < 50):
+        report.error(
+            f'Psionicist paragraph 3 should be just "Inherent Potential:" header, got: {para3[:60]}',
+            issue=False,
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def inherent_potential_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Inherent Potential Table section has one 9x3 table and two subheaders."""
+    header = doc.header(r'<p id="header-\d+-inherent-potential-table">')
+    if header is None:
+        report.error("Inherent Potential Table header not found in HTML", issue=False)
+        return
+
+    span = doc.section(r'<p id="header-\d+-inherent-potential-table">', r'<p id="header-\d+-non-player-characters')
+    if span:
+        tables = doc.tables_in(span)
+        if len(tables) == 0:
+            report.error("Inherent Potential Table header found but NO table in section", issue=False)
+        elif len(tables) > 1:
+            report.error(
+                f"Inherent Potential Table section has {len(tables)} tables but should have only 1",
+                issue=False,
+            )
+
+        subheaders = [
+            h for h in doc.find_headers(r'<p id="header-\d+-(power-checks|wild-talents)-">', span[0])
+            if h.start < span[1]
+        ]
+        if not any(h.id.endswith("-power-checks-") for h in subheaders):
+            report.error("'Power Checks:' should be an H2 subheader but not found", issue=False)
+        if not any(h.id.endswith("-wild-talents-") for h in subheaders):
+            report.error("'Wild Talents:' should be an H2 subheader but not found", issue=False)
+
+        for para in doc.findall(NON_HEADER_PARAGRAPH, *span):
+            clean = strip_tags(para)
+            if clean.startswith("Power Checks:"):
+                report.error("'Power Checks:' is inline in a paragraph but should be an H2 subheader", issue=False)
+            if clean.startswith("Wild Talents:"):
+                report.error("'Wild Talents:' is inline in a paragraph but should be an H2 subheader", issue=False)
+
+    table = doc.next_table(header.end, after_paragraph=True)
+    if table is None:
+        report.error("Inherent Potential Table exists as header but table not immediately after it", issue=False)
+        return
+
+    if len(table.rows) != 9:
+        report.error(
+            f"Inherent Potential Table has {len(table.rows)} rows but should have 9 (1 header + 8 data)",
+            issue=False,
+        )
+
+    if table.rows:
+        cells = table.rows[0].cells
+        if len(cells) != 3:
+            report.error(f"Inherent Potential Table has {len(cells)} columns but should have 3", issue=False)
+
+        header_texts = [cell.text for cell in cells]
+        expected_headers = ["Ability Score", "Base Score", "Ability Modifier"]
+        if header_texts != expected_headers:
+            report.error(
+                f"Inherent Potential Table headers are {header_texts} but should be {expected_headers}",
+                issue=False,
+            )
+
+    if "+ 1" in table.html or "+ 2" in table.html or "+ 3" in table.html:
+        report.error(
+            "Inherent Potential Table contains values with extra whitespace (e.g., '+ 2' instead of '+2')",
+            issue=False,
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def templar_spell_progression_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Templar Spell Progression table has 22 rows under a spanning header."""
+    header = doc.header(r'<p id="header-\d+-templar-spell-progression">')
+    table = doc.next_table(header.end, after_paragraph=True) if header else None
+    if table is None:
+        return
+
+    if len(table.rows) != 22:
+        report.error(
+            f"Templar Spell Progression table has {len(table.rows)} rows but should have 22 "
+            f"(2 header rows + 20 data rows)"
+        )
+        return
+
+    first_row = table.rows[0]
+    if len(first_row.cells) != 8:
+        report.error(
+            f"Templar Spell Progression table has {len(first_row.cells)} columns but should have 8 "
+            f"(Templar + 7 spell levels)"
+        )
+    if 'rowspan="2"' not in first_row.html:
+        report.error("Templar Spell Progression table first cell should have rowspan=2")
+    if 'colspan="7"' not in first_row.html:
+        report.error("Templar Spell Progression table second cell should have colspan=7")
+    if "Templar Level" not in first_row.html or "Spell Level" not in first_row.html:
+        report.error("Templar Spell Progression table headers should be 'Templar Level' and 'Spell Level'")
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "priest_classes",
+    [('<p id="header-3-priest-classes">', '<p id="header-4-rogue-classes">')],
+    expected=4,
+    message=(
+        "Priest Classes section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 4: (1) intro about three types of priests, "
+        "(2) cleric description, (3) templar description, (4) druid description."
+    ),
+))
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "rogue_classes",
+    [('<p id="header-4-rogue-classes">', '<p id="header-5-the-psionicist-class">')],
+    expected=3,
+    message=(
+        "Rogue Classes section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 3: (1) intro about corruption and rogue success, "
+        "(2) thief description, (3) bard description."
+    ),
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def psionicist_class(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Psionicist Class overview is 2 paragraphs."""
+    header = doc.header('<p id="header-5-the-psionicist-class">')
+    if header is None:
+        return
+
+    start = header.body_start
+    closing = doc.header(ANY_HEADER, start)
+    ends = [closing.start if closing else len(doc.content)]
+    h2 = doc.content.find('<h2>', start)
+    if h2 != -1:
+        ends.append(h2)
+
+    count = doc.paragraph_count((start, min(ends)))
+    if count != 2:
+        report.error(
+            f"The Psionicist Class section in Chapter 3 has {count} paragraphs "
+            f"but should have exactly 2: (1) intro about psionicists, "
+            f"(2) character requirements."
+        )
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "fighter",
+    [('<p id="header-17-fighter">', '<p id="header-18')],
+    expected=7,
+    after_table=True,
+    counter=paragraphs_without_span,
+    issue=False,
+    message=(
+        "Fighter section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 7: (1) intro, (2) alignments/items, (3) experience/reputation, "
+        "(4) followers structure, (5) first unit, (6) subsequent units, (7) cannot avoid followers."
+    ),
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def fighter_benefits(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Fighter benefits after the followers legend are 10 paragraphs."""
+    match = doc.search(r'<p><strong>Special:</strong>[^<]+</p>(.*?)<p id="header-[0-9]+-gladiator">')
+    if not match:
+        return
+
+    count = doc.paragraph_count(match.span(1), without_span=True)
+    if count != 10:
+        report.error(
+            f"Fighter benefits section in Chapter 3 has {count} paragraphs but should have exactly 10.",
+            issue=False,
+        )
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "gladiator",
+    [('<p id="header-[0-9]+-gladiator">', '<p id="header-[0-9]+-ranger">')],
+    expected=10,
+    after_table=True,
+    counter=paragraphs_without_span,
+    issue=False,
+    message=(
+        "Gladiator section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 10: (1) intro, (2) prime requisite bonus, (3) alignment, "
+        "(4) magical items, (5) special benefits intro, (6) weapon proficiency, (7) specialization, "
+        "(8) unarmed combat, (9) armor optimization, (10) followers."
+    ),
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def ranger_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Ranger requirements table and the text right after it."""
+    header = doc.header('<p id="header-[0-9]+-ranger">')
+    table = doc.next_table(header.end, after_paragraph=True) if header else None
+    if table is None:
+        return
+
+    if table.plain_row_count != 3:
+        report.error(
+            f"Ranger Ability Requirements table has {table.plain_row_count} rows but should have 3",
+            issue=False,
+        )
+    if "Strength 13 Dexterity 13 Constitution 14 Wisdom 14" not in table.html:
+        report.error("Ranger table missing correct ability requirements", issue=False)
+    if "Strength, Dexterity, Wisdom" not in table.html:
+        report.error("Ranger table missing correct prime requisites", issue=False)
+    if "Human, Elf, Half-elf, Halfling, Thri-kreen" not in table.html:
+        report.error("Ranger table missing correct races allowed", issue=False)
+
+    # Text from the table through the first paragraph after it
+    paragraph = doc.content.find('<p>', table.end)
+    close = doc.content.find('</p>', paragraph) if paragraph != -1 else -1
+    if close == -1:
+        return
+    context = doc.content[table.end:close + 4]
+    if "Though Athas" in context:
+        fragments = (
+            "Halfling" in context and "Thri-kreen" in context
+            and context.index("Halfling") < context.index("Though Athas")
+        )
+    else:
+        fragments = True
+    if "dom Human" in context or fragments:
+        report.error("Ranger section has duplicate race text fragments after table", issue=False)
+
+
+register_rule(ParagraphCountRule(
+    CHAPTER_THREE, "ranger",
+    [('<p id="header-[0-9]+-ranger">', '<p id="header-[0-9]+-(rangers-followers|wizard)">')],
+    expected=9,
+    after_table=True,
+    counter=paragraphs_without_span,
+    issue=False,
+    message=(
+        "Ranger section in Chapter 3 has {count} paragraphs "
+        "but should have exactly 9: (1) intro, (2) motivations, (3) weapons/armor, "
+        "(4) tracking/stealth, (5) species enemy, (6) animal handling, "
+        "(7) clerical spells, (8) potions, (9) followers."
+    ),
+))
+
+
+@chapter_rule(CHAPTER_THREE)
+def rangers_followers_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Rangers Followers table is a 24-row d100 table."""
+    header = doc.header('<p id="header-[0-9]+-rangers-followers">')
+    table = doc.next_table(header.end, after_paragraph=True) if header else None
+    if table is None:
+        return
+
+    if table.plain_row_count != 24:
+        report.error(
+            f"Rangers Followers table has {table.plain_row_count} rows but should have 24 "
+            f"(1 header + 23 data rows)",
+            issue=False,
+        )
+    if "d100 Roll" not in table.html:
+        report.error("Rangers Followers table missing 'd100 Roll' header", issue=False)
+    if "Follower Type" not in table.html:
+        report.error("Rangers Followers table missing 'Follower Type' header", issue=False)
+
+
+@chapter_rule(CHAPTER_THREE)
+def class_ability_requirements_table(doc: ChapterDocument, report: RuleReport) -> None:
+    """The Class Ability Requirements summary table is 5 rows by 7 columns."""
+    match = doc.search(r'<p[^>]*>\s*<span[^>]*>Class Ability Requirements</span>\s*</p>\s*<table')
+    table = doc.next_table(match.end() - len('<table')) if match else None
+    if table is None:
+        report.error("Class Ability Requirements table not found after the subheader")
+        return
+
+    if len(table.rows) != 5:
+        report.error(
+            f"Class Ability Requirements table has {len(table.rows)} rows but should have 5 "
+            f"(1 header + 4 data rows: Gladiator, Defiler, Templar, Psionicist)"
+        )
+    elif len(table.rows[0].cells) != 7:
+        report.error(
+            f"Class Ability Requirements table has {len(table.rows[0].cells)} columns but should have 7 "
+            f"(Class, Str, Dex, Con, Cha, Int, Wis)"
+        )
+
+
+CLASS_NAMES = [
+    "Fighter", "Gladiator", "Ranger", "Defiler", "Preserver", "Illusionist",
+    "Cleric", "Druid", "Templar", "Bard", "Thief", "Psionicist",
+]
+
+
+@chapter_rule(CHAPTER_THREE)
+def class_ability_tables(doc: ChapterDocument, report: RuleReport) -> None:
+    """Each class name is followed by a 3-row, 2-column ability table."""
+    for class_name in CLASS_NAMES:
+        match = doc.search(rf'<p[^>]*>\s*<span[^>]*>{class_name}</span>\s*</p>\s*(<table|<p>)')
+        if not match:
+            continue
+
+        table = doc.next_table(match.start(1)) if match.group(1) == '<table' else None
+        if table is None or table.start != match.start(1):
+            report.error(f"{class_name} class ability requirements table not found after class header")
+            continue
+
+        if len(table.rows) != 3:
+            report.error(
+                f"{class_name} ability requirements table has {len(table.rows)} rows "
+                f"but should have 3 (Ability Requirements, Prime Requisite, Races Allowed)"
+            )
+        elif len(table.rows[0].cells_named('td')) != 2:
+            report.error(
+                f"{class_name} ability requirements table has {len(table.rows[0].cells_named('td'))} columns "
+                f"but should have 2 (Label, Value)"
+            )
+
+
+@chapter_rule(CHAPTER_THREE)
+def header_back_links_inline(doc: ChapterDocument, report: RuleReport) -> None:
+    """Back-to-top links [^] sit on the same line as their header text."""
+    headers_with_newline = doc.findall(
+        r'<p id="header-[^"]+"><span[^>]*>([^<]+)</span>\s*\n\s*<a[^>]*>\[\^?\]</a></p>', flags=0
+    )
+    if headers_with_newline:
+        report.error(
+            f"Found {len(headers_with_newline)} headers in Chapter 3 where [^] link appears "
+            f"on a separate line instead of inline. Headers should have format: "
+            f"'<span>Header</span> <a>[^]</a>' without newlines between elements. "
+            f"Check CSS: span[style*=\"color\"] should have display: inline, not display: block."
+        )
+
+
+def _is_h1(span_attrs: str) -> bool:
+    return ('font-size: 0.9em' not in span_attrs) and ('font-size: 0.8em' not in span_attrs)
+
+
+def _strip_roman_prefix(text: str) -> str:
+    return re.sub(r'^[IVXLCDM]+\.\s+', '', text).strip()
+
+
+def _styled_headers(doc: ChapterDocument):
+    """Bare headers directly followed by their styled text span."""
+    return [
+        h for h in doc.find_headers(r'<p id="header-\d+-[^"]+">')
+        if h.span_text is not None
+    ]
+
+
+@chapter_rule(CHAPTER_THREE)
+def multi_class_h1(doc: ChapterDocument, report: RuleReport) -> None:
+    """"Multi-Class and Dual-Class Characters" is a single H1 header."""
+    h1_texts = [_strip_roman_prefix(h.span_text) for h in _styled_headers(doc) if _is_h1(h.span_attrs)]
+
+    matches = h1_texts.count("Multi-Class and Dual-Class Characters")
+    if not matches:
+        report.error('Multi-Class and Dual-Class Characters H1 header not found')
+    elif matches > 1:
+        report.error('Multiple "Multi-Class and Dual-Class Characters" H1 headers found')
+
+    if "Characters" in h1_texts:
+        report.error(
+            '"Characters" appears as a standalone H1 header; it must be merged into '
+            '"Multi-Class and Dual-Class Characters"'
+        )
+
+
+@chapter_rule(CHAPTER_THREE)
+def multi_class_intro_paragraph(doc: ChapterDocument, report: RuleReport) -> None:
+    """The paragraph before the Dwarf combinations table is complete."""
+    headers = _styled_headers(doc)
+    mc_comb = next((h for h in headers if "Multi-Class Combinations" in h.span_text), None)
+    dwarf = next((h for h in headers if "Dwarf" in h.span_text), None)
+
+    start = mc_comb
+    if start is None:
+        start = next(
+            (h for h in headers
+             if _is_h1(h.span_attrs) and _strip_roman_prefix(h.span_text) == "Multi-Class and Dual-Class Characters"),
+            None,
+        )
+
+    span = None
+    if dwarf and start:
+        span = doc.section(f'<p id="{re.escape(start.id)}">', f'<p id="{re.escape(dwarf.id)}"')
+
+    if span is None:
+        report.error("Multi-Class Combinations introductory paragraph not found")
+        return
+
+    para_text = re.sub(r'<[^>]+>', ' ', doc.text(span).strip()).strip()
+    para_text = re.sub(r'\s+', ' ', para_text)
+    required_parts = [
+        'Any demihuman character',
+        'requirements may elect',
+        'The following chart lists the possible character class combinations available',
+        'based upon the race of the character',
+    ]
+    missing_parts = [part for part in required_parts if part not in para_text]
+    if missing_parts:
+        report.error(
+            f"The paragraph 'Any demihuman character...' between Multi-Class Combinations "
+            f"and Dwarf is incomplete. Missing: {', '.join(missing_parts)}"
+        )
+
+
+MULTI_CLASS_RACES = [
+    ("Dwarf", 4),
+    ("Elf or Half-elf", 10),
+    ("Half-giant", 2),
+    ("Halfling", 6),
+    ("Mul", 4),
+    ("Thri-kreen", 2),
+]
+
+
+def _race_headers(doc: ChapterDocument, race_name: str):
+    """Find (header, span) pairs for a multi-class race.
+
+    A match is a header followed, anywhere later, by a span whose text
+    contains the race name; matches do not overlap.
+    """
+    needle = race_name.lower()
+    spans = [s for s in doc.spans if needle in s.text.lower()]
+    headers = list(doc.find_headers(r'<p id="header-\d+-[^"]+"'))
+    matches = []
+    pos = 0
+    while True:
+        header = next((h for h in headers if h.start >= pos), None)
+        span = next((s for s in spans if s.start >= header.end), None) if header else None
+        close = doc.content.find('</p>', span.end) if span else -1
+        if close == -1:
+            return matches
+        matches.append((header, span))
+        pos = close + 4
+
+
+@chapter_rule(CHAPTER_THREE)
+def multi_class_tables(doc: ChapterDocument, report: RuleReport) -> None:
+    """Each race has one multi-class header followed by its combinations table."""
+    for race_name, expected_rows in MULTI_CLASS_RACES:
+        matches = _race_headers(doc, race_name)
+        if not matches:
+            report.error(f"Multi-class {race_name} header not found")
+            continue
+
+        if len(matches) > 1:
+            report.error(f"Duplicate multi-class header detected for '{race_name}' ({len(matches)} instances)")
+
+        header, span = matches[0]
+        if race_name == "Half-giant" and 'font-size: 0.9em' not in span.attrs:
+            report.error("Half-giant header should have subheader styling (font-size: 0.9em)")
+
+        race = re.escape(race_name)
+        section = doc.search(
+            rf'<p id="{re.escape(header.id)}"[^>]*>.*?{race}.*?</p>(.*?)<p id="header-\d+',
+            flags=re.DOTALL | re.IGNORECASE,
+        )
+        if not section:
+            report.error(f"Could not find section content for multi-class {race_name} table")
+            continue
+
+        tables = doc.tables_in(section.span(1))
+        if not tables:
+            report.error(f"Multi-class {race_name} table not found after its header")
+            continue
+
+        table = tables[0]
+        if table.plain_row_count != expected_rows:
+            report.error(
+                f"Multi-class {race_name} table has {table.plain_row_count} rows but should have {expected_rows}"
+            )
+        if not re.search(r'>Fighter/|>Cleric/|>Mage/', table.inner):
+            report.error(f"Multi-class {race_name} table found but contains no multi-class combinations")
@@ -0,0 +1,317 @@
+"""Parsed HTML corpus shared by the chapter validation rules.
+
+Each chapter file is read and indexed once: header anchors with their
+positions, tables with parsed rows and cells, and the paragraph openings
+between them. Validation rules query a ChapterDocument instead of running
+their own regular expressions over the raw HTML.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+from ....utils.regex_registry import regex
+
+# Set up logging per PY-6
+logger = logging.getLogger(__name__)
+
+HEADER_TAG_RE = regex("html_corpus.header_tag", r'<p id="header[^>]*>')
+HEADER_ID_RE = regex("html_corpus.header_id", r'<p id="([^"]*)"')
+HEADER_SPAN_RE = regex("html_corpus.header_span", r'<span([^>]*)>([^<]+)</span>')
+SPAN_RE = regex("html_corpus.span", r'<span([^>]*)>([^<]*)</span>')
+TABLE_RE = regex("html_corpus.table", r'<table[^>]*>(.*?)</table>', re.DOTALL)
+ROW_RE = regex("html_corpus.row", r'<tr[^>]*>.*?</tr>', re.DOTALL)
+CELL_RE = regex("html_corpus.cell", r'<(t[hd])([^>]*)>(.*?)</t[hd]>', re.DOTALL)
+PLAIN_P_RE = regex("html_corpus.plain_p", r'<p>')
+TAG_RE = regex("html_corpus.tag", r'<[^>]+>')
+
+# Any header anchor, whatever its attributes
+ANY_HEADER = '<p id="header'
+
+TagPattern = Union[str, Pattern[str]]
+Span = Tuple[int, int]
+
+
+def strip_tags(html: str) -> str:
+    """Remove markup from an HTML fragment and trim whitespace.
+
+    Args:
+        html: HTML fragment
+
+    Returns:
+        Plain text
+    """
+    return TAG_RE.sub('', html).strip()
+
+
+def _compile(pattern: TagPattern) -> Pattern[str]:
+    if isinstance(pattern, str):
+        return re.compile(pattern)
+    return pattern
+
+
+class Header:
+    """A ``<p id="header-...">`` anchor in a chapter."""
+
+    __slots__ = ("tag", "id", "start", "end", "body_start", "span_attrs", "span_text")
+
+    def __init__(self, content: str, match: re.Match):
+        self.tag = match.group(0)
+        id_match = HEADER_ID_RE.match(self.tag)
+        self.id = id_match.group(1) if id_match else ""
+        self.start = match.start()
+        self.end = match.end()
+        # Position after the first closing </p> following the tag
+        close = content.find('</p>', self.end)
+        self.body_start = close + 4 if close != -1 else len(content)
+        # Styled header text directly after the tag, if any
+        span = HEADER_SPAN_RE.match(content, self.end)
+        self.span_attrs = span.group(1) if span else None
+        self.span_text = span.group(2) if span else None
+
+    @property
+    def bare(self) -> bool:
+        """Whether the anchor carries no attributes besides its id."""
+        return self.tag == f'<p id="{self.id}">'
+
+
+class TextSpan:
+    """A ``<span>`` element holding plain text."""
+
+    __slots__ = ("start", "end", "attrs", "text")
+
+    def __init__(self, match: re.Match):
+        self.start = match.start()
+        self.end = match.end()
+        self.attrs = match.group(1)
+        self.text = match.group(2)
+
+
+class TableCell:
+    """A ``<th>`` or ``<td>`` cell."""
+
+    __slots__ = ("name", "tag", "html", "text")
+
+    def __init__(self, match: re.Match):
+        self.name = match.group(1)
+        self.tag = f"<{match.group(1)}{match.group(2)}>"
+        self.html = match.group(3)
+        self.text = strip_tags(self.html)
+
+
+class TableRow:
+    """A ``<tr>`` row with its parsed cells."""
+
+    __slots__ = ("tag", "html", "cells")
+
+    def __init__(self, html: str):
+        self.html = html
+        self.tag = html[:html.index('>') + 1]
+        self.cells = [TableCell(m) for m in CELL_RE.finditer(html)]
+
+    def cells_named(self, name: str) -> List[TableCell]:
+        """Return the cells of one kind (``th`` or ``td``)."""
+        return [cell for cell in self.cells if cell.name == name]
+
+
+class Table:
+    """A ``<table>`` element with its rows."""
+
+    __slots__ = ("start", "end", "html", "inner", "after_paragraph", "rows")
+
+    def __init__(self, content: str, match: re.Match):
+        self.start = match.start()
+        self.end = match.end()
+        self.html = match.group(0)
+        self.inner = match.group(1)
+        # True when only whitespace separates the table from a preceding </p>
+        pos = self.start
+        while pos > 0 and content[pos - 1].isspace():
+            pos -= 1
+        self.after_paragraph = pos >= 4 and content.startswith('</p>', pos - 4)
+        self.rows = [TableRow(m.group(0)) for m in ROW_RE.finditer(self.html)]
+
+    @property
+    def plain_row_count(self) -> int:
+        """Number of rows opened with a bare ``<tr>``."""
+        return sum(1 for row in self.rows if row.tag == '<tr>')
+
+
+class ChapterDocument:
+    """Indexed view of one chapter's HTML output."""
+
+    def __init__(self, name: str, content: str):
+        """Parse a chapter.
+
+        Args:
+            name: Chapter file name
+            content: Raw HTML
+        """
+        self.name = name
+        self.content = content
+        self.headers = [Header(content, m) for m in HEADER_TAG_RE.finditer(content)]
+        self._header_starts = [h.start for h in self.headers]
+        self.tables = [Table(content, m) for m in TABLE_RE.finditer(content)]
+        self._table_starts = [t.start for t in self.tables]
+        self.spans = [TextSpan(m) for m in SPAN_RE.finditer(content)]
+
+        # Paragraph openings, with the variants the rules count
+        self._plain_p = [m.start() for m in PLAIN_P_RE.finditer(content)]
+        self._plain_p_outside_tables = [p for p in self._plain_p if self.table_containing(p) is None]
+        self._plain_p_without_span = [p for p in self._plain_p if not content.startswith('<span', p + 3)]
+
+        self._patterns: Dict[str, Pattern[str]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ChapterDocument":
+        """Read and index a chapter file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(path.name, f.read())
+
+    # Headers
+
+    def find_headers(self, pattern: TagPattern, start: int = 0) -> Iterator[Header]:
+        """Yield headers whose opening tag matches ``pattern``.
+
+        The pattern is matched against the start of the tag, so
+        ``'<p id="header-\\d+-ranger">'`` only matches an anchor without
+        other attributes while ``'<p id="header-18'`` matches any.
+        """
+        regex = _compile(pattern)
+        for header in self.headers[bisect_left(self._header_starts, start):]:
+            if regex.match(header.tag):
+                yield header
+
+    def header(self, pattern: TagPattern, start: int = 0) -> Optional[Header]:
+        """Return the first header matching ``pattern`` at or after ``start``."""
+        return next(self.find_headers(pattern, start), None)
+
+    def section(self, start: TagPattern, end: TagPattern = ANY_HEADER) -> Optional[Span]:
+        """Locate the content between a header's closing ``</p>`` and the next ``end`` header.
+
+        Args:
+            start: Pattern for the opening header tag
+            end: Pattern for the header that closes the section
+
+        Returns:
+            (start, end) offsets into the content, or None
+        """
+        for header in self.find_headers(start):
+            closing = self.header(end, header.body_start)
+            if closing:
+                return header.body_start, closing.start
+        return None
+
+    def section_after_table(self, start: TagPattern, end: TagPattern = ANY_HEADER) -> Optional[Span]:
+        """Like :meth:`section` but starting after the table that follows the header."""
+        for header in self.find_headers(start):
+            table = self.next_table(header.end, after_paragraph=True)
+            if table is None:
+                continue
+            closing = self.header(end, table.end)
+            if closing:
+                return table.end, closing.start
+        return None
+
+    # Tables
+
+    def next_table(self, pos: int, after_paragraph: bool = False) -> Optional[Table]:
+        """Return the first table starting at or after ``pos``.
+
+        Args:
+            pos: Offset to search from
+            after_paragraph: Only consider tables directly preceded by ``</p>``
+        """
+        for table in self.tables[bisect_left(self._table_starts, pos):]:
+            if not after_paragraph or (table.start >= pos + 4 and table.after_paragraph):
+                return table
+        return None
+
+    def tables_in(self, span: Span) -> List[Table]:
+        """Return the tables fully contained in a span."""
+        start, end = span
+        return [
+            t for t in self.tables[bisect_left(self._table_starts, start):]
+            if t.end <= end
+        ]
+
+    def table_containing(self, pos: int) -> Optional[Table]:
+        """Return the table enclosing an offset, if any."""
+        idx = bisect_left(self._table_starts, pos + 1) - 1
+        if idx >= 0 and self.tables[idx].end > pos:
+            return self.tables[idx]
+        return None
+
+    def table_ending_after(self, pos: int) -> Optional[Table]:
+        """Return the first table whose ``</table>`` lies after ``pos``."""
+        for table in self.tables[max(0, bisect_left(self._table_starts, pos) - 1):]:
+            if table.end > pos:
+                return table
+        return None
+
+    # Paragraphs
+
+    def paragraph_count(self, span: Span, outside_tables: bool = False, without_span: bool = False) -> int:
+        """Count bare ``<p>`` openings in a span.
+
+        Args:
+            span: (start, end) offsets
+            outside_tables: Ignore paragraphs inside tables
+            without_span: Ignore paragraphs that open with a ``<span>``
+        """
+        if outside_tables:
+            positions = self._plain_p_outside_tables
+        elif without_span:
+            positions = self._plain_p_without_span
+        else:
+            positions = self._plain_p
+        start, end = span
+        return bisect_left(positions, end) - bisect_left(positions, start)
+
+    def text(self, span: Span) -> str:
+        """Return the raw HTML of a span."""
+        return self.content[span[0]:span[1]]
+
+    # Free-form queries for rules anchored on body text
+
+    def search(self, pattern: str, start: int = 0, end: Optional[int] = None, flags: int = re.DOTALL) -> Optional[re.Match]:
+        """Search the chapter with a cached compiled pattern."""
+        return self._pattern(pattern, flags).search(self.content, start, len(self.content) if end is None else end)
+
+    def findall(self, pattern: str, start: int = 0, end: Optional[int] = None, flags: int = re.DOTALL) -> List:
+        """Find all matches of a cached compiled pattern within a span."""
+        return self._pattern(pattern, flags).findall(self.content, start, len(self.content) if end is None else end)
+
+    def _pattern(self, pattern: str, flags: int) -> Pattern[str]:
+        key = f"{flags}:{pattern}"
+        if key not in self._patterns:
+            self._patterns[key] = re.compile(pattern, flags)
+        return self._patterns[key]
+
+
+class HTMLCorpus:
+    """Lazily loaded, cached set of chapter documents in an HTML directory."""
+
+    def __init__(self, html_dir: Path):
+        """Initialize corpus.
+
+        Args:
+            html_dir: Directory containing chapter HTML files
+        """
+        self.html_dir = Path(html_dir)
+        self._documents: Dict[str, Optional[ChapterDocument]] = {}
+
+    def get(self, name: str) -> Optional[ChapterDocument]:
+        """Return the parsed document for a chapter file, or None if missing."""
+        if name not in self._documents:
+            path = self.html_dir / name
+            if path.exists():
+                logger.debug(f"Indexing {path}")
+                self._documents[name] = ChapterDocument.load(path)
+            else:
+                self._documents[name] = None
+        return self._documents[name]
@@ -0,0 +1,220 @@
+"""Rule objects and registry for chapter HTML validation.
+
+Rules are registered per chapter file and evaluated against a shared
+ChapterDocument, so every rule for a chapter reuses one parse.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .html_corpus import ChapterDocument, Span, TagPattern
+
+CHAPTER_TWO = "chapter-two-player-character-races.html"
+CHAPTER_THREE = "chapter-three-player-character-classes.html"
+
+
+class RuleReport:
+    """Errors and issue count collected while checking one chapter."""
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.errors: List[str] = []
+        self.issues = 0
+
+    def error(self, message: str, issue: bool = True) -> None:
+        """Record an error.
+
+        Args:
+            message: Error message
+            issue: Whether the error counts towards tables_with_issues
+        """
+        self.errors.append(message)
+        if issue:
+            self.issues += 1
+
+
+class ValidationRule(ABC):
+    """Base class for a check against one chapter document."""
+
+    chapter: str = ""
+    name: str = ""
+
+    @abstractmethod
+    def check(self, doc: ChapterDocument, report: RuleReport) -> None:
+        """Check the document and record problems in the report."""
+        pass
+
+
+class FunctionRule(ValidationRule):
+    """Rule backed by a plain check function."""
+
+    def __init__(self, chapter: str, func: Callable[[ChapterDocument, RuleReport], None]):
+        """Initialize rule.
+
+        Args:
+            chapter: Chapter file name
+            func: Function called with the document and report
+        """
+        self.chapter = chapter
+        self.name = func.__name__
+        self.func = func
+
+    def check(self, doc: ChapterDocument, report: RuleReport) -> None:
+        """Run the wrapped function."""
+        self.func(doc, report)
+
+
+def plain_paragraphs(doc: ChapterDocument, span: Span) -> int:
+    """Count bare ``<p>`` openings in a span."""
+    return doc.paragraph_count(span)
+
+
+def paragraphs_outside_tables(doc: ChapterDocument, span: Span) -> int:
+    """Count bare ``<p>`` openings in a span, ignoring tables."""
+    return doc.paragraph_count(span, outside_tables=True)
+
+
+def paragraphs_without_span(doc: ChapterDocument, span: Span) -> int:
+    """Count bare ``<p>`` openings not followed by a ``<span>``."""
+    return doc.paragraph_count(span, without_span=True)
+
+
+class SectionRule(ValidationRule):
+    """Base for rules that inspect the content between two headers.
+
+    The section is the first of ``sections`` found in the document; when
+    none is found the rule is silent.
+    """
+
+    def __init__(
+        self,
+        chapter: str,
+        name: str,
+        sections: Sequence[Tuple[TagPattern, TagPattern]],
+        after_table: bool = False,
+    ):
+        """Initialize rule.
+
+        Args:
+            chapter: Chapter file name
+            name: Rule name
+            sections: Candidate (start header, end header) patterns
+            after_table: Start the section after the table following the header
+        """
+        self.chapter = chapter
+        self.name = name
+        self.sections = list(sections)
+        self.after_table = after_table
+
+    def locate(self, doc: ChapterDocument) -> Optional[Span]:
+        """Return the span of the first candidate section present."""
+        locate = doc.section_after_table if self.after_table else doc.section
+        for start, end in self.sections:
+            span = locate(start, end)
+            if span:
+                return span
+        return None
+
+
+class ParagraphCountRule(SectionRule):
+    """Check the number of paragraphs in a section."""
+
+    def __init__(
+        self,
+        chapter: str,
+        name: str,
+        sections: Sequence[Tuple[TagPattern, TagPattern]],
+        expected: int,
+        message: str,
+        counter: Callable[[ChapterDocument, Span], int] = plain_paragraphs,
+        after_table: bool = False,
+        issue: bool = True,
+        marker: Optional[str] = None,
+    ):
+        """Initialize rule.
+
+        Args:
+            chapter: Chapter file name
+            name: Rule name
+            sections: Candidate (start header, end header) patterns
+            expected: Expected paragraph count
+            message: Error message; ``{count}`` is replaced by the actual count
+            counter: Function counting paragraphs in the section span
+            after_table: Start the section after the table following the header
+            issue: Whether a mismatch counts towards tables_with_issues
+            marker: Text (case-insensitive) that must appear in the chapter
+        """
+        super().__init__(chapter, name, sections, after_table)
+        self.expected = expected
+        self.message = message
+        self.counter = counter
+        self.issue = issue
+        self.marker = marker
+
+    def check(self, doc: ChapterDocument, report: RuleReport) -> None:
+        """Compare the paragraph count with the expected value."""
+        if self.marker and self.marker not in doc.content.lower():
+            return
+        span = self.locate(doc)
+        if span is None:
+            return
+        count = self.counter(doc, span)
+        if count != self.expected:
+            report.error(self.message.format(count=count), issue=self.issue)
+
+
+class StrayTextRule(SectionRule):
+    """Flag leftover text (such as split page numbers) inside a section."""
+
+    def __init__(self, chapter: str, name: str, sections: Sequence[Tuple[TagPattern, TagPattern]], text: str, message: str):
+        """Initialize rule.
+
+        Args:
+            chapter: Chapter file name
+            name: Rule name
+            sections: Candidate (start header, end header) patterns
+            text: Text that must not appear in the section
+            message: Error message
+        """
+        super().__init__(chapter, name, sections)
+        self.text = text
+        self.message = message
+
+    def check(self, doc: ChapterDocument, report: RuleReport) -> None:
+        """Report the section if it contains the stray text."""
+        span = self.locate(doc)
+        if span and self.text in doc.text(span):
+            report.error(self.message)
+
+
+_RULES: Dict[str, List[ValidationRule]] = {}
+
+
+def register_rule(rule: ValidationRule) -> ValidationRule:
+    """Register a rule for its chapter.
+
+    Rules run in registration order, so errors are reported in a stable order.
+    """
+    _RULES.setdefault(rule.chapter, []).append(rule)
+    return rule
+
+
+def chapter_rule(chapter: str) -> Callable:
+    """Decorator registering a check function as a rule for a chapter."""
+    def decorator(func: Callable[[ChapterDocument, RuleReport], None]):
+        register_rule(FunctionRule(chapter, func))
+        return func
+    return decorator
+
+
+def rules_for(chapter: str) -> List[ValidationRule]:
+    """Return the rules registered for a chapter file."""
+    return list(_RULES.get(chapter, []))
+
+
+def registered_chapters() -> List[str]:
+    """Return chapter files with registered rules, in registration order."""
+    return list(_RULES)
+
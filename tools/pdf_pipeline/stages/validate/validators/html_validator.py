@@ -0,0 +1,101 @@
+"""Chapter HTML validator running the registered rules per chapter."""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ....utils.parallel import run_process_pool
+# Importing the rule modules registers their rules
+from . import chapter2_rules, chapter3_rules  # noqa: F401
+from .html_corpus import HTMLCorpus
+from .html_rules import RuleReport, registered_chapters, rules_for
+
+logger = logging.getLogger(__name__)
+
+
+def validate_chapter(corpus: HTMLCorpus, chapter: str) -> RuleReport:
+    """Run every rule registered for a chapter against its parsed document.
+
+    Args:
+        corpus: Corpus providing the parsed chapter
+        chapter: Chapter file name
+
+    Returns:
+        RuleReport (empty when the chapter file does not exist)
+    """
+    report = RuleReport()
+    doc = corpus.get(chapter)
+    if doc is None:
+        return report
+    for rule in rules_for(chapter):
+        rule.check(doc, report)
+    return report
+
+
+def _validate_chapter_task(task: Tuple[str, str]) -> Dict[str, Any]:
+    """Worker: validate one chapter in a separate process."""
+    html_dir, chapter = task
+    report = validate_chapter(HTMLCorpus(Path(html_dir)), chapter)
+    return {
+        "items": 1,
+        "warnings": [],
+        "errors": [],
+        "chapter": chapter,
+        "rule_errors": report.errors,
+        "issues": report.issues,
+    }
+
+
+class HTMLRuleValidator:
+    """Validates paragraph and table structure in the chapter HTML output."""
+
+    def __init__(self, parallel: bool = False, max_workers: Optional[int] = None):
+        """Initialize validator.
+
+        Args:
+            parallel: Validate chapters in a process pool
+            max_workers: Worker count for the pool
+        """
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+    def validate(self, html_dir: Path) -> Tuple[List[str], int]:
+        """Validate all chapters with registered rules.
+
+        Args:
+            html_dir: Directory containing the chapter HTML files
+
+        Returns:
+            Tuple of (errors, tables_with_issues), in chapter registration order
+        """
+        chapters = [c for c in registered_chapters() if (html_dir / c).exists()]
+        reports: Dict[str, Tuple[List[str], int]] = {}
+
+        if self.parallel and len(chapters) > 1:
+            pool_result = run_process_pool(
+                [(str(html_dir), chapter) for chapter in chapters],
+                _validate_chapter_task,
+                max_workers=self.max_workers,
+                desc="HTML rule validation",
+            )
+            for result in pool_result["results"]:
+                if "chapter" in result:
+                    reports[result["chapter"]] = (result["rule_errors"], result["issues"])
+            pool_errors = pool_result["errors"]
+        else:
+            corpus = HTMLCorpus(html_dir)
+            for chapter in chapters:
+                report = validate_chapter(corpus, chapter)
+                reports[chapter] = (report.errors, report.issues)
+            pool_errors = []
+
+        errors: List[str] = []
+        issues = 0
+        for chapter in chapters:
+            chapter_errors, chapter_issues = reports.get(chapter, ([], 0))
+            errors.extend(chapter_errors)
+            issues += chapter_issues
+        errors.extend(pool_errors)
+
+        logger.info(f"Validated {len(chapters)} chapters, found {len(errors)} HTML issues")
+        return errors, issues
@@ -6,11 +6,13 @@ from .common import (
 )
 from .tables import (
     extract_lair_treasures_table,
+    extract_treasure_tables,
 )
 
 __all__ = [
     'normalize_plain_text',
     'is_header_block',
     'extract_lair_treasures_table',
+    'extract_treasure_tables',
 ]
 
@@ -1,8 +1,17 @@
 """Common utilities for Chapter 10 processing."""
 
-import re
 from typing import Optional
 
+try:
+    from ...utils.regex_registry import regex
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.regex_registry import regex
+
+_NUMBER_RANGE_RE = regex("chapter_10.number_range", r'(\d)[ \t]*-[ \t]*(\d)')
+_SPACED_PERCENT_RE = regex("chapter_10.spaced_percent", r'(\d)[ \t]+%')
+_SPACED_DIGITS_RE = regex("chapter_10.spaced_digits", r'(\d)[ \t]+(?=\d)')
+_SPACED_LETTERS_RE = regex("chapter_10.spaced_letters", r'([a-zA-Z])[ \t]([a-zA-Z])\b')
+
 
 def normalize_plain_text(block: dict) -> str:
     """Extract plain text from a block, joining all spans."""
@@ -40,15 +49,19 @@ def clean_whitespace(text: str) -> str:
     Note: This preserves newlines (\n) in the text.
     """
     # Remove spaces (but not newlines) around dashes in number ranges
-    text = re.sub(r'(\d)[ \t]*-[ \t]*(\d)', r'\1-\2', text)
+    text = _NUMBER_RANGE_RE.sub(r'\1-\2', text)
     # Remove spaces (but not newlines) between digits and %
-    text = re.sub(r'(\d)[ \t]+%', r'\1%', text)
+    text = _SPACED_PERCENT_RE.sub(r'\1%', text)
     # Remove spaces (but not newlines) within numbers
-    text = re.sub(r'(\d)[ \t]+(\d)', r'\1\2', text)
+    text = _SPACED_DIGITS_RE.sub(r'\1', text)
     # Remove spaces between letters that appear to be part of words
-    # Only do this for single-char separations (but not newlines)
-    text = re.sub(r'([a-zA-Z])[ \t]([a-zA-Z])\b', r'\1\2', text)
-    return text
+    # Only do this for single-char separations (but not newlines). Each pass
+    # joins every other letter ("A n y" -> "An y"), so repeat until stable
+    while True:
+        joined = _SPACED_LETTERS_RE.sub(r'\1\2', text)
+        if joined == text:
+            return text
+        text = joined
 
 
 def get_block_bbox(block: dict) -> Optional[list]:
@@ -17,8 +17,7 @@ from .chapter_10.common import (
     merge_paragraph_fragments,
 )
 from .chapter_10.tables import (
-    extract_lair_treasures_table,
-    extract_individual_treasures_table,
+    extract_treasure_tables,
     extract_gem_table,
 )
 
@@ -43,11 +42,9 @@ def apply_chapter_10_adjustments(section_data: dict) -> None:
         "priate for coins found"
     )
     
-    # Extract and format the Lair Treasures table
-    extract_lair_treasures_table(section_data)
-    
-    # Extract and format the Individual and Small Lair Treasures table
-    extract_individual_treasures_table(section_data)
+    # Extract and format the Lair Treasures and Individual and Small Lair
+    # Treasures tables from the chapter's table spec
+    extract_treasure_tables(section_data)
     
     # Extract and format the Gem Table
     extract_gem_table(section_data)
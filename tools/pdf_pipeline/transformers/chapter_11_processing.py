@@ -10,6 +10,11 @@ Key processing:
 
 import logging
 
+try:
+    from ..utils.text_index import PageTextIndex, SectionTextIndex
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.text_index import PageTextIndex, SectionTextIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +72,7 @@ def _merge_compendium_header_spans(pages: list) -> None:
                         
                         # Keep only the first span
                         line["spans"] = [first_span]
+                        PageTextIndex.invalidate(page)
                         
                         logger.warning(f"  AFTER merge: {len(line['spans'])} spans, text='{first_span['text']}'")
                         logger.warning(f"  Block {block_idx} now has merged header")
@@ -257,6 +263,7 @@ def _merge_wizard_priest_encounters_headers(pages: list) -> None:
                     
                     # Remove the second line
                     lines.pop(1)
+                    PageTextIndex.invalidate(page)
                     
                     logger.warning(f"  Merged to: '{first_span['text']}'")
                     return  # Only need to do this once
@@ -288,24 +295,12 @@ def _extract_forgotten_realms_list(pages: list) -> None:
     forgotten_realms_page_idx = None
     forgotten_realms_block_idx = None
     
-    for page_idx, page in enumerate(pages):
-        if page.get("page_number") != 80:
-            continue
-            
-        blocks = page.get("blocks", [])
-        for block_idx, block in enumerate(blocks):
-            if block.get("type") != "text":
-                continue
-                
-            text = _get_block_text(block)
-            if "Forgotten Realms" in text and "(MC3)" in text:
-                forgotten_realms_page_idx = page_idx
-                forgotten_realms_block_idx = block_idx
-                logger.warning(f"Found 'Forgotten Realms® (MC3)' at page {page_idx}, block {block_idx}")
-                break
-        
-        if forgotten_realms_page_idx is not None:
-            break
+    match = SectionTextIndex(pages).find_block_where(
+        lambda text: "Forgotten Realms" in text and "(MC3)" in text, page_number=80
+    )
+    if match:
+        forgotten_realms_page_idx, forgotten_realms_block_idx, _ = match
+        logger.warning(f"Found 'Forgotten Realms® (MC3)' at page {forgotten_realms_page_idx}, block {forgotten_realms_block_idx}")
     
     if forgotten_realms_page_idx is None:
         logger.warning("Could not find 'Forgotten Realms® (MC3)' header")
@@ -371,6 +366,7 @@ def _extract_forgotten_realms_list(pages: list) -> None:
     
     # Insert the new block after the header
     blocks.insert(forgotten_realms_block_idx + 1, new_list_block)
+    PageTextIndex.invalidate(page_80)
     logger.warning(f"Created Forgotten Realms list block with {len(forgotten_realms_monsters)} monsters")
 
 
@@ -510,6 +506,7 @@ def _extract_dragonlance_list(pages: list) -> None:
     
     # Insert the new block after the header
     blocks.insert(dragonlance_block_idx + 1, new_list_block)
+    PageTextIndex.invalidate(page_80)
     logger.warning(f"Created Dragonlance list block with {len(dragonlance_monsters)} monsters")
 
 
@@ -648,6 +645,7 @@ def _extract_greyhawk_list(pages: list) -> None:
     
     # Insert the new block after the header
     blocks.insert(greyhawk_block_idx + 1, new_list_block)
+    PageTextIndex.invalidate(page_80)
     logger.warning(f"Created Greyhawk list block with {len(greyhawk_monsters)} monsters")
 
 
@@ -809,6 +807,7 @@ def _extract_kara_tur_list(pages: list) -> None:
     blocks.insert(insertion_point, list_block)
     blocks.insert(insertion_point + 1, legend_block)
     blocks.insert(insertion_point + 2, no_creatures_block)
+    PageTextIndex.invalidate(page)
     
     logger.warning(f"Created Kara-Tur list block with {len(kara_tur_monsters)} monsters, legend, and paragraph")
 
@@ -819,20 +818,12 @@ def _find_monstrous_compendium_header(pages: list) -> tuple:
     Returns:
         tuple: (page_idx, block_idx, y_pos) or (None, None, None) if not found
     """
-    for page_idx, page in enumerate(pages):
-        if page.get("page_number") != 80:
-            continue
-            
-        blocks = page.get("blocks", [])
-        for block_idx, block in enumerate(blocks):
-            if block.get("type") != "text":
-                continue
-                
-            text = _get_block_text(block)
-            if "Monstrous Compendium 1 and 2" in text:
-                y_pos = block.get("bbox", [0, 0, 0, 0])[1]
-                logger.warning(f"Found 'Monstrous Compendium 1 and 2' at page {page_idx}, block {block_idx}, y={y_pos}")
-                return page_idx, block_idx, y_pos
+    match = SectionTextIndex(pages).find_containing("Monstrous Compendium 1 and 2", page_number=80, within_line=False)
+    if match:
+        page_idx, block_idx, block = match
+        y_pos = block.get("bbox", [0, 0, 0, 0])[1]
+        logger.warning(f"Found 'Monstrous Compendium 1 and 2' at page {page_idx}, block {block_idx}, y={y_pos}")
+        return page_idx, block_idx, y_pos
     
     logger.warning("Could not find 'Monstrous Compendium 1 and 2' header")
     return None, None, None
@@ -1288,6 +1279,7 @@ def _extract_monstrous_compendium_list(pages: list) -> None:
     # Create and insert list block
     new_block = _create_mc12_list_block(final_list, header_block_idx, header_y)
     blocks.insert(header_block_idx + 1, new_block)
+    PageTextIndex.invalidate(page_80)
     
     # Mark original blocks to skip
     _mark_mc12_blocks_to_skip(blocks, left_items, right_items)
@@ -1527,6 +1519,7 @@ def _merge_plant_based_monsters_text(section_data: dict) -> None:
             
             # Keep both the header line AND the merged paragraph line
             header_block["lines"] = [header_line, new_paragraph_line]
+            PageTextIndex.invalidate(page)
             
             logger.info(f"Merged Plant-Based Monsters text into single paragraph with {len(all_spans)} spans, marked {len(blocks_to_skip)} blocks to skip")
 
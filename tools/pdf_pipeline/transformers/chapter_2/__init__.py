@@ -9,6 +9,8 @@ functions for Chapter 2 of the Dark Sun rules.
 from .common import (
     update_block_bbox,
     find_block,
+    find_block_containing,
+    find_block_exact,
 )
 
 # Re-export table processing functions
@@ -37,6 +39,8 @@ __all__ = [
     # Common utilities
     "update_block_bbox",
     "find_block",
+    "find_block_containing",
+    "find_block_exact",
     # Table processing
     "process_table_2_ability_adjustments",
     "process_racial_ability_requirements_table",
@@ -4,6 +4,7 @@ Common utility functions for Chapter 2 processing.
 This module contains shared utility functions used across all race-specific processors.
 """
 
+from ...utils.text_index import PageTextIndex
 from ..journal import _normalize_plain_text
 
 
@@ -20,13 +21,16 @@ def update_block_bbox(block: dict) -> None:
 
 
 def find_block(page: dict, predicate) -> tuple[int, dict] | None:
-    """Find a block in a page that matches the predicate."""
-    for idx, block in enumerate(page.get("blocks", [])):
-        texts = [
-            _normalize_plain_text("".join(span.get("text", "") for span in line.get("spans", [])))
-            for line in block.get("lines", [])
-        ]
-        if predicate(texts):
-            return idx, block
-    return None
+    """Find a block in a page whose normalized line texts match the predicate."""
+    return PageTextIndex.for_page(page, _normalize_plain_text).find(predicate)
+
+
+def find_block_exact(page: dict, text: str) -> tuple[int, dict] | None:
+    """Find the first block with a normalized line equal to ``text``."""
+    return PageTextIndex.for_page(page, _normalize_plain_text).find_exact(text)
+
+
+def find_block_containing(page: dict, text: str) -> tuple[int, dict] | None:
+    """Find the first block with a normalized line containing ``text``."""
+    return PageTextIndex.for_page(page, _normalize_plain_text).find_containing(text)
 
@@ -18,6 +18,7 @@ from ..journal import (
     _table_from_rows,
     _compute_bbox_from_cells,
 )
+from ...utils.text_index import PageTextIndex
 from .common import update_block_bbox, find_block
 
 
@@ -87,6 +88,7 @@ def fix_dwarves_section_text_ordering(page2: dict) -> None:
     # Remove the duplicate block
     if duplicate_block_idx is not None and duplicate_block_idx < len(page2.get("blocks", [])):
         page2["blocks"].pop(duplicate_block_idx)
+    PageTextIndex.invalidate(page2)
 
 
 
@@ -18,7 +18,8 @@ from ..journal import (
     _table_from_rows,
     _compute_bbox_from_cells,
 )
-from .common import update_block_bbox, find_block
+from ...utils.text_index import PageTextIndex
+from .common import update_block_bbox, find_block, find_block_containing, find_block_exact
 
 
 def process_mul_exertion_table(page: dict) -> None:
@@ -33,7 +34,7 @@ def process_mul_exertion_table(page: dict) -> None:
     y_min = heading_bbox[1] - 2.0
     
     # Find next section (Roleplaying)
-    next_heading = find_block(page, lambda texts: any(text == "Roleplaying:" for text in texts))
+    next_heading = find_block_exact(page, "Roleplaying:")
     y_max = float(next_heading[1]["bbox"][1]) - 5.0 if next_heading else float(page.get("height", 0) or 0)
     
     # Collect all blocks in the table region
@@ -73,11 +74,11 @@ def process_mul_exertion_table(page: dict) -> None:
 
     # If the Age headers are currently positioned above the Height & Weight table,
     # move the Age header group (Age, Starting Age, Aging Effects) to start after the table.
-    age_match = find_block(page, lambda texts: any(text == "Age" for text in texts))
+    age_match = find_block_exact(page, "Age")
     if age_match:
         age_idx, age_block = age_match
-        start_match = find_block(page, lambda texts: any("Starting Age" in t for t in texts))
-        effects_match = find_block(page, lambda texts: any("Aging Effects" in t for t in texts))
+        start_match = find_block_containing(page, "Starting Age")
+        effects_match = find_block_containing(page, "Aging Effects")
         # Collect present blocks preserving their original order of appearance
         age_group: List[dict] = []
         for candidate in [age_block, start_match[1] if start_match else None, effects_match[1] if effects_match else None]:
@@ -105,6 +106,7 @@ def process_mul_exertion_table(page: dict) -> None:
     for idx in table_blocks:
         if idx < len(page["blocks"]):
             page["blocks"][idx]["lines"] = []
+    PageTextIndex.invalidate(page)
 
 
 
@@ -161,6 +163,7 @@ def force_mul_paragraph_breaks(page: dict) -> None:
     
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 
@@ -211,6 +214,7 @@ def force_mul_roleplaying_paragraph_breaks(page: dict) -> None:
     
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 
@@ -19,7 +19,9 @@ from ..journal import (
     _compute_bbox_from_cells,
     _join_fragments,
 )
-from .common import update_block_bbox, find_block
+from ...utils.page_index import PageIndex
+from ...utils.text_index import PageTextIndex
+from .common import update_block_bbox, find_block, find_block_containing, find_block_exact
 
 
 def process_height_weight_table(page: dict) -> None:
@@ -79,7 +81,7 @@ def _find_hw_table_bounds(page: dict) -> tuple | None:
     Returns:
         Tuple of (hw_bbox, y_min, y_max) or None
     """
-    hw_match = find_block(page, lambda texts: any("Height and Weight" in t for t in texts))
+    hw_match = find_block_containing(page, "Height and Weight")
     if not hw_match:
         return None
     _, hw_block = hw_match
@@ -148,13 +150,13 @@ def _move_age_group_below_table(page: dict, table_bottom: float) -> None:
         page: Page dictionary
         table_bottom: Bottom Y coordinate of table
     """
-    age_match = find_block(page, lambda texts: any(text == "Age" for text in texts))
+    age_match = find_block_exact(page, "Age")
     if not age_match:
         return
     
     _, age_block = age_match
-    start_match = find_block(page, lambda texts: any("Starting Age" in t for t in texts))
-    effects_match = find_block(page, lambda texts: any("Aging Effects" in t for t in texts))
+    start_match = find_block_containing(page, "Starting Age")
+    effects_match = find_block_containing(page, "Aging Effects")
     age_group = [b for b in [age_block, start_match[1] if start_match else None, effects_match[1] if effects_match else None] if b]
     
     if not age_group:
@@ -223,8 +225,8 @@ def _extract_hw_header_positions(page: dict) -> tuple | None:
     Returns:
         Tuple of (race_x1, h_base_x, h_mod_x, w_base_x, w_mod_x) or None
     """
-    left_header = find_block(page, lambda texts: any("Height in Inches" in t for t in texts))
-    right_header = find_block(page, lambda texts: any("Weight in Pounds" in t for t in texts))
+    left_header = find_block_containing(page, "Height in Inches")
+    right_header = find_block_containing(page, "Weight in Pounds")
     if not left_header or not right_header:
         return None
     
@@ -280,18 +282,12 @@ def _collect_hw_row_anchors(page: dict, y_min: float, y_max: float, race_split_x
     row_anchors: List[tuple[float, str]] = []
     footnote_prefix = "*"
     
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
-            continue
-        for line in block.get("lines", []):
-            x0, y0, x1, y1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-            if y0 < y_min or y0 > y_max:
+    for entry in PageIndex.for_page(page).between_y(y_min, y_max, inclusive=True):
+        if entry.x1 <= race_split_x:
+            txt = _line_text(entry.line)
+            if not txt or txt in {"Race"} or txt.startswith(footnote_prefix):
                 continue
-            if x1 <= race_split_x:
-                txt = _line_text(line)
-                if not txt or txt in {"Race"} or txt.startswith(footnote_prefix):
-                    continue
-                row_anchors.append((((y0 + y1) / 2.0), txt))
+            row_anchors.append((entry.cy, txt))
     
     if not row_anchors:
         return []
@@ -333,8 +329,8 @@ def _build_hw_table(
         Complete table dictionary
     """
     # Find header blocks for bbox calculation
-    left_block = find_block(page, lambda texts: any("Height in Inches" in t for t in texts))[1]
-    right_block = find_block(page, lambda texts: any("Weight in Pounds" in t for t in texts))[1]
+    left_block = find_block_containing(page, "Height in Inches")[1]
+    right_block = find_block_containing(page, "Weight in Pounds")[1]
     
     # Build rows
     data_rows = _build_hw_data_rows(page, row_anchors, h_base_x, h_mod_x, w_base_x, w_mod_x)
@@ -391,26 +387,15 @@ def _build_hw_data_rows(
     """
     data_rows: List[dict] = []
     y_tol = 3.5
+    index = PageIndex.for_page(page)
+    header_words = {"Race", "Base", "Modifier", "Height in Inches", "Weight in Pounds"}
     
     def _find_near(x_target: float, y_center: float) -> str:
-        best_txt = ""
-        best_dx = 1e9
-        for block in page.get("blocks", []):
-            if block.get("type") != "text":
-                continue
-            for line in block.get("lines", []):
-                x0, y0, x1, y1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-                if abs(((y0 + y1) / 2.0) - y_center) > y_tol:
-                    continue
-                cx = (x0 + x1) / 2.0
-                dx = abs(cx - x_target)
-                if dx < best_dx:
-                    txt = _line_text(line)
-                    if txt in {"Race", "Base", "Modifier", "Height in Inches", "Weight in Pounds"}:
-                        continue
-                    best_dx = dx
-                    best_txt = txt
-        return best_txt
+        entry = index.nearest(
+            x_target, y_center, y_tol=y_tol,
+            predicate=lambda e: _line_text(e.line) not in header_words,
+        )
+        return _line_text(entry.line) if entry else ""
     
     for y_c, race_txt in row_anchors:
         row_cells = [
@@ -458,18 +443,12 @@ def _compute_hw_table_bbox(
     
     # Data blocks
     x_targets = [h_base_x, h_mod_x, w_base_x, w_mod_x]
+    index = PageIndex.for_page(page)
     for y_c, _ in row_anchors:
-        for block in page.get("blocks", []):
-            if block.get("type") != "text":
-                continue
-            for line in block.get("lines", []):
-                x0, y0, x1, y1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-                if abs(((y0 + y1) / 2.0) - y_c) > y_tol:
-                    continue
-                cx = (x0 + x1) / 2.0
-                if any(abs(cx - xt) <= 40.0 for xt in x_targets) or x1 <= race_split_x:
-                    x_values.extend([x0, x1])
-                    y_values.extend([y0, y1])
+        for entry in index.near_y(y_c, y_tol):
+            if any(abs(entry.cx - xt) <= 40.0 for xt in x_targets) or entry.x1 <= race_split_x:
+                x_values.extend([entry.x0, entry.x1])
+                y_values.extend([entry.y0, entry.y1])
     
     if not x_values or not y_values:
         bbox = [0.0, hw_bbox[3] + 1.0, float(page.get("width", 612.0) or 612.0), y_max]
@@ -501,8 +480,8 @@ def _cleanup_hw_blocks(
         header_pos: Header position tuple
     """
     # Clear header blocks
-    left_header = find_block(page, lambda texts: any("Height in Inches" in t for t in texts))
-    right_header = find_block(page, lambda texts: any("Weight in Pounds" in t for t in texts))
+    left_header = find_block_containing(page, "Height in Inches")
+    right_header = find_block_containing(page, "Weight in Pounds")
     if left_header:
         left_header[1]["lines"] = []
     if right_header:
@@ -544,6 +523,7 @@ def _cleanup_hw_blocks(
         if len(remaining) != len(block.get("lines", [])):
             block["lines"] = remaining
             update_block_bbox(block) if remaining else block.update({"bbox": [0.0, 0.0, 0.0, 0.0]})
+    PageTextIndex.invalidate(page)
 
 
 
@@ -609,12 +589,12 @@ def _find_age_table_bounds(page: dict) -> tuple | None:
     Returns:
         Tuple of (start_block, y_min, y_max) or None
     """
-    start_match = find_block(page, lambda texts: any("Starting Age" in t for t in texts))
+    start_match = find_block_containing(page, "Starting Age")
     if not start_match:
         return None
     _, start_block = start_match
     y_min = float(start_block.get("bbox", [0, 0, 0, 0])[3]) + 2.0
-    end_match = find_block(page, lambda texts: any("Aging Effects" in t for t in texts))
+    end_match = find_block_containing(page, "Aging Effects")
     y_max = float(end_match[1]["bbox"][1]) - 2.0 if end_match else float(page.get("height", 0) or 0)
     return start_block, y_min, y_max
 
@@ -701,6 +681,7 @@ def _cleanup_age_labels_and_aggregates(page: dict, y_min: float, y_max: float, e
                 update_block_bbox(block)
             else:
                 block["bbox"] = [0.0, 0.0, 0.0, 0.0]
+    PageTextIndex.invalidate(page)
 
 
 def _extract_age_column_positions(page: dict) -> tuple | None:
@@ -712,8 +693,8 @@ def _extract_age_column_positions(page: dict) -> tuple | None:
     Returns:
         Tuple of (base_age_cx, start_var_cx, base_plus_cx, race_split_x) or None
     """
-    base_age_block = find_block(page, lambda texts: any("Base Age" in t for t in texts))
-    base_plus_block = find_block(page, lambda texts: any("(Base + Variable)" in t for t in texts))
+    base_age_block = find_block_containing(page, "Base Age")
+    base_plus_block = find_block_containing(page, "(Base + Variable)")
     if not base_age_block or not base_plus_block:
         return None
     
@@ -751,18 +732,10 @@ def _collect_age_row_anchors(page: dict, y_min: float, y_max: float, base_age_cx
     y_tol = 3.5
     anchors: List[tuple[float, dict]] = []
     
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
-            continue
-        for line in block.get("lines", []):
-            x0, y0, x1, y1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-            if y0 <= y_min or y0 >= y_max:
-                continue
-            cx = (x0 + x1) / 2.0
-            if abs(cx - base_age_cx) <= 40.0:
-                txt = _line_text(line)
-                if txt.isdigit():
-                    anchors.append((((y0 + y1) / 2.0), line))
+    for entry in PageIndex.for_page(page).between_y(y_min, y_max):
+        if abs(entry.cx - base_age_cx) <= 40.0:
+            if _line_text(entry.line).isdigit():
+                anchors.append((entry.cy, entry.line))
     
     if not anchors:
         return []
@@ -824,22 +797,16 @@ def _find_age_race(page: dict, y_center: float, race_split_x: float) -> str:
     best = ""
     best_x = 1e9
     
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
+    for entry in PageIndex.for_page(page).near_y(y_center, y_tol):
+        if entry.x1 >= race_split_x:
             continue
-        for line in block.get("lines", []):
-            lx0, ly0, lx1, ly1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-            if abs(((ly0 + ly1) / 2.0) - y_center) > y_tol:
-                continue
-            if lx1 >= race_split_x:
-                continue
-            txt = _line_text(line)
-            if not txt or txt in {"Race"}:
-                continue
-            # Prefer the leftmost text
-            if lx0 < best_x:
-                best_x = lx0
-                best = txt
+        txt = _line_text(entry.line)
+        if not txt or txt in {"Race"}:
+            continue
+        # Prefer the leftmost text
+        if entry.x0 < best_x:
+            best_x = entry.x0
+            best = txt
     
     return best
 
@@ -857,33 +824,12 @@ def _find_age_near(page: dict, x_target: float, y_center: float, *, accept_patte
     Returns:
         Matching text or empty string
     """
-    y_tol = 3.5
-    best_txt = ""
-    best_dx = 1e9
+    def _accept(entry) -> bool:
+        txt = _line_text(entry.line)
+        return bool(txt) and (not accept_pattern or re.search(accept_pattern, txt) is not None)
     
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
-            continue
-        for line in block.get("lines", []):
-            lx0, ly0, lx1, ly1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-            if abs(((ly0 + ly1) / 2.0) - y_center) > y_tol:
-                continue
-            cx = (lx0 + lx1) / 2.0
-            dx = abs(cx - x_target)
-            if x_window is not None and dx > x_window:
-                continue
-            if dx < best_dx:
-                txt = _line_text(line)
-                if not txt:
-                    continue
-                if accept_pattern:
-                    import re
-                    if not re.search(accept_pattern, txt):
-                        continue
-                best_dx = dx
-                best_txt = txt
-    
-    return best_txt
+    entry = PageIndex.for_page(page).nearest(x_target, y_center, y_tol=3.5, x_window=x_window, predicate=_accept)
+    return _line_text(entry.line) if entry else ""
 
 
 def _find_age_variable(page: dict, y_c: float, base_age_cx: float, base_plus_cx: float, start_var_cx: float) -> str:
@@ -899,30 +845,14 @@ def _find_age_variable(page: dict, y_c: float, base_age_cx: float, base_plus_cx:
     Returns:
         Variable value or empty string
     """
-    y_tol = 3.5
-    var = ""
-    import re as _re
-    best_dx = 1e9
-    
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
-            continue
-        for line in block.get("lines", []):
-            lx0, ly0, lx1, ly1 = [float(c) for c in line.get("bbox", [0, 0, 0, 0])]
-            if abs(((ly0 + ly1) / 2.0) - y_c) > y_tol:
-                continue
-            cx = (lx0 + lx1) / 2.0
-            # Only consider candidates between the two major columns
-            if not (base_age_cx + 10.0 <= cx <= base_plus_cx - 10.0):
-                continue
-            txt = _line_text(line)
-            if _re.match(r"^\d+d\d+$", txt):
-                dx = abs(cx - start_var_cx)
-                if dx < best_dx:
-                    best_dx = dx
-                    var = txt
-    
-    return var
+    def _accept(entry) -> bool:
+        # Only consider candidates between the two major columns
+        if not (base_age_cx + 10.0 <= entry.cx <= base_plus_cx - 10.0):
+            return False
+        return re.match(r"^\d+d\d+$", _line_text(entry.line)) is not None
+    
+    entry = PageIndex.for_page(page).nearest(start_var_cx, y_c, y_tol=3.5, predicate=_accept)
+    return _line_text(entry.line) if entry else ""
 
 
 def _build_age_table_structure(
@@ -952,8 +882,8 @@ def _build_age_table_structure(
     table_rows = [header_row] + data_rows
     
     # Compute bbox
-    base_age_block = find_block(page, lambda texts: any("Base Age" in t for t in texts))[1]
-    base_plus_block = find_block(page, lambda texts: any("(Base + Variable)" in t for t in texts))[1]
+    base_age_block = find_block_containing(page, "Base Age")[1]
+    base_plus_block = find_block_containing(page, "(Base + Variable)")[1]
     
     col_xs = [
         float(base_age_block["bbox"][0]), float(base_age_block["bbox"][2]),
@@ -1091,3 +1021,4 @@ def _cleanup_age_table_blocks(
                     update_block_bbox(block)
                 else:
                     block["bbox"] = [0.0, 0.0, 0.0, 0.0]
+    PageTextIndex.invalidate(page)
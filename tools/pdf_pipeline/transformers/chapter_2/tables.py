@@ -18,17 +18,18 @@ from ..journal import (
     _compute_bbox_from_cells,
     _join_fragments,
 )
-from .common import update_block_bbox, find_block
+from ...utils.text_index import PageTextIndex
+from .common import update_block_bbox, find_block, find_block_exact
 
 
 def process_table_2_ability_adjustments(page0: dict) -> None:
     """Process Table 2: Ability Adjustments on page 0."""
-    found = find_block(page0, lambda texts: any(text == "Table 2: Ability Adjustments" for text in texts))
+    found = find_block_exact(page0, "Table 2: Ability Adjustments")
     if not found:
         return
     
     heading_idx, heading_block = found
-    next_heading = find_block(page0, lambda texts: any(text == "Racial Ability Requirements" for text in texts))
+    next_heading = find_block_exact(page0, "Racial Ability Requirements")
     heading_bbox = [float(coord) for coord in heading_block.get("bbox", [0, 0, 0, 0])]
     y_min = heading_bbox[1] - 2.0
     y_max = (
@@ -94,6 +95,7 @@ def process_table_2_ability_adjustments(page0: dict) -> None:
         page0.setdefault("tables", []).append(table)
         for idx in table_blocks:
             page0["blocks"][idx]["lines"] = []
+        PageTextIndex.invalidate(page0)
 
 
 
@@ -247,6 +249,7 @@ def process_racial_ability_requirements_table(page0: dict) -> None:
                 update_block_bbox(block)
             else:
                 block["bbox"] = [0.0, 0.0, 0.0, 0.0]
+    PageTextIndex.invalidate(page0)
 
 
 
@@ -353,6 +356,7 @@ def process_table_3_racial_class_limits(page1: dict) -> None:
         if idx == heading_idx:
             continue
         page1["blocks"][idx]["lines"] = []
+    PageTextIndex.invalidate(page1)
 
     # Note: Legend blocks are NOT cleared here - they will be preserved in the output
     # and reordered by HTML post-processing to appear after the table.
@@ -364,14 +368,14 @@ def process_table_3_racial_class_limits(page1: dict) -> None:
 
 def process_other_languages_table(page2: dict) -> None:
     """Process Other Languages table on page 2."""
-    match = find_block(page2, lambda texts: any(text == "Other Languages" for text in texts))
+    match = find_block_exact(page2, "Other Languages")
     if not match:
         return
     
     heading_idx, heading_block = match
     heading_bbox = [float(coord) for coord in heading_block.get("bbox", [0, 0, 0, 0])]
     y_min = heading_bbox[1] - 2.0
-    next_heading = find_block(page2, lambda texts: any(text == "Dwarves" for text in texts))
+    next_heading = find_block_exact(page2, "Dwarves")
     y_max = float(next_heading[1]["bbox"][1]) - 2.0 if next_heading else float(page2.get("height", 0) or 0)
 
     table_blocks = []
@@ -426,6 +430,7 @@ def process_other_languages_table(page2: dict) -> None:
         page2.setdefault("tables", []).append(table)
         for idx in table_blocks:
             page2["blocks"][idx]["lines"] = []
+        PageTextIndex.invalidate(page2)
 
 
 
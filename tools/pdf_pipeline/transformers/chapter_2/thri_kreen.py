@@ -18,6 +18,7 @@ from ..journal import (
     _table_from_rows,
     _compute_bbox_from_cells,
 )
+from ...utils.text_index import PageTextIndex
 from .common import update_block_bbox, find_block
 
 
@@ -80,6 +81,7 @@ def force_thri_kreen_paragraph_breaks(page: dict) -> None:
     
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 
@@ -132,6 +134,7 @@ def force_thri_kreen_roleplaying_paragraph_breaks(page: dict) -> None:
     
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 
@@ -15,11 +15,13 @@ from .journal import (
     _compute_bbox_from_cells,
     _join_fragments,
 )
+from ..utils.text_index import PageTextIndex
 
 # Import extracted functions from chapter_2 sub-modules
 from .chapter_2.common import (
     update_block_bbox as _update_block_bbox,
     find_block as _find_block,
+    find_block_containing as _find_block_containing,
 )
 from .chapter_2.tables import (
     process_table_2_ability_adjustments as _process_table_2_ability_adjustments,
@@ -191,6 +193,7 @@ def _merge_ability_scores_header(page: dict) -> None:
             # Replace the two lines with the merged line
             block['lines'] = [merged_line] + lines[2:]
             break
+    PageTextIndex.invalidate(page)
 
 
 def _force_dwarves_paragraph_breaks(page: dict) -> None:
@@ -253,6 +256,7 @@ def _force_dwarves_paragraph_breaks(page: dict) -> None:
     # Insert new blocks
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 def _force_half_elves_roleplaying_paragraph_breaks(page: dict) -> None:
@@ -310,6 +314,7 @@ def _force_half_elves_roleplaying_paragraph_breaks(page: dict) -> None:
     # Insert new blocks
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
 
 # _force_human_paragraph_breaks - MOVED to chapter_2/humans.py
@@ -342,7 +347,7 @@ def _process_aging_effects_table(page: dict) -> None:
         return _normalize_plain_text("".join(span.get("text", "") for span in line.get("spans", []))).strip()
     
     # Section bounds: from "Aging Effects" to the next major header or page end
-    start_match = _find_block(page, lambda texts: any("Aging Effects" in t for t in texts))
+    start_match = _find_block_containing(page, "Aging Effects")
     if not start_match:
         return
     _, start_block = start_match
@@ -394,13 +399,14 @@ def _process_aging_effects_table(page: dict) -> None:
                         _update_block_bbox(block)
                     else:
                         block["bbox"] = [0.0, 0.0, 0.0, 0.0]
+            PageTextIndex.invalidate(page)
             return
     
     # Find column header positions
     race_block = _find_block(page, lambda texts: any(t.strip().lower().replace(" ", "") == "race" or t == "R a c e" for t in texts))
-    mid_block = _find_block(page, lambda texts: any("Middle Age" in t for t in texts))
-    old_block = _find_block(page, lambda texts: any("Old Age" in t for t in texts))
-    ven_block = _find_block(page, lambda texts: any("Venerable" in t for t in texts))
+    mid_block = _find_block_containing(page, "Middle Age")
+    old_block = _find_block_containing(page, "Old Age")
+    ven_block = _find_block_containing(page, "Venerable")
     
     if not (race_block and mid_block and old_block and ven_block):
         return
@@ -560,6 +566,7 @@ def _process_aging_effects_table(page: dict) -> None:
                 _update_block_bbox(block)
             else:
                 block["bbox"] = [0.0, 0.0, 0.0, 0.0]
+    PageTextIndex.invalidate(page)
 
 def apply_chapter_2_adjustments(section_data: dict) -> None:
     """Apply all Chapter 2 (Player Character Races) specific adjustments.
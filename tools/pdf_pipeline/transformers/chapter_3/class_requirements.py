@@ -10,12 +10,17 @@ table containing:
 """
 
 import logging
+import re
 from typing import List, Dict
 
+from ...utils.entities import ClassEntity
 from .common import extract_class_ability_table
 
 logger = logging.getLogger(__name__)
 
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\s+(?=[a-z])")
+_ABILITY_SCORE_RE = re.compile(r"(Strength|Dexterity|Constitution|Intelligence|Wisdom|Charisma)\s+(\d+)")
+
 
 # Class names that require requirements tables
 # This is the definitive list of all player classes in Chapter 3
@@ -326,6 +331,28 @@ def extract_psionicist_requirements_table(page: dict) -> bool:
     return extract_class_ability_table(page, "Psionicist")
 
 
+# Page index (0-based within the chapter) and extractor of each class's table
+CLASS_REQUIREMENTS_PAGES = {
+    # Warriors
+    "Fighter": (3, extract_fighter_requirements_table),  # PDF page 24
+    "Gladiator": (5, extract_gladiator_requirements_table),  # PDF page 26
+    "Ranger": (6, extract_ranger_requirements_table),  # PDF page 27
+    # Wizards
+    "Defiler": (7, extract_defiler_requirements_table),  # PDF page 28
+    "Preserver": (8, extract_preserver_requirements_table),  # PDF page 29
+    "Illusionist": (9, extract_illusionist_requirements_table),  # PDF page 30
+    # Priests
+    "Cleric": (10, extract_cleric_requirements_table),  # PDF page 31
+    "Druid": (12, extract_druid_requirements_table),  # PDF page 33
+    "Templar": (13, extract_templar_requirements_table),  # PDF page 34
+    # Rogues
+    "Bard": (16, extract_bard_requirements_table),  # PDF page 37
+    "Thief": (17, extract_thief_requirements_table),  # PDF page 38
+    # Psionicist
+    "Psionicist": (18, extract_psionicist_requirements_table),  # PDF page 39
+}
+
+
 def extract_all_class_requirements_tables(pages: List[dict]) -> Dict[str, bool]:
     """Extract all class requirements tables from their respective pages.
     
@@ -338,47 +365,9 @@ def extract_all_class_requirements_tables(pages: List[dict]) -> Dict[str, bool]:
     logger.info("=== Extracting ALL class requirements tables ===")
     
     results = {}
-    
-    # Warriors
-    if len(pages) > 3:  # Fighter is on page 3 (0-indexed), PDF page 24
-        results["Fighter"] = extract_fighter_requirements_table(pages[3])
-    
-    if len(pages) > 5:  # Gladiator is on page 5, PDF page 26
-        results["Gladiator"] = extract_gladiator_requirements_table(pages[5])
-    
-    if len(pages) > 6:  # Ranger is on page 6, PDF page 27
-        results["Ranger"] = extract_ranger_requirements_table(pages[6])
-    
-    # Wizards
-    if len(pages) > 7:  # Defiler is on page 7, PDF page 28
-        results["Defiler"] = extract_defiler_requirements_table(pages[7])
-    
-    if len(pages) > 8:  # Preserver is on page 8, PDF page 29
-        results["Preserver"] = extract_preserver_requirements_table(pages[8])
-    
-    if len(pages) > 9:  # Illusionist is on page 9, PDF page 30
-        results["Illusionist"] = extract_illusionist_requirements_table(pages[9])
-    
-    # Priests
-    if len(pages) > 10:  # Cleric is on page 10, PDF page 31
-        results["Cleric"] = extract_cleric_requirements_table(pages[10])
-    
-    if len(pages) > 12:  # Druid is on page 12, PDF page 33
-        results["Druid"] = extract_druid_requirements_table(pages[12])
-    
-    if len(pages) > 13:  # Templar is on page 13, PDF page 34
-        results["Templar"] = extract_templar_requirements_table(pages[13])
-    
-    # Rogues
-    if len(pages) > 16:  # Bard is on page 16, PDF page 37
-        results["Bard"] = extract_bard_requirements_table(pages[16])
-    
-    if len(pages) > 17:  # Thief is on page 17, PDF page 38
-        results["Thief"] = extract_thief_requirements_table(pages[17])
-    
-    # Psionicist
-    if len(pages) > 18:  # Psionicist is on page 18, PDF page 39
-        results["Psionicist"] = extract_psionicist_requirements_table(pages[18])
+    for class_name, (page_idx, extract) in CLASS_REQUIREMENTS_PAGES.items():
+        if len(pages) > page_idx:
+            results[class_name] = extract(pages[page_idx])
     
     # Log results
     successful = [k for k, v in results.items() if v]
@@ -390,3 +379,57 @@ def extract_all_class_requirements_tables(pages: List[dict]) -> Dict[str, bool]:
     
     return results
 
+
+def _split_list(text: str) -> List[str]:
+    """Split a comma separated table value, undoing line-break hyphenation and letter spacing."""
+    items = []
+    for item in text.split(","):
+        words = _HYPHEN_BREAK_RE.sub(r"\1", item).split()
+        if not words:
+            continue
+        item = "".join(words) if all(len(word) == 1 for word in words) else " ".join(words)
+        items.append(item[0].upper() + item[1:])
+    return items
+
+
+def class_entities(pages: List[dict], source: str = "chapter-three-player-character-classes") -> List[ClassEntity]:
+    """Build class records from the requirements tables on the class pages.
+    
+    Args:
+        pages: Chapter pages after the requirements tables were extracted
+        source: Chapter slug recorded on the records
+        
+    Returns:
+        One record per class whose table was found
+    """
+    classes = []
+    for class_name, (page_idx, _) in CLASS_REQUIREMENTS_PAGES.items():
+        if len(pages) <= page_idx:
+            continue
+        table = next(
+            (block["__class_requirements_table"] for block in pages[page_idx].get("blocks", [])
+             if "__class_requirements_table" in block),
+            None,
+        )
+        if table is None:
+            continue
+        
+        values = {}
+        for row in table.get("rows", []):
+            cells = row.get("cells", [])
+            if len(cells) >= 2:
+                values[cells[0].get("text", "").rstrip(":").strip().lower()] = cells[1].get("text", "")
+        
+        requirements = {
+            ability.lower(): int(score)
+            for ability, score in _ABILITY_SCORE_RE.findall(values.get("ability requirements", ""))
+        }
+        primes = next((value for label, value in values.items() if label.startswith("prime requisite")), "")
+        classes.append(ClassEntity(
+            name=class_name,
+            source=source,
+            ability_requirements=requirements,
+            prime_requisites=_split_list(primes),
+            races_allowed=_split_list(values.get("races allowed", "")),
+        ))
+    return classes
@@ -10,6 +10,8 @@ import logging
 import re
 from typing import List, Optional, Tuple, Union
 
+from ...utils.text_index import PageTextIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,60 +88,42 @@ def extract_class_ability_table(page: dict, class_name: str) -> bool:
     """
     logger.debug(f"Extracting requirements table for {class_name}")
     
+    text_index = PageTextIndex.for_page(page, normalize_plain_text)
+    
     # Strategy 1: Check if class name and ability requirements are in a single block (like Fighter)
-    for idx, block in enumerate(page.get("blocks", [])):
-        if block.get("type") != "text":
-            continue
-        
-        lines = block.get("lines", [])
-        if not lines:
-            continue
-        
-        text = " ".join(
-            normalize_plain_text("".join(span.get("text", "") for span in line.get("spans", [])))
-            for line in lines
-        )
+    # (the block starts with the class name followed by ability requirements)
+    match = text_index.find_block_where(lambda t: t.startswith(class_name + " Ability Requirement"), sep=" ")
+    if match:
+        idx, block = match
+        text = text_index.block_text(idx, sep=" ")
+        # Strip the class name from the beginning to get just the ability requirements
+        ability_text = text[len(class_name) + 1:] if text.startswith(class_name + " ") else text
         
-        # Check if this block starts with the class name followed by ability requirements
-        if text.startswith(class_name + " Ability Requirement"):
-            # Strip the class name from the beginning to get just the ability requirements
-            ability_text = text[len(class_name) + 1:] if text.startswith(class_name + " ") else text
-            
-            table_rows = parse_class_ability_requirements(ability_text)
-            if table_rows and len(table_rows) >= 2:
-                # Create a new header block for the class name
-                create_class_name_header_block(page, class_name, block, idx)
-                # Then create the table for ability requirements
-                create_class_ability_table(page, table_rows, block["bbox"], idx + 1)  # idx+1 because we inserted a header
-                return True
-            return False
+        table_rows = parse_class_ability_requirements(ability_text)
+        if table_rows and len(table_rows) >= 2:
+            # Create a new header block for the class name
+            create_class_name_header_block(page, class_name, block, idx)
+            # Then create the table for ability requirements
+            create_class_ability_table(page, table_rows, block["bbox"], idx + 1)  # idx+1 because we inserted a header
+            return True
+        return False
     
     # Strategy 2: Look for separate class header followed by ability requirements blocks (like Gladiator)
     logger.debug(f"  {class_name}: Trying Strategy 2 - looking for separate header")
     class_header_idx = None
-    for idx, block in enumerate(page.get("blocks", [])):
-        if block.get("type") != "text":
-            continue
-        
-        lines = block.get("lines", [])
-        if not lines:
-            continue
-        
-        text = " ".join(
-            normalize_plain_text("".join(span.get("text", "") for span in line.get("spans", [])))
-            for line in lines
+    # Check if a block is just the class header
+    match = text_index.find_block_text(class_name, sep=" ")
+    if match:
+        class_header_idx = match[0]
+        logger.debug(f"  {class_name}: Found class header at block {class_header_idx}")
+    # Special case for Psionicist which has "(Dark Sun variation)" in the header
+    if class_name == "Psionicist":
+        variation = text_index.find_block_where(
+            lambda t: t.strip().startswith("Psionicist") and "(Dark Sun variation)" in t, sep=" "
         )
-        
-        # Check if this block is just the class header
-        # Special case for Psionicist which has "(Dark Sun variation)" in the header
-        if text.strip() == class_name:
-            class_header_idx = idx
-            logger.debug(f"  {class_name}: Found class header at block {idx}")
-            break
-        elif class_name == "Psionicist" and text.strip().startswith("Psionicist") and "(Dark Sun variation)" in text:
-            class_header_idx = idx
-            logger.debug(f"  {class_name}: Found Psionicist header with variation at block {idx}")
-            break
+        if variation and (class_header_idx is None or variation[0] < class_header_idx):
+            class_header_idx = variation[0]
+            logger.debug(f"  {class_name}: Found Psionicist header with variation at block {class_header_idx}")
     
     if class_header_idx is None:
         logger.debug(f"  {class_name}: Strategy 2 - class header not found")
@@ -367,6 +351,7 @@ def create_class_name_header_block(page: dict, class_name: str, original_block:
     
     # Insert the header block at the specified position
     page["blocks"].insert(insert_at_idx, header_block)
+    PageTextIndex.invalidate(page)
 
 
 def create_class_ability_table(page: dict, table_rows: list, bbox: list, block_indices: Union[int, List[int]]) -> None:
@@ -410,6 +395,7 @@ def create_class_ability_table(page: dict, table_rows: list, bbox: list, block_i
                     }
             
             logger.debug(f"Inserted table marker block at index {first_idx}, cleared {len(block_indices) - 1} additional blocks")
+    PageTextIndex.invalidate(page)
 
 
 def update_block_bbox(block: dict) -> None:
@@ -571,6 +557,7 @@ def extract_class_ability_requirements_table(page: dict) -> None:
         logger.warning(f"Did not insert table. header_idx={header_idx}, blocks_to_clear={len(blocks_to_clear)}")
     
     logger.info("=== extract_class_ability_requirements_table END ===")
+    PageTextIndex.invalidate(page)
 
 
 
@@ -626,4 +613,5 @@ def force_warrior_classes_paragraph_breaks(page: dict) -> None:
     
     for offset, (insert_idx, new_block) in enumerate(blocks_to_insert):
         page["blocks"].insert(insert_idx + offset, new_block)
+    PageTextIndex.invalidate(page)
 
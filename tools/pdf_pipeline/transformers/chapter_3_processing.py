@@ -8,7 +8,12 @@ from copy import deepcopy
 from typing import Optional, List, Tuple, Union
 import re
 
+from ..utils.entities import emit_entities
+from ..utils.page_index import PageIndex
+from ..utils.page_store import get_page_service
+
 # Import extracted functions from chapter_3 sub-modules
+from .chapter_3.class_requirements import class_entities
 from .chapter_3.warrior import (
     extract_fighters_followers_table as _extract_fighters_followers_table,
     force_gladiator_paragraph_breaks as _force_gladiator_paragraph_breaks,
@@ -914,23 +919,15 @@ def _extract_text_between_positions(page: dict, start_y: float, end_y: float, x_
     """
     results = []
     
-    for block in page.get("blocks", []):
-        if block.get("type") != "text":
-            continue
-        
-        bbox = block.get("bbox", [0, 0, 0, 0])
-        x, y = bbox[0], bbox[1]
+    for entry in PageIndex.for_page(page).column(x_min, x_max, start_y, end_y, level="block"):
+        text = ''
+        for line in entry.block.get('lines', []):
+            for span in line.get('spans', []):
+                text += span.get('text', '')
         
-        # Check if block is in the right position
-        if start_y < y < end_y and x_min <= x <= x_max:
-            text = ''
-            for line in block.get('lines', []):
-                for span in line.get('spans', []):
-                    text += span.get('text', '')
-            
-            text = text.strip()
-            if text:
-                results.append((y, text))
+        text = text.strip()
+        if text:
+            results.append((entry.block.get("bbox", [0, 0, 0, 0])[1], text))
     
     # Sort by Y position
     results.sort(key=lambda x: x[0])
@@ -1115,26 +1112,25 @@ def _extract_combinations_from_source_pdf(pdf_path: str, page_nums: list[int]) -
     """
     Extract multi-class combinations directly from source PDF.
     
-    This extracts from the SOURCE PDF before any processing, ensuring we get
-    clean data without mixed tables or processed artifacts.
+    This reads the SOURCE page text before any processing, ensuring we get
+    clean data without mixed tables or processed artifacts. Pages come from
+    the shared page service (the extraction page store, falling back to
+    opening the PDF).
     
     Args:
         pdf_path: Path to the source PDF
-        page_nums: List of PDF page numbers to extract from
+        page_nums: List of 0-based PDF page indexes to extract from
     
     Returns:
         List of (page_num, y, x, combination_text) tuples
     """
-    import fitz
-    
-    doc = fitz.open(pdf_path)
+    service = get_page_service(pdf_path)
     all_combos = []
     
     class_names = ['Fighter', 'Cleric', 'Thief', 'Psionicist', 'Mage', 'Illusionist', 'Ranger', 'Druid']
     
     for page_num in page_nums:
-        page = doc[page_num]
-        blocks = page.get_text("dict")["blocks"]
+        blocks = service.page(page_num + 1, "dict")["blocks"]
         
         for block in blocks:
             if block['type'] == 0:  # Text block
@@ -1160,7 +1156,6 @@ def _extract_combinations_from_source_pdf(pdf_path: str, page_nums: list[int]) -
                             if '/' in subpart:
                                 all_combos.append((page_num, y, x, subpart))
     
-    doc.close()
     return all_combos
 
 
@@ -1409,3 +1404,10 @@ def apply_chapter_3_adjustments(section_data: dict) -> None:
     # Adjust header levels for proper hierarchy
     _adjust_header_levels(pages)
     
+    # Hand the class requirements out as class entities; fragments without
+    # the class pages (as in tests) have none to hand out
+    source = section_data.get("slug", "chapter-three-player-character-classes")
+    classes = class_entities(pages, source)
+    if classes:
+        emit_entities("class", source, classes)
+    
@@ -41,6 +41,9 @@ from .equipment import (
     extract_common_wages_table,
 )
 
+# Re-export entity extraction
+from .entities import weapon_entities, equipment_entities, emit_chapter_6_entities
+
 __all__ = [
     # Common utilities
     "normalize_plain_text",
@@ -65,5 +68,9 @@ __all__ = [
     # Equipment
     "extract_household_provisions_table",
     "extract_common_wages_table",
+    # Entities
+    "weapon_entities",
+    "equipment_entities",
+    "emit_chapter_6_entities",
 ]
 
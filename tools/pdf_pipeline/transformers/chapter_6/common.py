@@ -7,11 +7,21 @@ This module contains shared utility functions used across all Chapter 6 processo
 from __future__ import annotations
 
 import logging
-import re
 from typing import List, Tuple
 
+try:
+    from ...utils.regex_registry import regex
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.regex_registry import regex
+
 logger = logging.getLogger(__name__)
 
+_LETTER_GAP_RE = regex("chapter_6.letter_gap", r'(?<=[A-Za-z])\s+(?=[A-Za-z])')
+_SPACED_LETTER_RE = regex("chapter_6.spaced_letter", r'\b([A-Za-z])\s+(?=[A-Za-z]\b)')
+_SPACED_UNIT_RE = regex("chapter_6.spaced_unit", r'(\d+)\s+([a-z])\s+([a-z])\b')
+_SPACED_CP_RE = regex("chapter_6.spaced_cp", r'\bc\s+p\b')
+_SPACED_SP_RE = regex("chapter_6.spaced_sp", r'\bs\s+p\b')
+
 
 def normalize_plain_text(text: str) -> str:
     """Normalize text by replacing special characters."""
@@ -23,7 +33,7 @@ def normalize_plain_text(text: str) -> str:
     text = text.replace('\u2014', '--')  # Em dash
     text = text.replace('\xad', '')  # Soft hyphen
     # Remove extraneous whitespace (e.g., "D a i l y" -> "Daily")
-    text = re.sub(r'(?<=[A-Za-z])\s+(?=[A-Za-z])', lambda m: '' if len(m.group(0).strip()) == 0 and all(len(word) == 1 for word in m.string[max(0, m.start()-5):m.end()+5].split()) else m.group(0), text)
+    text = _LETTER_GAP_RE.sub(lambda m: '' if len(m.group(0).strip()) == 0 and all(len(word) == 1 for word in m.string[max(0, m.start()-5):m.end()+5].split()) else m.group(0), text)
     return text
 
 
@@ -32,13 +42,13 @@ def normalize_plain_text(text: str) -> str:
 def clean_whitespace(text: str) -> str:
     """Clean extraneous whitespace from text."""
     # Remove spaces between single letters (e.g., "D a i l y" -> "Daily")
-    text = re.sub(r'\b([A-Za-z])\s+(?=[A-Za-z]\b)', r'\1', text)
+    text = _SPACED_LETTER_RE.sub(r'\1', text)
     # Remove spaces in numbers with units (e.g., "1 c p" -> "1 cp")
-    text = re.sub(r'(\d+)\s+([a-z])\s+([a-z])\b', r'\1 \2\3', text)
+    text = _SPACED_UNIT_RE.sub(r'\1 \2\3', text)
     # Remove space before p in "c p" -> "cp"
-    text = re.sub(r'\bc\s+p\b', 'cp', text)
+    text = _SPACED_CP_RE.sub('cp', text)
     # Remove space before p in "s p" -> "sp"
-    text = re.sub(r'\bs\s+p\b', 'sp', text)
+    text = _SPACED_SP_RE.sub('sp', text)
     return text.strip()
 
 
@@ -0,0 +1,103 @@
+"""
+Weapon and equipment entities for Chapter 6.
+
+Reads the tables the chapter 6 extractors attach to blocks and turns their
+rows into ``WeaponEntity`` and ``EquipmentEntity`` records.
+"""
+
+import logging
+from typing import Iterator, List, Optional
+
+from ...utils.entities import EquipmentEntity, WeaponEntity, emit_entities
+
+logger = logging.getLogger(__name__)
+
+SOURCE = "chapter-six-money-and-equipment"
+
+# Price list tables and the equipment category of their rows
+EQUIPMENT_TABLES = {
+    "__household_provisions_table": "Household Provisions",
+    "__barding_table": "Barding",
+    "__transport_table": "Transport",
+    "__animals_table": "Animals",
+}
+
+
+def _find_table(section_data: dict, key: str) -> Optional[dict]:
+    """Return the first table attached under ``key``."""
+    for page in section_data.get("pages", []):
+        for block in page.get("blocks", []):
+            if key in block:
+                return block[key]
+    return None
+
+
+def _data_rows(table: dict) -> Iterator[List[str]]:
+    """Yield the unstripped cell texts of a table's rows below its header rows."""
+    for row in table.get("rows", [])[table.get("header_rows", 1):]:
+        yield [cell.get("text", "") for cell in row.get("cells", [])]
+
+
+def weapon_entities(section_data: dict) -> List[WeaponEntity]:
+    """Build weapon records from the New Weapons table."""
+    table = _find_table(section_data, "__new_weapons_table")
+    if table is None:
+        logger.warning("New Weapons table not found, no weapon entities")
+        return []
+
+    source = section_data.get("slug", SOURCE)
+    weapons = []
+    for cells in _data_rows(table):
+        cells = [text.strip() for text in cells] + [""] * (8 - len(cells))
+        name, cost, weight, size, damage_type, speed, damage_sm, damage_l = cells[:8]
+        if not name:
+            continue
+        weapons.append(WeaponEntity(
+            name=name, source=source, cost=cost, weight=weight, size=size,
+            damage_type=damage_type, speed=speed,
+            damage_small_medium=damage_sm, damage_large=damage_l,
+        ))
+    return weapons
+
+
+def equipment_entities(section_data: dict) -> List[EquipmentEntity]:
+    """Build equipment records from the price list tables.
+
+    A row without a price labels a group (``Chariot``, ``Kank``); the rows
+    below it that start in lower case, with a digit or indented are its
+    variants and are named ``Group (variant)``.
+    """
+    source = section_data.get("slug", SOURCE)
+    items = []
+    for key, category in EQUIPMENT_TABLES.items():
+        table = _find_table(section_data, key)
+        if table is None:
+            logger.warning(f"{category} table not found, no entities for it")
+            continue
+
+        group = None
+        for cells in _data_rows(table):
+            raw_name = cells[0] if cells else ""
+            cost = cells[1].strip() if len(cells) > 1 else ""
+            weight = cells[2].strip() if len(cells) > 2 else ""
+            name = raw_name.strip()
+            if not name:
+                continue
+            if group and (raw_name[:1].isspace() or name[:1].islower() or name[:1].isdigit()):
+                name = f"{group} ({name})"
+            elif not cost:
+                group = name
+                continue
+            else:
+                group = None
+            items.append(EquipmentEntity(
+                name=name, source=source, category=category, cost=cost, weight=weight,
+            ))
+    return items
+
+
+def emit_chapter_6_entities(section_data: dict) -> None:
+    """Emit the chapter's weapon and equipment entities."""
+    source = section_data.get("slug", SOURCE)
+    emit_entities("weapon", source, weapon_entities(section_data))
+    emit_entities("equipment", source, equipment_entities(section_data))
@@ -33,6 +33,7 @@ from .chapter_6.equipment import (
     extract_household_provisions_table as _extract_household_provisions_table,
     extract_common_wages_table as _extract_common_wages_table,
 )
+from .chapter_6.entities import emit_chapter_6_entities as _emit_chapter_6_entities
 
 
 # _normalize_plain_text - MOVED to chapter_6/common.py
@@ -336,6 +337,8 @@ def apply_chapter_6_adjustments(section_data: dict) -> None:
     _extract_new_weapons_table(section_data)
     _suppress_duplicate_weapon_column_headers(section_data)
     
+    _emit_chapter_6_entities(section_data)
+    
     # Verify markers are attached
     with open('/tmp/chapter6_debug.txt', 'a') as f:
         f.write(f"\n=== Verifying table markers after all adjustments ===\n")
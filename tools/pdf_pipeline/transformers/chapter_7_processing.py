@@ -10,9 +10,14 @@ import json
 import logging
 import re
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.entities import SpellEntity, emit_entities, parse_level
 
 logger = logging.getLogger(__name__)
 
+SPELL_ENTITY_SOURCE = "chapter-seven-magic"
+
 
 def _clean_text(text: str) -> str:
     """Clean text extracted from PDF by removing problematic Unicode characters.
@@ -186,6 +191,8 @@ def apply_chapter_7_adjustments(section_data: dict) -> None:
     
     # Save structured spell data to JSON
     _save_spell_data(spells_data)
+    slug = section_data.get("slug", SPELL_ENTITY_SOURCE)
+    emit_entities("spell", slug, spell_entities(spells_data["spells_by_sphere"], slug))
     
     # Mark spell blocks for special rendering (as list items)
     _mark_spell_blocks_for_rendering(section_data, spells_data)
@@ -942,6 +949,23 @@ def _save_spell_data(spells_data: dict) -> None:
     logger.info(f"Saved spell data to {output_path}")
 
 
+def spell_entities(spheres: Dict[str, List[dict]], source: str = SPELL_ENTITY_SOURCE) -> List[SpellEntity]:
+    """Build spell entities from spell lists keyed by sphere.
+    
+    Args:
+        spheres: Sphere name to spell dicts with ``name`` and ``level`` ("1st")
+        source: Chapter slug recorded on the records
+        
+    Returns:
+        One record per listed spell
+    """
+    return [
+        SpellEntity(name=spell["name"], source=source, level=parse_level(spell["level"]), sphere=sphere)
+        for sphere, spells in spheres.items()
+        for spell in spells
+    ]
+
+
 def _mark_spell_blocks_for_rendering(section_data: dict, spells_data: dict) -> None:
     """Mark spell text blocks for special rendering as list items.
     
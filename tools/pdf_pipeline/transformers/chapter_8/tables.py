@@ -11,6 +11,7 @@ import logging
 import re
 from typing import List, Tuple, Optional
 
+from ...utils.page_index import PageIndex
 from .common import (
     normalize_plain_text,
     update_block_bbox,
@@ -35,47 +36,36 @@ def _build_block_info_from_page(page: dict, page_num: int) -> list:
     Returns:
         list: Block info dictionaries with spatial data
     """
-    blocks = page.get("blocks", [])
     block_info = []
     
-    for idx, block in enumerate(blocks):
-        if block.get("type") != "text":
-            continue
-        
-        lines = block.get("lines", [])
-        if not lines:
-            continue
-        
-        bbox = block.get("bbox", [0, 0, 0, 0])
-        x0, y0, x1, y1 = bbox
-        
-        # Process each line separately - lines have their own bounding boxes!
-        for line_idx, line in enumerate(lines):
-            line_texts = []
-            for span in line.get("spans", []):
-                text = span.get("text", "").strip()
-                if text:
-                    line_texts.append(text)
+    # Process each line separately - lines have their own bounding boxes!
+    for entry in PageIndex.for_page(page).entries("line"):
+        line = entry.line
+        line_texts = []
+        for span in line.get("spans", []):
+            text = span.get("text", "").strip()
+            if text:
+                line_texts.append(text)
+        
+        if line_texts:
+            combined_text = " ".join(line_texts)
+            line_bbox = line.get("bbox", entry.block.get("bbox", [0, 0, 0, 0]))
+            line_x0, line_y0, line_x1, line_y1 = line_bbox
             
-            if line_texts:
-                combined_text = " ".join(line_texts)
-                line_bbox = line.get("bbox", bbox)
-                line_x0, line_y0, line_x1, line_y1 = line_bbox
-                
-                is_legend = combined_text.strip().startswith("*")
-                block_info.append({
-                    "block_idx": idx,
-                    "text": combined_text,
-                    "x": line_x0,
-                    "y": line_y0,
-                    "width": line_x1 - line_x0,
-                    "height": line_y1 - line_y0,
-                    "bbox": line_bbox,
-                    "is_header": is_class_award_header(combined_text),
-                    "is_column_header": is_column_header(combined_text),
-                    "is_xp": is_xp_value(combined_text),
-                    "is_legend": is_legend,
-                })
+            is_legend = combined_text.strip().startswith("*")
+            block_info.append({
+                "block_idx": entry.block_idx,
+                "text": combined_text,
+                "x": line_x0,
+                "y": line_y0,
+                "width": line_x1 - line_x0,
+                "height": line_y1 - line_y0,
+                "bbox": line_bbox,
+                "is_header": is_class_award_header(combined_text),
+                "is_column_header": is_column_header(combined_text),
+                "is_xp": is_xp_value(combined_text),
+                "is_legend": is_legend,
+            })
     
     return block_info
 
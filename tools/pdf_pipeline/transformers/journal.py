@@ -10,6 +10,11 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    from ..utils.profiling import profile_call
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.profiling import profile_call
+
 # Import all functions from sub-modules
 from .journal_lib import (
     # Utilities
@@ -91,13 +96,13 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         f.write(f"Processing slug: {slug}\n")
     if slug == "chapter-one-the-world-of-athas":
         from . import chapter_one_world_processing
-        chapter_one_world_processing.apply_chapter_one_world_adjustments(section_data)
+        profile_call("hook", chapter_one_world_processing.apply_chapter_one_world_adjustments, section_data)
     elif slug == "chapter-two-athasian-society":
         from . import chapter_two_athasian_society_processing
-        chapter_two_athasian_society_processing.apply_chapter_two_athasian_society_adjustments(section_data)
+        profile_call("hook", chapter_two_athasian_society_processing.apply_chapter_two_athasian_society_adjustments, section_data)
     elif slug == "chapter-two-player-character-races":
         from . import chapter_2_processing
-        chapter_2_processing.apply_chapter_2_adjustments(section_data)
+        profile_call("hook", chapter_2_processing.apply_chapter_2_adjustments, section_data)
         paragraph_breaks.extend(
             [
                 "The player character races are no exception to this",
@@ -110,10 +115,10 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
     elif slug == "chapter-three-player-character-classes":
         # Chapter 3 processing - apply table extractions and adjustments
         from . import chapter_3_processing
-        chapter_3_processing.apply_chapter_3_adjustments(section_data)
+        profile_call("hook", chapter_3_processing.apply_chapter_3_adjustments, section_data)
     elif slug == "chapter-six-money-and-equipment":
         from . import chapter_6_processing
-        chapter_6_processing.apply_chapter_6_adjustments(section_data)
+        profile_call("hook", chapter_6_processing.apply_chapter_6_adjustments, section_data)
         # Chapter 6 "What Things Are Worth" section - 7 paragraphs
         # Chapter 6 "Protracted Barter" section - 3 paragraphs
         # Chapter 6 "Starting Money" section - 2 paragraphs
@@ -148,10 +153,10 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         )
     elif slug == "chapter-five-monsters-of-athas":
         from . import chapter_5_processing
-        chapter_5_processing.apply_chapter_5_adjustments(section_data)
+        profile_call("hook", chapter_5_processing.apply_chapter_5_adjustments, section_data)
     elif slug == "chapter-seven-magic":
         from . import chapter_7_processing
-        chapter_7_processing.apply_chapter_7_adjustments(section_data)
+        profile_call("hook", chapter_7_processing.apply_chapter_7_adjustments, section_data)
     elif slug == "chapter-eight-experience":
         with open('/tmp/chapter8_debug.txt', 'w') as f:
             f.write("CHAPTER 8 BLOCK EXECUTED!\n")
@@ -164,7 +169,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
                 logger_ch8.info("APPLYING CHAPTER 8 PROCESSING FOR EXPERIENCE TABLES")
                 logger_ch8.info("=" * 60)
                 f.write("About to call apply_chapter_8_adjustments\n")
-                chapter_8_processing.apply_chapter_8_adjustments(section_data)
+                profile_call("hook", chapter_8_processing.apply_chapter_8_adjustments, section_data)
                 f.write("apply_chapter_8_adjustments completed\n")
                 logger_ch8.info("Chapter 8 processing complete")
             except Exception as e:
@@ -197,7 +202,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         logger.warning("=" * 80)
         from . import chapter_10_processing
         logger.warning(f"!!! Imported chapter_10_processing module !!!")
-        chapter_10_processing.apply_chapter_10_adjustments(section_data)
+        profile_call("hook", chapter_10_processing.apply_chapter_10_adjustments, section_data)
         logger.warning(f"!!! Finished apply_chapter_10_adjustments !!!")
         logger.warning("=" * 80)
         
@@ -224,7 +229,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         logger.warning("=" * 80)
         from . import chapter_11_processing
         logger.warning(f"!!! Imported chapter_11_processing module !!!")
-        chapter_11_processing.apply_chapter_11_adjustments(section_data)
+        profile_call("hook", chapter_11_processing.apply_chapter_11_adjustments, section_data)
         logger.warning(f"!!! Finished apply_chapter_11_adjustments !!!")
         logger.warning("=" * 80)
     elif slug == "chapter-twelve-npcs":
@@ -251,7 +256,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         logger.info("=" * 80)
         from . import chapter_13_processing
         logger.info("!!! Imported chapter_13_processing module !!!")
-        chapter_13_processing.apply_chapter_13_adjustments(section_data)
+        profile_call("hook", chapter_13_processing.apply_chapter_13_adjustments, section_data)
         logger.info("!!! Finished apply_chapter_13_adjustments !!!")
         logger.info("=" * 80)
     elif slug == "chapter-fourteen-time-and-movement":
@@ -260,7 +265,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         logger.info("=" * 80)
         from . import chapter_14_processing
         logger.info("!!! Imported chapter_14_processing module !!!")
-        chapter_14_processing.apply_chapter_14_adjustments(section_data)
+        profile_call("hook", chapter_14_processing.apply_chapter_14_adjustments, section_data)
         logger.info("!!! Finished apply_chapter_14_adjustments !!!")
         logger.info("=" * 80)
     elif slug == "chapter-fifteen-new-spells":
@@ -269,7 +274,7 @@ def transform(section_data: dict, config: dict | None = None) -> dict:
         logger.info("=" * 80)
         from . import chapter_15_processing
         logger.info("!!! Imported chapter_15_processing module !!!")
-        chapter_15_processing.apply_chapter_15_adjustments(section_data)
+        profile_call("hook", chapter_15_processing.apply_chapter_15_adjustments, section_data)
         logger.info("!!! Finished apply_chapter_15_adjustments !!!")
         logger.info("=" * 80)
 
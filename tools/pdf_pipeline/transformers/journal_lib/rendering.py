@@ -24,6 +24,11 @@ from .utilities import (
 )
 from .tables import build_matrix_from_cells, table_from_rows
 
+try:
+    from ...utils.regex_registry import regex
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.regex_registry import regex
+
 logger = logging.getLogger(__name__)
 
 # Create aliases for backward compatibility with underscore-prefixed function calls
@@ -38,6 +43,7 @@ _wrap_span = wrap_span
 # Regular expressions
 _PARAGRAPH_RE = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL)
 _TAG_RE = re.compile(r'<[^>]+>')
+_SPELL_LIST_ITEM_RE = regex("journal_lib.spell_list_item", r'(<li class="spell-list-item">.*?</li>)')
 
 
 # Helper functions for rendering
@@ -336,15 +342,13 @@ def wrap_spell_list_items(html_content: str) -> str:
     Returns:
         HTML with <li> elements wrapped in <ul class="spell-list"> tags
     """
-    import re
-    
     # Find all <li class="spell-list-item"> elements
     # Replace consecutive list items with a wrapped <ul> containing them
     result = []
     current_list_items = []
     
     # Split by <li> tags to find list items
-    parts = re.split(r'(<li class="spell-list-item">.*?</li>)', html_content)
+    parts = _SPELL_LIST_ITEM_RE.split(html_content)
     
     for part in parts:
         if part.startswith('<li class="spell-list-item">'):
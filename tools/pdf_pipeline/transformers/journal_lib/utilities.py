@@ -10,6 +10,11 @@ import html
 import re
 from typing import List, Tuple, Optional
 
+try:
+    from ...utils.regex_registry import regex
+except ImportError:  # imported as a top-level ``transformers`` package
+    from utils.regex_registry import regex
+
 
 def normalize_plain_text(text: str) -> str:
     if not text:
@@ -33,7 +38,7 @@ def normalize_plain_text(text: str) -> str:
     text = _SPACED_LETTERS_RE.sub(lambda match: match.group(0).replace(" ", ""), text)
     text = _SPACED_DIGITS_RE.sub(lambda match: match.group(0).replace(" ", ""), text)
     # Normalize hyphen + space + digit (e.g., "- 1" -> "-1")
-    text = re.sub(r"-\s+(\d)", r"-\1", text)
+    text = _HYPHEN_DIGIT_RE.sub(r"-\1", text)
     # Finally, collapse excess whitespace
     text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
@@ -159,6 +164,8 @@ def is_italic(font_name: str | None, flags: int | None) -> bool:
 _WHITESPACE_RE = re.compile(r'\s+')
 _SPACED_LETTERS_RE = re.compile(r'\b(?:[A-Za-z]\s){4,}[A-Za-z]\b')
 _SPACED_DIGITS_RE = re.compile(r'\b(?:\d\s){1,}\d\b')
+_HYPHEN_DIGIT_RE = regex("journal_lib.hyphen_digit", r"-\s+(\d)")
+_LINE_HYPHEN_RE = regex("journal_lib.line_hyphen", r'- ([a-z])')
 
 
 
@@ -193,8 +200,7 @@ def dehyphenate_text(text: str) -> str:
     """
     # Pattern: hyphen followed by space and a lowercase letter
     # Replace with just the lowercase letter (no hyphen, no space)
-    import re
-    result = re.sub(r'- ([a-z])', r'\1', text)
+    result = _LINE_HYPHEN_RE.sub(r'\1', text)
     return result
 
 
@@ -0,0 +1,105 @@
+"""Side artifacts produced by pipeline tasks.
+
+Some fixers produce data besides the HTML they return: spells pulled out of
+chapter 7 prose, monster records parsed in chapter 5. Writing those straight
+to shared files from a process-pool worker loses updates when two workers
+read-modify-write the same file, so tasks emit them as named artifacts
+instead::
+
+    emit_artifact("chapter-seven-extracted-spells", spells)
+
+A worker wraps its task in ``collect_artifacts()`` and returns the collected
+``(name, payload)`` pairs under its result's ``"artifacts"`` key.
+``run_process_pool`` gathers them in task order, and the parent applies them
+once with ``merge_artifacts``, which hands every payload of a name to the
+merger registered for it. Payloads cross process boundaries, so they must be
+picklable; plain JSON-style data is best.
+
+Outside ``collect_artifacts()`` (a fixer called directly, a sequential
+script) an emitted artifact is merged immediately, as the fixer used to do.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+Artifact = Tuple[str, Any]
+ArtifactMerger = Callable[[List[Any]], None]
+
+_mergers: Dict[str, ArtifactMerger] = {}
+_collectors: List[List[Artifact]] = []
+
+
+def register_merger(name: str, merger: ArtifactMerger) -> None:
+    """Register the parent-side merger for an artifact name.
+
+    Args:
+        name: Artifact name
+        merger: Called once with all payloads of that name, in task order
+    """
+    _mergers[name] = merger
+
+
+def emit_artifact(name: str, payload: Any) -> None:
+    """Hand an artifact to the active collector, or merge it now if there is none.
+
+    Args:
+        name: Artifact name with a registered merger
+        payload: Picklable artifact data
+    """
+    if _collectors:
+        _collectors[-1].append((name, payload))
+        return
+    for error in merge_artifacts([(name, payload)]):
+        logger.error(error)
+
+
+@contextmanager
+def collect_artifacts() -> Iterator[List[Artifact]]:
+    """Collect artifacts emitted inside the block instead of merging them.
+
+    Yields:
+        List the ``(name, payload)`` pairs are appended to
+    """
+    collected: List[Artifact] = []
+    _collectors.append(collected)
+    try:
+        yield collected
+    finally:
+        _collectors.remove(collected)
+
+
+def merge_artifacts(artifacts: Iterable[Artifact]) -> List[str]:
+    """Apply collected artifacts with their registered mergers.
+
+    Names are merged in order of first appearance and each merger sees its
+    payloads in the order given, so a task-ordered list merges the same way
+    however the tasks were scheduled.
+
+    Args:
+        artifacts: ``(name, payload)`` pairs
+
+    Returns:
+        Error messages for unknown names and failed mergers
+    """
+    grouped: Dict[str, List[Any]] = {}
+    for name, payload in artifacts:
+        grouped.setdefault(name, []).append(payload)
+
+    errors: List[str] = []
+    for name, payloads in grouped.items():
+        merger = _mergers.get(name)
+        if merger is None:
+            errors.append(f"No merger registered for artifact {name!r}")
+            continue
+        try:
+            merger(payloads)
+        except Exception as e:
+            errors.append(f"Failed to merge artifact {name!r}: {e}")
+        else:
+            logger.debug(f"Merged {len(payloads)} {name!r} artifact(s)")
+    return errors
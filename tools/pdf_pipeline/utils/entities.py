@@ -0,0 +1,284 @@
+"""Typed game entities extracted while chapters are transformed.
+
+Chapter transforms already rebuild spells, weapons, equipment lists, class
+requirements and monster stat blocks into structured tables before the
+journal HTML is rendered. They also hand those records out as entities, so
+later stages (rules conversion, compendium building) read them directly
+instead of scraping them back out of the HTML.
+
+Each entity type has a pydantic model; its fields are the type's columns.
+A transform calls::
+
+    emit_entities("weapon", section_data["slug"], records)
+
+which sends the rows through the artifact channel (see ``utils.artifacts``).
+The parent writes one file per type, ``<entities_dir>/<type>.jsonl``: the
+first line is a header naming the type and its columns, every further line
+is one record as a JSON array in column order. Rows are grouped by
+``source`` (the chapter slug); re-emitting a source replaces its rows and
+leaves other chapters' rows alone, so single-chapter runs keep the files
+complete. A file whose header no longer matches the model is rebuilt.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .artifacts import emit_artifact, register_merger
+
+logger = logging.getLogger(__name__)
+
+ENTITIES_ARTIFACT = "entities"
+DEFAULT_ENTITIES_DIR = Path("data/processed/entities")
+# Directory name of the entity files under a processed (or converted) directory
+ENTITIES_DIRNAME = "entities"
+
+# Bump when the file layout (not a model) changes
+ENTITY_FORMAT_VERSION = 1
+
+
+class SpellEntity(BaseModel):
+    """A spell; ``sphere`` is empty for wizard spells."""
+
+    name: str
+    source: str
+    level: Optional[int] = None
+    sphere: str = ""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class WeaponEntity(BaseModel):
+    """A weapon from an equipment table; damage is against small/medium and large foes."""
+
+    name: str
+    source: str
+    cost: str = ""
+    weight: str = ""
+    size: str = ""
+    damage_type: str = ""
+    speed: str = ""
+    damage_small_medium: str = ""
+    damage_large: str = ""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class EquipmentEntity(BaseModel):
+    """A priced item, mount or vehicle."""
+
+    name: str
+    source: str
+    category: str
+    cost: str = ""
+    weight: str = ""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ClassEntity(BaseModel):
+    """A player character class and its entry requirements."""
+
+    name: str
+    source: str
+    ability_requirements: Dict[str, int] = Field(default_factory=dict)
+    prime_requisites: List[str] = Field(default_factory=list)
+    races_allowed: List[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class MonsterEntity(BaseModel):
+    """A monster manual entry; ``stats`` maps stat labels to their values."""
+
+    name: str
+    source: str
+    stats: Dict[str, str] = Field(default_factory=dict)
+    has_psionics: bool = False
+    description: str = ""
+    combat: str = ""
+    habitat: str = ""
+    ecology: str = ""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+ENTITY_MODELS: Dict[str, Type[BaseModel]] = {
+    "spell": SpellEntity,
+    "weapon": WeaponEntity,
+    "equipment": EquipmentEntity,
+    "class": ClassEntity,
+    "monster": MonsterEntity,
+}
+
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)\b", re.IGNORECASE)
+_ORDINAL_WORDS = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9,
+}
+
+
+def entity_columns(entity_type: str) -> List[str]:
+    """Column names of an entity type, in file order.
+
+    Raises:
+        ValueError: If the type is unknown
+    """
+    model = ENTITY_MODELS.get(entity_type)
+    if model is None:
+        raise ValueError(f"Unknown entity type {entity_type!r}")
+    return list(model.model_fields)
+
+
+def parse_level(text: str) -> Optional[int]:
+    """Read a spell level written as "3rd" or "Third"."""
+    match = _ORDINAL_RE.search(text)
+    if match:
+        return int(match.group(1))
+    for word in text.lower().split():
+        if word in _ORDINAL_WORDS:
+            return _ORDINAL_WORDS[word]
+    return None
+
+
+def emit_entities(
+    entity_type: str,
+    source: str,
+    records: Iterable[Union[BaseModel, Dict[str, Any]]],
+    entities_dir: Union[str, Path] = DEFAULT_ENTITIES_DIR,
+) -> int:
+    """Validate records and hand them to the parent as an entity artifact.
+
+    An empty list is emitted too, so a chapter that no longer yields a type
+    clears its old rows.
+
+    Args:
+        entity_type: Key of ``ENTITY_MODELS``
+        source: Slug of the chapter the records come from
+        records: Models of the type, or dicts validated into them
+        entities_dir: Directory the entity files are written to
+
+    Returns:
+        Number of records emitted
+    """
+    model = ENTITY_MODELS.get(entity_type)
+    if model is None:
+        raise ValueError(f"Unknown entity type {entity_type!r}")
+    columns = entity_columns(entity_type)
+    rows = []
+    for record in records:
+        if not isinstance(record, model):
+            record = model.model_validate(record)
+        values = record.model_dump()
+        rows.append([values[column] for column in columns])
+    emit_artifact(ENTITIES_ARTIFACT, {
+        "type": entity_type,
+        "source": source,
+        "dir": str(entities_dir),
+        "rows": rows,
+    })
+    logger.info(f"Emitted {len(rows)} {entity_type} entities from {source}")
+    return len(rows)
+
+
+def entity_file(entity_type: str, entities_dir: Union[str, Path] = DEFAULT_ENTITIES_DIR) -> Path:
+    """Path of an entity type's file."""
+    return Path(entities_dir) / f"{entity_type}.jsonl"
+
+
+def read_entity_file(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield the records of an entity file as dicts keyed by column."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        columns = header.get("columns", [])
+        for line in f:
+            if line.strip():
+                yield dict(zip(columns, json.loads(line)))
+
+
+def read_entities(
+    entity_type: str, entities_dir: Union[str, Path] = DEFAULT_ENTITIES_DIR
+) -> List[Dict[str, Any]]:
+    """All records of a type, or an empty list if none were extracted."""
+    path = entity_file(entity_type, entities_dir)
+    if not path.exists():
+        return []
+    return list(read_entity_file(path))
+
+
+def write_entity_file(path: Union[str, Path], entity_type: str, rows: List[List[Any]], **header: Any) -> None:
+    """Write an entity file from rows already in column order.
+
+    Args:
+        path: Output file
+        entity_type: Key of ``ENTITY_MODELS``
+        rows: Records as lists in ``entity_columns`` order
+        **header: Extra header fields
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    head = {
+        "entity": entity_type,
+        "version": ENTITY_FORMAT_VERSION,
+        "columns": entity_columns(entity_type),
+        "count": len(rows),
+        **header,
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(head, ensure_ascii=False) + "\n")
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    tmp_path.replace(path)
+
+
+def load_entity_file(path: Union[str, Path]) -> Tuple[Dict[str, Any], List[List[Any]]]:
+    """Read an entity file's header and its rows (lists in column order)."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        return header, [json.loads(line) for line in f if line.strip()]
+
+
+def _existing_rows(path: Path, columns: List[str]) -> List[List[Any]]:
+    """Rows of an entity file, or none if it is missing or has other columns."""
+    if not path.exists():
+        return []
+    try:
+        header, rows = load_entity_file(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Rebuilding unreadable entity file {path}: {e}")
+        return []
+    if header.get("version") != ENTITY_FORMAT_VERSION or header.get("columns") != columns:
+        logger.info(f"Rebuilding {path}: columns changed")
+        return []
+    return rows
+
+
+def _merge_entities(payloads: List[Dict[str, Any]]) -> None:
+    """Replace each emitted source's rows in its type's file."""
+    grouped: Dict[Tuple[str, str], Dict[str, List[List[Any]]]] = {}
+    for payload in payloads:
+        key = (payload["dir"], payload["type"])
+        # A source emitted twice keeps its last rows
+        grouped.setdefault(key, {})[payload["source"]] = payload["rows"]
+
+    for (entities_dir, entity_type), by_source in grouped.items():
+        columns = entity_columns(entity_type)
+        source_idx = columns.index("source")
+        path = entity_file(entity_type, entities_dir)
+        rows = [row for row in _existing_rows(path, columns) if row[source_idx] not in by_source]
+        for source_rows in by_source.values():
+            rows.extend(source_rows)
+        # Stable sort keeps each chapter's own order
+        rows.sort(key=lambda row: row[source_idx])
+        write_entity_file(path, entity_type, rows)
+        logger.info(f"Wrote {len(rows)} {entity_type} entities to {path}")
+
+
+register_merger(ENTITIES_ARTIFACT, _merge_entities)
@@ -0,0 +1,341 @@
+"""Spatial index over the blocks, lines and spans of a PyMuPDF page dict.
+
+Table reconstruction code repeatedly asks "which lines sit on this row?" or
+"what is the nearest text to this column?". Scanning every block of the page
+for each question makes table extraction quadratic in the number of lines.
+``PageIndex`` flattens the page once into entries sorted by y so those
+questions become bisect lookups over a handful of candidates.
+
+Results are always returned in document order (block, line, span), so callers
+that pick the first best match keep the same tie-breaking as a full scan.
+
+The index never writes into the page dict (pages are serialized between
+stages). ``PageIndex.for_page`` caches one index per page and rebuilds it
+when the block list changes shape, e.g. when marker blocks are inserted or a
+block's lines are replaced. ``__skip_render`` flags are read at query time.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ("block", "line", "span")
+
+# Bisect windows are widened by this much and then filtered with the exact
+# comparison, so float rounding never drops a candidate a full scan would keep.
+_EPS = 1e-6
+
+_CACHE_SIZE = 16
+
+
+def _bbox(obj: dict, default: Optional[list] = None) -> Tuple[float, float, float, float]:
+    """Return an object's bbox as floats."""
+    x0, y0, x1, y1 = obj.get("bbox", default or [0, 0, 0, 0])
+    return float(x0), float(y0), float(x1), float(y1)
+
+
+class IndexEntry:
+    """One block, line or span of a page with its position."""
+
+    __slots__ = (
+        "level", "order", "block_idx", "line_idx", "span_idx",
+        "block", "line", "span", "x0", "y0", "x1", "y1", "cx", "cy",
+    )
+
+    def __init__(self, level: str, block_idx: int, block: dict, line_idx: int = -1, line: Optional[dict] = None,
+                 span_idx: int = -1, span: Optional[dict] = None, bbox: Tuple[float, float, float, float] = (0, 0, 0, 0),
+                 order: int = 0):
+        """Initialize entry; ``order`` is the position in document order."""
+        self.level = level
+        self.order = order
+        self.block_idx = block_idx
+        self.line_idx = line_idx
+        self.span_idx = span_idx
+        self.block = block
+        self.line = line
+        self.span = span
+        self.x0, self.y0, self.x1, self.y1 = bbox
+        self.cx = (self.x0 + self.x1) / 2.0
+        self.cy = (self.y0 + self.y1) / 2.0
+
+    @property
+    def hidden(self) -> bool:
+        """Whether the owning block is currently marked ``__skip_render``."""
+        return bool(self.block.get("__skip_render"))
+
+    @property
+    def obj(self) -> dict:
+        """The indexed dict (block, line or span)."""
+        if self.level == "span":
+            return self.span
+        if self.level == "line":
+            return self.line
+        return self.block
+
+    def __repr__(self) -> str:
+        return f"IndexEntry({self.level}, b={self.block_idx}, l={self.line_idx}, s={self.span_idx}, y0={self.y0:.1f})"
+
+
+class _LevelIndex:
+    """Entries of one level in document order plus y-sorted views."""
+
+    __slots__ = ("entries", "_by_top", "_tops", "_by_center", "_centers")
+
+    def __init__(self, entries: List[IndexEntry]):
+        self.entries = entries
+        self._by_top = sorted(entries, key=lambda e: e.y0)
+        self._tops = [e.y0 for e in self._by_top]
+        self._by_center = sorted(entries, key=lambda e: e.cy)
+        self._centers = [e.cy for e in self._by_center]
+
+    def top_window(self, y_min: float, y_max: float) -> List[IndexEntry]:
+        """Candidates whose top edge may lie in [y_min, y_max]."""
+        lo = bisect_left(self._tops, y_min - _EPS)
+        hi = bisect_right(self._tops, y_max + _EPS)
+        return self._by_top[lo:hi]
+
+    def center_window(self, y_min: float, y_max: float) -> List[IndexEntry]:
+        """Candidates whose center may lie in [y_min, y_max]."""
+        lo = bisect_left(self._centers, y_min - _EPS)
+        hi = bisect_right(self._centers, y_max + _EPS)
+        return self._by_center[lo:hi]
+
+
+def _in_document_order(entries: List[IndexEntry]) -> List[IndexEntry]:
+    """Sort entries back into block/line/span order."""
+    return sorted(entries, key=lambda e: e.order)
+
+
+class PageIndex:
+    """Spatial index of the text blocks of one page.
+
+    Only ``type == "text"`` blocks are indexed. Each query takes a ``level``
+    ("block", "line" or "span") and ``include_hidden``; hidden entries are
+    included by default so results match a plain scan over ``page["blocks"]``.
+    """
+
+    def __init__(self, page: dict):
+        """Build the index.
+
+        Args:
+            page: PyMuPDF-style page dictionary
+        """
+        self.page = page
+        self._signature = self._page_signature(page)
+        per_level: Dict[str, List[IndexEntry]] = {level: [] for level in LEVELS}
+        order = 0
+        for b_idx, block in enumerate(page.get("blocks", [])):
+            if block.get("type") != "text":
+                continue
+            block_bbox = _bbox(block)
+            per_level["block"].append(IndexEntry("block", b_idx, block, bbox=block_bbox, order=order))
+            order += 1
+            for l_idx, line in enumerate(block.get("lines", [])):
+                line_bbox = _bbox(line)
+                per_level["line"].append(
+                    IndexEntry("line", b_idx, block, l_idx, line, bbox=line_bbox, order=order)
+                )
+                order += 1
+                for s_idx, span in enumerate(line.get("spans", [])):
+                    span_bbox = _bbox(span, line.get("bbox"))
+                    per_level["span"].append(
+                        IndexEntry("span", b_idx, block, l_idx, line, s_idx, span, bbox=span_bbox, order=order)
+                    )
+                    order += 1
+        self._levels = {level: _LevelIndex(entries) for level, entries in per_level.items()}
+
+    # ------------------------------------------------------------------
+    # Construction and caching
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _page_signature(page: dict) -> tuple:
+        """Cheap fingerprint of the block structure of a page.
+
+        Holds on to the block and line containers it fingerprints, so their
+        ids cannot be recycled while the signature is alive.
+        """
+        blocks = page.get("blocks", [])
+        return (blocks, len(blocks), tuple(
+            (block, block.get("lines"), len(block.get("lines") or ()), block.get("bbox"), block.get("type"))
+            for block in blocks
+        ))
+
+    def is_current(self) -> bool:
+        """Return True when the page's blocks still match the indexed structure."""
+        old_blocks, old_len, old_items = self._signature
+        blocks = self.page.get("blocks", [])
+        if blocks is not old_blocks or len(blocks) != old_len:
+            return False
+        for block, (o_block, o_lines, o_count, o_bbox, o_type) in zip(blocks, old_items):
+            lines = block.get("lines")
+            if (block is not o_block or lines is not o_lines or len(lines or ()) != o_count
+                    or block.get("bbox") is not o_bbox or block.get("type") != o_type):
+                return False
+        return True
+
+    _cache: Dict[int, "PageIndex"] = {}
+
+    @classmethod
+    def for_page(cls, page: dict) -> "PageIndex":
+        """Return a cached index for the page, rebuilding it if the page changed.
+
+        Args:
+            page: PyMuPDF-style page dictionary
+
+        Returns:
+            PageIndex reflecting the current blocks of the page
+        """
+        index = cls._cache.get(id(page))
+        if index is not None and index.page is page and index.is_current():
+            return index
+        index = cls(page)
+        cls._cache.pop(id(page), None)
+        if len(cls._cache) >= _CACHE_SIZE:
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[id(page)] = index
+        return index
+
+    @classmethod
+    def invalidate(cls, page: Optional[dict] = None) -> None:
+        """Drop the cached index of a page (or of all pages).
+
+        Needed only after changing line or span geometry in place, which the
+        structural check in ``for_page`` cannot see.
+        """
+        if page is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(id(page), None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def entries(self, level: str = "line", include_hidden: bool = True) -> Iterator[IndexEntry]:
+        """Iterate entries of a level in document order."""
+        for entry in self._levels[level].entries:
+            if include_hidden or not entry.hidden:
+                yield entry
+
+    def between_y(
+        self,
+        y_min: float,
+        y_max: float,
+        level: str = "line",
+        *,
+        inclusive: bool = False,
+        include_hidden: bool = True,
+    ) -> List[IndexEntry]:
+        """Entries whose top edge (y0) lies between two y positions.
+
+        Args:
+            y_min: Lower bound
+            y_max: Upper bound
+            level: Entry level
+            inclusive: Include entries exactly on a bound
+            include_hidden: Include entries of ``__skip_render`` blocks
+
+        Returns:
+            Matching entries in document order
+        """
+        if inclusive:
+            keep = lambda e: y_min <= e.y0 <= y_max  # noqa: E731
+        else:
+            keep = lambda e: y_min < e.y0 < y_max  # noqa: E731
+        found = [
+            e for e in self._levels[level].top_window(y_min, y_max)
+            if keep(e) and (include_hidden or not e.hidden)
+        ]
+        return _in_document_order(found)
+
+    def near_y(
+        self, y_center: float, y_tol: float, level: str = "line", *, include_hidden: bool = True
+    ) -> List[IndexEntry]:
+        """Entries whose vertical center is within ``y_tol`` of ``y_center``.
+
+        Returns:
+            Matching entries in document order
+        """
+        found = [
+            e for e in self._levels[level].center_window(y_center - y_tol, y_center + y_tol)
+            if abs(e.cy - y_center) <= y_tol and (include_hidden or not e.hidden)
+        ]
+        return _in_document_order(found)
+
+    def column(
+        self,
+        x_min: float,
+        x_max: float,
+        y_min: float,
+        y_max: float,
+        level: str = "line",
+        *,
+        inclusive: bool = False,
+        include_hidden: bool = True,
+    ) -> List[IndexEntry]:
+        """Entries in a column window: left edge in [x_min, x_max], top edge between y bounds.
+
+        The y bounds follow ``between_y`` (exclusive unless ``inclusive``).
+
+        Returns:
+            Matching entries in document order
+        """
+        return [
+            e for e in self.between_y(y_min, y_max, level, inclusive=inclusive, include_hidden=include_hidden)
+            if x_min <= e.x0 <= x_max
+        ]
+
+    def in_rect(
+        self, rect: Tuple[float, float, float, float], level: str = "line", *, include_hidden: bool = True
+    ) -> List[IndexEntry]:
+        """Entries whose bounding box lies entirely inside ``rect``.
+
+        Returns:
+            Matching entries in document order
+        """
+        rx0, ry0, rx1, ry1 = (float(c) for c in rect)
+        return [
+            e for e in self.between_y(ry0, ry1, level, inclusive=True, include_hidden=include_hidden)
+            if rx0 <= e.x0 and e.x1 <= rx1 and e.y1 <= ry1
+        ]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        *,
+        y_tol: float,
+        x_window: Optional[float] = None,
+        level: str = "line",
+        predicate: Optional[Callable[[IndexEntry], bool]] = None,
+        include_hidden: bool = True,
+    ) -> Optional[IndexEntry]:
+        """Entry on the row at ``y`` whose horizontal center is closest to ``x``.
+
+        Args:
+            x: Target x position
+            y: Row center
+            y_tol: Maximum distance between the entry's center and ``y``
+            x_window: Maximum horizontal center distance
+            level: Entry level
+            predicate: Only consider entries for which this returns True
+            include_hidden: Include entries of ``__skip_render`` blocks
+
+        Returns:
+            The closest entry (first in document order on ties), or None
+        """
+        best: Optional[IndexEntry] = None
+        best_dx = float("inf")
+        for entry in self.near_y(y, y_tol, level, include_hidden=include_hidden):
+            dx = abs(entry.cx - x)
+            if x_window is not None and dx > x_window:
+                continue
+            if dx < best_dx and (predicate is None or predicate(entry)):
+                best = entry
+                best_dx = dx
+        return best
@@ -0,0 +1,415 @@
+"""Shared source-PDF page service.
+
+Extraction already reads every page of the source PDF. Later stages that
+need a page's text again (chapter fixers re-reading a page, the OCR
+validator's text layer) used to reopen the PDF for it. ``PageStore`` keeps
+the extracted page dicts on disk, and ``SourcePageService`` serves them,
+falling back to PyMuPDF only for pages or modes the store does not have.
+
+Layout of a store (one directory per PDF, keyed by path, size and mtime)::
+
+    <root>/<pdf key>/<mode>-<shard>.bin       concatenated JSON page payloads
+    <root>/<pdf key>/<mode>-<shard>.idx.json  {page_number: [offset, length]}
+    <root>/<pdf key>/meta.json                {"page_count": ...}
+
+Shards are written whole and renamed into place, so several extraction
+workers can each write their own shard while other processes read. Readers
+memory-map the ``.bin`` files, so a page costs one slice and one
+``json.loads`` and the OS page cache is shared between worker processes.
+
+Pages are keyed by 1-based page number. Modes are PyMuPDF ``get_text``
+modes: "dict", "rawdict" and "text". A "dict" request is also answered from a
+stored "rawdict" page by joining each span's characters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PAGE_STORE_VERSION = 1
+DEFAULT_PAGE_STORE_DIR = Path("data/.page_store")
+# Modes written by the extraction stage unless configured otherwise
+DEFAULT_STORE_MODES = ("dict", "text")
+SUPPORTED_MODES = ("dict", "rawdict", "text")
+
+_MEMORY_PAGES = 64
+
+
+def pdf_store_key(pdf_path: Path) -> str:
+    """Key identifying a PDF's store directory.
+
+    Built from the resolved path, size and modification time, so a replaced
+    PDF gets a fresh store without hashing its bytes.
+    """
+    pdf_path = Path(pdf_path).expanduser().resolve()
+    stat = pdf_path.stat()
+    raw = f"{PAGE_STORE_VERSION}|{pdf_path}|{stat.st_size}|{stat.st_mtime_ns}"
+    return f"{pdf_path.stem[:40]}-{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+def jsonable_page(data: Any) -> Any:
+    """Make a PyMuPDF ``get_text`` result JSON-serializable.
+
+    Image blocks carry raw bytes (``image``, ``mask``); those are dropped.
+    Tuples become lists through ``json.dumps``.
+    """
+    if isinstance(data, dict):
+        return {k: jsonable_page(v) for k, v in data.items() if not isinstance(v, (bytes, bytearray))}
+    if isinstance(data, (list, tuple)):
+        return [jsonable_page(v) for v in data]
+    return data
+
+
+def dict_from_rawdict(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a "rawdict" page to the "dict" layout (span text instead of chars)."""
+    page = {k: v for k, v in raw.items() if k != "blocks"}
+    blocks = []
+    for block in raw.get("blocks", []):
+        if "lines" not in block:
+            blocks.append(block)
+            continue
+        lines = []
+        for line in block["lines"]:
+            spans = []
+            for span in line.get("spans", []):
+                converted = {k: v for k, v in span.items() if k != "chars"}
+                converted["text"] = "".join(ch.get("c", "") for ch in span.get("chars", []))
+                spans.append(converted)
+            lines.append({**line, "spans": spans})
+        blocks.append({**block, "lines": lines})
+    page["blocks"] = blocks
+    return page
+
+
+class _Shard:
+    """A memory-mapped shard file and its page offsets."""
+
+    __slots__ = ("path", "offsets", "_file", "_map")
+
+    def __init__(self, path: Path, offsets: Dict[int, Tuple[int, int]]):
+        """Initialize shard; the data file is mapped on first read."""
+        self.path = path
+        self.offsets = offsets
+        self._file = None
+        self._map = None
+
+    def read(self, page_number: int) -> Any:
+        """Decode one page payload."""
+        offset, length = self.offsets[page_number]
+        if self._map is None:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return json.loads(self._map[offset:offset + length])
+
+    def close(self) -> None:
+        """Unmap the data file."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+
+class PageStoreWriter:
+    """Writes one shard of pages for a single mode.
+
+    Use as a context manager; the shard becomes visible to readers only when
+    the writer is closed without error.
+    """
+
+    def __init__(self, directory: Path, mode: str, shard: Optional[str] = None):
+        """Initialize writer.
+
+        Args:
+            directory: Store directory of the PDF
+            mode: Page mode being written
+            shard: Shard name (defaults to a unique name)
+        """
+        self.directory = directory
+        self.mode = mode
+        self.shard = shard or uuid.uuid4().hex[:12]
+        self.offsets: Dict[int, Tuple[int, int]] = {}
+        self._tmp = directory / f".{mode}-{self.shard}.{os.getpid()}.tmp"
+        self._file = None
+        self._pos = 0
+
+    def __enter__(self) -> "PageStoreWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def put(self, page_number: int, data: Any) -> None:
+        """Append one page payload."""
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._tmp, "wb")
+        payload = json.dumps(jsonable_page(data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._file.write(payload)
+        self.offsets[page_number] = (self._pos, len(payload))
+        self._pos += len(payload)
+
+    def close(self) -> None:
+        """Publish the shard (data file first, then its index)."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        name = f"{self.mode}-{self.shard}"
+        os.replace(self._tmp, self.directory / f"{name}.bin")
+        idx_tmp = self.directory / f".{name}.{os.getpid()}.idx.tmp"
+        idx_tmp.write_text(json.dumps({str(k): list(v) for k, v in self.offsets.items()}), encoding="utf-8")
+        os.replace(idx_tmp, self.directory / f"{name}.idx.json")
+
+    def abort(self) -> None:
+        """Discard the shard."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._tmp.unlink(missing_ok=True)
+
+
+class PageStore:
+    """On-disk page store for one PDF."""
+
+    def __init__(self, root: Path, pdf_path: Path):
+        """Initialize store.
+
+        Args:
+            root: Store root directory
+            pdf_path: Source PDF the store belongs to
+        """
+        self.directory = Path(root) / pdf_store_key(pdf_path)
+        self._shards: Dict[str, Dict[int, _Shard]] = {}
+        self._seen: set = set()
+
+    def _refresh(self) -> None:
+        """Pick up shards published since the last refresh."""
+        if not self.directory.exists():
+            return
+        for idx_path in self.directory.glob("*.idx.json"):
+            if idx_path.name in self._seen:
+                continue
+            mode = idx_path.name.split("-", 1)[0]
+            bin_path = self.directory / idx_path.name.replace(".idx.json", ".bin")
+            try:
+                offsets = {int(k): (v[0], v[1]) for k, v in json.loads(idx_path.read_text(encoding="utf-8")).items()}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable page store index {idx_path}: {e}")
+                continue
+            self._seen.add(idx_path.name)
+            shard = _Shard(bin_path, offsets)
+            pages = self._shards.setdefault(mode, {})
+            for page_number in offsets:
+                pages.setdefault(page_number, shard)
+
+    def has(self, page_number: int, mode: str) -> bool:
+        """Whether the store holds a page in a mode."""
+        if page_number not in self._shards.get(mode, {}):
+            self._refresh()
+        return page_number in self._shards.get(mode, {})
+
+    def pages(self, mode: str) -> set:
+        """Page numbers stored for a mode."""
+        self._refresh()
+        return set(self._shards.get(mode, {}))
+
+    def get(self, page_number: int, mode: str) -> Optional[Any]:
+        """Read a stored page, or None when absent."""
+        if not self.has(page_number, mode):
+            return None
+        return self._shards[mode][page_number].read(page_number)
+
+    def writer(self, mode: str, shard: Optional[str] = None) -> PageStoreWriter:
+        """Create a shard writer for a mode."""
+        return PageStoreWriter(self.directory, mode, shard)
+
+    def read_meta(self) -> Dict[str, Any]:
+        """Read PDF-level metadata (page count), if recorded."""
+        meta_path = self.directory / "meta.json"
+        if not meta_path.exists():
+            return {}
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def write_meta(self, meta: Dict[str, Any]) -> None:
+        """Record PDF-level metadata."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f".meta.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self.directory / "meta.json")
+
+    def close(self) -> None:
+        """Unmap all shard files."""
+        for pages in self._shards.values():
+            for shard in set(pages.values()):
+                shard.close()
+
+
+class SourcePageService:
+    """Serves page text of a source PDF from the page store, then PyMuPDF.
+
+    The store is only written by extraction; the PyMuPDF fallback covers
+    pages and modes it did not store (or a missing store) and keeps the PDF
+    open for the lifetime of the service.
+    """
+
+    def __init__(self, pdf_path: Path, store_dir: Optional[Path] = DEFAULT_PAGE_STORE_DIR):
+        """Initialize service.
+
+        Args:
+            pdf_path: Source PDF
+            store_dir: Page store root, or None to use PyMuPDF only
+        """
+        self.pdf_path = Path(pdf_path)
+        self.store = PageStore(store_dir, self.pdf_path) if store_dir is not None and self.pdf_path.exists() else None
+        self._doc = None
+        self._memory: Dict[Tuple[int, str], Any] = {}
+        self.stats = {"memory": 0, "store": 0, "pdf": 0}
+
+    def _document(self):
+        """Open the PDF on first use."""
+        if self._doc is None:
+            import fitz
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc
+
+    def _remember(self, key: Tuple[int, str], data: Any) -> None:
+        """Keep a page in the bounded in-memory cache."""
+        if len(self._memory) >= _MEMORY_PAGES:
+            self._memory.pop(next(iter(self._memory)))
+        self._memory[key] = data
+
+    def page(self, page_number: int, mode: str = "dict") -> Any:
+        """Return the ``get_text(mode)`` result of a page.
+
+        Args:
+            page_number: 1-based page number
+            mode: "dict", "rawdict" or "text"
+
+        Returns:
+            Page dict (or text for "text"). Image bytes are not included.
+        """
+        if mode not in SUPPORTED_MODES:
+            raise ValueError(f"Unsupported page mode '{mode}'")
+        key = (page_number, mode)
+        if key in self._memory:
+            self.stats["memory"] += 1
+            return self._memory[key]
+
+        data = None
+        if self.store is not None:
+            data = self.store.get(page_number, mode)
+            if data is None and mode == "dict":
+                raw = self.store.get(page_number, "rawdict")
+                data = dict_from_rawdict(raw) if raw is not None else None
+        if data is not None:
+            self.stats["store"] += 1
+        else:
+            self.stats["pdf"] += 1
+            data = jsonable_page(self._document()[page_number - 1].get_text(mode))
+
+        self._remember(key, data)
+        return data
+
+    def text(self, page_number: int) -> str:
+        """Return the plain text layer of a page."""
+        return self.page(page_number, "text")
+
+    def page_count(self) -> int:
+        """Return the number of pages in the PDF."""
+        if self.store is not None:
+            count = self.store.read_meta().get("page_count")
+            if count is not None:
+                return int(count)
+        return len(self._document())
+
+    def close(self) -> None:
+        """Release the PDF and the store mappings."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if self.store is not None:
+            self.store.close()
+
+
+_SERVICES: Dict[tuple, SourcePageService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_page_service(pdf_path: Path, store_dir: Optional[Path] = DEFAULT_PAGE_STORE_DIR) -> SourcePageService:
+    """Return this process's shared service for a PDF.
+
+    Each worker process gets its own service instance; they share pages
+    through the on-disk store.
+    """
+    resolved = Path(pdf_path).expanduser().resolve()
+    stat = resolved.stat() if resolved.exists() else None
+    # A PDF replaced in place gets a new service (and a new store key)
+    key = (str(resolved), stat.st_size if stat else None, stat.st_mtime_ns if stat else None, str(store_dir))
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(key)
+        if service is None:
+            service = _SERVICES[key] = SourcePageService(pdf_path, store_dir)
+        return service
+
+
+def close_page_services() -> None:
+    """Close every shared service in this process."""
+    with _SERVICES_LOCK:
+        for service in _SERVICES.values():
+            service.close()
+        _SERVICES.clear()
+
+
+def store_pages(
+    store_dir: Path,
+    pdf_path: Path,
+    pages: Iterable[Tuple[int, Dict[str, Any]]],
+    shard: str,
+) -> int:
+    """Write extracted pages into the store, one shard per mode.
+
+    Args:
+        store_dir: Page store root
+        pdf_path: Source PDF
+        pages: (page_number, {mode: data}) pairs
+        shard: Shard name (e.g. the section slug)
+
+    Returns:
+        Number of page payloads written
+    """
+    store = PageStore(store_dir, pdf_path)
+    existing: Dict[str, set] = {}
+    writers: Dict[str, PageStoreWriter] = {}
+    written = 0
+    try:
+        for page_number, by_mode in pages:
+            for mode, data in by_mode.items():
+                if mode not in existing:
+                    existing[mode] = store.pages(mode)
+                if page_number in existing[mode]:
+                    continue
+                if mode not in writers:
+                    writers[mode] = store.writer(mode, shard)
+                writers[mode].put(page_number, data)
+                written += 1
+    except Exception:
+        for writer in writers.values():
+            writer.abort()
+        raise
+    for writer in writers.values():
+        writer.close()
+    store.close()
+    return written
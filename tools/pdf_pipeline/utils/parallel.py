@@ -9,11 +9,49 @@ from __future__ import annotations
 import logging
 import multiprocessing as mp
 import os
+import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from .artifacts import merge_artifacts
+from .profiling import drain_profilers, is_profile_artifact, peak_rss_kb, profile_span
+
 logger = logging.getLogger(__name__)
 
+# Task keys that name what a task works on, in order of preference
+_TASK_LABEL_KEYS = ("slug", "relative_path", "json_file", "section_file", "input_file", "path")
+
+
+def _task_label(task: Any, index: int) -> str:
+    """Short name of a task for timings and profiles."""
+    if isinstance(task, dict):
+        if isinstance(task.get("section"), dict) and task["section"].get("slug"):
+            return task["section"]["slug"]
+        for key in _TASK_LABEL_KEYS:
+            if task.get(key):
+                return Path(str(task[key])).name
+    return f"task {index}"
+
+
+def _run_task(worker: Callable[[Any], Dict[str, Any]], task: Any, label: str) -> Dict[str, Any]:
+    """Run one pool task, timing it and returning the worker's profiler measurements."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    with profile_span("task", label):
+        result = worker(task)
+    result["task_stats"] = {
+        "label": label,
+        "pid": os.getpid(),
+        "wall_s": round(time.perf_counter() - wall_start, 4),
+        "cpu_s": round(time.process_time() - cpu_start, 4),
+        "peak_rss_mb": round(peak_rss_kb() / 1024, 1),
+    }
+    profiles = drain_profilers()
+    if profiles:
+        result["artifacts"] = list(result.get("artifacts") or []) + profiles
+    return result
+
 
 def run_process_pool(
     tasks: Iterable[Any],
@@ -30,6 +68,7 @@ def run_process_pool(
             - items: int (number of items processed)
             - warnings: List[str] (warnings encountered)
             - errors: List[str] (errors encountered)
+            - artifacts: Optional list of (name, payload) side artifacts
             - Any other data to collect
         max_workers: Maximum number of worker processes (default: min(4, cpu_count))
         chunksize: Number of tasks to batch per worker (default: 1)
@@ -41,7 +80,14 @@ def run_process_pool(
             - warnings: List of all warnings
             - errors: List of all errors
             - results: List of all worker results
+            - artifacts: All side artifacts, in task order, for
+              ``utils.artifacts.merge_artifacts``
+            - task_stats: Per task label, pid, wall and CPU seconds and the
+              worker's peak RSS, in task order
             - success: True if no errors occurred
+    
+    Worker profiler measurements (see ``utils.profiling``) are merged here
+    rather than returned with the other artifacts.
     """
     if max_workers is None:
         max_workers = min(4, os.cpu_count() or 1)
@@ -54,6 +100,8 @@ def run_process_pool(
             "warnings": [],
             "errors": [],
             "results": [],
+            "artifacts": [],
+            "task_stats": [],
             "success": True,
         }
     
@@ -65,6 +113,10 @@ def run_process_pool(
     warnings: List[str] = []
     errors: List[str] = []
     results: List[Dict[str, Any]] = []
+    # Artifacts keyed by task index, so merge order does not depend on scheduling
+    artifacts_by_task: Dict[int, List[Any]] = {}
+    stats_by_task: Dict[int, Dict[str, Any]] = {}
+    labels = [_task_label(task, index) for index, task in enumerate(task_list)]
     
     # Use spawn context for MacOS safety
     ctx = mp.get_context("spawn")
@@ -72,7 +124,10 @@ def run_process_pool(
     try:
         with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as executor:
             # Submit all tasks and track futures
-            futures = {executor.submit(worker, task): task for task in task_list}
+            futures = {
+                executor.submit(_run_task, worker, task, labels[index]): index
+                for index, task in enumerate(task_list)
+            }
             
             # Process completed tasks as they finish
             completed = 0
@@ -89,6 +144,16 @@ def run_process_pool(
                         warnings.extend(result["warnings"])
                     if "errors" in result:
                         errors.extend(result["errors"])
+                    if "task_stats" in result:
+                        stats_by_task[futures[future]] = result.pop("task_stats")
+                    if result.get("artifacts"):
+                        task_artifacts = list(result["artifacts"])
+                        profiles = [a for a in task_artifacts if is_profile_artifact(a[0])]
+                        if profiles:
+                            merge_artifacts(profiles)
+                            task_artifacts = [a for a in task_artifacts if not is_profile_artifact(a[0])]
+                            result["artifacts"] = task_artifacts
+                        artifacts_by_task[futures[future]] = task_artifacts
                     
                     # Store full result
                     results.append(result)
@@ -99,7 +164,7 @@ def run_process_pool(
                 
                 except Exception as e:
                     # Worker raised an exception
-                    task = futures[future]
+                    task = task_list[futures[future]]
                     error_msg = f"Worker failed on task {task}: {e}"
                     logger.error(error_msg)
                     errors.append(error_msg)
@@ -118,12 +183,17 @@ def run_process_pool(
     
     success = len(errors) == 0
     logger.info(f"Parallel execution completed: {items_processed} items, {len(errors)} errors, {len(warnings)} warnings")
+    if stats_by_task:
+        slowest = max(stats_by_task.values(), key=lambda stats: stats["wall_s"])
+        logger.info(f"Slowest task{desc_str}: {slowest['label']} ({slowest['wall_s']:.2f}s)")
     
     return {
         "items_processed": items_processed,
         "warnings": warnings,
         "errors": errors,
         "results": results,
+        "artifacts": [artifact for index in sorted(artifacts_by_task) for artifact in artifacts_by_task[index]],
+        "task_stats": [stats_by_task[index] for index in sorted(stats_by_task)],
         "success": success,
     }
 
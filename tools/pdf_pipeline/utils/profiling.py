@@ -0,0 +1,380 @@
+"""Opt-in pipeline profiler: wall time, CPU time and peak RSS per span.
+
+A span is a named, timed block::
+
+    with profile_span("section", f"transform/{slug}"):
+        ...
+
+Spans are recorded for transformers, stages, processors and
+postprocessors (``domain``), for each section a stage processes
+(``stages.transform``, ``stages.extract``, ``postprocessors.html_export``),
+for each chapter hook (``apply_chapter_N_adjustments`` and the export
+postprocess functions, via ``profile_call``) and for each process-pool task
+(``utils.parallel``). Every span records:
+
+- wall and CPU time, and self wall time (without nested spans)
+- peak RSS while the span ran, and how far that is above the RSS it started at
+
+On Linux the peak is the kernel's high-water mark (``VmHWM``), reset at the
+start of each span and carried up to enclosing spans; without ``/proc`` it
+is the process-wide peak, which never goes down.
+
+``Profiler`` is off unless ``run_pipeline.py --profile`` (or the
+``PDF_PIPELINE_PROFILE`` environment variable, which process-pool workers
+inherit) turns it on; a disabled span costs one attribute check.
+
+The report is a Chrome trace (open it in ``chrome://tracing`` or Perfetto)
+whose ``summary`` aggregates spans by category and name, so two runs'
+reports can be compared key by key.
+
+``ProcessProfiler`` is the base of this profiler and of the regex profiler
+(``utils.regex_registry``). It covers what they share: the environment
+variable that turns a profiler on, its report file, and the way worker
+measurements reach the parent. Worker processes record locally;
+``run_process_pool`` drains every registered profiler after each task and
+merges the payloads in the parent as they arrive.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from .artifacts import register_merger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "PDF_PIPELINE_PROFILE"
+PROFILE_ARTIFACT = "profile"
+# Outside data/processed, so later stages never read a report as pipeline data
+PROFILE_DIR = Path("data/profiles")
+DEFAULT_PROFILE_PATH = PROFILE_DIR / "profile.json"
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_RSS_UNIT_KB = 1 / 1024 if sys.platform == "darwin" else 1
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+_MEMORY_LINE_RE = re.compile(r"^(VmHWM|VmRSS):\s+(\d+)", re.MULTILINE)
+
+
+def _memory_kb() -> Tuple[int, int]:
+    """Current high-water mark and RSS of this process, in kilobytes."""
+    with open(_PROC_STATUS, "r", encoding="ascii") as f:
+        values = dict(_MEMORY_LINE_RE.findall(f.read()))
+    return int(values.get("VmHWM", 0)), int(values.get("VmRSS", 0))
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process, in kilobytes.
+
+    Uses ``VmHWM`` where ``/proc`` exists: ``ru_maxrss`` survives
+    ``execve`` on Linux, so spawned workers would report their parent's peak.
+    """
+    try:
+        return _memory_kb()[0]
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT_KB)
+
+
+def _reset_high_water_mark() -> bool:
+    """Reset the kernel's RSS high-water mark to the current RSS (Linux)."""
+    try:
+        with open(_PROC_CLEAR_REFS, "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class ProcessProfiler(ABC):
+    """An opt-in profiler whose worker-process measurements merge into the parent.
+
+    Subclasses set the environment variable that turns them on, the artifact
+    name their measurements travel under and their default report path.
+    """
+
+    env_var: str
+    artifact: str
+    default_report_path: Path
+    # JSON indent of the written report
+    report_indent: Optional[int] = None
+
+    def __init__(self):
+        """Create a disabled profiler."""
+        self.enabled = False
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; recorded measurements are kept."""
+        self.enabled = False
+
+    def enable_in_workers(self) -> None:
+        """Turn profiling on here and in process-pool workers started later."""
+        os.environ[self.env_var] = "1"
+        self.enable()
+
+    @abstractmethod
+    def has_data(self) -> bool:
+        """Whether anything was recorded since the last drain."""
+
+    @abstractmethod
+    def drain(self) -> Dict[str, Any]:
+        """Return the recorded measurements as a picklable payload and reset them."""
+
+    @abstractmethod
+    def absorb(self, payload: Dict[str, Any]) -> None:
+        """Add measurements drained from another process."""
+
+    @abstractmethod
+    def report(self) -> Dict[str, Any]:
+        """Build the JSON report."""
+
+    @abstractmethod
+    def format_summary(self, limit: int = 25) -> str:
+        """Plain-text table of the costliest entries."""
+
+    def write_report(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Write the report as JSON and return its path."""
+        path = Path(path or self.default_report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=self.report_indent, ensure_ascii=False)
+        return path
+
+
+_ProfilerT = TypeVar("_ProfilerT", bound=ProcessProfiler)
+_profilers: List[ProcessProfiler] = []
+
+
+def register_profiler(profiler: _ProfilerT) -> _ProfilerT:
+    """Merge a profiler's worker payloads into it, and enable it if its variable is set."""
+    _profilers.append(profiler)
+    register_merger(profiler.artifact, lambda payloads: [profiler.absorb(p) for p in payloads])
+    if os.environ.get(profiler.env_var):
+        profiler.enable()
+    return profiler
+
+
+def drain_profilers() -> List[Tuple[str, Dict[str, Any]]]:
+    """Drain every registered profiler that recorded something, as artifacts."""
+    return [(profiler.artifact, profiler.drain()) for profiler in _profilers if profiler.has_data()]
+
+
+def is_profile_artifact(name: str) -> bool:
+    """Whether an artifact carries a registered profiler's measurements."""
+    return any(profiler.artifact == name for profiler in _profilers)
+
+
+class Profiler(ProcessProfiler):
+    """Timed spans of one process, plus spans merged from workers."""
+
+    env_var = PROFILE_ENV_VAR
+    artifact = PROFILE_ARTIFACT
+    default_report_path = DEFAULT_PROFILE_PATH
+
+    def __init__(self):
+        """Create a disabled profiler."""
+        super().__init__()
+        self.spans: List[Dict[str, Any]] = []
+        # Per open span: wall time of its nested spans and peak RSS seen so far
+        self._open: List[List[float]] = []
+        self._per_span_peaks = False
+
+    def enable(self) -> None:
+        """Start recording spans."""
+        super().enable()
+        self._per_span_peaks = os.path.exists(_PROC_STATUS) and _reset_high_water_mark()
+
+    def _peak_and_rss(self) -> Tuple[int, int]:
+        if self._per_span_peaks:
+            return _memory_kb()
+        peak = peak_rss_kb()
+        return peak, peak
+
+    @contextmanager
+    def span(self, category: str, name: str, **args: Any) -> Iterator[None]:
+        """Record the enclosed block as a span.
+
+        Args:
+            category: Span kind (``stage``, ``section``, ``hook``, ...)
+            name: Span name, unique within the category
+            **args: Extra values shown with the span in the trace
+        """
+        if not self.enabled:
+            yield
+            return
+        peak, rss_start = self._peak_and_rss()
+        if self._per_span_peaks:
+            # The enclosing span keeps the peak reached so far; this span
+            # measures its own from here
+            if self._open:
+                self._open[-1][1] = max(self._open[-1][1], peak)
+            _reset_high_water_mark()
+        frame = [0.0, 0]
+        self._open.append(frame)
+        start = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self._open.pop()
+            rss = max(frame[1], self._peak_and_rss()[0])
+            if self._open:
+                self._open[-1][0] += wall
+                self._open[-1][1] = max(self._open[-1][1], rss)
+            self.spans.append({
+                "cat": category,
+                "name": name,
+                "ts": round(start * 1e6),
+                "dur": round(wall * 1e6),
+                "self": round(max(wall - frame[0], 0.0) * 1e6),
+                "cpu": round(cpu * 1e6),
+                "rss_kb": rss,
+                "rss_growth_kb": max(rss - rss_start, 0),
+                "pid": os.getpid(),
+                "args": args,
+            })
+
+    # ------------------------------------------------------------------
+    # Merging and reporting
+    # ------------------------------------------------------------------
+
+    def has_data(self) -> bool:
+        """Whether any spans were recorded since the last drain."""
+        return bool(self.spans)
+
+    def drain(self) -> Dict[str, Any]:
+        """Return the recorded spans and reset them."""
+        payload = {"spans": self.spans}
+        self.spans = []
+        return payload
+
+    def absorb(self, payload: Dict[str, Any]) -> None:
+        """Add spans drained from another profiler."""
+        self.spans.extend(payload.get("spans", []))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Spans aggregated by category and name, slowest self time first."""
+        totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for span in self.spans:
+            row = totals.setdefault((span["cat"], span["name"]), {
+                "category": span["cat"],
+                "name": span["name"],
+                "calls": 0,
+                "wall_ms": 0.0,
+                "self_ms": 0.0,
+                "cpu_ms": 0.0,
+                "max_wall_ms": 0.0,
+                "peak_rss_mb": 0.0,
+                "rss_growth_mb": 0.0,
+            })
+            row["calls"] += 1
+            row["wall_ms"] += span["dur"] / 1000
+            row["self_ms"] += span["self"] / 1000
+            row["cpu_ms"] += span["cpu"] / 1000
+            row["max_wall_ms"] = max(row["max_wall_ms"], span["dur"] / 1000)
+            row["peak_rss_mb"] = max(row["peak_rss_mb"], span["rss_kb"] / 1024)
+            row["rss_growth_mb"] = max(row["rss_growth_mb"], span["rss_growth_kb"] / 1024)
+        rows = sorted(totals.values(), key=lambda row: row["self_ms"], reverse=True)
+        for row in rows:
+            for key, value in row.items():
+                if isinstance(value, float):
+                    row[key] = round(value, 3)
+        return rows
+
+    def report(self) -> Dict[str, Any]:
+        """Build the report: Chrome trace events plus the per-span summary."""
+        events = []
+        for span in sorted(self.spans, key=lambda span: (span["ts"], -span["dur"])):
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": span["ts"],
+                "dur": span["dur"],
+                "pid": span["pid"],
+                "tid": span["pid"],
+                "args": {
+                    "self_ms": span["self"] / 1000,
+                    "cpu_ms": span["cpu"] / 1000,
+                    "peak_rss_mb": round(span["rss_kb"] / 1024, 1),
+                    "rss_growth_mb": round(span["rss_growth_kb"] / 1024, 1),
+                    **span["args"],
+                },
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "summary": self.summary(),
+        }
+
+    def format_summary(self, limit: int = 25, baseline: Optional[Dict[str, Any]] = None) -> str:
+        """Plain-text table of the spans with the most self time.
+
+        Args:
+            limit: Number of rows
+            baseline: An earlier report; adds the change in wall time per span
+        """
+        previous = {}
+        if baseline:
+            previous = {(row["category"], row["name"]): row for row in baseline.get("summary", [])}
+        header = f"{'self ms':>10} {'wall ms':>10} {'cpu ms':>10} {'calls':>6} {'peak MB':>8} {'+MB':>7}"
+        if baseline is not None:
+            header += f" {'vs base':>9}"
+        lines = [header + "  category / name"]
+        for row in self.summary()[:limit]:
+            line = (
+                f"{row['self_ms']:>10.1f} {row['wall_ms']:>10.1f} {row['cpu_ms']:>10.1f} "
+                f"{row['calls']:>6} {row['peak_rss_mb']:>8.1f} {row['rss_growth_mb']:>7.1f}"
+            )
+            if baseline is not None:
+                old = previous.get((row["category"], row["name"]))
+                line += f" {row['wall_ms'] - old['wall_ms']:>+9.1f}" if old else f" {'new':>9}"
+            lines.append(f"{line}  {row['category']} / {row['name'][:80]}")
+        return "\n".join(lines)
+
+
+PROFILER = register_profiler(Profiler())
+
+
+def profile_span(category: str, name: str, **args: Any):
+    """Record the enclosed block as a span of ``PROFILER`` (see ``Profiler.span``)."""
+    return PROFILER.span(category, name, **args)
+
+
+def profile_call(category: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a function inside a span named after its module and name."""
+    if not PROFILER.enabled:
+        return func(*args, **kwargs)
+    module = getattr(func, "__module__", "") or ""
+    name = f"{module.rsplit('.', 1)[-1]}.{getattr(func, '__name__', repr(func))}"
+    with PROFILER.span(category, name):
+        return func(*args, **kwargs)
+
+
+def enable_profiling() -> None:
+    """Turn profiling on here and in process-pool workers started later."""
+    PROFILER.enable_in_workers()
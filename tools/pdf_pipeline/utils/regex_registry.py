@@ -0,0 +1,292 @@
+"""Named, precompiled regular expressions and an opt-in regex profiler.
+
+Chapter fixers use many distinct patterns. Passing pattern strings to
+``re.sub`` and friends compiles them through ``re``'s internal cache, which
+holds 512 patterns and is shared by the whole process; past that size,
+patterns are recompiled on every use. Patterns that fixers use repeatedly
+are registered once, at import, under a name::
+
+    _HEADER_RE = regex("chapter7.header", r'<p id="header-(\\d+)')
+
+``regex`` returns a ``NamedPattern`` that behaves like a compiled pattern.
+
+``RegexProfiler`` records call count, time and input size per pattern and
+per chapter. It is off unless ``run_pipeline.py --profile-regex`` (or the
+``PDF_PIPELINE_PROFILE_REGEX`` environment variable, which process-pool
+workers inherit) turns it on. While enabled it also wraps the module-level
+``re`` functions so inline patterns are measured, keyed by calling module
+and pattern text.
+
+``regex_scope(chapter)`` attributes calls to a chapter. Worker
+measurements reach the parent the way every ``ProcessProfiler``'s do (see
+``utils.profiling``).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from .profiling import PROFILE_DIR, ProcessProfiler, register_profiler
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "PDF_PIPELINE_PROFILE_REGEX"
+REGEX_PROFILE_ARTIFACT = "regex-profile"
+DEFAULT_REGEX_REPORT_PATH = PROFILE_DIR / "regex_profile.json"
+
+# Chapter label of calls made outside any ``regex_scope``
+_NO_SCOPE = "-"
+
+# Module-level ``re`` functions wrapped while profiling, with the position of
+# their string argument
+_RE_FUNCTIONS = {
+    "search": 1, "match": 1, "fullmatch": 1, "findall": 1,
+    "finditer": 1, "split": 1, "sub": 2, "subn": 2,
+}
+# The same for methods of a compiled pattern
+_PATTERN_METHODS = {
+    "search": 0, "match": 0, "fullmatch": 0, "findall": 0,
+    "finditer": 0, "split": 0, "sub": 1, "subn": 1,
+}
+
+_REPORT_PATTERN_CHARS = 120
+
+
+class RegexProfiler(ProcessProfiler):
+    """Per-pattern, per-chapter regex timings."""
+
+    env_var = PROFILE_ENV_VAR
+    artifact = REGEX_PROFILE_ARTIFACT
+    default_report_path = DEFAULT_REGEX_REPORT_PATH
+    report_indent = 2
+
+    def __init__(self):
+        """Create a disabled profiler."""
+        super().__init__()
+        self.chapter = _NO_SCOPE
+        # (name, chapter) -> [calls, seconds, chars, max seconds]
+        self.stats: Dict[Tuple[str, str], List[float]] = {}
+        self.patterns: Dict[str, str] = {}
+        self._originals: Dict[str, Callable] = {}
+
+    def enable(self) -> None:
+        """Start recording, including calls to the module-level ``re`` functions."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for name, position in _RE_FUNCTIONS.items():
+            original = getattr(re, name)
+            self._originals[name] = original
+            setattr(re, name, self._wrap_re_function(original, position))
+
+    def disable(self) -> None:
+        """Stop recording and restore the ``re`` module."""
+        if not self.enabled:
+            return
+        for name, original in self._originals.items():
+            setattr(re, name, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def record(self, name: str, pattern: str, seconds: float, chars: int) -> None:
+        """Add one call to the statistics."""
+        entry = self.stats.get((name, self.chapter))
+        if entry is None:
+            entry = self.stats[(name, self.chapter)] = [0, 0.0, 0, 0.0]
+            self.patterns.setdefault(name, pattern)
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += chars
+        if seconds > entry[3]:
+            entry[3] = seconds
+
+    def timed(self, name: str, pattern: str, call: Callable, args: tuple, kwargs: dict, position: int) -> Any:
+        """Run a regex call, recording it under ``name``."""
+        start = time.perf_counter()
+        result = call(*args, **kwargs)
+        if call.__name__ == "finditer":
+            result = list(result)
+        elapsed = time.perf_counter() - start
+        text = args[position] if len(args) > position else kwargs.get("string", "")
+        self.record(name, pattern, elapsed, len(text) if isinstance(text, (str, bytes)) else 0)
+        return iter(result) if call.__name__ == "finditer" else result
+
+    def _wrap_re_function(self, original: Callable, position: int) -> Callable:
+        profiler = self
+
+        def wrapper(pattern, *args, **kwargs):
+            if isinstance(pattern, NamedPattern):
+                pattern = pattern.regex
+            text = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+            text = text if isinstance(text, str) else repr(text)
+            module = sys._getframe(1).f_globals.get("__name__", "?")
+            return profiler.timed(f"{module}:{text}", text, original, (pattern,) + args, kwargs, position)
+
+        wrapper.__name__ = original.__name__
+        wrapper.__doc__ = original.__doc__
+        return wrapper
+
+    # ------------------------------------------------------------------
+    # Merging and reporting
+    # ------------------------------------------------------------------
+
+    def has_data(self) -> bool:
+        """Whether any calls were recorded since the last drain."""
+        return bool(self.stats)
+
+    def drain(self) -> Dict[str, Any]:
+        """Return the recorded statistics and reset them."""
+        payload = {
+            "stats": [[name, chapter] + values for (name, chapter), values in self.stats.items()],
+            "patterns": dict(self.patterns),
+        }
+        self.stats = {}
+        self.patterns = {}
+        return payload
+
+    def absorb(self, payload: Dict[str, Any]) -> None:
+        """Add statistics drained from another profiler."""
+        for name, pattern in payload.get("patterns", {}).items():
+            self.patterns.setdefault(name, pattern)
+        for name, chapter, calls, seconds, chars, max_seconds in payload.get("stats", []):
+            entry = self.stats.setdefault((name, chapter), [0, 0.0, 0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+            entry[2] += chars
+            entry[3] = max(entry[3], max_seconds)
+
+    def report(self) -> Dict[str, Any]:
+        """Build the report: every pattern/chapter pair, slowest first, plus per-chapter totals."""
+        rows = []
+        chapters: Dict[str, List[float]] = {}
+        for (name, chapter), (calls, seconds, chars, max_seconds) in self.stats.items():
+            rows.append({
+                "name": name,
+                "pattern": self.patterns.get(name, "")[:_REPORT_PATTERN_CHARS],
+                "chapter": chapter,
+                "calls": int(calls),
+                "total_ms": round(seconds * 1000, 3),
+                "mean_us": round(seconds * 1e6 / calls, 3) if calls else 0.0,
+                "max_ms": round(max_seconds * 1000, 3),
+                "input_chars": int(chars),
+            })
+            totals = chapters.setdefault(chapter, [0, 0.0])
+            totals[0] += calls
+            totals[1] += seconds
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return {
+            "patterns": rows,
+            "chapters": {
+                chapter: {"calls": int(calls), "total_ms": round(seconds * 1000, 3)}
+                for chapter, (calls, seconds) in sorted(chapters.items(), key=lambda item: -item[1][1])
+            },
+        }
+
+    def format_summary(self, limit: int = 15) -> str:
+        """Plain-text table of the slowest patterns."""
+        rows = self.report()["patterns"][:limit]
+        lines = [f"{'total ms':>10} {'calls':>8} {'mean us':>10} {'MB in':>8}  chapter / pattern"]
+        for row in rows:
+            lines.append(
+                f"{row['total_ms']:>10.1f} {row['calls']:>8} {row['mean_us']:>10.1f} "
+                f"{row['input_chars'] / 1e6:>8.2f}  {row['chapter']} / {row['name'][:90]}"
+            )
+        return "\n".join(lines)
+
+
+PROFILER = register_profiler(RegexProfiler())
+
+
+class NamedPattern:
+    """A registered, precompiled pattern; profiled under its name when enabled."""
+
+    __slots__ = ("name", "regex", "pattern", "flags")
+
+    def __init__(self, name: str, regex: "re.Pattern"):
+        self.name = name
+        self.regex = regex
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+
+    def _call(self, method: str, args: tuple, kwargs: dict) -> Any:
+        call = getattr(self.regex, method)
+        if not PROFILER.enabled:
+            return call(*args, **kwargs)
+        return PROFILER.timed(self.name, self.pattern, call, args, kwargs, _PATTERN_METHODS[method])
+
+    def search(self, *args, **kwargs):
+        return self._call("search", args, kwargs)
+
+    def match(self, *args, **kwargs):
+        return self._call("match", args, kwargs)
+
+    def fullmatch(self, *args, **kwargs):
+        return self._call("fullmatch", args, kwargs)
+
+    def findall(self, *args, **kwargs):
+        return self._call("findall", args, kwargs)
+
+    def finditer(self, *args, **kwargs):
+        return self._call("finditer", args, kwargs)
+
+    def split(self, *args, **kwargs):
+        return self._call("split", args, kwargs)
+
+    def sub(self, *args, **kwargs):
+        return self._call("sub", args, kwargs)
+
+    def subn(self, *args, **kwargs):
+        return self._call("subn", args, kwargs)
+
+    def __repr__(self) -> str:
+        return f"NamedPattern({self.name!r}, {self.pattern!r})"
+
+
+_registry: Dict[str, NamedPattern] = {}
+
+
+def regex(name: str, pattern: str, flags: int = 0) -> NamedPattern:
+    """Compile and register a pattern under a unique name.
+
+    Registering the same name again with the same pattern returns the
+    existing entry (modules may be imported under two package paths).
+
+    Raises:
+        ValueError: If the name is already registered for another pattern
+    """
+    existing = _registry.get(name)
+    if existing is not None:
+        if existing.pattern != pattern or existing.flags != re.compile(pattern, flags).flags:
+            raise ValueError(f"Regex name {name!r} is already registered for {existing.pattern!r}")
+        return existing
+    named = _registry[name] = NamedPattern(name, re.compile(pattern, flags))
+    return named
+
+
+def registered_patterns() -> Dict[str, NamedPattern]:
+    """All registered patterns by name."""
+    return dict(_registry)
+
+
+@contextmanager
+def regex_scope(chapter: str) -> Iterator[None]:
+    """Attribute regex calls inside the block to a chapter."""
+    if not PROFILER.enabled:
+        yield
+        return
+    previous = PROFILER.chapter
+    PROFILER.chapter = chapter
+    try:
+        yield
+    finally:
+        PROFILER.chapter = previous
+
+
+def enable_regex_profiling() -> None:
+    """Turn profiling on here and in process-pool workers started later."""
+    PROFILER.enable_in_workers()
@@ -0,0 +1,395 @@
+"""Declarative paragraph splits for chapters exported as a single HTML page.
+
+Two-column PDF pages often come out of extraction with several paragraphs
+merged into one. Such fixes used to be one function per section: locate the
+section between two regexes, split its text at marker phrases, rewrap the
+pieces in ``<p>`` tags and splice them back into the page. Each of those
+functions searched and rebuilt the whole page.
+
+A ``SectionSplitSpec`` (loaded from a JSON spec file) describes the same
+fixes as data:
+
+- ``headers``: styled Roman-numeral headers to restyle as ``hN-header``
+  paragraphs,
+- ``remove_headers``: styled headers to drop,
+- ``sections``: start/end anchors, marker phrases and layout of each split.
+
+``SectionSplitter`` finds every anchor of the page (``<p id>``, ``<h2 id>``
+and ``<a id>`` tags) in one scan. Start and end anchors are matched only at
+those positions, and all splits and header rewrites are applied in a single
+rebuild.
+
+Sections run in one of two stages:
+
+- ``before_headers`` anchors see the page as extracted.
+- ``after_headers`` anchors see the page with header rules applied, exactly
+  as if the header pass had run before them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .regex_registry import regex
+
+logger = logging.getLogger(__name__)
+
+# Every tag a section may be anchored on; the id is captured for header rules
+_ANCHOR_RE = regex("section_splits.anchor", r'<(?:(?:p|h2) id="([^"]*)"[^>]*>|a id="[^"]*"></a>)')
+
+# Sections without an end anchor run to the end of the page body
+_END_OF_CONTENT_RE = regex("section_splits.end_of_content", r'</body>|$')
+
+_PARAGRAPH_RE = regex("section_splits.paragraph", r'<p>(.*?)</p>', re.DOTALL)
+_PARAGRAPH_TAG_RE = regex("section_splits.paragraph_tag", r'</?p>')
+
+_STYLED_HEADER = (
+    r'<p id="{id}">[IVXLCDM]+\.\s+<a href="#top"[^>]*>\[\^\]</a>\s+<span[^>]*>{text}</span></p>'
+)
+_RESTYLED_HEADER = (
+    '<p id="{id}" class="h{level}-header"><a href="#top" style="font-size: 0.8em; text-decoration: none;">[^]</a>'
+    ' <span style="color: #cd490a; font-size: 0.9em">{text}</span></p>'
+)
+
+
+class HeaderRule(BaseModel):
+    """A styled ``<p id>`` header ("IV. [^] Name") to restyle or remove."""
+
+    id: str
+    text: str
+    level: int = 2
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SectionSplit(BaseModel):
+    """Where a merged section starts and ends, and where to split it."""
+
+    name: str
+    start: str
+    end: Optional[List[str]] = None
+    stage: Literal["before_headers", "after_headers"] = "before_headers"
+    content: Literal["all", "first_paragraph"] = "all"
+    markers: List[str]
+    paragraphs: Optional[int] = None
+    blockquote: Optional[Tuple[int, int]] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SectionSplitSpec(BaseModel):
+    """All paragraph splits and header rewrites of one chapter."""
+
+    headers: List[HeaderRule] = Field(default_factory=list)
+    remove_headers: List[HeaderRule] = Field(default_factory=list)
+    sections: List[SectionSplit] = Field(default_factory=list)
+
+    model_config = ConfigDict(extra="forbid")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SectionSplitSpec":
+        """Load a spec from a JSON file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.model_validate(json.load(f))
+
+
+def split_paragraph_at_markers(content: str, markers: List[str]) -> List[str]:
+    """
+    Split content into paragraphs at specified markers.
+
+    Args:
+        content: The HTML content to split
+        markers: List of text markers where splits should occur
+
+    Returns:
+        List of paragraph strings
+    """
+    # Normalize HTML entities for matching
+    normalized = content.replace("&#x27;", "'").replace("&quot;", '"').replace("&amp;", "&")
+
+    paragraphs = []
+    start = 0
+
+    for marker in markers:
+        # Find the marker in normalized text
+        pos = normalized.find(marker, start)
+
+        if pos == -1:
+            logger.debug(f"Could not find marker: '{marker}'")
+            continue
+
+        # Add the text up to this marker as a paragraph
+        if pos > start:
+            chunk = normalized[start:pos].strip()
+            if chunk:
+                paragraphs.append(chunk)
+
+        # Move start position to the marker
+        start = pos
+
+    # Add the remaining content
+    if start < len(normalized):
+        chunk = normalized[start:].strip()
+        if chunk:
+            paragraphs.append(chunk)
+
+    return paragraphs
+
+
+def wrap_paragraphs(paragraphs: List[str]) -> str:
+    """
+    Wrap paragraph text in <p> tags.
+
+    Args:
+        paragraphs: List of paragraph text strings
+
+    Returns:
+        HTML string with paragraphs wrapped
+    """
+    return "\n".join(f"<p>{para}</p>" for para in paragraphs if para.strip())
+
+
+def _render_blockquote(paragraphs: List[str], first: int, stop: int) -> str:
+    """Wrap ``paragraphs[first:stop]`` in an italic block quote, the rest as paragraphs."""
+    intro_html = "".join(f"<p>{para}</p>\n" for para in paragraphs[:first] if para.strip())
+
+    blockquote_html = '<blockquote style="margin: 1em 2em; font-style: italic;">\n'
+    for para in paragraphs[first:stop]:
+        if para.strip():
+            blockquote_html += f"<p><em>{para}</em></p>\n"
+    blockquote_html += "</blockquote>"
+
+    return intro_html + blockquote_html + "\n" + wrap_paragraphs(paragraphs[stop:])
+
+
+class _Anchor:
+    """A tag a section can start or end at, with the header paragraph it opens."""
+
+    __slots__ = ("pos", "end", "id", "text")
+
+    def __init__(self, pos: int, end: int, anchor_id: Optional[str]):
+        self.pos = pos
+        self.end = end
+        self.id = anchor_id
+        # Header text after header rules, when they change it
+        self.text: Optional[str] = None
+
+
+class _CompiledSection:
+    """A ``SectionSplit`` with its anchor patterns compiled."""
+
+    __slots__ = ("spec", "start", "end")
+
+    def __init__(self, spec: SectionSplit):
+        self.spec = spec
+        self.start = re.compile(spec.start, re.DOTALL)
+        self.end = [re.compile(pattern, re.DOTALL) for pattern in spec.end] if spec.end is not None else None
+
+
+class SectionSplitter:
+    """Applies a ``SectionSplitSpec`` to a page in one scan and one rebuild."""
+
+    def __init__(self, spec: SectionSplitSpec):
+        """Compile the spec.
+
+        Args:
+            spec: Header rules and section splits, in application order
+        """
+        self.spec = spec
+        self._header_rules: Dict[str, List[Tuple["re.Pattern", str]]] = {}
+        for rule in spec.headers:
+            self._header_rules.setdefault(rule.id, []).append((
+                self._styled_header_pattern(rule),
+                _RESTYLED_HEADER.format(id=rule.id, level=rule.level, text=rule.text),
+            ))
+        self._removals: Dict[str, List["re.Pattern"]] = {}
+        for rule in spec.remove_headers:
+            self._removals.setdefault(rule.id, []).append(self._styled_header_pattern(rule))
+        self._sections = [_CompiledSection(section) for section in spec.sections]
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "SectionSplitter":
+        """Compile the spec stored in a JSON file."""
+        return cls(SectionSplitSpec.load(path))
+
+    @staticmethod
+    def _styled_header_pattern(rule: HeaderRule) -> "re.Pattern":
+        return re.compile(_STYLED_HEADER.format(id=re.escape(rule.id), text=re.escape(rule.text)))
+
+    # ------------------------------------------------------------------
+    # Scan
+    # ------------------------------------------------------------------
+
+    def _scan(self, html: str) -> List[_Anchor]:
+        """Find every anchor and apply the header rules to its paragraph."""
+        anchors = []
+        for match in _ANCHOR_RE.finditer(html):
+            anchor_id = match.group(1)
+            end = match.end()
+            if match.group(0).startswith("<p"):
+                close = html.find("</p>", end)
+                if close != -1:
+                    end = close + len("</p>")
+            anchor = _Anchor(match.start(), end, anchor_id)
+            if anchor_id is not None:
+                self._apply_header_rules(html, anchor)
+            anchors.append(anchor)
+        return anchors
+
+    def _apply_header_rules(self, html: str, anchor: _Anchor) -> None:
+        """Set the restyled (or removed) text of a header paragraph."""
+        text = None
+        for pattern, replacement in self._header_rules.get(anchor.id, ()):
+            if pattern.fullmatch(html, anchor.pos, anchor.end):
+                text = replacement
+                logger.debug(f"Restyled header '{anchor.id}'")
+                break
+        for pattern in self._removals.get(anchor.id, ()):
+            if pattern.fullmatch(text if text is not None else html[anchor.pos:anchor.end]):
+                text = ""
+                logger.debug(f"Removed header '{anchor.id}'")
+                break
+        anchor.text = text
+
+    @staticmethod
+    def _header_text(html: str, anchor: _Anchor, restyled: bool) -> str:
+        if restyled and anchor.text is not None:
+            return anchor.text
+        return html[anchor.pos:anchor.end]
+
+    @staticmethod
+    def _view(html: str, anchors: List[_Anchor], start: int, end: int, restyled: bool) -> str:
+        """Text of ``html[start:end]``, with header rules applied when ``restyled``."""
+        if not restyled:
+            return html[start:end]
+        parts = []
+        cursor = start
+        for anchor in anchors:
+            if anchor.text is None or anchor.pos < start:
+                continue
+            if anchor.end > end:
+                break
+            parts.append(html[cursor:anchor.pos])
+            parts.append(anchor.text)
+            cursor = anchor.end
+        parts.append(html[cursor:end])
+        return "".join(parts)
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _locate(
+        self, html: str, anchors: List[_Anchor], section: _CompiledSection
+    ) -> Optional[Tuple[int, int, str, str]]:
+        """Resolve a section against the anchors.
+
+        Returns:
+            (replace_start, replace_end, kept_prefix, content) or None
+        """
+        restyled = section.spec.stage == "after_headers"
+
+        for idx, anchor in enumerate(anchors):
+            header = self._header_text(html, anchor, restyled)
+            start_match = section.start.match(header)
+            if start_match:
+                break
+        else:
+            return None
+
+        if section.end is None:
+            end = _END_OF_CONTENT_RE.search(html, anchor.end).start()
+        else:
+            end = None
+            for pattern in section.end:
+                for later in anchors[idx + 1:]:
+                    if pattern.match(self._header_text(html, later, restyled)):
+                        end = later.pos
+                        break
+                if end is not None:
+                    break
+            if end is None:
+                return None
+
+        if start_match.end() == len(header):
+            # Section body starts after the header paragraph
+            return anchor.end, end, "", self._view(html, anchors, anchor.end, end, restyled)
+        # Section body starts inside the header paragraph and absorbs its tail
+        content = header[start_match.end():] + self._view(html, anchors, anchor.end, end, restyled)
+        return anchor.pos, end, header[:start_match.end()], content
+
+    @staticmethod
+    def _render(section: SectionSplit, content: str) -> Optional[str]:
+        """Split a section body at its markers and rewrap it."""
+        if section.content == "first_paragraph":
+            para_match = _PARAGRAPH_RE.search(content)
+            if not para_match:
+                logger.warning(f"Could not extract {section.name} paragraph content")
+                return None
+            para_content = para_match.group(1)
+        else:
+            para_content = _PARAGRAPH_TAG_RE.sub("", content).strip()
+
+        paragraphs = split_paragraph_at_markers(para_content, section.markers)
+        if section.paragraphs is not None and len(paragraphs) != section.paragraphs:
+            logger.warning(f"Expected {section.paragraphs} {section.name} paragraphs, got {len(paragraphs)}")
+        logger.info(f"Split {section.name} section into {len(paragraphs)} paragraphs")
+
+        if section.blockquote is not None and len(paragraphs) >= section.blockquote[1]:
+            return _render_blockquote(paragraphs, *section.blockquote)
+        return wrap_paragraphs(paragraphs)
+
+    # ------------------------------------------------------------------
+    # Apply
+    # ------------------------------------------------------------------
+
+    def apply(self, html: str) -> str:
+        """
+        Apply all header rules and section splits.
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            HTML with every located section split and every matching header rewritten
+        """
+        anchors = self._scan(html)
+
+        edits: List[Tuple[int, int, str]] = []
+        for section in self._sections:
+            located = self._locate(html, anchors, section)
+            if located is None:
+                logger.warning(f"Could not locate {section.spec.name} section")
+                continue
+            start, end, prefix, content = located
+            if any(start < e_end and e_start < end for e_start, e_end, _ in edits):
+                logger.warning(f"Skipping {section.spec.name} section: it overlaps an earlier split")
+                continue
+            rendered = self._render(section.spec, content)
+            if rendered is None:
+                continue
+            edits.append((start, end, prefix + rendered))
+
+        # Header rewrites outside the split sections
+        for anchor in anchors:
+            if anchor.text is None:
+                continue
+            if any(start <= anchor.pos < end for start, end, _ in edits):
+                continue
+            edits.append((anchor.pos, anchor.end, anchor.text))
+
+        edits.sort(key=lambda edit: edit[0])
+        parts = []
+        cursor = 0
+        for start, end, text in edits:
+            parts.append(html[cursor:start])
+            parts.append(text)
+            cursor = end
+        parts.append(html[cursor:])
+        return "".join(parts)
@@ -0,0 +1,50 @@
+"""Cached loading of the JSON spec files under ``data/mappings``.
+
+Spec-driven helpers (``TableEngine``, ``SectionSplitter``) compile their spec
+file once per process and reuse the compiled form until the file changes.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Project root, for resolving specs when running from another directory
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Compiled spec per resolved path, with the file's mtime when it was built
+_compiled: Dict[str, Tuple[int, Any]] = {}
+
+
+def resolve_spec_path(spec_path: Union[str, Path]) -> Path:
+    """Resolve a relative spec path against the project root if it is not found here."""
+    path = Path(spec_path)
+    if not path.is_absolute() and not path.exists():
+        path = PROJECT_ROOT / path
+    return path
+
+
+def load_spec(spec_path: Union[str, Path], build: Callable[[Path], T]) -> T:
+    """Compile a spec file with ``build``, reusing the result until the file changes.
+
+    Each path has one entry: a changed file replaces its stale compiled form.
+
+    Args:
+        spec_path: Spec file, absolute or relative to the working directory
+            or the project root
+        build: Compiles the spec file at the given path
+
+    Returns:
+        The compiled spec
+    """
+    path = resolve_spec_path(spec_path)
+    key = str(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _compiled.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    compiled = build(path)
+    _compiled[key] = (mtime, compiled)
+    return compiled
@@ -0,0 +1,355 @@
+"""Declarative reconstruction of tables laid out as loose text on a page.
+
+Tables that extraction leaves as scattered lines get one extractor each.
+Every extractor finds its header block, scans ahead for the block that ends
+the table, collects the lines in between, buckets them into hand-measured
+column x ranges, anchors rows on a label column and finally hides the
+source blocks. Each of those steps walks the page's blocks again.
+
+A ``TableSpecFile`` (loaded from a JSON spec file) describes such tables as
+data:
+
+- ``header`` / ``end``: text of the block above the table and of the block
+  below it (the end defaults to the bottom of the page),
+- ``top`` / ``column_header_bottom``: y positions the table's lines start
+  below, and the bottom of its printed column headers,
+- ``columns``: the column names; every column except the row label column
+  has an x band its lines' left edges fall in,
+- ``row_anchor``: label texts that start a row, and how far a row reaches
+  towards the next one,
+- ``exclude``, ``min_cell_length`` and ``clean``: cleanup of cell text,
+- ``attach``: block key the table is attached under for rendering.
+
+``TableEngine`` evaluates all specs of a page together: one pass over the
+page's blocks finds the header and end anchors, and one traversal of the
+page's ``PageIndex`` hands every line in a table region to its table.
+
+The chapter 10 treasure tables are described this way; the other chapters'
+table extractors still have their own code.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .page_index import PageIndex
+
+logger = logging.getLogger(__name__)
+
+# Stand-in for "no end anchor on this page"
+_PAGE_BOTTOM = 999999.0
+
+CellCleaner = Callable[[str], str]
+
+
+class ColumnSpec(BaseModel):
+    """A table column; ``x`` is the half-open band its lines start in."""
+
+    name: str
+    x: Optional[Tuple[float, float]] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RowAnchorSpec(BaseModel):
+    """Labels that start a row, and the vertical reach of each row.
+
+    A row starts ``lead`` above its label and reaches ``fraction`` of the way
+    to the next label, or ``last_row_height`` below the last one.
+    """
+
+    values: List[str]
+    lead: float = 2.0
+    fraction: float = 0.8
+    last_row_height: float = 20.0
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class TableSpec(BaseModel):
+    """How to find, read and clean up one table."""
+
+    name: str
+    header: str
+    header_size: Optional[float] = None
+    end: Optional[str] = None
+    end_match: Literal["exact", "contains"] = "exact"
+    top: Optional[float] = None
+    column_header_bottom: Optional[float] = None
+    columns: List[ColumnSpec]
+    row_anchor: RowAnchorSpec
+    exclude: List[str] = Field(default_factory=list)
+    min_cell_length: int = 1
+    clean: List[str] = Field(default_factory=list)
+    empty_cell: str = "-"
+    attach: str
+    bbox_offsets: Tuple[float, float, float, float] = (0.0, 5.0, 0.0, 100.0)
+    hide_source: bool = True
+
+    model_config = ConfigDict(extra="forbid")
+
+    def is_end(self, text: str) -> bool:
+        """Whether a block's text is this table's end anchor."""
+        if self.end is None:
+            return False
+        if self.end_match == "contains":
+            return self.end in text
+        return text.strip() == self.end
+
+
+class TableSpecFile(BaseModel):
+    """All table specs of a chapter, in application order."""
+
+    tables: List[TableSpec]
+
+    model_config = ConfigDict(extra="forbid")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TableSpecFile":
+        """Load specs from a JSON file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.model_validate(json.load(f))
+
+
+def block_plain_text(block: dict) -> str:
+    """Text of a block with all spans joined by spaces (empty for non-text blocks)."""
+    if block.get("type") != "text":
+        return ""
+    return " ".join(
+        span.get("text", "") for line in block.get("lines", []) for span in line.get("spans", [])
+    ).strip()
+
+
+class _Cell:
+    """A non-empty span of a table region, positioned by its line."""
+
+    __slots__ = ("text", "x", "y")
+
+    def __init__(self, text: str, x: float, y: float):
+        """Initialize a cell from a span's text and its line's top-left corner."""
+        self.text = text
+        self.x = x
+        self.y = y
+
+
+class _Placement:
+    """A table spec located on a page."""
+
+    __slots__ = ("spec", "header_idx", "header", "top", "end_y", "cells")
+
+    def __init__(self, spec: TableSpec, header_idx: int, header: dict, end_y: float):
+        self.spec = spec
+        self.header_idx = header_idx
+        self.header = header
+        self.end_y = end_y
+        self.top = spec.top if spec.top is not None else header.get("bbox", [0, 0, 0, 0])[3]
+        self.cells: List[_Cell] = []
+
+    def takes(self, block_idx: int, y0: float) -> bool:
+        """Whether a line belongs to this table's region."""
+        return block_idx > self.header_idx and self.top < y0 < self.end_y
+
+
+class TableEngine:
+    """Reconstructs the tables described by a set of specs."""
+
+    def __init__(self, specs: Sequence[TableSpec], cleaners: Optional[Dict[str, CellCleaner]] = None):
+        """Check the specs against the available cell cleaners.
+
+        Args:
+            specs: Table specs, in application order
+            cleaners: Named cell cleanup functions the specs' ``clean`` lists refer to
+        """
+        self.specs = list(specs)
+        self.cleaners = dict(cleaners or {})
+        for spec in self.specs:
+            unknown = [name for name in spec.clean if name not in self.cleaners]
+            if unknown:
+                raise ValueError(f"Table spec {spec.name!r} uses unknown cleaners: {unknown}")
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], cleaners: Optional[Dict[str, CellCleaner]] = None) -> "TableEngine":
+        """Build an engine for the specs stored in a JSON file."""
+        return cls(TableSpecFile.load(path).tables, cleaners)
+
+    def apply(self, pages: List[dict], names: Optional[Sequence[str]] = None) -> Dict[str, bool]:
+        """Reconstruct every table whose header is found in the pages.
+
+        Each table is taken from the first page holding its header block.
+
+        Args:
+            pages: Page dictionaries, modified in place
+            names: Only apply the specs with these names
+
+        Returns:
+            Mapping of spec name to whether its table was built
+        """
+        pending = [spec for spec in self.specs if names is None or spec.name in names]
+        built = {spec.name: False for spec in pending}
+        for page in pages:
+            if not pending:
+                break
+            placements = self._locate(page, pending)
+            if not placements:
+                continue
+            self._collect(page, placements)
+            for placement in placements:
+                self._build(page, placement)
+                built[placement.spec.name] = True
+            found = {placement.spec.name for placement in placements}
+            pending = [spec for spec in pending if spec.name not in found]
+
+        for spec in pending:
+            logger.warning(f"Could not find '{spec.header}' table header")
+        return built
+
+    # ------------------------------------------------------------------
+    # Passes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _locate(page: dict, specs: List[TableSpec]) -> List[_Placement]:
+        """Find the header and end anchors of the specs present on a page."""
+        blocks = page.get("blocks", [])
+        texts = [block_plain_text(block) for block in blocks]
+        placements = []
+        for spec in specs:
+            header_idx = next((idx for idx, text in enumerate(texts) if text == spec.header), None)
+            if header_idx is None:
+                continue
+            end_y = _PAGE_BOTTOM
+            for idx in range(header_idx + 1, len(blocks)):
+                if spec.is_end(texts[idx]):
+                    end_y = blocks[idx].get("bbox", [0, 0, 0, 0])[1]
+                    break
+            logger.info(f"Found '{spec.header}' table header at block {header_idx}, end at Y={end_y:.1f}")
+            placements.append(_Placement(spec, header_idx, blocks[header_idx], end_y))
+        return placements
+
+    @staticmethod
+    def _collect(page: dict, placements: List[_Placement]) -> None:
+        """Hand every line of the table regions to its tables in one index traversal."""
+        y_min = min(placement.top for placement in placements)
+        y_max = max(placement.end_y for placement in placements)
+        for entry in PageIndex.for_page(page).between_y(y_min, y_max):
+            owners = [placement for placement in placements if placement.takes(entry.block_idx, entry.y0)]
+            if not owners:
+                continue
+            bbox = entry.line.get("bbox", [0, 0, 0, 0])
+            for span in entry.line.get("spans", []):
+                text = span.get("text", "").strip()
+                if text:
+                    for placement in owners:
+                        placement.cells.append(_Cell(text, bbox[0], bbox[1]))
+
+    def _build(self, page: dict, placement: _Placement) -> None:
+        """Assemble, attach and clean up one located table."""
+        spec = placement.spec
+        rows = self._rows(placement)
+
+        label_column = spec.columns[0].name
+        header_row = {"cells": [{"text": column.name} for column in spec.columns]}
+        data_rows = []
+        for label in spec.row_anchor.values:
+            if label not in rows:
+                continue
+            row = rows[label]
+            cells = [{"text": label}]
+            for column in spec.columns:
+                if column.name != label_column:
+                    cells.append({"text": row.get(column.name, spec.empty_cell)})
+            data_rows.append({"cells": cells})
+
+        header = placement.header
+        hx0, _, hx1, hy1 = header.get("bbox", [0, 0, 0, 0])
+        dx0, dy0, dx1, dy1 = spec.bbox_offsets
+        header[spec.attach] = {
+            "rows": [header_row] + data_rows,
+            "header_rows": 1,
+            "bbox": [hx0 + dx0, hy1 + dy0, hx1 + dx1, hy1 + dy1],
+        }
+        logger.info(f"Attached {spec.name} table with {len(data_rows)} data rows")
+
+        if spec.header_size is not None:
+            for line in header.get("lines", []):
+                for span in line.get("spans", []):
+                    if spec.header in span.get("text", ""):
+                        span["size"] = spec.header_size
+
+        if spec.hide_source:
+            self._hide_source(page, placement)
+
+    def _rows(self, placement: _Placement) -> Dict[str, Dict[str, str]]:
+        """Bucket a table's cells into columns and anchor them on row labels."""
+        spec = placement.spec
+        cells = placement.cells
+        if spec.column_header_bottom is not None:
+            cells = [cell for cell in cells if cell.y >= spec.column_header_bottom]
+
+        anchors = sorted((cell for cell in cells if cell.text in spec.row_anchor.values), key=lambda c: c.y)
+        logger.info(f"{spec.name}: {len(cells)} cells, {len(anchors)} row anchors")
+
+        excluded = set(spec.exclude)
+        columns: Dict[str, List[_Cell]] = {}
+        for column in spec.columns:
+            if column.x is None:
+                continue
+            x_min, x_max = column.x
+            columns[column.name] = sorted(
+                (
+                    cell for cell in cells
+                    if x_min <= cell.x < x_max and cell.text not in excluded
+                    and len(cell.text) >= spec.min_cell_length
+                ),
+                key=lambda c: c.y,
+            )
+
+        anchor_spec = spec.row_anchor
+        rows: Dict[str, Dict[str, str]] = {}
+        for i, anchor in enumerate(anchors):
+            y_min = anchor.y - anchor_spec.lead
+            if i < len(anchors) - 1:
+                y_max = anchor.y + (anchors[i + 1].y - anchor.y) * anchor_spec.fraction
+            else:
+                y_max = anchor.y + anchor_spec.last_row_height
+            row = {}
+            for name, column_cells in columns.items():
+                texts = [cell.text for cell in column_cells if y_min <= cell.y < y_max]
+                row[name] = self._clean(spec, "\n".join(texts)) if texts else spec.empty_cell
+            rows[anchor.text] = row
+        return rows
+
+    def _clean(self, spec: TableSpec, text: str) -> str:
+        """Run a cell's text through the spec's cleaners, in order."""
+        for name in spec.clean:
+            text = self.cleaners[name](text)
+        return text
+
+    @staticmethod
+    def _hide_source(page: dict, placement: _Placement) -> None:
+        """Mark the blocks and auto-detected tables under the table for removal."""
+        spec = placement.spec
+        blocks = page.get("blocks", [])
+        y_start = placement.header.get("bbox", [0, 0, 0, 0])[3]
+        y_end = placement.end_y
+
+        marked = 0
+        for idx in range(placement.header_idx + 1, len(blocks)):
+            block = blocks[idx]
+            if block.get("type") != "text" or spec.is_end(block_plain_text(block)):
+                continue
+            if y_start < block.get("bbox", [0, 0, 0, 0])[1] < y_end:
+                block["__skip_render"] = True
+                marked += 1
+
+        tables_marked = 0
+        for table in page.get("tables", []):
+            if y_start < table.get("bbox", [0, 0, 0, 0])[1] < y_end:
+                table["__skip_render"] = True
+                tables_marked += 1
+        logger.info(f"{spec.name}: marked {marked} blocks and {tables_marked} page tables for removal")
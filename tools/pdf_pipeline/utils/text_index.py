@@ -0,0 +1,255 @@
+"""Cached plain-text index over the blocks of a page or section.
+
+Chapter adjustments locate their anchors (class headers, table titles,
+monster names) by rebuilding every block's text from its spans and testing a
+predicate, once per anchor. ``PageTextIndex`` joins and normalizes each line
+once, and keeps an exact-match map and a sorted list for prefix lookups so
+most anchor searches no longer touch the spans at all.
+
+Line text is ``"".join(span["text"])`` passed through an optional
+``normalize`` function; block text is its line texts joined with a separator
+(``""`` by default, ``" "`` for helpers that join lines with spaces).
+Indexes are cached per (page, normalize). A lookup does not re-check the
+page, so a fixer that changes a page's blocks, lines or span text calls
+``PageTextIndex.invalidate(page)`` and the next lookup rebuilds the index.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Normalizer = Optional[Callable[[str], str]]
+
+_CACHE_SIZE = 32
+
+
+class PageTextIndex:
+    """Normalized text of every block and line of one page."""
+
+    def __init__(self, page: dict, normalize: Normalizer = None):
+        """Build the index.
+
+        Args:
+            page: PyMuPDF-style page dictionary
+            normalize: Optional function applied to each joined line text
+        """
+        self.page = page
+        self.normalize = normalize
+        self._lines: List[List[str]] = []
+        self._blocks: Dict[str, List[str]] = {}
+        self._block_maps: Dict[str, Dict[str, int]] = {}
+        self._exact: Dict[str, List[Tuple[int, int]]] = {}
+        sorted_lines: List[Tuple[str, int, int]] = []
+
+        for b_idx, block in enumerate(page.get("blocks", [])):
+            texts = []
+            for l_idx, line in enumerate(block.get("lines", [])):
+                text = "".join(span.get("text", "") for span in line.get("spans", []))
+                if normalize is not None:
+                    text = normalize(text)
+                texts.append(text)
+                self._exact.setdefault(text, []).append((b_idx, l_idx))
+                sorted_lines.append((text, b_idx, l_idx))
+            self._lines.append(texts)
+
+        sorted_lines.sort()
+        self._sorted_texts = [t for t, _, _ in sorted_lines]
+        self._sorted_locs = [(b, l) for _, b, l in sorted_lines]
+
+    # ------------------------------------------------------------------
+    # Construction and caching
+    # ------------------------------------------------------------------
+
+    _cache: Dict[Tuple[int, int], "PageTextIndex"] = {}
+
+    @classmethod
+    def for_page(cls, page: dict, normalize: Normalizer = None) -> "PageTextIndex":
+        """Return the cached index for the page, building it on first use.
+
+        Args:
+            page: PyMuPDF-style page dictionary
+            normalize: Optional line normalizer (part of the cache key)
+
+        Returns:
+            PageTextIndex of the page as of its last ``invalidate``
+        """
+        key = (id(page), id(normalize))
+        index = cls._cache.get(key)
+        if index is not None and index.page is page and index.normalize is normalize:
+            return index
+        index = cls(page, normalize)
+        cls._cache.pop(key, None)
+        if len(cls._cache) >= _CACHE_SIZE:
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[key] = index
+        return index
+
+    @classmethod
+    def invalidate(cls, page: Optional[dict] = None) -> None:
+        """Drop cached indexes of a page (or of all pages).
+
+        Fixers call this after changing a page's blocks, lines or span text.
+        """
+        if page is None:
+            cls._cache.clear()
+            return
+        for key in [k for k in cls._cache if k[0] == id(page)]:
+            del cls._cache[key]
+
+    # ------------------------------------------------------------------
+    # Text access
+    # ------------------------------------------------------------------
+
+    def line_texts(self, block_idx: int) -> List[str]:
+        """Normalized line texts of a block."""
+        return self._lines[block_idx]
+
+    def block_texts(self, sep: str = "") -> List[str]:
+        """Normalized text of every block, line texts joined with ``sep``."""
+        texts = self._blocks.get(sep)
+        if texts is None:
+            texts = self._blocks[sep] = [sep.join(lines) for lines in self._lines]
+        return texts
+
+    def block_text(self, block_idx: int, sep: str = "") -> str:
+        """Normalized text of a block, line texts joined with ``sep``."""
+        return self.block_texts(sep)[block_idx]
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    # ------------------------------------------------------------------
+    # Lookups (all return the first match in document order)
+    # ------------------------------------------------------------------
+
+    def _hit(self, block_idx: Optional[int]) -> Optional[Tuple[int, dict]]:
+        """Turn a block index into an (index, block) match."""
+        if block_idx is None:
+            return None
+        return block_idx, self.page["blocks"][block_idx]
+
+    def find(self, predicate: Callable[[List[str]], bool]) -> Optional[Tuple[int, dict]]:
+        """Find the first block whose line texts satisfy ``predicate``."""
+        for idx, texts in enumerate(self._lines):
+            if predicate(texts):
+                return self._hit(idx)
+        return None
+
+    def find_exact(self, text: str) -> Optional[Tuple[int, dict]]:
+        """Find the first block with a line equal to ``text``."""
+        locs = self._exact.get(text)
+        return self._hit(locs[0][0]) if locs else None
+
+    def find_prefix(self, prefix: str) -> Optional[Tuple[int, dict]]:
+        """Find the first block with a line starting with ``prefix``."""
+        best: Optional[int] = None
+        pos = bisect_left(self._sorted_texts, prefix)
+        while pos < len(self._sorted_texts) and self._sorted_texts[pos].startswith(prefix):
+            b_idx = self._sorted_locs[pos][0]
+            if best is None or b_idx < best:
+                best = b_idx
+            pos += 1
+        return self._hit(best)
+
+    def find_containing(self, needle: str, *, within_line: bool = True) -> Optional[Tuple[int, dict]]:
+        """Find the first block containing ``needle``.
+
+        Args:
+            needle: Substring to look for
+            within_line: Require the substring inside a single line; otherwise
+                match against the whole block text, across line boundaries
+        """
+        for idx, text in enumerate(self.block_texts()):
+            if needle not in text:
+                continue
+            if not within_line or any(needle in line for line in self._lines[idx]):
+                return self._hit(idx)
+        return None
+
+    def find_block_text(self, text: str, sep: str = "") -> Optional[Tuple[int, dict]]:
+        """Find the first block whose stripped text (lines joined with ``sep``) equals ``text``."""
+        block_map = self._block_maps.get(sep)
+        if block_map is None:
+            block_map = self._block_maps[sep] = {}
+            for idx, block_text in enumerate(self.block_texts(sep)):
+                block_map.setdefault(block_text.strip(), idx)
+        return self._hit(block_map.get(text))
+
+    def find_block_where(self, predicate: Callable[[str], bool], sep: str = "") -> Optional[Tuple[int, dict]]:
+        """Find the first block whose text (lines joined with ``sep``) satisfies ``predicate``."""
+        for idx, block_text in enumerate(self.block_texts(sep)):
+            if predicate(block_text):
+                return self._hit(idx)
+        return None
+
+
+class SectionTextIndex:
+    """Text lookups across all pages of a section.
+
+    Each page is indexed lazily through ``PageTextIndex.for_page``, so pages
+    invalidated by earlier fixers are re-indexed on their next lookup.
+    """
+
+    def __init__(self, pages: List[dict], normalize: Normalizer = None):
+        """Initialize the section index.
+
+        Args:
+            pages: Section pages
+            normalize: Optional line normalizer
+        """
+        self.pages = pages
+        self.normalize = normalize
+
+    def page(self, page_idx: int) -> PageTextIndex:
+        """Index of one page."""
+        return PageTextIndex.for_page(self.pages[page_idx], self.normalize)
+
+    def _pages(self, page_number: Optional[int]) -> Iterator[Tuple[int, PageTextIndex]]:
+        """Indexes of all pages, or of the pages with a given page number."""
+        for page_idx, page in enumerate(self.pages):
+            if page_number is None or page.get("page_number") == page_number:
+                yield page_idx, self.page(page_idx)
+
+    def find_exact(self, text: str, page_number: Optional[int] = None) -> Optional[Tuple[int, int, dict]]:
+        """Find the first block with a line equal to ``text``.
+
+        Returns:
+            (page_idx, block_idx, block) or None
+        """
+        for page_idx, index in self._pages(page_number):
+            hit = index.find_exact(text)
+            if hit:
+                return (page_idx,) + hit
+        return None
+
+    def find_prefix(self, prefix: str, page_number: Optional[int] = None) -> Optional[Tuple[int, int, dict]]:
+        """Find the first block with a line starting with ``prefix``."""
+        for page_idx, index in self._pages(page_number):
+            hit = index.find_prefix(prefix)
+            if hit:
+                return (page_idx,) + hit
+        return None
+
+    def find_containing(
+        self, needle: str, page_number: Optional[int] = None, *, within_line: bool = True
+    ) -> Optional[Tuple[int, int, dict]]:
+        """Find the first block containing ``needle``."""
+        for page_idx, index in self._pages(page_number):
+            hit = index.find_containing(needle, within_line=within_line)
+            if hit:
+                return (page_idx,) + hit
+        return None
+
+    def find_block_where(
+        self, predicate: Callable[[str], bool], page_number: Optional[int] = None, sep: str = ""
+    ) -> Optional[Tuple[int, int, dict]]:
+        """Find the first block whose text satisfies ``predicate``."""
+        for page_idx, index in self._pages(page_number):
+            hit = index.find_block_where(predicate, sep)
+            if hit:
+                return (page_idx,) + hit
+        return None